@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cognitive memory hot paths on synthetic corpora.
+
+Generates a corpus per size (markdown trees, git commit histories and
+free-text experiences, see benchmarks/corpus.py) and measures on a fresh
+system:
+
+- store_experience: per-call latency and throughput
+- load_markdown / load_git: load_memories_from_source throughput
+- connection_extraction: markdown extract_connections time per file
+- retrieval: retrieve_memories p50/p95/p99 per memory type and for all types
+- delete_reload: delete, reload, atomic reload and incremental reload cost
+  of single markdown files
+
+Vectors live in an in-process ``QdrantClient(":memory:")``, or in the
+embedded NumPy store with ``--vector-storage embedded``, so no Qdrant
+server or Docker is needed. Text is encoded with a deterministic hashing
+encoder by default so runs are reproducible and independent of the model
+download; ``--encoder onnx`` uses the configured sentence embedding model.
+
+Results are printed as JSON; pass a previous run with ``--baseline`` to add
+the relative change of every metric, e.g.::
+
+    python benchmarks/cognitive_paths.py --sizes 1000 10000 --output head.json
+    python benchmarks/cognitive_paths.py --sizes 1000 10000 --baseline head.json
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from corpus import COMPONENTS, CONCERNS, IDENTIFIERS, generate_corpus  # noqa: E402
+from qdrant_client import QdrantClient  # noqa: E402
+
+from cognitive_memory.core.cognitive_system import CognitiveMemorySystem  # noqa: E402
+from cognitive_memory.core.config import (  # noqa: E402
+    CognitiveConfig,
+    DatabaseConfig,
+    EmbeddingConfig,
+    LoggingConfig,
+    QdrantConfig,
+    SystemConfig,
+)
+from cognitive_memory.core.interfaces import EmbeddingProvider  # noqa: E402
+from cognitive_memory.loaders.git_loader import GitHistoryLoader  # noqa: E402
+from cognitive_memory.loaders.markdown_loader import (  # noqa: E402
+    MarkdownMemoryLoader,
+)
+from cognitive_memory.retrieval.basic_activation import (  # noqa: E402
+    BasicActivationEngine,
+)
+from cognitive_memory.retrieval.bridge_discovery import (  # noqa: E402
+    SimpleBridgeDiscovery,
+)
+from cognitive_memory.storage.bridge_cache import BridgeCache  # noqa: E402
+from cognitive_memory.storage.embedded_vector_storage import (  # noqa: E402
+    EmbeddedVectorStorage,
+)
+from cognitive_memory.storage.embedding_cache import EmbeddingCache  # noqa: E402
+from cognitive_memory.storage.qdrant_storage import (  # noqa: E402
+    HierarchicalMemoryStorage,
+)
+from cognitive_memory.storage.sqlite_persistence import (  # noqa: E402
+    MemoryMetadataStore,
+    create_sqlite_persistence,
+)
+
+MEMORY_TYPES = ("core", "peripheral", "bridge")
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic bag-of-words encoder for reproducible benchmarks.
+
+    Each token is hashed to a signed dimension, so texts sharing vocabulary
+    get similar vectors without loading a model.
+    """
+
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+        self._token_slots: dict[str, tuple[int, float]] = {}
+
+    def _slot(self, token: str) -> tuple[int, float]:
+        slot = self._token_slots.get(token)
+        if slot is None:
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            slot = (value % self.dimension, 1.0 if value >> 63 else -1.0)
+            self._token_slots[token] = slot
+        return slot
+
+    def encode(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            index, sign = self._slot(token)
+            vector[index] += sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def encode_batch(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([self.encode(text) for text in texts])
+
+
+def create_embedding_provider(encoder: str, config: SystemConfig) -> Any:
+    """Create the embedding provider selected on the command line."""
+    if encoder == "onnx":
+        from cognitive_memory.encoding.sentence_bert import (
+            create_sentence_bert_provider,
+        )
+
+        return create_sentence_bert_provider(model_name=config.embedding.model_name)
+    return HashingEmbeddingProvider(config.embedding.embedding_dimension)
+
+
+@dataclass
+class BenchmarkSystem:
+    """A benchmark system and the stores it owns."""
+
+    system: CognitiveMemorySystem
+    config: SystemConfig
+    memory_storage: MemoryMetadataStore
+    vector_storage: HierarchicalMemoryStorage | EmbeddedVectorStorage
+
+    def close(self) -> None:
+        """Close the database and vector stores."""
+        self.memory_storage.db_manager.close()
+        self.vector_storage.close()
+
+
+def create_benchmark_system(
+    data_dir: Path, encoder: str, vector_storage_backend: str = "qdrant"
+) -> BenchmarkSystem:
+    """
+    Assemble a system the way create_default_system does, on local storage.
+
+    Retrieval telemetry is left out so sampling does not skew latencies.
+    """
+    config = SystemConfig(
+        qdrant=QdrantConfig(),
+        database=DatabaseConfig(path=str(data_dir / "cognitive_memory.db")),
+        embedding=EmbeddingConfig(),
+        cognitive=CognitiveConfig(),
+        logging=LoggingConfig(),
+        project_id=f"benchmark_{uuid.uuid4().hex[:8]}",
+    )
+
+    embedding_provider = create_embedding_provider(encoder, config)
+    vector_storage: HierarchicalMemoryStorage | EmbeddedVectorStorage
+    if vector_storage_backend == "embedded":
+        vector_storage = EmbeddedVectorStorage(
+            vector_size=config.embedding.embedding_dimension,
+            project_id=config.project_id,
+            path=data_dir / "vectors",
+        )
+    else:
+        vector_storage = HierarchicalMemoryStorage(
+            vector_size=config.embedding.embedding_dimension,
+            project_id=config.project_id,
+            client=QdrantClient(":memory:"),
+        )
+    memory_storage, connection_graph = create_sqlite_persistence(
+        db_path=config.database.path,
+        pool_size=config.database.connection_pool_size,
+        stats_flush_interval=config.database.stats_flush_interval,
+        stats_flush_max_pending=config.database.stats_flush_max_pending,
+        retrieval_retention_days=config.database.retrieval_retention_days,
+    )
+    system = CognitiveMemorySystem(
+        embedding_provider=embedding_provider,
+        vector_storage=vector_storage,
+        memory_storage=memory_storage,
+        connection_graph=connection_graph,
+        activation_engine=BasicActivationEngine(
+            memory_storage=memory_storage, connection_graph=connection_graph
+        ),
+        bridge_discovery=SimpleBridgeDiscovery(
+            memory_storage=memory_storage,
+            cache=BridgeCache(
+                memory_storage.db_manager,
+                ttl_hours=config.cognitive.bridge_cache_ttl_hours,
+            ),
+        ),
+        config=config,
+        embedding_cache=EmbeddingCache(
+            memory_storage.db_manager,
+            max_bytes=config.embedding.embedding_cache_max_bytes,
+        ),
+    )
+    return BenchmarkSystem(system, config, memory_storage, vector_storage)
+
+
+def latency_summary(samples: list[float]) -> dict[str, float]:
+    """Summarize latencies in seconds as milliseconds."""
+    if not samples:
+        return {"count": 0}
+    milliseconds = np.asarray(samples) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        "count": len(samples),
+        "mean_ms": float(milliseconds.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+    }
+
+
+def timed(function: Any) -> tuple[float, Any]:
+    """Run a function and return (seconds, result)."""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def bench_store_experience(
+    system: CognitiveMemorySystem, experiences: list[str]
+) -> dict[str, Any]:
+    """Store every experience one call at a time."""
+    samples = []
+    stored = 0
+    for text in experiences:
+        seconds, memory_id = timed(partial(system.store_experience, text))
+        samples.append(seconds)
+        stored += bool(memory_id)
+    total = sum(samples)
+    return {
+        "memories_stored": stored,
+        "seconds": total,
+        "memories_per_second": stored / total if total else 0.0,
+        "latency": latency_summary(samples),
+    }
+
+
+def bench_load(
+    system: CognitiveMemorySystem,
+    loader: Any,
+    sources: list[Path],
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Load every source through load_memories_from_source."""
+    memories = connections = failures = 0
+    samples = []
+    for source in sources:
+        seconds, result = timed(
+            partial(system.load_memories_from_source, loader, str(source), **kwargs)
+        )
+        samples.append(seconds)
+        if result.get("success"):
+            memories += result.get("memories_loaded", 0)
+            connections += result.get("connections_created", 0)
+        else:
+            failures += 1
+    total = sum(samples)
+    return {
+        "sources": len(sources),
+        "failed_sources": failures,
+        "memories_loaded": memories,
+        "connections_created": connections,
+        "seconds": total,
+        "memories_per_second": memories / total if total else 0.0,
+        "latency_per_source": latency_summary(samples),
+    }
+
+
+def bench_connection_extraction(
+    config: SystemConfig, files: list[Path]
+) -> dict[str, Any]:
+    """Time markdown connection extraction per file, without storage."""
+    loader = MarkdownMemoryLoader(config.cognitive)
+    samples = []
+    connections = 0
+    for path in files:
+        memories = loader.load_from_source(str(path))
+        seconds, extracted = timed(partial(loader.extract_connections, memories))
+        samples.append(seconds)
+        connections += len(extracted)
+    return {
+        "files": len(files),
+        "connections": connections,
+        "seconds": sum(samples),
+        "latency_per_file": latency_summary(samples),
+    }
+
+
+def make_queries(count: int, rng: random.Random) -> list[str]:
+    """Build distinct queries from the corpus vocabulary."""
+    queries = []
+    for index in range(count):
+        queries.append(
+            f"how does the {rng.choice(COMPONENTS)} handle "
+            f"{rng.choice(CONCERNS)} in {rng.choice(IDENTIFIERS)} ({index})"
+        )
+    return queries
+
+
+def bench_retrieval(
+    system: CognitiveMemorySystem, query_count: int, rng: random.Random
+) -> dict[str, Any]:
+    """Measure retrieve_memories latency per memory type and for all types."""
+    results: dict[str, Any] = {}
+    for label, types in [(t, [t]) for t in MEMORY_TYPES] + [("all", None)]:
+        samples = []
+        returned = 0
+        # Fresh queries per type so no type is served from the query caches
+        for query in make_queries(query_count, rng):
+            seconds, retrieved = timed(
+                partial(system.retrieve_memories, query, types=types, max_results=10)
+            )
+            samples.append(seconds)
+            returned += sum(len(memories) for memories in retrieved.values())
+        results[label] = {
+            **latency_summary(samples),
+            "mean_results": returned / len(samples) if samples else 0.0,
+        }
+    return results
+
+
+def bench_delete_reload(
+    system: CognitiveMemorySystem,
+    loader: MarkdownMemoryLoader,
+    files: list[Path],
+    rng: random.Random,
+) -> dict[str, Any]:
+    """Delete and reload single markdown files in the populated system."""
+    delete, reload, atomic, incremental = [], [], [], []
+    for path in files:
+        source = str(path)
+        delete.append(timed(partial(system.delete_memories_by_source_path, source))[0])
+        reload.append(
+            timed(partial(system.load_memories_from_source, loader, source))[0]
+        )
+        atomic.append(
+            timed(partial(system.atomic_reload_memories_from_source, loader, source))[0]
+        )
+
+        # Change one paragraph, as an editor save would
+        content = path.read_text(encoding="utf-8")
+        path.write_text(
+            content.replace("\n\n", f"\n\nEdited {rng.random():.6f}.\n\n", 1),
+            encoding="utf-8",
+        )
+        incremental.append(
+            timed(
+                partial(system.incremental_reload_memories_from_source, loader, source)
+            )[0]
+        )
+    return {
+        "files": len(files),
+        "delete": latency_summary(delete),
+        "reload_after_delete": latency_summary(reload),
+        "atomic_reload": latency_summary(atomic),
+        "incremental_reload": latency_summary(incremental),
+    }
+
+
+def run(size: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Benchmark one corpus size on a fresh system."""
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        generation_seconds, corpus = timed(
+            partial(generate_corpus, root / "corpus", size, seed=args.seed)
+        )
+        benchmark = create_benchmark_system(root, args.encoder, args.vector_storage)
+        system, config = benchmark.system, benchmark.config
+        try:
+            markdown_loader = MarkdownMemoryLoader(config.cognitive, system)
+            git_loader = GitHistoryLoader(config.cognitive, system)
+
+            result: dict[str, Any] = {
+                "corpus": {
+                    "markdown_files": len(corpus.markdown_files),
+                    "repositories": len(corpus.repositories),
+                    "commits": corpus.commit_count,
+                    "experiences": len(corpus.experiences),
+                    "generation_seconds": generation_seconds,
+                },
+                "store_experience": bench_store_experience(system, corpus.experiences),
+                "load_markdown": bench_load(
+                    system, markdown_loader, corpus.markdown_files
+                ),
+                "load_git": bench_load(
+                    system,
+                    git_loader,
+                    corpus.repositories,
+                    max_commits=corpus.commit_count,
+                ),
+                "connection_extraction": bench_connection_extraction(
+                    config, corpus.markdown_files[: args.extraction_files]
+                ),
+            }
+
+            with benchmark.memory_storage.db_manager.get_connection() as conn:
+                result["corpus"]["memories"] = conn.execute(
+                    "SELECT COUNT(*) FROM memories"
+                ).fetchone()[0]
+
+            result["retrieval"] = bench_retrieval(system, args.queries, rng)
+            result["delete_reload"] = bench_delete_reload(
+                system,
+                markdown_loader,
+                rng.sample(
+                    corpus.markdown_files,
+                    min(args.reload_files, len(corpus.markdown_files)),
+                ),
+                rng,
+            )
+            return result
+        finally:
+            benchmark.close()
+
+
+def flatten(results: Any, prefix: str = "") -> dict[str, float]:
+    """Flatten nested numeric results into dotted metric names."""
+    metrics: dict[str, float] = {}
+    if isinstance(results, dict):
+        for key, value in results.items():
+            metrics.update(flatten(value, f"{prefix}{key}."))
+    elif isinstance(results, int | float) and not isinstance(results, bool):
+        metrics[prefix.rstrip(".")] = float(results)
+    return metrics
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Relative change of every metric present in both runs."""
+    before = flatten(baseline.get("results", {}))
+    after = flatten(current["results"])
+    return {
+        "baseline_commit": baseline.get("environment", {}).get("commit"),
+        "metrics": {
+            name: {
+                "baseline": before[name],
+                "current": value,
+                "change": (value - before[name]) / before[name],
+            }
+            for name, value in after.items()
+            if name in before and before[name]
+        },
+    }
+
+
+def git_commit() -> str | None:
+    """Commit of the benchmarked tree, if it is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    """Run the benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Approximate memory counts of the generated corpora",
+    )
+    parser.add_argument(
+        "--encoder",
+        choices=["hashing", "onnx"],
+        default="hashing",
+        help="Deterministic hashing encoder or the configured ONNX model",
+    )
+    parser.add_argument(
+        "--vector-storage",
+        choices=["qdrant", "embedded"],
+        default="qdrant",
+        help="In-process Qdrant client or the embedded NumPy store",
+    )
+    parser.add_argument(
+        "--queries", type=int, default=100, help="Queries per memory type"
+    )
+    parser.add_argument(
+        "--extraction-files",
+        type=int,
+        default=200,
+        help="Markdown files timed for connection extraction",
+    )
+    parser.add_argument(
+        "--reload-files",
+        type=int,
+        default=20,
+        help="Markdown files deleted and reloaded",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON results")
+    parser.add_argument("--output", type=Path, help="Write JSON results to a file")
+    args = parser.parse_args()
+
+    # Per-memory logging would dominate the measured time
+    logger.disable("cognitive_memory")
+
+    results: dict[str, Any] = {
+        "benchmark": "cognitive_paths",
+        "environment": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "encoder": args.encoder,
+            "vector_storage": (
+                "qdrant_in_memory"
+                if args.vector_storage == "qdrant"
+                else "embedded_numpy"
+            ),
+            "seed": args.seed,
+        },
+        "results": {str(size): run(size, args) for size in args.sizes},
+    }
+    if args.baseline:
+        results["comparison"] = compare(json.loads(args.baseline.read_text()), results)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Deterministic synthetic corpora for the cognitive memory benchmarks.
+
+Three kinds of sources are generated from a shared technical vocabulary so
+that queries, markdown sections, commits and experiences overlap the way a
+real project's memories do:
+
+- markdown trees: documentation files with nested sections, code blocks and
+  cross-file links, loaded through MarkdownMemoryLoader
+- commit histories: real git repositories written with ``git fast-import``,
+  loaded through GitHistoryLoader
+- experiences: free-text notes stored with store_experience
+
+The same seed always produces the same corpus.
+"""
+
+import random
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Share of the requested memory count produced by each source type
+MARKDOWN_SHARE = 0.5
+COMMIT_SHARE = 0.2
+
+SECTIONS_PER_FILE = 4
+SUBSECTIONS_PER_SECTION = 2
+# Memories the markdown loader creates per generated file once short
+# sections are merged into their parents, measured on generated files
+MEMORIES_PER_FILE = 5
+FILES_PER_DIRECTORY = 20
+
+# Commit loading is capped at 10000 commits per repository
+MAX_COMMITS_PER_REPOSITORY = 5000
+FILES_PER_REPOSITORY = 200
+
+COMPONENTS = [
+    "activation engine",
+    "bridge discovery",
+    "connection graph",
+    "embedding cache",
+    "file monitor",
+    "git loader",
+    "markdown parser",
+    "memory store",
+    "query cache",
+    "retrieval pipeline",
+    "vector index",
+    "consolidation job",
+]
+CONCERNS = [
+    "latency",
+    "throughput",
+    "memory usage",
+    "lock contention",
+    "cache invalidation",
+    "error handling",
+    "schema migration",
+    "batch size",
+    "connection pooling",
+    "tokenization",
+    "decay rate",
+    "ranking",
+]
+ACTIONS = [
+    "refactor",
+    "profile",
+    "document",
+    "optimize",
+    "validate",
+    "instrument",
+    "simplify",
+    "parallelize",
+]
+OUTCOMES = [
+    "cut p99 latency in half",
+    "removed a redundant database round trip",
+    "fixed an off-by-one in the window calculation",
+    "made the behaviour deterministic across runs",
+    "reduced peak memory during large loads",
+    "surfaced a race between the writer and the reader",
+    "kept results identical while avoiding the full scan",
+]
+IDENTIFIERS = [
+    "activate_memories",
+    "discover_bridges",
+    "store_vectors_batch",
+    "extract_connections",
+    "encode_batch",
+    "get_connections",
+    "search_cross_level",
+    "load_from_source",
+]
+AUTHORS = [
+    ("Ada Reyes", "ada@example.com"),
+    ("Bo Lindqvist", "bo@example.com"),
+    ("Chidi Okafor", "chidi@example.com"),
+    ("Dana Weiss", "dana@example.com"),
+]
+
+
+@dataclass
+class Corpus:
+    """Paths and texts of a generated corpus."""
+
+    markdown_files: list[Path] = field(default_factory=list)
+    repositories: list[Path] = field(default_factory=list)
+    commit_count: int = 0
+    experiences: list[str] = field(default_factory=list)
+
+
+def sentence(rng: random.Random) -> str:
+    """Build one sentence from the shared vocabulary."""
+    component = rng.choice(COMPONENTS)
+    concern = rng.choice(CONCERNS)
+    template = rng.randrange(4)
+    if template == 0:
+        return (
+            f"The {component} trades {concern} against "
+            f"{rng.choice(CONCERNS)} when the corpus grows."
+        )
+    if template == 1:
+        return (
+            f"We {rng.choice(ACTIONS)} `{rng.choice(IDENTIFIERS)}` in the "
+            f"{component} because {concern} dominated the profile."
+        )
+    if template == 2:
+        return (
+            f"Changing the {concern} policy of the {component} {rng.choice(OUTCOMES)}."
+        )
+    return (
+        f"When the {component} calls `{rng.choice(IDENTIFIERS)}`, "
+        f"{concern} depends on how many memories are activated."
+    )
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    """Build a paragraph of the given number of sentences."""
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+
+def markdown_document(rng: random.Random, title: str, neighbours: list[str]) -> str:
+    """Build one markdown file with nested sections, code and links."""
+    lines = [f"# {title}", "", paragraph(rng, 3), ""]
+    for section in range(SECTIONS_PER_FILE):
+        component = rng.choice(COMPONENTS)
+        lines += [f"## {component.title()} {section + 1}", "", paragraph(rng, 4), ""]
+        for subsection in range(SUBSECTIONS_PER_SECTION):
+            lines += [
+                f"### {rng.choice(CONCERNS).title()} {subsection + 1}",
+                "",
+                paragraph(rng, 3),
+                "",
+            ]
+            if rng.random() < 0.3:
+                identifier = rng.choice(IDENTIFIERS)
+                lines += [
+                    "```python",
+                    f"result = system.{identifier}(batch_size={rng.randint(8, 256)})",
+                    "```",
+                    "",
+                ]
+            if neighbours and rng.random() < 0.3:
+                target = rng.choice(neighbours)
+                lines += [f"See [{target}]({target}.md) for the related design.", ""]
+    return "\n".join(lines)
+
+
+def generate_markdown_tree(
+    root: Path, memory_count: int, rng: random.Random
+) -> list[Path]:
+    """
+    Create markdown files yielding roughly memory_count memories.
+
+    Files are spread over directories of FILES_PER_DIRECTORY files each and
+    link to other files in the same directory.
+    """
+    file_count = max(1, round(memory_count / MEMORIES_PER_FILE))
+    files = []
+    for index in range(file_count):
+        directory = root / f"area_{index // FILES_PER_DIRECTORY:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        first = index - index % FILES_PER_DIRECTORY
+        neighbours = [
+            f"doc_{other:05d}"
+            for other in range(first, min(first + FILES_PER_DIRECTORY, file_count))
+            if other != index
+        ]
+        path = directory / f"doc_{index:05d}.md"
+        path.write_text(
+            markdown_document(rng, f"Design Note {index}", neighbours),
+            encoding="utf-8",
+        )
+        files.append(path)
+    return files
+
+
+def _fast_import_stream(
+    commit_count: int, rng: random.Random, start_time: int
+) -> bytes:
+    """Build a git fast-import stream with commit_count commits."""
+    chunks = []
+    file_versions: dict[str, int] = {}
+    for number in range(1, commit_count + 1):
+        name, email = rng.choice(AUTHORS)
+        timestamp = start_time + number * 600
+        component = rng.choice(COMPONENTS)
+        message = (
+            f"{rng.choice(ACTIONS).capitalize()} {component} "
+            f"{rng.choice(CONCERNS)}\n\n{paragraph(rng, 2)}\n"
+        ).encode()
+
+        chunks.append(b"commit refs/heads/main\n")
+        chunks.append(f"mark :{number}\n".encode())
+        chunks.append(f"author {name} <{email}> {timestamp} +0000\n".encode())
+        chunks.append(f"committer {name} <{email}> {timestamp} +0000\n".encode())
+        chunks.append(f"data {len(message)}\n".encode() + message)
+        if number > 1:
+            chunks.append(f"from :{number - 1}\n".encode())
+
+        for _ in range(rng.randint(1, 3)):
+            directory = rng.choice(COMPONENTS).replace(" ", "_")
+            path = f"src/{directory}/module_{rng.randrange(FILES_PER_REPOSITORY)}.py"
+            version = file_versions.get(path, 0) + 1
+            file_versions[path] = version
+            content = "\n".join(
+                f"# {sentence(rng)}" for _ in range(version % 5 + 2)
+            ).encode()
+            chunks.append(f"M 100644 inline {path}\n".encode())
+            chunks.append(f"data {len(content)}\n".encode() + content + b"\n")
+        chunks.append(b"\n")
+    return b"".join(chunks)
+
+
+def generate_git_repository(path: Path, commit_count: int, rng: random.Random) -> Path:
+    """Create a git repository with a linear history of commit_count commits."""
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        ["git", "init", "--quiet", "--initial-branch=main", str(path)], check=True
+    )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=path,
+        input=_fast_import_stream(commit_count, rng, start_time=1_700_000_000),
+        check=True,
+    )
+    return path
+
+
+def generate_experiences(count: int, rng: random.Random) -> list[str]:
+    """Build free-text experience notes."""
+    return [
+        f"While working on the {rng.choice(COMPONENTS)} I learned that "
+        f"{paragraph(rng, rng.randint(1, 3))}"
+        for _ in range(count)
+    ]
+
+
+def generate_corpus(root: Path, memory_count: int, seed: int = 0) -> Corpus:
+    """
+    Generate a corpus of roughly memory_count memories under root.
+
+    Args:
+        root: Empty directory to create sources in
+        memory_count: Approximate number of memories the corpus loads into
+        seed: Random seed; equal seeds produce identical corpora
+
+    Returns:
+        Corpus describing the generated sources
+    """
+    rng = random.Random(seed)
+    corpus = Corpus()
+
+    corpus.markdown_files = generate_markdown_tree(
+        root / "docs", round(memory_count * MARKDOWN_SHARE), rng
+    )
+
+    remaining = max(1, round(memory_count * COMMIT_SHARE))
+    corpus.commit_count = remaining
+    index = 0
+    while remaining > 0:
+        commits = min(remaining, MAX_COMMITS_PER_REPOSITORY)
+        corpus.repositories.append(
+            generate_git_repository(root / f"repo_{index}", commits, rng)
+        )
+        remaining -= commits
+        index += 1
+
+    corpus.experiences = generate_experiences(
+        max(
+            1,
+            memory_count - round(memory_count * MARKDOWN_SHARE) - corpus.commit_count,
+        ),
+        rng,
+    )
+    return corpus
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark the polling FileMonitor scan cost per cycle.
+
+Generates synthetic markdown trees (10k and 100k files by default, plus an
+ignored node_modules subtree) and measures:
+
+- rglob_reference: the previous rglob + is_file walk over the whole tree
+- cold_scan: first polling cycle with an empty directory cache
+- warm_scan: a cycle where nothing changed
+- one_change_scan: a cycle after one file was added to one directory
+
+Results are printed as JSON, e.g.::
+
+    python benchmarks/file_scan.py --sizes 10000 100000 --output scan.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from heimdall.monitoring.file_types import FileMonitor  # noqa: E402
+
+FILES_PER_DIRECTORY = 20
+DIRECTORIES_PER_LEVEL = 25
+IGNORE_PATTERNS = {".git", "node_modules", "__pycache__"}
+
+
+def generate_tree(root: Path, file_count: int) -> None:
+    """
+    Create a two-level docs tree with file_count markdown files.
+
+    Every directory also gets a non-markdown file, and an ignored
+    node_modules subtree holds a tenth as many files again. Directory mtimes
+    are moved an hour into the past so cached listings are not treated as
+    racy.
+    """
+    directories = max(1, file_count // FILES_PER_DIRECTORY)
+    for index in range(directories):
+        directory = (
+            root / f"section_{index // DIRECTORIES_PER_LEVEL}" / f"topic_{index}"
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "assets.txt").write_text("not markdown")
+        for number in range(FILES_PER_DIRECTORY):
+            (directory / f"page_{number}.md").write_text(f"# Page {number}\n")
+
+    ignored = root / "node_modules" / "package"
+    ignored.mkdir(parents=True)
+    for number in range(max(1, file_count // 10)):
+        (ignored / f"README_{number}.md").write_text("ignored")
+
+    past = time.time_ns() - 3600 * 10**9
+    for walked, _subdirectories, _files in os.walk(root):
+        os.utime(walked, ns=(past, past))
+
+
+def rglob_reference(monitor: FileMonitor) -> set[Path]:
+    """Walk the tree the way the scanner did before the directory cache."""
+    files = set()
+    for path in monitor.monitored_paths:
+        for file_path in path.rglob("*"):
+            if (
+                file_path.is_file()
+                and file_path.suffix.lower() in monitor.MARKDOWN_EXTENSIONS
+                and not monitor._should_ignore_path(file_path)
+            ):
+                files.add(file_path)
+    return files
+
+
+def timed(function: Any) -> tuple[float, Any]:
+    """Run a function and return (seconds, result)."""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def run(file_count: int, repeats: int) -> dict[str, Any]:
+    """Benchmark one tree size."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        generate_tree(root, file_count)
+
+        monitor = FileMonitor(ignore_patterns=IGNORE_PATTERNS)
+        monitor.add_path(root)
+
+        reference_seconds, reference_files = timed(lambda: rglob_reference(monitor))
+        cold_seconds, files = timed(monitor._scan_files)
+        cold_listed = monitor.last_scan_stats["directories_listed"]
+
+        warm = [timed(monitor._scan_files)[0] for _ in range(repeats)]
+        warm_listed = monitor.last_scan_stats["directories_listed"]
+
+        target = next(iter(monitor.directory_cache))
+        (target / "new_page.md").write_text("# New\n")
+        os.utime(target, ns=(10**9, 10**9))
+        change_seconds, _ = timed(monitor._scan_files)
+        change_listed = monitor.last_scan_stats["directories_listed"]
+
+        return {
+            "files": len(monitor.file_states),
+            "directories": monitor.last_scan_stats["directories"],
+            "reference_files": len(reference_files),
+            "rglob_reference_seconds": reference_seconds,
+            "cold_scan_seconds": cold_seconds,
+            "cold_directories_listed": cold_listed,
+            "warm_scan_seconds_min": min(warm),
+            "warm_scan_seconds_mean": sum(warm) / len(warm),
+            "warm_directories_listed": warm_listed,
+            "one_change_scan_seconds": change_seconds,
+            "one_change_directories_listed": change_listed,
+        }
+
+
+def main() -> int:
+    """Run the benchmark and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Markdown file counts to benchmark",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Warm scans per tree size"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to a file")
+    args = parser.parse_args()
+
+    # Per-file event logging would dominate the measured scan time
+    logger.disable("heimdall")
+
+    results = {
+        "benchmark": "file_scan",
+        "results": {str(size): run(size, args.repeats) for size in args.sizes},
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,14 @@ between encoding, storage, and retrieval subsystems through their abstract inter
 All dependencies are injected through interfaces to enable testing and component swapping.
 """
 
+import hashlib
 import time
 import uuid
+from collections import defaultdict
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 from loguru import logger
 
 from .config import SystemConfig
@@ -25,6 +28,11 @@ from .interfaces import (
     VectorStorage,
 )
 from .memory import BridgeMemory, CognitiveMemory
+from .query_cache import QueryEmbeddingCache, get_model_identity
+
+if TYPE_CHECKING:
+    from ..storage.embedding_cache import EmbeddingCache
+    from ..storage.retrieval_telemetry import RetrievalTelemetry
 
 
 class CognitiveMemorySystem(CognitiveSystem):
@@ -45,6 +53,8 @@ class CognitiveMemorySystem(CognitiveSystem):
         activation_engine: ActivationEngine,
         bridge_discovery: BridgeDiscovery,
         config: SystemConfig,
+        embedding_cache: "EmbeddingCache | None" = None,
+        retrieval_telemetry: "RetrievalTelemetry | None" = None,
     ):
         """
         Initialize cognitive memory system with injected dependencies.
@@ -57,6 +67,8 @@ class CognitiveMemorySystem(CognitiveSystem):
             activation_engine: Interface for memory activation
             bridge_discovery: Interface for bridge discovery
             config: System configuration
+            embedding_cache: Optional persistent cache of content embeddings
+            retrieval_telemetry: Optional sampler of per-phase retrieval latency
         """
         self.embedding_provider = embedding_provider
         self.vector_storage = vector_storage
@@ -66,6 +78,18 @@ class CognitiveMemorySystem(CognitiveSystem):
         self.bridge_discovery = bridge_discovery
         self.config = config
 
+        # Shared by retrieval, lesson storage and SimilaritySearch callers
+        self.query_cache = QueryEmbeddingCache(
+            max_entries=config.embedding.query_cache_size,
+            max_bytes=config.embedding.query_cache_max_bytes,
+        )
+
+        # Reused across loads, reloads and consolidation of unchanged content
+        self.embedding_cache = embedding_cache
+        self._embedding_cache_model_id: str | None = None
+
+        self.retrieval_telemetry = retrieval_telemetry
+
         logger.info(
             "Cognitive memory system initialized",
             components=[
@@ -99,7 +123,7 @@ class CognitiveMemorySystem(CognitiveSystem):
             current_time = datetime.now()
 
             # Encode the experience
-            embedding = self.embedding_provider.encode(text)
+            embedding = self.encode_query(text)
 
             # Determine hierarchy level based on context or heuristics
             if context and "hierarchy_level" in context:
@@ -181,6 +205,19 @@ class CognitiveMemorySystem(CognitiveSystem):
             )
             return ""
 
+    def encode_query(self, text: str) -> np.ndarray:
+        """
+        Encode query text, reusing cached embeddings for repeated queries.
+
+        Args:
+            text: Query or experience text to encode
+
+        Returns:
+            Embedding of the text; repeats that differ only in whitespace or
+            Unicode normalization reuse the cached embedding
+        """
+        return self.query_cache.encode(self.embedding_provider, text)
+
     def retrieve_memories(
         self,
         query: str,
@@ -205,9 +242,32 @@ class CognitiveMemorySystem(CognitiveSystem):
         if types is None:
             types = ["core", "peripheral", "bridge"]
 
+        # Per-phase latency of sampled retrievals, in milliseconds
+        sampled = (
+            self.retrieval_telemetry is not None
+            and self.retrieval_telemetry.should_sample()
+        )
+        phase_times: dict[str, float] = {}
+        activation_strengths: dict[str, float] = {}
+        start_time = phase_start = time.perf_counter()
+
+        def start_phase() -> None:
+            # Keeps skipped phases from being charged to the next one that runs
+            nonlocal phase_start
+            phase_start = time.perf_counter()
+
+        def end_phase(phase: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            phase_times[phase] = (
+                phase_times.get(phase, 0.0) + (now - phase_start) * 1000
+            )
+            phase_start = now
+
         try:
             # Encode the query
-            query_embedding = self.embedding_provider.encode(query.strip())
+            query_embedding = self.encode_query(query)
+            end_phase("query_encode")
 
             results: dict[str, list[CognitiveMemory | BridgeMemory]] = {
                 "core": [],
@@ -217,6 +277,7 @@ class CognitiveMemorySystem(CognitiveSystem):
 
             # Activate memories if core or peripheral types requested
             if "core" in types or "peripheral" in types:
+                start_phase()
                 activation_result = self.activation_engine.activate_memories(
                     context=query_embedding,
                     threshold=self.config.cognitive.activation_threshold,
@@ -235,12 +296,20 @@ class CognitiveMemorySystem(CognitiveSystem):
                         activation_result.peripheral_memories[: max_results // 2]
                     )
 
+                end_phase("activation")
+                if sampled:
+                    engine_phases = getattr(activation_result, "phase_times_ms", None)
+                    if isinstance(engine_phases, dict):
+                        phase_times.update(engine_phases)
+                    activation_strengths = activation_result.activation_strengths
+
             # Fallback to direct vector similarity search if no core/peripheral memories found
             if (
                 ("core" in types or "peripheral" in types)
                 and not results["core"]
                 and not results["peripheral"]
             ):
+                start_phase()
                 logger.debug(
                     "No memories activated, falling back to direct vector similarity search"
                 )
@@ -271,8 +340,11 @@ class CognitiveMemorySystem(CognitiveSystem):
                         peripheral_memories.append(result.memory)
                     results["peripheral"].extend(peripheral_memories)
 
+                end_phase("vector_fallback")
+
             # Discover bridge memories if requested
             if "bridge" in types:
+                start_phase()
                 # Use activated memories as input for bridge discovery
                 activated_memories = []
                 if results["core"]:
@@ -302,7 +374,10 @@ class CognitiveMemorySystem(CognitiveSystem):
                     )
                     results["bridge"].extend(bridge_memories)
 
+                end_phase("bridge_discovery")
+
             # Log retrieval statistics
+            start_phase()
             total_retrieved = sum(len(memories) for memories in results.values())
             logger.info(
                 "Memory retrieval completed",
@@ -313,6 +388,13 @@ class CognitiveMemorySystem(CognitiveSystem):
                 peripheral_count=len(results["peripheral"]),
                 bridge_count=len(results["bridge"]),
             )
+            end_phase("response_formatting")
+
+            if sampled and self.retrieval_telemetry is not None:
+                phase_times["total"] = (time.perf_counter() - start_time) * 1000
+                self._record_retrieval_telemetry(
+                    query, phase_times, results, activation_strengths, types
+                )
 
             return results
 
@@ -325,6 +407,29 @@ class CognitiveMemorySystem(CognitiveSystem):
             )
             return {"core": [], "peripheral": [], "bridge": []}
 
+    def _record_retrieval_telemetry(
+        self,
+        query: str,
+        phase_times: dict[str, float],
+        results: dict[str, list[CognitiveMemory | BridgeMemory]],
+        activation_strengths: dict[str, float],
+        types: list[str],
+    ) -> None:
+        """Hand a sampled retrieval to telemetry without failing the retrieval."""
+        if self.retrieval_telemetry is None:
+            return
+
+        try:
+            self.retrieval_telemetry.record(
+                query,
+                phase_times,
+                results,
+                scores=activation_strengths,
+                query_metadata={"types": types},
+            )
+        except Exception as e:
+            logger.warning("Failed to record retrieval telemetry", error=str(e))
+
     def _determine_hierarchy_level(self, text: str) -> int:
         """
         Determine hierarchy level based on content analysis.
@@ -461,7 +566,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                         # Store semantic memory
                         if self.memory_storage.store_memory(semantic_memory):
                             # Re-encode and store in vector storage
-                            embedding = self.embedding_provider.encode(memory.content)
+                            embedding = self._encode_content(memory.content)
                             vector_metadata = {
                                 "memory_id": semantic_memory.id,
                                 "content": semantic_memory.content,
@@ -561,6 +666,17 @@ class CognitiveMemorySystem(CognitiveSystem):
             except Exception as e:
                 logger.debug("Embedding provider info not available", error=str(e))
 
+            stats["query_cache"] = self.query_cache.get_stats()
+            if self.embedding_cache is not None:
+                stats["embedding_cache"] = self.embedding_cache.get_stats()
+            bridge_cache = getattr(self.bridge_discovery, "cache", None)
+            if bridge_cache is not None:
+                stats["bridge_cache"] = bridge_cache.get_stats()
+            if self.retrieval_telemetry is not None:
+                stats["retrieval_latency"] = (
+                    self.retrieval_telemetry.get_latency_percentiles()
+                )
+
             return stats
 
         except Exception as e:
@@ -607,46 +723,16 @@ class CognitiveMemorySystem(CognitiveSystem):
             memories = loader.load_from_source(source_path, **kwargs)
             logger.info(f"Loaded {len(memories)} raw memories from source")
 
-            # Store memories in the system
+            # Store memories in the system, one batch at a time
             stored_count = 0
             failed_count = 0
+            batch_size = max(1, self.config.embedding.batch_size)
 
-            for memory in memories:
-                try:
-                    # Encode the memory content
-                    embedding = self.embedding_provider.encode(memory.content)
-                    memory.cognitive_embedding = embedding
-
-                    # Store in memory persistence
-                    if self.memory_storage.store_memory(memory):
-                        # Store in vector storage with metadata
-                        vector_metadata = {
-                            "memory_id": memory.id,
-                            "content": memory.content,
-                            "memory_type": memory.memory_type,
-                            "hierarchy_level": memory.hierarchy_level,
-                            "timestamp": memory.timestamp.timestamp()
-                            if memory.timestamp
-                            else time.time(),
-                            "source_type": "loaded",
-                            **memory.metadata,
-                        }
-
-                        self.vector_storage.store_vector(
-                            memory.id, embedding, vector_metadata
-                        )
-                        stored_count += 1
-
-                        logger.debug(
-                            f"Stored memory L{memory.hierarchy_level}: {memory.metadata.get('title', 'Untitled')[:50]}"
-                        )
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to store memory: {memory.id}")
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Error storing memory {memory.id}: {e}")
+            for batch_start in range(0, len(memories), batch_size):
+                batch = memories[batch_start : batch_start + batch_size]
+                batch_stored, batch_failed = self._store_loaded_memories(batch)
+                stored_count += batch_stored
+                failed_count += batch_failed
 
             # Extract and store connections
             connections_created = 0
@@ -715,6 +801,198 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "processing_time": processing_time,
             }
 
+    def _store_loaded_memories(
+        self, memories: list[CognitiveMemory]
+    ) -> tuple[int, int]:
+        """
+        Encode and store a batch of loaded memories.
+
+        Encodes the batch with one embedding call, writes the memory rows in
+        one storage transaction, and upserts the vectors in one vector storage
+        call when the backends support batch operations. Falls back to
+        per-memory calls otherwise, and counts failures per memory.
+
+        Args:
+            memories: Batch of memories produced by a loader
+
+        Returns:
+            Tuple of (stored_count, failed_count)
+        """
+        failed_count = 0
+
+        # Phase 1: Encode the batch content
+        encoded = self._encode_loaded_memories(memories)
+        failed_count += len(memories) - len(encoded)
+
+        # Phase 2: Persist memory metadata
+        if hasattr(self.memory_storage, "store_memories_batch"):
+            try:
+                results = self.memory_storage.store_memories_batch(encoded)
+            except Exception as e:
+                logger.error(f"Error storing memory batch: {e}")
+                results = [False] * len(encoded)
+        else:
+            results = []
+            for memory in encoded:
+                try:
+                    results.append(self.memory_storage.store_memory(memory))
+                except Exception as e:
+                    logger.error(f"Error storing memory {memory.id}: {e}")
+                    results.append(False)
+
+        persisted = []
+        for memory, success in zip(encoded, results, strict=True):
+            if success:
+                persisted.append(memory)
+            else:
+                failed_count += 1
+                logger.warning(f"Failed to store memory: {memory.id}")
+
+        # Phase 3: Store vectors with metadata; memories without an embedding
+        # are counted as failed below
+        vector_items = [
+            (
+                memory.id,
+                memory.cognitive_embedding,
+                self._loaded_vector_metadata(memory),
+            )
+            for memory in persisted
+            if memory.cognitive_embedding is not None
+        ]
+
+        if hasattr(self.vector_storage, "store_vectors_batch"):
+            try:
+                vector_ids = set(self.vector_storage.store_vectors_batch(vector_items))
+            except Exception as e:
+                logger.error(f"Error storing vector batch: {e}")
+                vector_ids = set()
+        else:
+            vector_ids = set()
+            for memory_id, embedding, metadata in vector_items:
+                try:
+                    self.vector_storage.store_vector(memory_id, embedding, metadata)
+                    vector_ids.add(memory_id)
+                except Exception as e:
+                    logger.error(f"Error storing memory {memory_id}: {e}")
+
+        stored_count = 0
+        for memory in persisted:
+            if memory.id in vector_ids:
+                stored_count += 1
+                logger.debug(
+                    f"Stored memory L{memory.hierarchy_level}: {memory.metadata.get('title', 'Untitled')[:50]}"
+                )
+            else:
+                failed_count += 1
+
+        return stored_count, failed_count
+
+    def _encode_loaded_memories(
+        self, memories: list[CognitiveMemory]
+    ) -> list[CognitiveMemory]:
+        """
+        Attach cognitive embeddings to a batch of memories.
+
+        Args:
+            memories: Memories to encode
+
+        Returns:
+            Memories that were encoded successfully, in input order
+        """
+        try:
+            embeddings = self._encode_contents([memory.content for memory in memories])
+            if len(embeddings) != len(memories):
+                raise ValueError(
+                    f"Expected {len(memories)} embeddings, got {len(embeddings)}"
+                )
+
+            for memory, embedding in zip(memories, embeddings, strict=True):
+                memory.cognitive_embedding = embedding
+            return list(memories)
+
+        except Exception as e:
+            logger.warning(f"Batch encoding failed, encoding individually: {e}")
+
+        encoded = []
+        for memory in memories:
+            try:
+                memory.cognitive_embedding = self._encode_content(memory.content)
+                encoded.append(memory)
+            except Exception as e:
+                logger.error(f"Error encoding memory {memory.id}: {e}")
+        return encoded
+
+    def _cache_model_id(self) -> str | None:
+        """Get the embedding cache key for the current model, if caching applies."""
+        if self.embedding_cache is None:
+            return None
+        if self._embedding_cache_model_id is None:
+            self._embedding_cache_model_id = get_model_identity(self.embedding_provider)
+        return self._embedding_cache_model_id
+
+    def _encode_contents(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode memory contents in one batch, reusing cached embeddings.
+
+        Only texts missing from the persistent embedding cache are passed to
+        the embedding provider, and their embeddings are cached afterwards.
+
+        Args:
+            texts: Memory contents to encode
+
+        Returns:
+            Embeddings in input order
+        """
+        model_id = self._cache_model_id()
+        if model_id is None or not texts or self.embedding_cache is None:
+            return self.embedding_provider.encode_batch(texts)
+
+        embeddings: list[np.ndarray | None] = self.embedding_cache.get_many(
+            model_id, texts
+        )
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = self.embedding_provider.encode_batch(missing_texts)
+            if len(encoded) != len(missing_texts):
+                raise ValueError(
+                    f"Expected {len(missing_texts)} embeddings, got {len(encoded)}"
+                )
+            self.embedding_cache.put_many(model_id, missing_texts, encoded)
+            for i, embedding in zip(missing, encoded, strict=True):
+                embeddings[i] = embedding
+
+        # Every missing entry has been filled from the provider
+        return np.stack(cast(list[np.ndarray], embeddings))
+
+    def _encode_content(self, text: str) -> np.ndarray:
+        """Encode a single memory content, reusing a cached embedding."""
+        model_id = self._cache_model_id()
+        if model_id is None or self.embedding_cache is None:
+            return self.embedding_provider.encode(text)
+
+        cached = self.embedding_cache.get_many(model_id, [text])[0]
+        if cached is not None:
+            return cached
+
+        embedding = self.embedding_provider.encode(text)
+        self.embedding_cache.put_many(model_id, [text], [embedding])
+        return embedding
+
+    def _loaded_vector_metadata(self, memory: CognitiveMemory) -> dict[str, Any]:
+        """Build vector storage metadata for a memory loaded from a source."""
+        return {
+            "memory_id": memory.id,
+            "content": memory.content,
+            "memory_type": memory.memory_type,
+            "hierarchy_level": memory.hierarchy_level,
+            "timestamp": memory.timestamp.timestamp()
+            if memory.timestamp
+            else time.time(),
+            "source_type": "loaded",
+            **memory.metadata,
+        }
+
     def upsert_memories(self, memories: list[CognitiveMemory]) -> dict[str, Any]:
         """
         Update existing memories or insert new ones using deterministic IDs.
@@ -743,7 +1021,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                         # Update existing memory
                         if self.memory_storage.update_memory(memory):
                             # Update vector storage as well
-                            embedding = self.embedding_provider.encode(memory.content)
+                            embedding = self._encode_content(memory.content)
 
                             # Delete old vector first
                             self.vector_storage.delete_vector(memory.id)
@@ -769,7 +1047,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                         # Insert new memory - store in both memory storage and vector storage
                         if self.memory_storage.store_memory(memory):
                             # Also store in vector storage
-                            embedding = self.embedding_provider.encode(memory.content)
+                            embedding = self._encode_content(memory.content)
                             self.vector_storage.store_vector(
                                 memory.id,
                                 embedding,
@@ -861,20 +1139,24 @@ class CognitiveMemorySystem(CognitiveSystem):
                     "processing_time": time.time() - start_time,
                 }
 
-            # Delete vectors from Qdrant
-            vector_deletion_failures = 0
-            for memory in memories_to_delete:
+            # Delete vectors from Qdrant, by payload filter when supported
+            vector_deletion_failures = None
+            if hasattr(self.vector_storage, "delete_vectors_by_source_path"):
                 try:
-                    success = self.vector_storage.delete_vector(memory.id)
-                    if not success:
-                        vector_deletion_failures += 1
-                        logger.warning("Failed to delete vector", memory_id=memory.id)
+                    if self.vector_storage.delete_vectors_by_source_path(source_path):
+                        vector_deletion_failures = 0
                 except Exception as e:
-                    vector_deletion_failures += 1
-                    logger.error(
-                        "Error deleting vector", memory_id=memory.id, error=str(e)
+                    logger.warning(
+                        "Error deleting vectors by source path",
+                        source_path=source_path,
+                        error=str(e),
                     )
 
+            if vector_deletion_failures is None:
+                vector_deletion_failures = self._delete_memory_vectors(
+                    memories_to_delete
+                )
+
             # Delete memory connections if connection graph exists
             if hasattr(self, "connection_graph") and self.connection_graph:
                 for memory in memories_to_delete:
@@ -928,6 +1210,39 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "error": str(e),
             }
 
+    def _delete_memory_vectors(self, memories: list[CognitiveMemory]) -> int:
+        """
+        Delete the vectors of several memories in bulk.
+
+        Args:
+            memories: Memories whose vectors should be deleted
+
+        Returns:
+            Number of vectors that failed to delete
+        """
+        memory_ids = [memory.id for memory in memories]
+        try:
+            successfully_deleted_vectors = self.vector_storage.delete_vectors_by_ids(
+                memory_ids,
+                hierarchy_levels={
+                    memory.id: memory.hierarchy_level for memory in memories
+                },
+            )
+        except Exception as e:
+            logger.error("Error deleting vectors", count=len(memory_ids), error=str(e))
+            return len(memory_ids)
+
+        vector_deletion_failures = len(memory_ids) - len(successfully_deleted_vectors)
+
+        if vector_deletion_failures > 0:
+            logger.warning(
+                "Some vectors failed to delete",
+                total_vectors=len(memory_ids),
+                failed_count=vector_deletion_failures,
+            )
+
+        return vector_deletion_failures
+
     def delete_memory_by_id(self, memory_id: str) -> dict[str, Any]:
         """
         Delete a single memory by its ID.
@@ -1036,20 +1351,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                 }
 
             # Delete vectors from Qdrant
-            memory_ids = [memory.id for memory in memories_to_delete]
-            successfully_deleted_vectors = self.vector_storage.delete_vectors_by_ids(
-                memory_ids
-            )
-            vector_deletion_failures = len(memory_ids) - len(
-                successfully_deleted_vectors
-            )
-
-            if vector_deletion_failures > 0:
-                logger.warning(
-                    "Some vectors failed to delete",
-                    total_vectors=len(memory_ids),
-                    failed_count=vector_deletion_failures,
-                )
+            vector_deletion_failures = self._delete_memory_vectors(memories_to_delete)
 
             # Delete metadata from SQLite
             deleted_count = self.memory_storage.delete_memories_by_tags(tags)
@@ -1197,6 +1499,194 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "error": error_msg,
             }
 
+    def incremental_reload_memories_from_source(
+        self, loader: Any, source_path: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Reload a modified source by diffing its chunks against stored memories.
+
+        Chunks are identified by (source_path, header path, content hash).
+        Unchanged chunks keep their existing memories, including IDs,
+        embeddings and connections. Only added or changed chunks are encoded
+        and stored, and chunks that vanished from the source are deleted.
+        Connections are re-extracted over the full new chunk set. Unchanged
+        chunks keep their stored metadata, so position fields such as line
+        numbers may lag behind the edited source.
+
+        Only markdown sources are diffed. Other loaders, such as the git
+        history loader, keep their own incremental cursor and parse only new
+        items, so they are reloaded with atomic_reload_memories_from_source.
+        A parse that yields no chunks for a source with stored memories, or
+        a reload whose new chunks fail to store, leaves the stored memories
+        in place.
+
+        Args:
+            loader: MemoryLoader instance to use for loading
+            source_path: Path to the source file
+            **kwargs: Additional loader parameters
+
+        Returns:
+            Dictionary containing the same keys as
+            atomic_reload_memories_from_source, plus memories_unchanged
+        """
+        start_time = time.time()
+        loader_type = loader.__class__.__name__ if loader else "Unknown"
+
+        def failure(error_msg: str, deleted_count: int = 0) -> dict[str, Any]:
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "deleted_count": deleted_count,
+                "memories_loaded": 0,
+                "memories_unchanged": 0,
+                "connections_created": 0,
+                "memories_failed": 0,
+                "connections_failed": 0,
+                "processing_time": time.time() - start_time,
+                "hierarchy_distribution": {},
+                "source_path": source_path,
+                "loader_type": loader_type,
+                "error": error_msg,
+            }
+
+        from ..loaders.markdown_loader import MarkdownMemoryLoader
+
+        if not isinstance(loader, MarkdownMemoryLoader):
+            return self.atomic_reload_memories_from_source(
+                loader, source_path, **kwargs
+            )
+
+        try:
+            if not loader.validate_source(source_path):
+                return failure(f"Source validation failed for {source_path}")
+
+            logger.info(f"Starting incremental reload for source: {source_path}")
+
+            # Step 1: Parse the source before touching stored memories
+            memories = loader.load_from_source(source_path, **kwargs)
+            existing = self.memory_storage.get_memories_by_source_path(source_path)
+
+            if existing and not memories:
+                return failure(
+                    f"Parsing {source_path} produced no chunks, keeping "
+                    f"{len(existing)} stored memories"
+                )
+
+            # Step 2: Match new chunks to stored memories by chunk identity
+            stored_by_key: dict[tuple[Any, ...], list[CognitiveMemory]] = defaultdict(
+                list
+            )
+            for memory in existing:
+                stored_by_key[self._chunk_identity(memory)].append(memory)
+
+            added: list[CognitiveMemory] = []
+            unchanged_count = 0
+            for memory in memories:
+                matches = stored_by_key.get(self._chunk_identity(memory))
+                if matches:
+                    # Reuse the stored ID so connections resolve to it
+                    memory.id = matches.pop().id
+                    unchanged_count += 1
+                else:
+                    added.append(memory)
+
+            vanished = [memory for group in stored_by_key.values() for memory in group]
+
+            # Step 3: Encode and store only the added or changed chunks
+            stored_count = 0
+            failed_count = 0
+            batch_size = max(1, self.config.embedding.batch_size)
+
+            for batch_start in range(0, len(added), batch_size):
+                batch = added[batch_start : batch_start + batch_size]
+                batch_stored, batch_failed = self._store_loaded_memories(batch)
+                stored_count += batch_stored
+                failed_count += batch_failed
+
+            if failed_count > 0:
+                return failure(
+                    f"Failed to store {failed_count} chunks from {source_path}, "
+                    f"keeping {len(vanished)} stored memories they replace"
+                )
+
+            # Step 4: Delete memories whose chunks vanished or changed
+            deleted_count = 0
+            if vanished:
+                self._delete_memory_vectors(vanished)
+                deleted_count = self.memory_storage.delete_memories_by_ids(
+                    [memory.id for memory in vanished]
+                )
+
+            # Step 5: Store connections over the full new chunk set
+            connections_created = 0
+            connections_failed = 0
+
+            if memories:
+                try:
+                    connections = loader.extract_connections(memories)
+
+                    for source_id, target_id, strength, connection_type in connections:
+                        try:
+                            if self.connection_graph.add_connection(
+                                source_id, target_id, strength, connection_type
+                            ):
+                                connections_created += 1
+                            else:
+                                connections_failed += 1
+                        except Exception as e:
+                            connections_failed += 1
+                            logger.debug(
+                                f"Failed to store connection {source_id} -> {target_id}: {e}"
+                            )
+
+                except Exception as e:
+                    logger.error(f"Failed to extract connections: {e}")
+
+            processing_time = time.time() - start_time
+
+            logger.info(
+                f"Incremental reload completed: {unchanged_count} unchanged, "
+                f"deleted {deleted_count}, loaded {stored_count} memories "
+                f"from {source_path}"
+            )
+
+            return {
+                "success": True,
+                "deleted_count": deleted_count,
+                "memories_loaded": stored_count,
+                "memories_unchanged": unchanged_count,
+                "connections_created": connections_created,
+                "memories_failed": failed_count,
+                "connections_failed": connections_failed,
+                "processing_time": processing_time,
+                "hierarchy_distribution": self._calculate_hierarchy_distribution(added),
+                "source_path": source_path,
+                "loader_type": loader_type,
+                "error": None,
+            }
+
+        except Exception as e:
+            return failure(f"Incremental reload failed: {str(e)}")
+
+    @staticmethod
+    def _chunk_identity(memory: CognitiveMemory) -> tuple[Any, ...]:
+        """
+        Build the identity of a loaded chunk for incremental reloads.
+
+        Args:
+            memory: Memory produced by a loader or read back from storage
+
+        Returns:
+            Tuple of (header path, content hash)
+        """
+        metadata = memory.metadata or {}
+        header_path = metadata.get("hierarchical_path") or [metadata.get("title")]
+        content_hash = (
+            metadata.get("content_hash")
+            or hashlib.sha256(memory.content.encode("utf-8")).hexdigest()
+        )
+        return tuple(str(part) for part in header_path), content_hash
+
     def _calculate_hierarchy_distribution(
         self, memories: list[CognitiveMemory]
     ) -> dict[str, int]:
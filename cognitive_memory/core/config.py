@@ -291,6 +291,23 @@ def detect_project_config() -> dict[str, str] | None:
                     if "path" in database:
                         env_overrides["SQLITE_PATH"] = database["path"]
 
+                # Map vector storage settings
+                if "vector_storage" in config_data and isinstance(
+                    config_data["vector_storage"], dict
+                ):
+                    vector_storage = config_data["vector_storage"]
+                    vector_storage_keys = {
+                        "backend": "VECTOR_BACKEND",
+                        "path": "VECTOR_STORAGE_PATH",
+                        "search_mode": "VECTOR_SEARCH_MODE",
+                        "ivf_min_vectors": "VECTOR_IVF_MIN_VECTORS",
+                        "ivf_probes": "VECTOR_IVF_PROBES",
+                        "compaction_ratio": "VECTOR_COMPACTION_RATIO",
+                    }
+                    for key, env_name in vector_storage_keys.items():
+                        if key in vector_storage:
+                            env_overrides[env_name] = str(vector_storage[key])
+
                 # Map logging settings
                 if "logging" in config_data and isinstance(
                     config_data["logging"], dict
@@ -378,6 +395,40 @@ class QdrantConfig:
         )
 
 
+@dataclass
+class VectorStorageConfig:
+    """Configuration for the vector storage backend."""
+
+    # "qdrant" for a Qdrant server, "embedded" for in-process NumPy storage
+    backend: str = "qdrant"
+    # Embedded store directory, empty for "vectors" next to the database
+    path: str = ""
+    search_mode: str = "auto"
+    ivf_min_vectors: int = 100000
+    ivf_probes: int = 0
+    compaction_ratio: float = 0.25
+
+    def resolve_path(self, database_path: str) -> str:
+        """Get the embedded store directory for a database path."""
+        return self.path or str(Path(database_path).parent / "vectors")
+
+    @classmethod
+    def from_env(cls) -> "VectorStorageConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            backend=os.getenv("VECTOR_BACKEND", cls.backend).lower(),
+            path=os.getenv("VECTOR_STORAGE_PATH", cls.path),
+            search_mode=os.getenv("VECTOR_SEARCH_MODE", cls.search_mode).lower(),
+            ivf_min_vectors=int(
+                os.getenv("VECTOR_IVF_MIN_VECTORS", str(cls.ivf_min_vectors))
+            ),
+            ivf_probes=int(os.getenv("VECTOR_IVF_PROBES", str(cls.ivf_probes))),
+            compaction_ratio=float(
+                os.getenv("VECTOR_COMPACTION_RATIO", str(cls.compaction_ratio))
+            ),
+        )
+
+
 @dataclass
 class DatabaseConfig:
     """Configuration for SQLite database."""
@@ -385,6 +436,12 @@ class DatabaseConfig:
     path: str = "./data/cognitive_memory.db"
     backup_interval_hours: int = 24
     enable_wal_mode: bool = True
+    connection_pool_size: int = 8
+    # Write-behind of access and activation statistics, 0 writes through
+    stats_flush_interval: float = 1.0
+    stats_flush_max_pending: int = 1000
+    # Age in days after which sampled retrieval telemetry rows are pruned
+    retrieval_retention_days: float = 7.0
 
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
@@ -395,6 +452,22 @@ class DatabaseConfig:
                 os.getenv("DB_BACKUP_INTERVAL", str(cls.backup_interval_hours))
             ),
             enable_wal_mode=os.getenv("DB_ENABLE_WAL", "true").lower() == "true",
+            connection_pool_size=int(
+                os.getenv("DB_CONNECTION_POOL_SIZE", str(cls.connection_pool_size))
+            ),
+            stats_flush_interval=float(
+                os.getenv("DB_STATS_FLUSH_INTERVAL", str(cls.stats_flush_interval))
+            ),
+            stats_flush_max_pending=int(
+                os.getenv(
+                    "DB_STATS_FLUSH_MAX_PENDING", str(cls.stats_flush_max_pending)
+                )
+            ),
+            retrieval_retention_days=float(
+                os.getenv(
+                    "DB_RETRIEVAL_RETENTION_DAYS", str(cls.retrieval_retention_days)
+                )
+            ),
         )
 
 
@@ -423,6 +496,10 @@ class EmbeddingConfig:
     embedding_dimension: int = 384  # Sentence-BERT semantic embedding dimension
     batch_size: int = 32
     device: str = "auto"  # auto, cpu, cuda
+    query_cache_size: int = 1024  # Cached query embeddings, 0 disables
+    query_cache_max_bytes: int = 16 * 1024 * 1024
+    # Persistent content embedding cache in SQLite, 0 disables
+    embedding_cache_max_bytes: int = 256 * 1024 * 1024
 
     @classmethod
     def from_env(cls) -> "EmbeddingConfig":
@@ -437,6 +514,17 @@ class EmbeddingConfig:
             ),
             batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", str(cls.batch_size))),
             device=os.getenv("EMBEDDING_DEVICE", cls.device),
+            query_cache_size=int(
+                os.getenv("QUERY_CACHE_SIZE", str(cls.query_cache_size))
+            ),
+            query_cache_max_bytes=int(
+                os.getenv("QUERY_CACHE_MAX_BYTES", str(cls.query_cache_max_bytes))
+            ),
+            embedding_cache_max_bytes=int(
+                os.getenv(
+                    "EMBEDDING_CACHE_MAX_BYTES", str(cls.embedding_cache_max_bytes)
+                )
+            ),
         )
 
 
@@ -447,7 +535,12 @@ class CognitiveConfig:
     # Activation and retrieval parameters
     activation_threshold: float = 0.7
     bridge_discovery_k: int = 5
+    bridge_cache_ttl_hours: int = 168  # Cached bridge results, 0 disables
     max_activations: int = 50
+
+    # Sampled per-phase retrieval latency telemetry, sample rate 0 disables
+    retrieval_telemetry_sample_rate: float = 0.1
+    retrieval_telemetry_window_minutes: float = 60.0
     consolidation_threshold: int = 100
 
     # Activity tracking parameters for context-aware decay
@@ -520,6 +613,8 @@ class CognitiveConfig:
     max_merge_children: int = 5
     max_hierarchical_depth: int = 4
     max_connections_per_memory: int = 10
+    connection_exact_pair_limit: int = 300
+    connection_candidate_neighbors: int = 20
 
     # Base connection weights
     hierarchical_weight: float = 0.80
@@ -542,6 +637,21 @@ class CognitiveConfig:
             bridge_discovery_k=int(
                 os.getenv("BRIDGE_DISCOVERY_K", str(cls.bridge_discovery_k))
             ),
+            bridge_cache_ttl_hours=int(
+                os.getenv("BRIDGE_CACHE_TTL_HOURS", str(cls.bridge_cache_ttl_hours))
+            ),
+            retrieval_telemetry_sample_rate=float(
+                os.getenv(
+                    "RETRIEVAL_TELEMETRY_SAMPLE_RATE",
+                    str(cls.retrieval_telemetry_sample_rate),
+                )
+            ),
+            retrieval_telemetry_window_minutes=float(
+                os.getenv(
+                    "RETRIEVAL_TELEMETRY_WINDOW_MINUTES",
+                    str(cls.retrieval_telemetry_window_minutes),
+                )
+            ),
             max_activations=int(os.getenv("MAX_ACTIVATIONS", str(cls.max_activations))),
             consolidation_threshold=int(
                 os.getenv("CONSOLIDATION_THRESHOLD", str(cls.consolidation_threshold))
@@ -590,6 +700,17 @@ class CognitiveConfig:
                 os.getenv("CODE_BLOCK_LINES", str(cls.code_block_lines))
             ),
             strength_floor=float(os.getenv("STRENGTH_FLOOR", str(cls.strength_floor))),
+            connection_exact_pair_limit=int(
+                os.getenv(
+                    "CONNECTION_EXACT_PAIR_LIMIT", str(cls.connection_exact_pair_limit)
+                )
+            ),
+            connection_candidate_neighbors=int(
+                os.getenv(
+                    "CONNECTION_CANDIDATE_NEIGHBORS",
+                    str(cls.connection_candidate_neighbors),
+                )
+            ),
             hierarchical_weight=float(
                 os.getenv("HIERARCHICAL_WEIGHT", str(cls.hierarchical_weight))
             ),
@@ -783,6 +904,7 @@ class SystemConfig:
     embedding: EmbeddingConfig
     cognitive: CognitiveConfig
     logging: LoggingConfig
+    vector_storage: VectorStorageConfig = field(default_factory=VectorStorageConfig)
 
     # System-wide settings
     debug: bool = False
@@ -821,6 +943,7 @@ class SystemConfig:
             embedding=EmbeddingConfig.from_env(),
             cognitive=CognitiveConfig.from_env(),
             logging=LoggingConfig.from_env(),
+            vector_storage=VectorStorageConfig.from_env(),
             debug=os.getenv("DEBUG", "false").lower() == "true",
             max_memory_usage_mb=int(os.getenv("MAX_MEMORY_USAGE_MB", "1024")),
             cleanup_interval_hours=int(os.getenv("CLEANUP_INTERVAL_HOURS", "24")),
@@ -859,6 +982,12 @@ class SystemConfig:
         if self.cognitive.max_activations <= 0:
             errors.append("Max activations must be positive")
 
+        if not 0.0 <= self.cognitive.retrieval_telemetry_sample_rate <= 1.0:
+            errors.append("Retrieval telemetry sample rate must be between 0.0 and 1.0")
+
+        if self.database.retrieval_retention_days <= 0:
+            errors.append("Retrieval retention days must be positive")
+
         # Check dimension weights sum to reasonable range
         total_weight = (
             self.cognitive.emotional_weight
@@ -944,6 +1073,22 @@ class SystemConfig:
         if self.cognitive.low_activity_multiplier <= 0:
             errors.append("Low activity multiplier must be positive")
 
+        # Validate vector storage parameters
+        if self.vector_storage.backend not in ("qdrant", "embedded"):
+            errors.append(
+                f"Vector backend must be 'qdrant' or 'embedded', got "
+                f"{self.vector_storage.backend!r}"
+            )
+
+        if self.vector_storage.search_mode not in ("auto", "exact", "ivf"):
+            errors.append("Vector search mode must be 'auto', 'exact' or 'ivf'")
+
+        if self.vector_storage.ivf_probes < 0:
+            errors.append("Vector IVF probes must not be negative")
+
+        if not 0.0 < self.vector_storage.compaction_ratio <= 1.0:
+            errors.append("Vector compaction ratio must be between 0.0 and 1.0")
+
         # Validate monitoring parameters
         if self.cognitive.monitoring_interval_seconds <= 0:
             errors.append("Monitoring interval must be positive")
@@ -979,6 +1124,18 @@ class SystemConfig:
                 "path": self.database.path,
                 "backup_interval_hours": self.database.backup_interval_hours,
                 "enable_wal_mode": self.database.enable_wal_mode,
+                "connection_pool_size": self.database.connection_pool_size,
+                "stats_flush_interval": self.database.stats_flush_interval,
+                "stats_flush_max_pending": self.database.stats_flush_max_pending,
+                "retrieval_retention_days": self.database.retrieval_retention_days,
+            },
+            "vector_storage": {
+                "backend": self.vector_storage.backend,
+                "path": self.vector_storage.resolve_path(self.database.path),
+                "search_mode": self.vector_storage.search_mode,
+                "ivf_min_vectors": self.vector_storage.ivf_min_vectors,
+                "ivf_probes": self.vector_storage.ivf_probes,
+                "compaction_ratio": self.vector_storage.compaction_ratio,
             },
             "embedding": {
                 "model_name": self.embedding.model_name,
@@ -990,6 +1147,10 @@ class SystemConfig:
             "cognitive": {
                 "activation_threshold": self.cognitive.activation_threshold,
                 "bridge_discovery_k": self.cognitive.bridge_discovery_k,
+                "bridge_cache_ttl_hours": self.cognitive.bridge_cache_ttl_hours,
+                "retrieval_telemetry_sample_rate": (
+                    self.cognitive.retrieval_telemetry_sample_rate
+                ),
                 "max_activations": self.cognitive.max_activations,
                 "consolidation_threshold": self.cognitive.consolidation_threshold,
                 "dimension_weights": {
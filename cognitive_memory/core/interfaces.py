@@ -6,12 +6,16 @@ testing, and scaling as outlined in the technical specification.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 from .memory import ActivationResult, BridgeMemory, CognitiveMemory, SearchResult
 
+if TYPE_CHECKING:
+    from ..storage.embedding_index import LevelEmbeddingIndex
+
 
 class EmbeddingProvider(ABC):
     """Abstract interface for embedding models."""
@@ -57,8 +61,15 @@ class VectorStorage(ABC):
         pass
 
     @abstractmethod
-    def delete_vectors_by_ids(self, memory_ids: list[str]) -> list[str]:
-        """Delete vectors by their IDs. Returns list of successfully deleted memory IDs."""
+    def delete_vectors_by_ids(
+        self, memory_ids: list[str], hierarchy_levels: dict[str, int] | None = None
+    ) -> list[str]:
+        """
+        Delete vectors by their IDs. Returns list of successfully deleted memory IDs.
+
+        hierarchy_levels optionally maps IDs to their known level so backends
+        that partition vectors by level can skip the other partitions.
+        """
         pass
 
 
@@ -146,6 +157,37 @@ class MemoryStorage(ABC):
         """Delete memories by their IDs. Returns count of deleted memories."""
         pass
 
+    def get_memories_by_ids(self, memory_ids: Sequence[str]) -> list[CognitiveMemory]:
+        """
+        Get memories by their IDs.
+
+        The default implementation retrieves memories one at a time. Override
+        it to load them in a single query without updating access statistics.
+
+        Args:
+            memory_ids: Memory IDs to fetch
+
+        Returns:
+            Found memories in the order of the requested IDs
+        """
+        memories = (self.retrieve_memory(memory_id) for memory_id in memory_ids)
+        return [memory for memory in memories if memory is not None]
+
+    def get_level_index(self, level: int) -> "LevelEmbeddingIndex | None":
+        """
+        Get a resident embedding index for a hierarchy level.
+
+        Storages without one return None, and callers fall back to
+        get_memories_by_level().
+
+        Args:
+            level: Hierarchy level (0, 1, or 2)
+
+        Returns:
+            Synchronized LevelEmbeddingIndex, or None if not supported
+        """
+        return None
+
 
 class ConnectionGraph(ABC):
     """Abstract interface for memory connection tracking."""
@@ -350,6 +392,28 @@ class CognitiveSystem(ABC):
         """
         pass
 
+    @abstractmethod
+    def incremental_reload_memories_from_source(
+        self, loader: MemoryLoader, source_path: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Reload a modified source, re-encoding only chunks that changed.
+
+        Unchanged chunks keep their memories and connections, added or changed
+        chunks are stored, and chunks no longer in the source are deleted.
+        Loaders that only parse new items, such as git history, are reloaded
+        atomically instead.
+
+        Args:
+            loader: MemoryLoader instance to use
+            source_path: Path to the source content
+            **kwargs: Additional parameters for the loader
+
+        Returns:
+            Dictionary containing combined operation results and statistics
+        """
+        pass
+
     @abstractmethod
     def retrieve_memory(self, memory_id: str) -> CognitiveMemory | None:
         """Retrieve a memory by ID."""
@@ -164,6 +164,8 @@ class ActivationResult:
     activation_strengths: dict[str, float] = field(default_factory=dict)
     total_activated: int = 0
     activation_time_ms: float = 0.0
+    # Breakdown of activation_time_ms by phase, e.g. l0_load and activation_bfs
+    phase_times_ms: dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         self.total_activated = len(self.core_memories) + len(self.peripheral_memories)
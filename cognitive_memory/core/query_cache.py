@@ -0,0 +1,183 @@
+"""
+LRU cache of query embeddings.
+
+Agents tend to repeat the same or near-identical queries within a session,
+and every repeat would otherwise pay a full forward pass through the
+embedding model. Entries are keyed by the embedding model identity and the
+whitespace-normalized text, while the model still embeds the text as given.
+The cache is bounded both by entry count and by the total bytes held in
+cached vectors.
+"""
+
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .interfaces import EmbeddingProvider
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize text for cache lookup: NFC form with collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def get_model_identity(provider: EmbeddingProvider) -> str | None:
+    """
+    Identify the model behind an embedding provider.
+
+    Built from the model name, version, embedding dimension and maximum
+    sequence length reported by get_model_info(), since any of them changes
+    the vectors produced for the same text.
+
+    Returns:
+        Stable identity string, or None if the provider does not report a model
+    """
+    get_model_info = getattr(provider, "get_model_info", None)
+    if not callable(get_model_info):
+        return None
+
+    try:
+        info = get_model_info()
+    except Exception:
+        return None
+
+    model_name = info.get("model_name") if isinstance(info, dict) else None
+    if not model_name:
+        return None
+
+    return ":".join(
+        str(part)
+        for part in (
+            type(provider).__name__,
+            model_name,
+            info.get("model_version", ""),
+            info.get("embedding_dimension", ""),
+            info.get("max_sequence_length", ""),
+        )
+    )
+
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe, size-aware LRU cache of query embeddings.
+
+    Cached vectors are stored read-only and returned as copies so callers
+    cannot corrupt an entry by modifying the array they receive.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached embeddings (0 disables caching)
+            max_bytes: Maximum total bytes of cached vectors
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._model_identities: dict[int, str] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache holds any entries at all."""
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def encode(self, provider: EmbeddingProvider, text: str) -> np.ndarray:
+        """
+        Encode text through the cache.
+
+        Args:
+            provider: Embedding provider used on a cache miss
+            text: Query text to encode
+
+        Returns:
+            Embedding of the text, or of the first cached text that normalizes
+            to the same key
+        """
+        if not self.enabled:
+            return provider.encode(text)
+
+        key = (self._model_identity(provider), normalize_query_text(text))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        embedding = provider.encode(text)
+        self.put(key, embedding)
+        return embedding
+
+    def get(self, key: tuple[str, str]) -> np.ndarray | None:
+        """Look up an embedding and mark it most recently used."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding.copy()
+
+    def put(self, key: tuple[str, str], embedding: np.ndarray) -> None:
+        """Cache an embedding, evicting least recently used entries as needed."""
+        stored = np.array(embedding, copy=True)
+        stored.setflags(write=False)
+        size = stored.nbytes + len(key[1])
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes + len(key[1])
+
+            self._entries[key] = stored
+            self._bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes + len(evicted_key[1])
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and current cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _model_identity(self, provider: EmbeddingProvider) -> str:
+        """Get the model identity for a provider, computed once per provider."""
+        identity = self._model_identities.get(id(provider))
+        if identity is None:
+            identity = get_model_identity(provider) or (
+                f"{type(provider).__name__}:{id(provider)}"
+            )
+            self._model_identities[id(provider)] = identity
+        return identity
@@ -295,22 +295,18 @@ class CognitiveEncoder:
             semantic_embeddings = self.semantic_provider.encode_batch(texts)
 
             # Extract cognitive dimensions for all texts
-            batch_cognitive_dims = []
-            for text in texts:
-                dimension_dict = self.dimension_extractor.extract_dimensions(text)
-                cognitive_dims = np.concatenate(
-                    [
-                        dimension_dict["emotional"],
-                        dimension_dict["temporal"],
-                        dimension_dict["contextual"],
-                        dimension_dict["social"],
-                    ],
-                    axis=0,
-                )
-                batch_cognitive_dims.append(cognitive_dims)
-
-            # Stack cognitive dimensions into batch array
-            cognitive_dims_batch = np.stack(batch_cognitive_dims, axis=0)
+            dimension_batch = self.dimension_extractor.extract_batch(texts)
+
+            # Concatenate dimension categories into batch array
+            cognitive_dims_batch = np.concatenate(
+                [
+                    dimension_batch["emotional"],
+                    dimension_batch["temporal"],
+                    dimension_batch["contextual"],
+                    dimension_batch["social"],
+                ],
+                axis=1,
+            )
 
             # Fuse through linear layer
             cognitive_embeddings = self.fusion_layer.forward(
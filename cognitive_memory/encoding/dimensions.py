@@ -8,27 +8,81 @@ This module implements extractors for the four cognitive dimensions:
 - Social (3D): collaboration, support, interaction patterns
 
 Each extractor analyzes text using rule-based patterns and returns
-normalized dimensional vectors suitable for cognitive fusion.
+normalized dimensional vectors suitable for cognitive fusion. Patterns are
+compiled once and counted in a single scan of the text; the combined
+extractor scans once for all four extractors.
 """
 
-import re
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Sequence
 
 import numpy as np
 from nrclex import NRCLex
+from textblob.tokenizers import word_tokenize
 
 from ..core.config import CognitiveConfig
 from ..core.interfaces import DimensionExtractor
+from .pattern_matcher import PatternMatcher
+
+
+def nrc_affect_frequencies(text: str) -> dict[str, float]:
+    """
+    Compute NRCLex affect frequencies for text.
+
+    Equivalent to NRCLex(text).affect_frequencies without building an NRCLex
+    object, which also segments sentences and ranks top emotions.
+
+    Args:
+        text: Original (not lowercased) text
+
+    Returns:
+        Fraction of lexicon affect hits for each affect found
+    """
+    affect_counts: Counter[str] = Counter()
+    for word in word_tokenize(text, include_punc=False):
+        affects = NRCLex.lexicon.get(word)
+        if affects:
+            affect_counts.update(affects)
+
+    total = sum(affect_counts.values())
+    return {affect: count / total for affect, count in affect_counts.items()}
 
 
 class BaseDimensionExtractor(ABC):
     """Abstract base class for individual dimension extractors."""
 
+    # Score contributed by each pattern match
+    match_weight = 0.2
+
+    _matcher: PatternMatcher | None = None
+
     @abstractmethod
     def extract(self, text: str) -> np.ndarray:
         """Extract dimensional features from text."""
         pass
 
+    @abstractmethod
+    def get_patterns(self) -> dict[str, list[str]]:
+        """Get the regex patterns counted for each scoring category."""
+        pass
+
+    @abstractmethod
+    def score(self, text: str, counts: dict[str, int]) -> np.ndarray:
+        """Compute dimensions from text and its per-category match counts."""
+        pass
+
+    @property
+    def matcher(self) -> PatternMatcher:
+        """Compiled matcher for this extractor's patterns."""
+        if self._matcher is None:
+            self._matcher = PatternMatcher(self.get_patterns())
+        return self._matcher
+
+    def _pattern_score(self, matches: int) -> float:
+        """Calculate score based on the number of pattern matches."""
+        return min(1.0, matches * self.match_weight)
+
     @abstractmethod
     def get_dimension_names(self) -> list[str]:
         """Get names of the dimensions extracted."""
@@ -66,28 +120,32 @@ class EmotionalExtractor(BaseDimensionExtractor):
             r"\b(anxious|panic|rush|hurry|emergency)\b",
         ]
 
+    def get_patterns(self) -> dict[str, list[str]]:
+        """Get the regex patterns counted for each emotional dimension."""
+        return {
+            "frustration": self.frustration_patterns,
+            "satisfaction": self.satisfaction_patterns,
+            "curiosity": self.curiosity_patterns,
+            "stress": self.stress_patterns,
+        }
+
     def extract(self, text: str) -> np.ndarray:
         """Extract emotional dimensions from text using NRCLex."""
         if not text or not text.strip():
             return np.zeros(self.config.emotional_dimensions, dtype=np.float32)
 
-        text_lower = text.lower()
+        return self.score(text, self.matcher.count(text.lower()))
 
+    def score(self, text: str, counts: dict[str, int]) -> np.ndarray:
+        """Combine pattern match counts with NRCLex emotion analysis."""
         # Calculate pattern-based scores
-        frustration_pattern = self._calculate_pattern_score(
-            text_lower, self.frustration_patterns
-        )
-        satisfaction_pattern = self._calculate_pattern_score(
-            text_lower, self.satisfaction_patterns
-        )
-        curiosity_pattern = self._calculate_pattern_score(
-            text_lower, self.curiosity_patterns
-        )
-        stress_pattern = self._calculate_pattern_score(text_lower, self.stress_patterns)
+        frustration_pattern = self._pattern_score(counts["frustration"])
+        satisfaction_pattern = self._pattern_score(counts["satisfaction"])
+        curiosity_pattern = self._pattern_score(counts["curiosity"])
+        stress_pattern = self._pattern_score(counts["stress"])
 
         # Enhance with NRCLex emotion analysis
-        nrc_emotion = NRCLex(text)
-        nrc_scores = nrc_emotion.affect_frequencies
+        nrc_scores = nrc_affect_frequencies(text)
 
         # Map NRC emotions to cognitive dimensions
         # NRC provides: anger, fear, anticipation, trust, surprise, sadness, joy, disgust
@@ -117,14 +175,6 @@ class EmotionalExtractor(BaseDimensionExtractor):
 
         return dimensions
 
-    def _calculate_pattern_score(self, text: str, patterns: list[str]) -> float:
-        """Calculate score based on pattern matches."""
-        total_score = 0.0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            total_score += matches * 0.2  # Each match contributes 0.2
-        return min(1.0, total_score)
-
     def get_dimension_names(self) -> list[str]:
         """Get names of emotional dimensions."""
         return ["frustration", "satisfaction", "curiosity", "stress"]
@@ -133,6 +183,8 @@ class EmotionalExtractor(BaseDimensionExtractor):
 class TemporalExtractor(BaseDimensionExtractor):
     """Extract temporal dimensions: urgency, deadline pressure, time context."""
 
+    match_weight = 0.25
+
     def __init__(self, config: CognitiveConfig) -> None:
         self.config = config
         self.urgency_patterns = [
@@ -153,26 +205,38 @@ class TemporalExtractor(BaseDimensionExtractor):
             r"\b(this (week|month|year)|next (week|month))\b",
         ]
 
+        # Presence of these boosts urgency and deadline pressure
+        self.urgency_boost_patterns = [r"\b(today|now|immediately)\b"]
+        self.deadline_boost_patterns = [r"\b(tomorrow|due|deadline)\b"]
+
+    def get_patterns(self) -> dict[str, list[str]]:
+        """Get the regex patterns counted for each temporal dimension and boost."""
+        return {
+            "urgency": self.urgency_patterns,
+            "deadline_pressure": self.deadline_patterns,
+            "time_context": self.time_context_patterns,
+            "urgency_boost": self.urgency_boost_patterns,
+            "deadline_boost": self.deadline_boost_patterns,
+        }
+
     def extract(self, text: str) -> np.ndarray:
         """Extract temporal dimensions from text."""
         if not text or not text.strip():
             return np.zeros(self.config.temporal_dimensions, dtype=np.float32)
 
-        text_lower = text.lower()
+        return self.score(text, self.matcher.count(text.lower()))
 
-        urgency = self._calculate_pattern_score(text_lower, self.urgency_patterns)
-        deadline_pressure = self._calculate_pattern_score(
-            text_lower, self.deadline_patterns
-        )
-        time_context = self._calculate_pattern_score(
-            text_lower, self.time_context_patterns
-        )
+    def score(self, text: str, counts: dict[str, int]) -> np.ndarray:
+        """Compute temporal dimensions from pattern match counts."""
+        urgency = self._pattern_score(counts["urgency"])
+        deadline_pressure = self._pattern_score(counts["deadline_pressure"])
+        time_context = self._pattern_score(counts["time_context"])
 
         # Boost urgency if specific time indicators are present
-        if re.search(r"\b(today|now|immediately)\b", text_lower):
+        if counts["urgency_boost"]:
             urgency = min(1.0, urgency + 0.3)
 
-        if re.search(r"\b(tomorrow|due|deadline)\b", text_lower):
+        if counts["deadline_boost"]:
             deadline_pressure = min(1.0, deadline_pressure + 0.2)
 
         dimensions = np.array(
@@ -181,14 +245,6 @@ class TemporalExtractor(BaseDimensionExtractor):
 
         return dimensions
 
-    def _calculate_pattern_score(self, text: str, patterns: list[str]) -> float:
-        """Calculate score based on pattern matches."""
-        total_score = 0.0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            total_score += matches * 0.25  # Each match contributes 0.25
-        return min(1.0, total_score)
-
     def get_dimension_names(self) -> list[str]:
         """Get names of temporal dimensions."""
         return ["urgency", "deadline_pressure", "time_context"]
@@ -235,54 +291,40 @@ class ContextualExtractor(BaseDimensionExtractor):
             r"\b(my own|by myself|independently)\b",
         ]
 
+    def get_patterns(self) -> dict[str, list[str]]:
+        """Get the regex patterns counted for each contextual dimension."""
+        return {
+            "work_context": self.work_context_patterns,
+            "technical_context": self.technical_patterns,
+            "creative_context": self.creative_patterns,
+            "analytical_context": self.analytical_patterns,
+            "collaborative_context": self.collaborative_patterns,
+            "individual_context": self.individual_patterns,
+        }
+
     def extract(self, text: str) -> np.ndarray:
         """Extract contextual dimensions from text."""
         if not text or not text.strip():
             return np.zeros(self.config.contextual_dimensions, dtype=np.float32)
 
-        text_lower = text.lower()
-
-        work_context = self._calculate_pattern_score(
-            text_lower, self.work_context_patterns
-        )
-        technical_context = self._calculate_pattern_score(
-            text_lower, self.technical_patterns
-        )
-        creative_context = self._calculate_pattern_score(
-            text_lower, self.creative_patterns
-        )
-        analytical_context = self._calculate_pattern_score(
-            text_lower, self.analytical_patterns
-        )
-        collaborative_context = self._calculate_pattern_score(
-            text_lower, self.collaborative_patterns
-        )
-        individual_context = self._calculate_pattern_score(
-            text_lower, self.individual_patterns
-        )
+        return self.score(text, self.matcher.count(text.lower()))
 
+    def score(self, text: str, counts: dict[str, int]) -> np.ndarray:
+        """Compute contextual dimensions from pattern match counts."""
         dimensions = np.array(
             [
-                work_context,
-                technical_context,
-                creative_context,
-                analytical_context,
-                collaborative_context,
-                individual_context,
+                self._pattern_score(counts["work_context"]),
+                self._pattern_score(counts["technical_context"]),
+                self._pattern_score(counts["creative_context"]),
+                self._pattern_score(counts["analytical_context"]),
+                self._pattern_score(counts["collaborative_context"]),
+                self._pattern_score(counts["individual_context"]),
             ],
             dtype=np.float32,
         )
 
         return dimensions
 
-    def _calculate_pattern_score(self, text: str, patterns: list[str]) -> float:
-        """Calculate score based on pattern matches."""
-        total_score = 0.0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            total_score += matches * 0.2  # Each match contributes 0.2
-        return min(1.0, total_score)
-
     def get_dimension_names(self) -> list[str]:
         """Get names of contextual dimensions."""
         return [
@@ -298,6 +340,8 @@ class ContextualExtractor(BaseDimensionExtractor):
 class SocialExtractor(BaseDimensionExtractor):
     """Extract social dimensions: collaboration, support, interaction patterns."""
 
+    match_weight = 0.25
+
     def __init__(self, config: CognitiveConfig) -> None:
         self.config = config
         self.collaboration_patterns = [
@@ -318,41 +362,45 @@ class SocialExtractor(BaseDimensionExtractor):
             r"\b(present|demonstrate|show|teach)\b",
         ]
 
+        # Team-oriented and help-seeking language boost collaboration and support
+        self.collaboration_boost_patterns = [r"\b(we|us|our|team|together)\b"]
+        self.support_boost_patterns = [r"\b(need help|can you|would you|please)\b"]
+
+    def get_patterns(self) -> dict[str, list[str]]:
+        """Get the regex patterns counted for each social dimension and boost."""
+        return {
+            "collaboration": self.collaboration_patterns,
+            "support": self.support_patterns,
+            "interaction": self.interaction_patterns,
+            "collaboration_boost": self.collaboration_boost_patterns,
+            "support_boost": self.support_boost_patterns,
+        }
+
     def extract(self, text: str) -> np.ndarray:
         """Extract social dimensions from text."""
         if not text or not text.strip():
             return np.zeros(self.config.social_dimensions, dtype=np.float32)
 
-        text_lower = text.lower()
+        return self.score(text, self.matcher.count(text.lower()))
 
-        collaboration = self._calculate_pattern_score(
-            text_lower, self.collaboration_patterns
-        )
-        support = self._calculate_pattern_score(text_lower, self.support_patterns)
-        interaction = self._calculate_pattern_score(
-            text_lower, self.interaction_patterns
-        )
+    def score(self, text: str, counts: dict[str, int]) -> np.ndarray:
+        """Compute social dimensions from pattern match counts."""
+        collaboration = self._pattern_score(counts["collaboration"])
+        support = self._pattern_score(counts["support"])
+        interaction = self._pattern_score(counts["interaction"])
 
         # Boost collaboration if team-oriented language is present
-        if re.search(r"\b(we|us|our|team|together)\b", text_lower):
+        if counts["collaboration_boost"]:
             collaboration = min(1.0, collaboration + 0.2)
 
         # Boost support if help-seeking language is present
-        if re.search(r"\b(need help|can you|would you|please)\b", text_lower):
+        if counts["support_boost"]:
             support = min(1.0, support + 0.2)
 
         dimensions = np.array([collaboration, support, interaction], dtype=np.float32)
 
         return dimensions
 
-    def _calculate_pattern_score(self, text: str, patterns: list[str]) -> float:
-        """Calculate score based on pattern matches."""
-        total_score = 0.0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            total_score += matches * 0.25  # Each match contributes 0.25
-        return min(1.0, total_score)
-
     def get_dimension_names(self) -> list[str]:
         """Get names of social dimensions."""
         return ["collaboration", "support", "interaction"]
@@ -373,45 +421,78 @@ class CognitiveDimensionExtractor(DimensionExtractor):
         self.contextual_extractor = ContextualExtractor(config)
         self.social_extractor = SocialExtractor(config)
 
+        self._extractors: dict[str, BaseDimensionExtractor] = {
+            "emotional": self.emotional_extractor,
+            "temporal": self.temporal_extractor,
+            "contextual": self.contextual_extractor,
+            "social": self.social_extractor,
+        }
+
+        # One matcher over every extractor's patterns, keyed by (category, name)
+        self.matcher = PatternMatcher(
+            {
+                (category, name): patterns
+                for category, extractor in self._extractors.items()
+                for name, patterns in extractor.get_patterns().items()
+            }
+        )
+
     def extract_dimensions(self, text: str) -> dict[str, np.ndarray]:
         """Extract all cognitive dimensions from text."""
         if not text or not text.strip():
             # Return zero tensors for empty text
-            return {
-                "emotional": np.zeros(
-                    self.config.emotional_dimensions, dtype=np.float32
-                ),
-                "temporal": np.zeros(self.config.temporal_dimensions, dtype=np.float32),
-                "contextual": np.zeros(
-                    self.config.contextual_dimensions, dtype=np.float32
-                ),
-                "social": np.zeros(self.config.social_dimensions, dtype=np.float32),
-            }
+            return self._zero_dimensions()
 
         try:
-            emotional_dims = self.emotional_extractor.extract(text)
-            temporal_dims = self.temporal_extractor.extract(text)
-            contextual_dims = self.contextual_extractor.extract(text)
-            social_dims = self.social_extractor.extract(text)
-
-            return {
-                "emotional": emotional_dims,
-                "temporal": temporal_dims,
-                "contextual": contextual_dims,
-                "social": social_dims,
-            }
+            return self._extract(text)
         except Exception:
             # Fallback to zero tensors on any extraction error
-            return {
-                "emotional": np.zeros(
-                    self.config.emotional_dimensions, dtype=np.float32
-                ),
-                "temporal": np.zeros(self.config.temporal_dimensions, dtype=np.float32),
-                "contextual": np.zeros(
-                    self.config.contextual_dimensions, dtype=np.float32
-                ),
-                "social": np.zeros(self.config.social_dimensions, dtype=np.float32),
-            }
+            return self._zero_dimensions()
+
+    def extract_batch(self, texts: Sequence[str]) -> dict[str, np.ndarray]:
+        """
+        Extract all cognitive dimensions from several texts.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Dimensions per category, stacked into [len(texts), dimensions]
+            arrays in input order
+        """
+        rows = [self.extract_dimensions(text) for text in texts]
+        return {
+            category: (
+                np.stack([row[category] for row in rows], axis=0)
+                if rows
+                else np.zeros((0, zeros.shape[0]), dtype=np.float32)
+            )
+            for category, zeros in self._zero_dimensions().items()
+        }
+
+    def _extract(self, text: str) -> dict[str, np.ndarray]:
+        """Scan text once and score every extractor from the shared counts."""
+        counts = self.matcher.count(text.lower())
+
+        category_counts: dict[str, dict[str, int]] = {
+            category: {} for category in self._extractors
+        }
+        for (category, name), count in counts.items():
+            category_counts[category][name] = count
+
+        return {
+            category: extractor.score(text, category_counts[category])
+            for category, extractor in self._extractors.items()
+        }
+
+    def _zero_dimensions(self) -> dict[str, np.ndarray]:
+        """Zero tensors for every category."""
+        return {
+            "emotional": np.zeros(self.config.emotional_dimensions, dtype=np.float32),
+            "temporal": np.zeros(self.config.temporal_dimensions, dtype=np.float32),
+            "contextual": np.zeros(self.config.contextual_dimensions, dtype=np.float32),
+            "social": np.zeros(self.config.social_dimensions, dtype=np.float32),
+        }
 
     def get_all_dimension_names(self) -> dict[str, list[str]]:
         """Get names of all dimensions organized by category."""
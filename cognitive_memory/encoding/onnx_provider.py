@@ -160,6 +160,7 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
                 raise FileNotFoundError(f"Tokenizer file not found: {tokenizer_file}")
 
             self.tokenizer = Tokenizer.from_file(str(tokenizer_file))
+            self._configure_tokenizer()
 
             logger.debug("Tokenizer loaded successfully")
 
@@ -167,6 +168,51 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
             logger.error("Failed to load tokenizer", error=str(e))
             raise
 
+    def _configure_tokenizer(self) -> None:
+        """Truncate natively to max_length and leave padding to batch assembly."""
+        padding = self.tokenizer.padding or {}
+        self.pad_id = int(padding.get("pad_id", 0))
+
+        self.tokenizer.enable_truncation(max_length=self.max_length)
+        self.tokenizer.no_padding()
+
+    def _tokenize(self, texts: list[str]) -> list[list[int]]:
+        """
+        Tokenize texts into truncated, unpadded token ID sequences.
+
+        Args:
+            texts: Input texts to tokenize
+
+        Returns:
+            Token IDs for each text, at most max_length long
+        """
+        return [encoding.ids for encoding in self.tokenizer.encode_batch(texts)]
+
+    def _pad_token_ids(
+        self, token_ids: list[list[int]], pad_to_max_length: bool = False
+    ) -> dict[str, np.ndarray]:
+        """
+        Pad token ID sequences into model input arrays.
+
+        Args:
+            token_ids: Unpadded token IDs for each text
+            pad_to_max_length: Pad to max_length instead of the longest
+                sequence in the batch, to measure fixed-length padding
+
+        Returns:
+            Dictionary with input_ids and attention_mask as numpy arrays
+        """
+        lengths = [len(ids) for ids in token_ids]
+        width = self.max_length if pad_to_max_length else max(lengths, default=0)
+
+        input_ids = np.full((len(token_ids), width), self.pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(token_ids), width), dtype=np.int64)
+        for row, (ids, length) in enumerate(zip(token_ids, lengths, strict=True)):
+            input_ids[row, :length] = ids
+            attention_mask[row, :length] = 1
+
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
     def _tokenize_text(self, text: str) -> dict[str, np.ndarray]:
         """
         Tokenize text using the loaded tokenizer.
@@ -177,30 +223,11 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
         Returns:
             Dictionary with input_ids and attention_mask as numpy arrays
         """
-        # Tokenize the text
-        encoding = self.tokenizer.encode(text)
-
-        # Get token IDs and create attention mask
-        input_ids = encoding.ids
-        attention_mask = [1] * len(input_ids)
-
-        # Pad or truncate to max_length
-        if len(input_ids) > self.max_length:
-            input_ids = input_ids[: self.max_length]
-            attention_mask = attention_mask[: self.max_length]
-        else:
-            padding_length = self.max_length - len(input_ids)
-            input_ids.extend([0] * padding_length)  # 0 is typically the pad token
-            attention_mask.extend([0] * padding_length)
-
-        return {
-            "input_ids": np.array([input_ids], dtype=np.int64),
-            "attention_mask": np.array([attention_mask], dtype=np.int64),
-        }
+        return self._tokenize_batch([text])
 
     def _tokenize_batch(self, texts: list[str]) -> dict[str, np.ndarray]:
         """
-        Tokenize a batch of texts.
+        Tokenize a batch of texts, padded only to its longest item.
 
         Args:
             texts: List of input texts to tokenize
@@ -208,31 +235,43 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
         Returns:
             Dictionary with input_ids and attention_mask as numpy arrays
         """
-        all_input_ids = []
-        all_attention_masks = []
-
-        for text in texts:
-            # Tokenize individual text
-            encoding = self.tokenizer.encode(text)
-            input_ids = encoding.ids
-            attention_mask = [1] * len(input_ids)
-
-            # Pad or truncate to max_length
-            if len(input_ids) > self.max_length:
-                input_ids = input_ids[: self.max_length]
-                attention_mask = attention_mask[: self.max_length]
-            else:
-                padding_length = self.max_length - len(input_ids)
-                input_ids.extend([0] * padding_length)
-                attention_mask.extend([0] * padding_length)
+        return self._pad_token_ids(self._tokenize(texts))
 
-            all_input_ids.append(input_ids)
-            all_attention_masks.append(attention_mask)
+    def _embed_token_ids(
+        self, token_ids: list[list[int]], pad_to_max_length: bool = False
+    ) -> np.ndarray:
+        """
+        Run inference over tokenized texts in length-sorted batches.
 
-        return {
-            "input_ids": np.array(all_input_ids, dtype=np.int64),
-            "attention_mask": np.array(all_attention_masks, dtype=np.int64),
-        }
+        Inputs larger than one batch are sorted by token count and split into
+        batches of batch_size, so each batch pads to similar lengths. Results
+        are returned in the original input order.
+
+        Args:
+            token_ids: Unpadded token IDs for each text
+            pad_to_max_length: Pad every batch to max_length, to measure
+                fixed-length padding
+
+        Returns:
+            Embedding vectors in input order
+        """
+        batch_size = max(1, self.embedding_config.batch_size)
+        if len(token_ids) <= batch_size:
+            tokens = self._pad_token_ids(token_ids, pad_to_max_length)
+            return self._run_inference(tokens["input_ids"], tokens["attention_mask"])
+
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+        embeddings = np.zeros((len(token_ids), self.embedding_dimension), np.float32)
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            tokens = self._pad_token_ids(
+                [token_ids[i] for i in indices], pad_to_max_length
+            )
+            embeddings[indices] = self._run_inference(
+                tokens["input_ids"], tokens["attention_mask"]
+            )
+
+        return embeddings
 
     def _run_inference(
         self, input_ids: np.ndarray, attention_mask: np.ndarray
@@ -335,13 +374,8 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
             return np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
 
         try:
-            # Tokenize the batch
-            tokens = self._tokenize_batch(filtered_texts)
-
-            # Run ONNX inference
-            embeddings = self._run_inference(
-                tokens["input_ids"], tokens["attention_mask"]
-            )
+            # Tokenize the batch and run ONNX inference in length buckets
+            embeddings = self._embed_token_ids(self._tokenize(filtered_texts))
 
             # If we had empty texts, we need to reconstruct the full batch
             if len(valid_indices) != len(texts):
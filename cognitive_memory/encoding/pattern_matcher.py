@@ -0,0 +1,211 @@
+"""
+Multi-pattern matcher for rule-based dimension extraction.
+
+The dimension extractors score text by counting matches of several dozen
+keyword patterns. Running re.findall once per pattern rescans the whole text
+each time, and Python's regex engine has no fast path for patterns that start
+with a word boundary and an alternation. PatternMatcher scans the words of the
+text once and, at each word, only tries the patterns that can start with it.
+"""
+
+import re
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, Generic, TypeVar
+
+# The regex parser is private API: Python 3.11 moved it from sre_parse to
+# re._parser, and its opcodes and output shapes can change in any release. It is
+# only used to build the first-word index. If it is missing or its output is not
+# understood, patterns stay unindexed and are counted with findall, which is
+# slower but exact. test_extractor_patterns_match_findall checks every extractor
+# pattern against findall, so a parser change that skews the index fails there.
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11, or the private module moved again
+    try:
+        import sre_parse
+    except ImportError:
+        sre_parse = None
+
+K = TypeVar("K", bound=Hashable)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Give up enumerating first words beyond this many alternatives
+_MAX_FIRST_WORDS = 1000
+
+
+class PatternMatcher(Generic[K]):
+    """
+    Count matches of many regex patterns with a single scan of the text.
+
+    Patterns are grouped under category keys, and the count for a category
+    equals summing len(re.findall(pattern, text, re.IGNORECASE)) over its
+    patterns. Patterns are indexed by the words their matches can start with;
+    patterns whose first words cannot be enumerated fall back to findall.
+    """
+
+    def __init__(self, categories: Mapping[K, Sequence[str]]) -> None:
+        """
+        Compile patterns and build the first-word index.
+
+        Args:
+            categories: Regex patterns for each category key
+        """
+        self.categories = list(categories)
+        self._patterns: list[re.Pattern[str]] = []
+        self._pattern_categories: list[K] = []
+        self._index: dict[str, list[int]] = {}
+        self._unindexed: list[int] = []
+
+        for category, patterns in categories.items():
+            for pattern in patterns:
+                index = len(self._patterns)
+                self._patterns.append(re.compile(pattern, re.IGNORECASE))
+                self._pattern_categories.append(category)
+
+                first_words = _first_words(pattern)
+                if first_words is None:
+                    self._unindexed.append(index)
+                    continue
+                for word in first_words:
+                    self._index.setdefault(word, []).append(index)
+
+    def count(self, text: str) -> dict[K, int]:
+        """
+        Count pattern matches per category.
+
+        Args:
+            text: Text to scan, normally lowercased
+
+        Returns:
+            Number of matches for each category key
+        """
+        counts = dict.fromkeys(self.categories, 0)
+        for index in self._unindexed:
+            matches = self._patterns[index].findall(text)
+            counts[self._pattern_categories[index]] += len(matches)
+
+        # End of the last counted match per pattern; findall never overlaps
+        ends = [0] * len(self._patterns)
+
+        for word in _WORD_PATTERN.finditer(text):
+            candidates = self._index.get(word.group().lower())
+            if candidates is None:
+                continue
+
+            start = word.start()
+            for index in candidates:
+                if start < ends[index]:
+                    continue
+                match = self._patterns[index].match(text, start)
+                if match is not None:
+                    ends[index] = match.end()
+                    counts[self._pattern_categories[index]] += 1
+
+        return counts
+
+
+def _first_words(pattern: str) -> set[str] | None:
+    """
+    Enumerate the lowercased words a pattern's matches can start with.
+
+    Only patterns that start with a word boundary and a first word built from
+    literals, groups, alternations and bounded repeats are enumerated. The
+    first word must end at a word boundary or a non-word literal, so it is
+    always a whole word of the text.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Possible first words, or None if they cannot be enumerated
+    """
+    if sre_parse is None:
+        return None
+
+    try:
+        items = _parse(pattern)
+        if not items or items[0] != (sre_parse.AT, sre_parse.AT_BOUNDARY):
+            return None
+        prefixes = _expand(items[1:], {("", False)})
+    except (AttributeError, TypeError, ValueError):
+        # Unsupported construct, or parser output this code does not know
+        return None
+
+    words = set()
+    for prefix, finished in prefixes:
+        if not finished or not prefix:
+            return None
+        words.add(prefix)
+    return words
+
+
+def _parse(pattern: str) -> list[tuple[Any, Any]]:
+    """
+    Parse a regex pattern with the standard library's private parser.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Parsed (opcode, argument) sequence
+    """
+    parsed: list[tuple[Any, Any]] = list(sre_parse.parse(pattern))
+    return parsed
+
+
+def _expand(items: list[Any], prefixes: set[tuple[str, bool]]) -> set[tuple[str, bool]]:
+    """
+    Extend first-word prefixes through a parsed regex sequence.
+
+    Args:
+        items: Parsed (opcode, argument) sequence
+        prefixes: (prefix, finished) pairs; finished prefixes are complete words
+
+    Returns:
+        Prefixes after consuming the sequence
+
+    Raises:
+        ValueError: If a construct cannot be enumerated
+    """
+    for opcode, argument in items:
+        if all(finished for _, finished in prefixes):
+            break
+        if len(prefixes) > _MAX_FIRST_WORDS:
+            raise ValueError("too many first words")
+
+        done = {item for item in prefixes if item[1]}
+        open_ = {item for item in prefixes if not item[1]}
+
+        if opcode == sre_parse.LITERAL:
+            char = chr(argument).lower()
+            if _WORD_PATTERN.fullmatch(char):
+                extended = {(prefix + char, False) for prefix, _ in open_}
+            else:
+                extended = {(prefix, True) for prefix, _ in open_}
+        elif opcode == sre_parse.AT:
+            if argument != sre_parse.AT_BOUNDARY or ("", False) in open_:
+                raise ValueError("unsupported anchor")
+            extended = {(prefix, True) for prefix, _ in open_}
+        elif opcode == sre_parse.SUBPATTERN:
+            extended = _expand(list(argument[-1]), open_)
+        elif opcode == sre_parse.BRANCH:
+            extended = set()
+            for branch in argument[1]:
+                extended |= _expand(list(branch), open_)
+        elif opcode in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, high, body = argument
+            if high == sre_parse.MAXREPEAT or high > 3:
+                raise ValueError("unbounded repeat")
+            extended = set()
+            current = open_
+            for repeat in range(high + 1):
+                if repeat >= low:
+                    extended |= current
+                current = _expand(list(body), current)
+        else:
+            raise ValueError("unsupported construct")
+
+        prefixes = done | extended
+
+    return prefixes
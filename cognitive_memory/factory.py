@@ -72,7 +72,9 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
         from .encoding.sentence_bert import create_sentence_bert_provider
         from .retrieval.basic_activation import BasicActivationEngine
         from .retrieval.bridge_discovery import SimpleBridgeDiscovery
-        from .storage.qdrant_storage import create_hierarchical_storage
+        from .storage.bridge_cache import BridgeCache
+        from .storage.embedding_cache import EmbeddingCache
+        from .storage.retrieval_telemetry import RetrievalTelemetry
         from .storage.sqlite_persistence import create_sqlite_persistence
 
         # Create embedding provider
@@ -87,20 +89,36 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
             )
 
         # Create vector storage
-        # Parse Qdrant URL to extract host and port
-        from urllib.parse import urlparse
-
-        parsed_url = urlparse(config.qdrant.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
-
-        vector_storage = create_hierarchical_storage(
-            vector_size=config.embedding.embedding_dimension,
-            project_id=config.project_id,
-            host=host,
-            port=port,
-            prefer_grpc=config.qdrant.prefer_grpc,
-        )
+        vector_storage: VectorStorage
+        if config.vector_storage.backend == "embedded":
+            from .storage.embedded_vector_storage import create_embedded_storage
+
+            vector_storage = create_embedded_storage(
+                vector_size=config.embedding.embedding_dimension,
+                project_id=config.project_id,
+                path=config.vector_storage.resolve_path(config.database.path),
+                search_mode=config.vector_storage.search_mode,
+                ivf_min_vectors=config.vector_storage.ivf_min_vectors,
+                ivf_probes=config.vector_storage.ivf_probes,
+                compaction_ratio=config.vector_storage.compaction_ratio,
+            )
+        else:
+            from urllib.parse import urlparse
+
+            from .storage.qdrant_storage import create_hierarchical_storage
+
+            # Parse Qdrant URL to extract host and port
+            parsed_url = urlparse(config.qdrant.url)
+            host = parsed_url.hostname or "localhost"
+            port = parsed_url.port or 6333
+
+            vector_storage = create_hierarchical_storage(
+                vector_size=config.embedding.embedding_dimension,
+                project_id=config.project_id,
+                host=host,
+                port=port,
+                prefer_grpc=config.qdrant.prefer_grpc,
+            )
 
         # Validate vector storage
         if not isinstance(vector_storage, VectorStorage):
@@ -110,7 +128,11 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
 
         # Create memory and connection storage
         memory_storage, connection_graph = create_sqlite_persistence(
-            db_path=config.database.path
+            db_path=config.database.path,
+            pool_size=config.database.connection_pool_size,
+            stats_flush_interval=config.database.stats_flush_interval,
+            stats_flush_max_pending=config.database.stats_flush_max_pending,
+            retrieval_retention_days=config.database.retrieval_retention_days,
         )
 
         # Validate storage components
@@ -124,6 +146,16 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
                 f"Connection graph does not implement ConnectionGraph interface: {type(connection_graph)}"
             )
 
+        # Persistent embedding cache shares the memory database
+        embedding_cache = (
+            EmbeddingCache(
+                memory_storage.db_manager,
+                max_bytes=config.embedding.embedding_cache_max_bytes,
+            )
+            if config.embedding.embedding_cache_max_bytes > 0
+            else None
+        )
+
         # Create activation engine
         activation_engine = BasicActivationEngine(
             memory_storage=memory_storage, connection_graph=connection_graph
@@ -135,8 +167,18 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
                 f"Activation engine does not implement ActivationEngine interface: {type(activation_engine)}"
             )
 
-        # Create bridge discovery
-        bridge_discovery = SimpleBridgeDiscovery(memory_storage=memory_storage)
+        # Create bridge discovery, caching results in the memory database
+        bridge_cache = (
+            BridgeCache(
+                memory_storage.db_manager,
+                ttl_hours=config.cognitive.bridge_cache_ttl_hours,
+            )
+            if config.cognitive.bridge_cache_ttl_hours > 0
+            else None
+        )
+        bridge_discovery = SimpleBridgeDiscovery(
+            memory_storage=memory_storage, cache=bridge_cache
+        )
 
         # Validate bridge discovery
         if not isinstance(bridge_discovery, BridgeDiscovery):
@@ -144,6 +186,17 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
                 f"Bridge discovery does not implement BridgeDiscovery interface: {type(bridge_discovery)}"
             )
 
+        # Sampled retrieval latency telemetry in the memory database
+        retrieval_telemetry = (
+            RetrievalTelemetry(
+                memory_storage.db_manager,
+                sample_rate=config.cognitive.retrieval_telemetry_sample_rate,
+                window_minutes=config.cognitive.retrieval_telemetry_window_minutes,
+            )
+            if config.cognitive.retrieval_telemetry_sample_rate > 0
+            else None
+        )
+
         # Create cognitive system
         cognitive_system = CognitiveMemorySystem(
             embedding_provider=embedding_provider,
@@ -153,6 +206,8 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
             activation_engine=activation_engine,
             bridge_discovery=bridge_discovery,
             config=config,
+            embedding_cache=embedding_cache,
+            retrieval_telemetry=retrieval_telemetry,
         )
 
         # Final validation
@@ -164,6 +219,7 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
         logger.info(
             "Default cognitive memory system created successfully",
             embedding_model=config.embedding.model_name,
+            vector_backend=config.vector_storage.backend,
             qdrant_url=config.qdrant.url,
             database_path=config.database.path,
         )
@@ -244,6 +300,7 @@ def create_test_system(**overrides: Any) -> CognitiveMemorySystem:
             activation_engine=cast(ActivationEngine, components["activation_engine"]),
             bridge_discovery=cast(BridgeDiscovery, components["bridge_discovery"]),
             config=cast(SystemConfig, components["config"]),
+            embedding_cache=default_system.embedding_cache,
         )
 
         logger.info(
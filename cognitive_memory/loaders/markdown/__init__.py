@@ -7,8 +7,10 @@ This package contains specialized components for processing markdown documents:
 - MemoryFactory: Memory creation and assembly
 - ConnectionExtractor: Relationship analysis
 - ChunkProcessor: Document chunking logic
+- CandidatePairGenerator: Candidate pairs for associative connections
 """
 
+from .candidate_generator import CandidatePairGenerator
 from .chunk_processor import ChunkProcessor
 from .connection_extractor import ConnectionExtractor
 from .content_analyzer import ContentAnalyzer
@@ -21,4 +23,5 @@ __all__ = [
     "MemoryFactory",
     "ConnectionExtractor",
     "ChunkProcessor",
+    "CandidatePairGenerator",
 ]
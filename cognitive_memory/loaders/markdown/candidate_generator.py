@@ -0,0 +1,172 @@
+"""
+Candidate pair generation for associative markdown connections.
+
+Scoring every pair of chunks is quadratic in the number of chunks in a load.
+This module proposes a bounded set of candidate pairs instead, combining two
+signals that approximate the semantic and lexical terms of the relevance
+score:
+
+- the top-M nearest neighbours of each chunk by embedding cosine similarity
+- MinHash/LSH buckets over lemma sets, which surface pairs with high
+  Jaccard overlap
+
+Only candidate pairs are passed on to the full relevance score, so scoring
+work grows with n * M rather than n^2.
+"""
+
+import zlib
+from collections import defaultdict
+
+import numpy as np
+from loguru import logger
+
+# Smallest prime above 2^32, the modulus of the MinHash permutations
+_MINHASH_PRIME = 4294967311
+
+
+class CandidatePairGenerator:
+    """
+    Proposes chunk pairs worth scoring for associative connections.
+    """
+
+    def __init__(
+        self,
+        neighbors: int = 20,
+        num_permutations: int = 64,
+        bands: int = 16,
+        max_bucket_size: int = 50,
+        block_size: int = 1024,
+        seed: int = 0,
+    ):
+        """
+        Initialize the candidate generator.
+
+        Args:
+            neighbors: Nearest neighbours (M) proposed per chunk
+            num_permutations: MinHash signature length
+            bands: LSH bands; num_permutations must be divisible by bands
+            max_bucket_size: Members paired per LSH bucket (caps hot buckets)
+            block_size: Rows per block when searching nearest neighbours
+            seed: Seed for the MinHash permutations
+        """
+        if num_permutations % bands != 0:
+            raise ValueError("num_permutations must be divisible by bands")
+
+        self.neighbors = neighbors
+        self.num_permutations = num_permutations
+        self.bands = bands
+        self.max_bucket_size = max_bucket_size
+        self.block_size = block_size
+
+        rng = np.random.default_rng(seed)
+        # Coefficients below 2^31 keep a * h + b within uint64 for 32-bit h
+        self._hash_a = rng.integers(1, 1 << 31, size=num_permutations, dtype=np.uint64)
+        self._hash_b = rng.integers(0, 1 << 31, size=num_permutations, dtype=np.uint64)
+
+    def generate(
+        self, vectors: np.ndarray, lemmas: list[frozenset[str]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate candidate pairs from embeddings and lemma sets.
+
+        Args:
+            vectors: Row-normalized chunk embeddings, shape (n, dimension)
+            lemmas: Lemma set per chunk
+
+        Returns:
+            Tuple of (rows, columns) index arrays with rows < columns,
+            sorted lexicographically
+        """
+        pairs = self.nearest_neighbor_pairs(vectors) | self.minhash_pairs(lemmas)
+        if not pairs:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        ordered = np.array(sorted(pairs), dtype=np.int64)
+
+        logger.debug(
+            "Generated associative candidate pairs",
+            chunks=len(lemmas),
+            candidates=len(ordered),
+        )
+        return ordered[:, 0], ordered[:, 1]
+
+    def nearest_neighbor_pairs(self, vectors: np.ndarray) -> set[tuple[int, int]]:
+        """
+        Pair each chunk with its top-M most similar chunks.
+
+        Similarities are computed block by block so memory stays at
+        block_size * n regardless of the number of chunks.
+
+        Args:
+            vectors: Row-normalized chunk embeddings, shape (n, dimension)
+
+        Returns:
+            Set of (i, j) pairs with i < j
+        """
+        n = vectors.shape[0]
+        k = min(self.neighbors, n - 1)
+        if k <= 0 or vectors.shape[1] == 0:
+            return set()
+
+        pairs: set[tuple[int, int]] = set()
+        for start in range(0, n, self.block_size):
+            block = vectors[start : start + self.block_size]
+            similarities = block @ vectors.T
+
+            # Exclude each chunk from its own neighbour list
+            rows = np.arange(block.shape[0])
+            similarities[rows, rows + start] = -np.inf
+
+            top = np.argpartition(similarities, -k, axis=1)[:, -k:]
+            neighbor_rows: list[list[int]] = top.tolist()
+            for offset, neighbors in enumerate(neighbor_rows):
+                i = start + offset
+                for j in neighbors:
+                    pairs.add((i, j) if i < j else (j, i))
+
+        return pairs
+
+    def minhash_pairs(self, lemmas: list[frozenset[str]]) -> set[tuple[int, int]]:
+        """
+        Pair chunks that share an LSH bucket of their MinHash signatures.
+
+        Args:
+            lemmas: Lemma set per chunk
+
+        Returns:
+            Set of (i, j) pairs with i < j
+        """
+        rows_per_band = self.num_permutations // self.bands
+        buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+
+        for index, words in enumerate(lemmas):
+            if not words:
+                continue
+            signature = self._signature(words)
+            for band in range(self.bands):
+                key = signature[band * rows_per_band : (band + 1) * rows_per_band]
+                buckets[(band, key.tobytes())].append(index)
+
+        pairs: set[tuple[int, int]] = set()
+        for members in buckets.values():
+            members = members[: self.max_bucket_size]
+            for position, i in enumerate(members):
+                for j in members[position + 1 :]:
+                    pairs.add((i, j))
+
+        return pairs
+
+    def _signature(self, words: frozenset[str]) -> np.ndarray:
+        """Compute the MinHash signature of a lemma set."""
+        hashes = np.fromiter(
+            (zlib.crc32(word.encode("utf-8")) for word in words),
+            dtype=np.uint64,
+            count=len(words),
+        )
+        # (a * h + b) mod p for every permutation and word
+        permuted = (
+            self._hash_a[:, None] * hashes[None, :] + self._hash_b[:, None]
+        ) % np.uint64(_MINHASH_PRIME)
+        signature: np.ndarray = permuted.min(axis=1)
+        return signature
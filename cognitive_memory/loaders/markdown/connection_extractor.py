@@ -7,12 +7,46 @@ CognitiveMemory objects derived from markdown content.
 
 import re
 from collections import defaultdict
+from dataclasses import dataclass
 
+import numpy as np
 import spacy
 from loguru import logger
 
 from ...core.config import CognitiveConfig
 from ...core.memory import CognitiveMemory
+from .candidate_generator import CandidatePairGenerator
+
+
+@dataclass
+class ChunkAnalysis:
+    """
+    Linguistic analysis of every chunk in one load, computed in a single pass.
+
+    Attributes:
+        index: Memory ID to row position
+        vectors: Document vectors normalized to unit length (zero rows when
+            the chunk has no vector), shape (n, dimension)
+        lemmas: Lower-cased alphabetic lemmas per chunk
+        links: Lower-cased markdown link texts per chunk
+        titles: Lower-cased chunk titles
+        contents: Lower-cased chunk contents
+        levels: Header level per chunk
+        own_link: Whether a chunk's link texts mention its own title
+        relevance: Pairwise relevance scores, shape (n, n), for loads of up to
+            connection_exact_pair_limit chunks; None for larger loads, which
+            are scored per candidate pair
+    """
+
+    index: dict[str, int]
+    vectors: np.ndarray
+    lemmas: list[frozenset[str]]
+    links: list[list[str]]
+    titles: list[str]
+    contents: list[str]
+    levels: np.ndarray
+    own_link: np.ndarray
+    relevance: np.ndarray | None = None
 
 
 class ConnectionExtractor:
@@ -37,6 +71,14 @@ class ConnectionExtractor:
         # Precompiled regex patterns for efficiency
         self.link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
+        # Analysis of the memories currently being connected (None outside a load)
+        self._analysis: ChunkAnalysis | None = None
+
+        # Candidate pairs for associative scoring of large loads
+        self.candidate_generator = CandidatePairGenerator(
+            neighbors=config.connection_candidate_neighbors
+        )
+
     def extract_connections(
         self, memories: list[CognitiveMemory]
     ) -> list[tuple[str, str, float, str]]:
@@ -51,17 +93,22 @@ class ConnectionExtractor:
         """
         connections = []
 
-        # Extract hierarchical connections (header -> subsection)
-        hierarchical_connections = self._extract_hierarchical_connections(memories)
-        connections.extend(hierarchical_connections)
+        # Parse every chunk once before scoring any pair
+        self._analysis = self.analyze_memories(memories)
+        try:
+            # Extract hierarchical connections (header -> subsection)
+            hierarchical_connections = self._extract_hierarchical_connections(memories)
+            connections.extend(hierarchical_connections)
 
-        # Extract sequential connections (step-by-step procedures)
-        sequential_connections = self._extract_sequential_connections(memories)
-        connections.extend(sequential_connections)
+            # Extract sequential connections (step-by-step procedures)
+            sequential_connections = self._extract_sequential_connections(memories)
+            connections.extend(sequential_connections)
 
-        # Extract associative connections (semantic similarity)
-        associative_connections = self._extract_associative_connections(memories)
-        connections.extend(associative_connections)
+            # Extract associative connections (semantic similarity)
+            associative_connections = self._extract_associative_connections(memories)
+            connections.extend(associative_connections)
+        finally:
+            self._analysis = None
 
         # Filter by strength floor
         filtered_connections = [
@@ -78,6 +125,205 @@ class ConnectionExtractor:
 
         return limited_connections
 
+    def analyze_memories(self, memories: list[CognitiveMemory]) -> ChunkAnalysis:
+        """
+        Parse all memories in one spaCy pass and extract per-chunk features.
+
+        Each chunk is parsed once with nlp.pipe. For loads of up to
+        connection_exact_pair_limit chunks every pair is scored up front from
+        a similarity matrix over the normalized document vectors, lemma-set
+        overlaps, and precomputed title and link matches; larger loads keep
+        only the per-chunk features and are scored with score_pairs.
+
+        Args:
+            memories: Memories to analyze
+
+        Returns:
+            ChunkAnalysis with per-chunk features and, for small loads, the
+            relevance matrix
+        """
+        docs = list(self.nlp.pipe(memory.content for memory in memories))
+
+        dimension = max((len(doc.vector) for doc in docs), default=0)
+        vectors = np.zeros((len(memories), dimension), dtype=np.float32)
+        for row, doc in enumerate(docs):
+            if doc.vector_norm and len(doc.vector) == dimension:
+                vectors[row] = doc.vector / doc.vector_norm
+
+        titles = [memory.metadata.get("title", "").lower() for memory in memories]
+        link_texts = [
+            [text.lower() for text, _url in self.link_pattern.findall(memory.content)]
+            for memory in memories
+        ]
+
+        analysis = ChunkAnalysis(
+            index={memory.id: row for row, memory in enumerate(memories)},
+            vectors=vectors,
+            lemmas=[
+                frozenset(token.lemma_.lower() for token in doc if token.is_alpha)
+                for doc in docs
+            ],
+            links=link_texts,
+            titles=titles,
+            contents=[memory.content.lower() for memory in memories],
+            levels=np.array(
+                [memory.metadata.get("header_level", 3) for memory in memories],
+                dtype=np.float64,
+            ),
+            own_link=np.array(
+                [
+                    any(title in text for text in texts)
+                    for title, texts in zip(titles, link_texts, strict=True)
+                ],
+                dtype=bool,
+            ),
+        )
+
+        if len(memories) <= self.config.connection_exact_pair_limit:
+            analysis.relevance = self._relevance_matrix(analysis)
+
+        return analysis
+
+    def _relevance_matrix(self, analysis: ChunkAnalysis) -> np.ndarray:
+        """Score every pair of chunks in the analysis."""
+        n = len(analysis.index)
+
+        # Semantic similarity: cosine of document vectors
+        semantic = analysis.vectors @ analysis.vectors.T
+
+        # Lexical overlap (Jaccard coefficient of lemma sets)
+        lexical = self._jaccard_matrix(analysis.lemmas)
+
+        # Structural proximity (header level difference)
+        levels = analysis.levels
+        structural = 1.0 / (1.0 + np.abs(levels[:, None] - levels[None, :]))
+
+        # Explicit references (titles mentioned in content or link text)
+        # title_in_content[i, j]: title of i appears in content of j
+        title_in_content = np.array(
+            [
+                [title in content for content in analysis.contents]
+                for title in analysis.titles
+            ],
+            dtype=bool,
+        ).reshape(n, n)
+        # title_in_links[k, m]: title of m appears in a link text of chunk k
+        title_in_links = np.array(
+            [
+                [any(title in text for text in texts) for title in analysis.titles]
+                for texts in analysis.links
+            ],
+            dtype=bool,
+        ).reshape(n, n)
+        own_link = analysis.own_link
+        explicit = (
+            title_in_content
+            | title_in_content.T
+            | title_in_links
+            | title_in_links.T
+            | own_link[:, None]
+            | own_link[None, :]
+        ).astype(np.float64)
+
+        return self._combine_scores(semantic, lexical, structural, explicit)
+
+    def score_pairs(
+        self, analysis: ChunkAnalysis, rows: np.ndarray, columns: np.ndarray
+    ) -> np.ndarray:
+        """
+        Score selected pairs of chunks from their precomputed features.
+
+        Args:
+            analysis: Analysis of the current load
+            rows: Row positions of the first chunk of each pair
+            columns: Row positions of the second chunk of each pair
+
+        Returns:
+            Relevance score per pair
+        """
+        if analysis.relevance is not None:
+            scores: np.ndarray = analysis.relevance[rows, columns]
+            return scores
+
+        # Semantic similarity: row-wise dot product of normalized vectors
+        semantic = np.einsum(
+            "ij,ij->i", analysis.vectors[rows], analysis.vectors[columns]
+        ).astype(np.float64)
+
+        # Structural proximity (header level difference)
+        structural = 1.0 / (
+            1.0 + np.abs(analysis.levels[rows] - analysis.levels[columns])
+        )
+
+        lexical = np.zeros(len(rows), dtype=np.float64)
+        explicit = np.zeros(len(rows), dtype=np.float64)
+        titles, contents, links = analysis.titles, analysis.contents, analysis.links
+        for position, (i, j) in enumerate(zip(rows, columns, strict=True)):
+            # Lexical overlap (Jaccard coefficient of lemma sets)
+            words_i, words_j = analysis.lemmas[i], analysis.lemmas[j]
+            union = len(words_i | words_j)
+            if union:
+                lexical[position] = len(words_i & words_j) / union
+
+            # Explicit references (titles mentioned in content or link text)
+            explicit[position] = float(
+                analysis.own_link[i]
+                or analysis.own_link[j]
+                or titles[i] in contents[j]
+                or titles[j] in contents[i]
+                or any(titles[j] in text for text in links[i])
+                or any(titles[i] in text for text in links[j])
+            )
+
+        return self._combine_scores(semantic, lexical, structural, explicit)
+
+    def _combine_scores(
+        self,
+        semantic: np.ndarray,
+        lexical: np.ndarray,
+        structural: np.ndarray,
+        explicit: np.ndarray,
+    ) -> np.ndarray:
+        """Combine component scores into relevance scores clipped to [0, 1]."""
+        return np.clip(
+            self.config.semantic_alpha * semantic
+            + self.config.lexical_beta * lexical
+            + self.config.structural_gamma * structural
+            + self.config.explicit_delta * explicit,
+            0.0,
+            1.0,
+        )
+
+    @staticmethod
+    def _jaccard_matrix(lemmas: list[frozenset[str]]) -> np.ndarray:
+        """Compute pairwise Jaccard coefficients of lemma sets."""
+        n = len(lemmas)
+        sizes = np.array([len(words) for words in lemmas], dtype=np.float64)
+
+        # Only lemmas shared by two or more chunks can contribute to overlaps
+        document_frequency: dict[str, int] = defaultdict(int)
+        for words in lemmas:
+            for word in words:
+                document_frequency[word] += 1
+        vocabulary = {
+            word: column
+            for column, word in enumerate(
+                word for word, count in document_frequency.items() if count > 1
+            )
+        }
+
+        incidence = np.zeros((n, len(vocabulary)), dtype=np.float32)
+        for row, words in enumerate(lemmas):
+            columns = [vocabulary[word] for word in words if word in vocabulary]
+            incidence[row, columns] = 1.0
+
+        intersection = (incidence @ incidence.T).astype(np.float64)
+        union = sizes[:, None] + sizes[None, :] - intersection
+
+        jaccard = np.zeros((n, n), dtype=np.float64)
+        np.divide(intersection, union, out=jaccard, where=union > 0)
+        return jaccard
+
     def _extract_hierarchical_connections(
         self, memories: list[CognitiveMemory]
     ) -> list[tuple[str, str, float, str]]:
@@ -163,6 +409,32 @@ class ConnectionExtractor:
         """Extract associative connections (semantic similarity)."""
         connections: list[tuple[str, str, float, str]] = []
 
+        analysis = self._analysis
+        if analysis is not None and len(analysis.index) == len(memories):
+            if analysis.relevance is not None:
+                # Small load: score all pairs from the relevance matrix
+                rows, columns = np.triu_indices(len(memories), k=1)
+            else:
+                # Large load: only score nearest-neighbour and MinHash candidates
+                rows, columns = self.candidate_generator.generate(
+                    self._candidate_vectors(memories, analysis), analysis.lemmas
+                )
+
+            strengths = self.config.associative_weight * self.score_pairs(
+                analysis, rows, columns
+            )
+            keep = strengths >= self.config.strength_floor
+            pair_rows: list[int] = rows[keep].tolist()
+            pair_columns: list[int] = columns[keep].tolist()
+            pair_strengths: list[float] = strengths[keep].tolist()
+            for i, j, strength in zip(
+                pair_rows, pair_columns, pair_strengths, strict=True
+            ):
+                connections.append(
+                    (memories[i].id, memories[j].id, strength, "associative")
+                )
+            return connections
+
         # Compare all pairs for semantic similarity
         for i, memory1 in enumerate(memories):
             for memory2 in memories[i + 1 :]:
@@ -180,6 +452,33 @@ class ConnectionExtractor:
 
         return connections
 
+    @staticmethod
+    def _candidate_vectors(
+        memories: list[CognitiveMemory], analysis: ChunkAnalysis
+    ) -> np.ndarray:
+        """
+        Choose the vectors used to find nearest-neighbour candidates.
+
+        Cognitive embeddings are preferred when every memory already has one;
+        otherwise the spaCy document vectors from the analysis are used.
+        """
+        embeddings: list[np.ndarray] = [
+            memory.cognitive_embedding
+            for memory in memories
+            if memory.cognitive_embedding is not None
+        ]
+        if (
+            not embeddings
+            or len(embeddings) != len(memories)
+            or any(embedding.shape != embeddings[0].shape for embedding in embeddings)
+        ):
+            return analysis.vectors
+
+        vectors = np.vstack(embeddings).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
     def calculate_relevance_score(
         self, memory1: CognitiveMemory, memory2: CognitiveMemory
     ) -> float:
@@ -187,8 +486,18 @@ class ConnectionExtractor:
         Calculate relevance score between two memories.
 
         Uses weighted combination of semantic similarity, lexical overlap,
-        structural proximity, and explicit references.
+        structural proximity, and explicit references. Scores are read from
+        the current load's analysis when both memories are part of it.
         """
+        analysis = self._analysis
+        if analysis is not None:
+            row1 = analysis.index.get(memory1.id)
+            row2 = analysis.index.get(memory2.id)
+            if row1 is not None and row2 is not None:
+                return float(
+                    self.score_pairs(analysis, np.array([row1]), np.array([row2]))[0]
+                )
+
         # Semantic similarity using spaCy vectors
         doc1 = self.nlp(memory1.content)
         doc2 = self.nlp(memory2.content)
@@ -5,6 +5,7 @@ This module handles the creation of CognitiveMemory objects from processed
 markdown chunks, including content assembly and metadata enrichment.
 """
 
+import hashlib
 import uuid
 from datetime import datetime
 from typing import Any
@@ -122,6 +123,7 @@ class MemoryFactory:
                 "has_children": chunk_data.get("has_children", False),
                 "node_position": chunk_data.get("node_position", {}),
                 "token_count": self.content_analyzer.count_tokens(content),
+                "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
                 "linguistic_features": linguistic_features,
                 "sentiment": sentiment,
                 "loader_type": "markdown",
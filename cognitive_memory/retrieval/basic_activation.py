@@ -14,6 +14,8 @@ from loguru import logger
 
 from ..core.interfaces import ActivationEngine, ConnectionGraph, MemoryStorage
 from ..core.memory import ActivationResult, CognitiveMemory
+from ..storage.connection_index import ConnectionAdjacencyIndex
+from ..storage.embedding_index import LevelEmbeddingIndex
 
 
 class BasicActivationEngine(ActivationEngine):
@@ -25,6 +27,9 @@ class BasicActivationEngine(ActivationEngine):
     using breadth-first search with threshold-based filtering.
     """
 
+    # Minimum number of neighbour rows loaded per query during frontier BFS
+    HYDRATION_BATCH_SIZE = 16
+
     def __init__(
         self,
         memory_storage: MemoryStorage,
@@ -58,6 +63,12 @@ class BasicActivationEngine(ActivationEngine):
         3. Apply threshold-based filtering to limit computational overhead
         4. Track activation strength for result ranking
 
+        When the memory storage maintains a resident L0 embedding index, the
+        starting points are selected with a single vectorized similarity scan
+        and only the selected memories are loaded from storage. When the
+        connection graph maintains a resident adjacency index, BFS expands a
+        whole frontier at a time and loads only the neighbours it may activate.
+
         Args:
             context: Context vector for similarity computation
             threshold: Minimum activation threshold
@@ -70,15 +81,24 @@ class BasicActivationEngine(ActivationEngine):
 
         try:
             # Phase 1: Find high-similarity L0 concepts as starting points
-            l0_memories = self.memory_storage.get_memories_by_level(0)
-            starting_memories = self._find_starting_memories(
-                context, l0_memories, threshold
-            )
+            level_index = self._get_level_index(0)
+            if level_index is not None:
+                starting_memories = self._find_starting_memories_indexed(
+                    context, level_index, threshold
+                )
+            else:
+                l0_memories = self.memory_storage.get_memories_by_level(0)
+                starting_memories = self._find_starting_memories(
+                    context, l0_memories, threshold
+                )
+
+            l0_load_ms = (time.time() - start_time) * 1000
 
             if not starting_memories:
                 logger.debug("No starting memories found for activation")
                 return ActivationResult(
-                    activation_time_ms=(time.time() - start_time) * 1000
+                    activation_time_ms=(time.time() - start_time) * 1000,
+                    phase_times_ms={"l0_load": l0_load_ms},
                 )
 
             # Phase 2: BFS traversal through connection graph
@@ -88,6 +108,10 @@ class BasicActivationEngine(ActivationEngine):
 
             # Calculate timing
             activation_result.activation_time_ms = (time.time() - start_time) * 1000
+            activation_result.phase_times_ms = {
+                "l0_load": l0_load_ms,
+                "activation_bfs": activation_result.activation_time_ms - l0_load_ms,
+            }
 
             logger.debug(
                 "Memory activation completed",
@@ -148,6 +172,75 @@ class BasicActivationEngine(ActivationEngine):
         )
         return starting_memories
 
+    def _get_level_index(self, level: int) -> LevelEmbeddingIndex | None:
+        """
+        Get the storage's resident embedding index for a level, if supported.
+
+        Args:
+            level: Hierarchy level
+
+        Returns:
+            LevelEmbeddingIndex, or None if the storage does not provide one
+        """
+        index = self.memory_storage.get_level_index(level)
+        return index if isinstance(index, LevelEmbeddingIndex) else None
+
+    def _find_starting_memories_indexed(
+        self,
+        context: np.ndarray,
+        level_index: LevelEmbeddingIndex,
+        threshold: float,
+    ) -> list[CognitiveMemory]:
+        """
+        Find starting memories using the resident L0 embedding index.
+
+        Args:
+            context: Context vector for similarity computation
+            level_index: Synchronized L0 embedding index
+            threshold: Minimum similarity threshold
+
+        Returns:
+            List of starting memories, highest similarity first
+        """
+        matches = level_index.search(context, threshold=threshold)
+        if not matches:
+            logger.debug(
+                f"Found 0 starting memories from {len(level_index)} indexed L0 concepts"
+            )
+            return []
+
+        memories = self.memory_storage.get_memories_by_ids(
+            [memory_id for memory_id, _ in matches]
+        )
+
+        # Rows may have changed level since the snapshot; keep only L0 concepts
+        starting_memories = [
+            memory
+            for memory in memories
+            if memory.hierarchy_level == 0 and memory.cognitive_embedding is not None
+        ]
+
+        logger.debug(
+            f"Found {len(starting_memories)} starting memories from {len(level_index)} indexed L0 concepts"
+        )
+        return starting_memories
+
+    def _get_adjacency_index(self) -> ConnectionAdjacencyIndex | None:
+        """
+        Get the connection graph's resident adjacency index, if supported.
+
+        Returns:
+            ConnectionAdjacencyIndex, or None if the graph does not provide one
+        """
+        get_adjacency_index = getattr(
+            self.connection_graph, "get_adjacency_index", None
+        )
+        if get_adjacency_index is None:
+            return None
+
+        index = get_adjacency_index()
+        return index if isinstance(index, ConnectionAdjacencyIndex) else None
+
     def _bfs_activation(
         self,
         context: np.ndarray,
@@ -167,8 +260,10 @@ class BasicActivationEngine(ActivationEngine):
         Returns:
             ActivationResult with activated memories
         """
-        # Initialize BFS structures
-        queue = deque(starting_memories)
+        # Initialize BFS structures; the per-node queue is only used when the
+        # connection graph has no adjacency index
+        adjacency_index = self._get_adjacency_index()
+        queue = deque(starting_memories if adjacency_index is None else ())
         activated_ids: set[str] = set()
         core_memories: list[CognitiveMemory] = []
         peripheral_memories: list[CognitiveMemory] = []
@@ -190,6 +285,19 @@ class BasicActivationEngine(ActivationEngine):
 
                 activated_ids.add(memory.id)
 
+        if adjacency_index is not None:
+            self._bfs_frontiers(
+                context,
+                adjacency_index,
+                [memory.id for memory in starting_memories],
+                threshold,
+                max_activations,
+                activated_ids,
+                activation_strengths,
+                core_memories,
+                peripheral_memories,
+            )
+
         # BFS traversal through connection graph
         while queue and len(activated_ids) < max_activations:
             current_memory = queue.popleft()
@@ -251,6 +359,105 @@ class BasicActivationEngine(ActivationEngine):
             activation_strengths=activation_strengths,
         )
 
+    def _bfs_frontiers(
+        self,
+        context: np.ndarray,
+        adjacency_index: ConnectionAdjacencyIndex,
+        frontier: list[str],
+        threshold: float,
+        max_activations: int,
+        activated_ids: set[str],
+        activation_strengths: dict[str, float],
+        core_memories: list[CognitiveMemory],
+        peripheral_memories: list[CognitiveMemory],
+    ) -> None:
+        """
+        Spread activation level by level using the resident adjacency index.
+
+        Visits memories in the same order as the per-node queue: each frontier
+        is expanded in traversal order with neighbours strongest first. Memory
+        rows are loaded in batches, only for neighbours whose connection passes
+        the peripheral threshold and that are not yet active, and no further
+        than needed to reach max_activations.
+
+        Args:
+            context: Context vector for similarity computation
+            adjacency_index: Synchronized connection adjacency index
+            frontier: IDs of the starting memories
+            threshold: Minimum activation threshold
+            max_activations: Maximum number of memories to activate
+            activated_ids: Activated memory IDs, updated in place
+            activation_strengths: Activation strengths, updated in place
+            core_memories: Core memories, appended in place
+            peripheral_memories: Peripheral memories, appended in place
+        """
+        record_activations = getattr(self.connection_graph, "record_activations", None)
+
+        while frontier and len(activated_ids) < max_activations:
+            expansion = adjacency_index.expand(
+                frontier, min_strength=self.peripheral_threshold
+            )
+
+            # Unvisited neighbours in traversal order, with the frontier
+            # position of the memory that reaches them first
+            candidates: dict[str, int] = {}
+            for position, (_, neighbours) in enumerate(expansion):
+                for neighbour_id, _ in neighbours:
+                    if neighbour_id not in activated_ids:
+                        candidates.setdefault(neighbour_id, position)
+
+            candidate_ids = list(candidates)
+            next_frontier: list[str] = []
+            expanded = len(expansion)
+            start = 0
+            while start < len(candidate_ids):
+                remaining = max_activations - len(activated_ids)
+                if remaining <= 0:
+                    # The per-node traversal stops before expanding the rest
+                    expanded = candidates[candidate_ids[start]]
+                    break
+
+                chunk = candidate_ids[
+                    start : start + max(remaining, self.HYDRATION_BATCH_SIZE)
+                ]
+                start += len(chunk)
+
+                for memory in self.memory_storage.get_memories_by_ids(chunk):
+                    if memory.cognitive_embedding is None:
+                        continue
+                    if len(activated_ids) >= max_activations:
+                        break
+
+                    similarity = self._compute_cosine_similarity(
+                        context, memory.cognitive_embedding
+                    )
+                    strength = memory.calculate_activation_strength(similarity)
+
+                    # Apply threshold filtering
+                    if strength >= threshold:
+                        activation_strengths[memory.id] = strength
+                        activated_ids.add(memory.id)
+
+                        # Categorize as core or peripheral
+                        if strength >= self.core_threshold:
+                            core_memories.append(memory)
+                        elif strength >= self.peripheral_threshold:
+                            peripheral_memories.append(memory)
+
+                        next_frontier.append(memory.id)
+
+            if record_activations is not None:
+                record_activations(
+                    [
+                        memory_id
+                        for memory_id, neighbours in expansion[: expanded + 1]
+                        if neighbours
+                    ],
+                    self.peripheral_threshold,
+                )
+
+            frontier = next_frontier
+
     def _compute_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
         Compute cosine similarity between two vectors.
@@ -7,12 +7,15 @@ activated memories, enabling serendipitous connections.
 """
 
 import time
+from collections.abc import Sequence
 
 import numpy as np
 from loguru import logger
 
 from ..core.interfaces import BridgeDiscovery, MemoryStorage
 from ..core.memory import BridgeMemory, CognitiveMemory
+from ..storage.bridge_cache import BridgeCache, CachedBridge
+from ..storage.embedding_index import LevelEmbeddingIndex
 
 
 class SimpleBridgeDiscovery(BridgeDiscovery):
@@ -31,6 +34,7 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
         connection_weight: float = 0.4,
         max_candidates: int = 100,
         min_novelty: float = 0.3,
+        cache: BridgeCache | None = None,
     ):
         """
         Initialize simple bridge discovery.
@@ -41,12 +45,14 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
             connection_weight: Weight for connection potential (0.0 to 1.0)
             max_candidates: Maximum candidate memories to consider
             min_novelty: Minimum novelty threshold
+            cache: Optional result cache
         """
         self.memory_storage = memory_storage
         self.novelty_weight = novelty_weight
         self.connection_weight = connection_weight
         self.max_candidates = max_candidates
         self.min_novelty = min_novelty
+        self.cache = cache
 
         # Validate weights
         total_weight = novelty_weight + connection_weight
@@ -65,12 +71,17 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
         Discover bridge memories that create novel connections.
 
         Implementation follows the algorithm specification:
-        1. Get non-activated memories as candidates
+        1. Get non-activated memories as candidates (scored exactly against
+           the resident level embedding indexes when the storage provides
+           them, so only the best are loaded)
         2. Calculate novelty score (inverse similarity to query)
         3. Calculate connection potential to activated memories
         4. Compute bridge score: (novelty * 0.6) + (connection_potential * 0.4)
         5. Return top-k bridge memories
 
+        Results are served from and stored in the bridge cache when one is
+        configured.
+
         Args:
             context: Query context vector
             activated: List of currently activated memories
@@ -85,28 +96,41 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
             # Get activated memory IDs for exclusion
             activated_ids = {memory.id for memory in activated}
 
-            # Get candidate memories (non-activated)
-            candidates = self._get_candidate_memories(activated_ids)
+            query_hash = None
+            generation = 0
+            if self.cache is not None:
+                query_hash = BridgeCache.query_hash(
+                    context, activated_ids, k, self.get_discovery_config()
+                )
+                generation, cached = self.cache.get(query_hash)
+                cached_bridges = (
+                    self._load_cached_bridges(cached) if cached is not None else None
+                )
+                if cached_bridges is not None:
+                    logger.debug(
+                        "Bridge discovery served from cache",
+                        bridges_found=len(cached_bridges),
+                        discovery_time_ms=(time.time() - start_time) * 1000,
+                    )
+                    return cached_bridges
+
+            # Score candidates on the resident embedding indexes when the
+            # storage provides them; otherwise load all non-activated memories
+            candidates = self._get_indexed_candidates(context, activated, activated_ids)
+            if candidates is None:
+                candidates = self._get_candidate_memories(activated_ids)
 
             if not candidates:
                 logger.debug("No candidate memories found for bridge discovery")
                 return []
 
-            # Compute bridge scores for candidates
-            bridge_scores = self._compute_bridge_scores(context, candidates, activated)
-
-            # Sort by bridge score and return top-k
-            bridge_scores.sort(key=lambda x: x[1], reverse=True)
-            top_bridges = bridge_scores[:k]
+            # Score all candidates at once and keep the top-k
+            scored = self._score_bridges(context, candidates, activated)
+            scored.sort(key=lambda x: x[1], reverse=True)
 
             # Create BridgeMemory objects
             bridge_memories = []
-            for candidate, bridge_score in top_bridges:
-                novelty = self._calculate_novelty_score(context, candidate)
-                connection_potential = self._calculate_connection_potential(
-                    candidate, activated
-                )
-
+            for candidate, bridge_score, novelty, connection_potential in scored[:k]:
                 bridge_memory = BridgeMemory(
                     memory=candidate,
                     novelty_score=novelty,
@@ -118,6 +142,13 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
                 )
                 bridge_memories.append(bridge_memory)
 
+            if query_hash is not None and self.cache is not None:
+                self.cache.put(
+                    query_hash,
+                    generation,
+                    self._to_cached_bridges(bridge_memories, activated),
+                )
+
             discovery_time_ms = (time.time() - start_time) * 1000
 
             logger.debug(
@@ -133,184 +164,289 @@ class SimpleBridgeDiscovery(BridgeDiscovery):
             logger.error("Bridge discovery failed", error=str(e))
             return []
 
-    def _get_candidate_memories(self, activated_ids: set[str]) -> list[CognitiveMemory]:
+    def _load_cached_bridges(
+        self, cached: Sequence[CachedBridge]
+    ) -> list[BridgeMemory] | None:
         """
-        Get candidate memories excluding already activated ones.
+        Rebuild bridge memories from a cached result.
 
         Args:
-            activated_ids: Set of activated memory IDs to exclude
+            cached: Cached bridges in rank order
 
         Returns:
-            List of candidate memories for bridge discovery
+            Bridge memories, or None if a bridge memory can no longer be loaded
         """
-        candidates = []
+        memories = self.memory_storage.get_memories_by_ids(
+            [bridge.bridge_id for bridge in cached]
+        )
+        if len(memories) != len(cached):
+            return None
+
+        return [
+            BridgeMemory(
+                memory=memory,
+                novelty_score=bridge.novelty_score,
+                connection_potential=bridge.connection_potential,
+                bridge_score=bridge.bridge_score,
+                explanation=self._generate_bridge_explanation(
+                    memory, bridge.novelty_score, bridge.connection_potential
+                ),
+            )
+            for memory, bridge in zip(memories, cached, strict=True)
+        ]
 
-        # Get memories from all hierarchy levels
-        for level in [0, 1, 2]:
-            level_memories = self.memory_storage.get_memories_by_level(level)
+    def _to_cached_bridges(
+        self, bridges: list[BridgeMemory], activated: list[CognitiveMemory]
+    ) -> list[CachedBridge]:
+        """
+        Convert discovered bridges to cache entries.
 
-            for memory in level_memories:
-                if (
-                    memory.id not in activated_ids
-                    and memory.cognitive_embedding is not None
-                ):
-                    candidates.append(memory)
+        Each bridge records the activated memory it is most similar to.
 
-        # Limit candidates for performance
-        if len(candidates) > self.max_candidates:
-            # Sort by importance/strength and take top candidates
-            candidates.sort(key=lambda m: m.importance_score, reverse=True)
-            candidates = candidates[: self.max_candidates]
+        Args:
+            bridges: Discovered bridges in rank order
+            activated: Currently activated memories
 
-        logger.debug(f"Found {len(candidates)} candidate memories for bridge discovery")
-        return candidates
+        Returns:
+            Cache entries in rank order
+        """
+        if not bridges:
+            return []
+
+        dimension = bridges[0].memory.cognitive_embedding.size  # type: ignore[union-attr]
+        with_embeddings = [
+            memory
+            for memory in activated
+            if memory.cognitive_embedding is not None
+            and memory.cognitive_embedding.size == dimension
+        ]
+        bridge_matrix = self._embedding_matrix(
+            [bridge.memory for bridge in bridges], dimension
+        )
+        activated_matrix = self._embedding_matrix(with_embeddings, dimension)
+
+        source_ids = [bridge.memory.id for bridge in bridges]
+        if bridge_matrix is not None and activated_matrix is not None:
+            closest = np.argmax(bridge_matrix @ activated_matrix.T, axis=1)
+            source_ids = [with_embeddings[int(row)].id for row in closest]
+
+        return [
+            CachedBridge(
+                bridge_id=bridge.memory.id,
+                source_id=source_id,
+                novelty_score=bridge.novelty_score,
+                connection_potential=bridge.connection_potential,
+                bridge_score=bridge.bridge_score,
+            )
+            for bridge, source_id in zip(bridges, source_ids, strict=True)
+        ]
 
-    def _compute_bridge_scores(
+    def _get_indexed_candidates(
         self,
         context: np.ndarray,
-        candidates: list[CognitiveMemory],
         activated: list[CognitiveMemory],
-    ) -> list[tuple[CognitiveMemory, float]]:
+        activated_ids: set[str],
+    ) -> list[CognitiveMemory] | None:
         """
-        Compute bridge scores for candidate memories.
+        Select candidates from the storage's resident level embedding indexes.
+
+        Scores every indexed memory exactly, with one matrix product per level
+        over all resident rows, keeping those far from the query but near the
+        activated set, and loads only the best max_candidates from storage.
 
         Args:
             context: Query context vector
-            candidates: Candidate memories
             activated: Currently activated memories
+            activated_ids: Set of activated memory IDs to exclude
 
         Returns:
-            List of (memory, bridge_score) tuples
+            List of candidate memories, or None if indexes are unavailable
         """
-        bridge_scores = []
+        context_vector = np.asarray(context, dtype=np.float32).reshape(-1)
+        activated_matrix = self._embedding_matrix(activated, context_vector.shape[0])
+        queries = (
+            np.vstack([context_vector, activated_matrix])
+            if activated_matrix is not None
+            else context_vector[np.newaxis, :]
+        )
+
+        scored_ids: list[tuple[float, str]] = []
+        for level in [0, 1, 2]:
+            index = self.memory_storage.get_level_index(level)
+            if not isinstance(index, LevelEmbeddingIndex):
+                return None
 
-        for candidate in candidates:
-            # Calculate novelty score (inverse similarity to query)
-            novelty = self._calculate_novelty_score(context, candidate)
+            result = index.similarities(queries)
+            if result is None:
+                return None
 
-            # Skip if novelty is too low
-            if novelty < self.min_novelty:
+            ids, similarities = result
+            if not ids:
                 continue
 
-            # Calculate connection potential to activated memories
-            connection_potential = self._calculate_connection_potential(
-                candidate, activated
+            novelty = 1.0 - similarities[:, 0]
+            connection_potential = (
+                similarities[:, 1:].max(axis=1)
+                if similarities.shape[1] > 1
+                else np.zeros(len(ids), dtype=np.float32)
             )
-
-            # Compute bridge score using weights from algorithm specification
-            bridge_score = (
+            bridge_scores = (
                 self.novelty_weight * novelty
                 + self.connection_weight * connection_potential
             )
+            bridge_scores[novelty < self.min_novelty] = -np.inf
+
+            keep = min(len(ids), self.max_candidates + len(activated_ids))
+            top = np.argpartition(-bridge_scores, keep - 1)[:keep]
+            scored_ids.extend(
+                (float(bridge_scores[row]), ids[row])
+                for row in top
+                if np.isfinite(bridge_scores[row]) and ids[row] not in activated_ids
+            )
+
+        scored_ids.sort(reverse=True)
+        candidate_ids = [
+            memory_id for _, memory_id in scored_ids[: self.max_candidates]
+        ]
+        if not candidate_ids:
+            return []
 
-            bridge_scores.append((candidate, bridge_score))
+        candidates = [
+            memory
+            for memory in self.memory_storage.get_memories_by_ids(candidate_ids)
+            if memory.cognitive_embedding is not None
+        ]
 
-        return bridge_scores
+        logger.debug(
+            f"Found {len(candidates)} indexed candidate memories for bridge discovery"
+        )
+        return candidates
 
-    def _calculate_novelty_score(
-        self, context: np.ndarray, memory: CognitiveMemory
-    ) -> float:
+    def _get_candidate_memories(self, activated_ids: set[str]) -> list[CognitiveMemory]:
         """
-        Calculate novelty score as inverse similarity to query.
+        Get candidate memories excluding already activated ones.
 
         Args:
-            context: Query context vector
-            memory: Memory to calculate novelty for
+            activated_ids: Set of activated memory IDs to exclude
 
         Returns:
-            Novelty score (0.0 to 1.0, higher = more novel)
+            List of candidate memories for bridge discovery
         """
-        if memory.cognitive_embedding is None:
-            return 0.0
+        candidates = []
 
-        try:
-            similarity = self._compute_cosine_similarity(
-                context, memory.cognitive_embedding
-            )
-            novelty = 1.0 - similarity  # Inverse similarity
-            return max(0.0, min(1.0, novelty))
+        # Get memories from all hierarchy levels
+        for level in [0, 1, 2]:
+            level_memories = self.memory_storage.get_memories_by_level(level)
 
-        except Exception as e:
-            logger.warning(
-                "Novelty calculation failed", memory_id=memory.id, error=str(e)
-            )
-            return 0.0
+            for memory in level_memories:
+                if (
+                    memory.id not in activated_ids
+                    and memory.cognitive_embedding is not None
+                ):
+                    candidates.append(memory)
+
+        # Limit candidates for performance
+        if len(candidates) > self.max_candidates:
+            # Sort by importance/strength and take top candidates
+            candidates.sort(key=lambda m: m.importance_score, reverse=True)
+            candidates = candidates[: self.max_candidates]
 
-    def _calculate_connection_potential(
-        self, candidate: CognitiveMemory, activated: list[CognitiveMemory]
-    ) -> float:
+        logger.debug(f"Found {len(candidates)} candidate memories for bridge discovery")
+        return candidates
+
+    def _score_bridges(
+        self,
+        context: np.ndarray,
+        candidates: list[CognitiveMemory],
+        activated: list[CognitiveMemory],
+    ) -> list[tuple[CognitiveMemory, float, float, float]]:
         """
-        Calculate connection potential to activated memories.
+        Compute novelty, connection potential, and bridge scores in bulk.
+
+        Candidates and activated memories are stacked into normalized matrices
+        so novelty takes one matrix-vector product and connection potential one
+        matrix-matrix product. Candidates below min_novelty are dropped.
 
         Args:
-            candidate: Candidate memory
-            activated: List of activated memories
+            context: Query context vector
+            candidates: Candidate memories
+            activated: Currently activated memories
 
         Returns:
-            Connection potential score (0.0 to 1.0)
+            List of (memory, bridge_score, novelty, connection_potential) tuples
         """
-        if not activated or candidate.cognitive_embedding is None:
-            return 0.0
+        context_vector = np.asarray(context, dtype=np.float32).reshape(-1)
+        dimension = context_vector.shape[0]
+
+        scorable = [
+            candidate
+            for candidate in candidates
+            if candidate.cognitive_embedding is not None
+            and candidate.cognitive_embedding.size == dimension
+        ]
+        candidate_matrix = self._embedding_matrix(scorable, dimension)
+        if candidate_matrix is None:
+            return []
 
-        try:
-            max_similarity = 0.0
+        context_norm = float(np.linalg.norm(context_vector))
+        if context_norm == 0.0:
+            query_similarity = np.zeros(len(scorable), dtype=np.float32)
+        else:
+            query_similarity = candidate_matrix @ (context_vector / context_norm)
+        novelty = 1.0 - np.clip(query_similarity, 0.0, 1.0).astype(np.float64)
 
-            for activated_memory in activated:
-                if activated_memory.cognitive_embedding is not None:
-                    similarity = self._compute_cosine_similarity(
-                        candidate.cognitive_embedding,
-                        activated_memory.cognitive_embedding,
-                    )
-                    max_similarity = max(max_similarity, similarity)
+        activated_matrix = self._embedding_matrix(activated, dimension)
+        if activated_matrix is None:
+            connection_potential = np.zeros(len(scorable))
+        else:
+            connection_potential = (
+                np.clip(candidate_matrix @ activated_matrix.T, 0.0, 1.0)
+                .max(axis=1)
+                .astype(np.float64)
+            )
 
-            return max_similarity
+        bridge_scores = (
+            self.novelty_weight * novelty
+            + self.connection_weight * connection_potential
+        )
 
-        except Exception as e:
-            logger.warning(
-                "Connection potential calculation failed",
-                candidate_id=candidate.id,
-                error=str(e),
+        return [
+            (
+                candidate,
+                float(bridge_scores[i]),
+                float(novelty[i]),
+                float(connection_potential[i]),
             )
-            return 0.0
+            for i, candidate in enumerate(scorable)
+            if novelty[i] >= self.min_novelty
+        ]
 
-    def _compute_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
+    def _embedding_matrix(
+        self, memories: list[CognitiveMemory], dimension: int
+    ) -> np.ndarray | None:
         """
-        Compute cosine similarity between two vectors.
+        Stack memory embeddings into a row-normalized float32 matrix.
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            memories: Memories whose embeddings to stack
+            dimension: Required embedding dimension; other sizes are skipped
 
         Returns:
-            Cosine similarity score (0.0 to 1.0)
+            Matrix of shape (n, dimension), or None if no embeddings qualify
         """
-        try:
-            # Ensure arrays have compatible dtypes
-            if vec1.dtype != vec2.dtype:
-                vec2 = vec2.astype(vec1.dtype)
-
-            # Flatten vectors for dot product
-            vec1_flat = vec1.flatten()
-            vec2_flat = vec2.flatten()
-
-            # Compute cosine similarity
-            dot_product = np.dot(vec1_flat, vec2_flat)
-            norm1 = np.linalg.norm(vec1_flat)
-            norm2 = np.linalg.norm(vec2_flat)
-
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-
-            similarity = dot_product / (norm1 * norm2)
-
-            # Clamp to [0, 1] range and handle numerical issues
-            similarity = np.clip(similarity, 0.0, 1.0)
-
-            return float(similarity)
-
-        except Exception as e:
-            logger.warning("Cosine similarity computation failed", error=str(e))
-            return 0.0
+        vectors = [
+            np.asarray(memory.cognitive_embedding, dtype=np.float32).reshape(-1)
+            for memory in memories
+            if memory.cognitive_embedding is not None
+            and memory.cognitive_embedding.size == dimension
+        ]
+        if not vectors:
+            return None
+
+        matrix = np.vstack(vectors)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return np.asarray(matrix / norms, dtype=np.float32)
 
     def _generate_bridge_explanation(
         self, memory: CognitiveMemory, novelty: float, connection_potential: float
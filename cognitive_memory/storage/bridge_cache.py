@@ -0,0 +1,284 @@
+"""
+Bridge discovery result cache backed by the bridge_cache table.
+
+Bridge discovery scores the whole corpus against the query and the activated
+set, which makes it the most expensive stage of retrieval. Repeated and
+near-identical queries activate the same memories and find the same bridges,
+so results are cached per (quantized query embedding, activated set, discovery
+parameters). Entries expire after their TTL and are invalidated by the
+``memory_generation`` counter whenever memories are added, deleted or
+re-embedded.
+"""
+
+import hashlib
+import json
+import threading
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from .sqlite_persistence import DatabaseManager
+
+
+@dataclass
+class CachedBridge:
+    """One cached bridge discovery result."""
+
+    bridge_id: str
+    # Activated memory the bridge is closest to (the bridge itself if none)
+    source_id: str
+    novelty_score: float
+    connection_potential: float
+    bridge_score: float
+
+
+class BridgeCache:
+    """
+    SQLite-backed cache of bridge discovery results.
+
+    Each cached result is stored as one bridge_cache row per bridge, in rank
+    order, tagged with the memory generation it was computed at. Hit counts
+    and last access times are written behind through the database's
+    statistics buffer. Cache failures are logged and treated as misses.
+    """
+
+    # Query embeddings are normalized and rounded to this many steps per unit
+    # before hashing, so near-identical queries share an entry
+    QUANTIZATION_STEPS = 256
+
+    def __init__(self, db_manager: DatabaseManager, ttl_hours: int = 168):
+        """
+        Initialize the bridge cache.
+
+        Args:
+            db_manager: Database holding the bridge_cache table
+            ttl_hours: Hours a cached result stays valid
+        """
+        self.db_manager = db_manager
+        self.ttl_hours = ttl_hours
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    @classmethod
+    def query_hash(
+        cls,
+        context: np.ndarray,
+        activated_ids: Collection[str],
+        k: int,
+        parameters: dict[str, Any],
+    ) -> str:
+        """
+        Build the cache key of a bridge discovery request.
+
+        Args:
+            context: Query context vector
+            activated_ids: IDs of the activated memories
+            k: Number of bridges requested
+            parameters: Discovery parameters the result depends on
+
+        Returns:
+            Hex digest identifying the request
+        """
+        vector = np.asarray(context, dtype=np.float64).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0.0:
+            vector = vector / norm
+        quantized = np.round(vector * cls.QUANTIZATION_STEPS).astype("<i2")
+
+        digest = hashlib.sha256()
+        digest.update(quantized.tobytes())
+        digest.update("\x00".join(sorted(activated_ids)).encode("utf-8"))
+        digest.update(
+            json.dumps({"k": k, **parameters}, sort_keys=True).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def get(self, query_hash: str) -> tuple[int, list[CachedBridge] | None]:
+        """
+        Look up a cached result.
+
+        Args:
+            query_hash: Cache key from query_hash()
+
+        Returns:
+            (memory generation, cached bridges in rank order or None on a miss);
+            the generation should be passed to put() when storing a fresh result
+        """
+        generation = 0
+        bridges: list[CachedBridge] | None = None
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                generation = self._read_generation(cursor)
+                cursor.execute(
+                    """
+                    SELECT bridge_memory_id, source_memory_id, bridge_strength,
+                           discovery_score, context_data
+                    FROM bridge_cache
+                    WHERE query_hash = ?
+                      AND julianday('now') <= created_at + ttl_hours / 24.0
+                    ORDER BY id
+                    """,
+                    (query_hash,),
+                )
+                rows = cursor.fetchall()
+
+            if rows:
+                cached: list[CachedBridge] = []
+                stale = False
+                for row in rows:
+                    context_data = json.loads(row["context_data"] or "{}")
+                    if context_data.get("generation") != generation:
+                        stale = True
+                        break
+                    cached.append(
+                        CachedBridge(
+                            bridge_id=row["bridge_memory_id"],
+                            source_id=row["source_memory_id"],
+                            novelty_score=context_data["novelty_score"],
+                            connection_potential=row["bridge_strength"],
+                            bridge_score=row["discovery_score"],
+                        )
+                    )
+
+                if stale:
+                    with self._lock:
+                        self.invalidations += 1
+                else:
+                    bridges = cached
+
+        except Exception as e:
+            logger.warning("Bridge cache lookup failed", error=str(e))
+            bridges = None
+
+        with self._lock:
+            if bridges is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if bridges is not None:
+            self.db_manager.stats_buffer.record_bridge_hit(query_hash)
+        return generation, bridges
+
+    def put(
+        self, query_hash: str, generation: int, bridges: Sequence[CachedBridge]
+    ) -> None:
+        """
+        Cache a discovery result, replacing any previous entry for the key.
+
+        Expired entries and entries from older memory generations are purged
+        in the same transaction.
+
+        Args:
+            query_hash: Cache key from query_hash()
+            generation: Memory generation returned by get() before discovery
+            bridges: Bridges in rank order
+        """
+        if not bridges:
+            return
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        """
+                        DELETE FROM bridge_cache
+                        WHERE query_hash = ?
+                           OR julianday('now') > created_at + ttl_hours / 24.0
+                           OR json_extract(context_data, '$.generation') != ?
+                        """,
+                        (query_hash, generation),
+                    )
+                    cursor.executemany(
+                        """
+                        INSERT INTO bridge_cache (
+                            query_hash, bridge_memory_id, source_memory_id,
+                            target_memory_id, bridge_strength, discovery_score,
+                            ttl_hours, context_data
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                query_hash,
+                                bridge.bridge_id,
+                                bridge.source_id,
+                                bridge.bridge_id,
+                                bridge.connection_potential,
+                                bridge.bridge_score,
+                                self.ttl_hours,
+                                json.dumps(
+                                    {
+                                        "generation": generation,
+                                        "novelty_score": bridge.novelty_score,
+                                    }
+                                ),
+                            )
+                            for bridge in bridges
+                        ],
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+            with self._lock:
+                self.stores += 1
+
+        except Exception as e:
+            logger.warning("Bridge cache store failed", error=str(e))
+
+    def clear(self) -> None:
+        """Delete every cached result."""
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("DELETE FROM bridge_cache")
+                conn.commit()
+        except Exception as e:
+            logger.warning("Failed to clear bridge cache", error=str(e))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache size and hit-rate statistics.
+
+        Returns:
+            Dictionary with cached row and query counts in the database, the
+            TTL, and hit, miss, store and invalidation counts for this process
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats: dict[str, Any] = {
+                "ttl_hours": self.ttl_hours,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*), COUNT(DISTINCT query_hash) FROM bridge_cache"
+                ).fetchone()
+            stats["entries"] = int(row[0])
+            stats["queries"] = int(row[1])
+        except Exception as e:
+            logger.warning("Failed to read bridge cache stats", error=str(e))
+
+        return stats
+
+    @staticmethod
+    def _read_generation(cursor: Any) -> int:
+        """Read the memories write generation maintained by triggers."""
+        cursor.execute("SELECT generation FROM memory_generation WHERE id = 1")
+        row = cursor.fetchone()
+        return int(row[0]) if row else 0
@@ -0,0 +1,259 @@
+"""
+Resident adjacency index of the memory connection graph.
+
+Spreading activation expands every activated memory's neighbours. Reading them
+from SQLite costs one OR-join per node that also returns full memory rows. This
+module keeps the undirected graph in compressed sparse row (CSR) form instead:
+a memory ID index, one neighbour array and one strength array, with each node's
+neighbours sorted by strength so threshold filtering is a prefix scan.
+
+The index is owned and maintained by the connection graph store: writes made
+through the store patch the affected nodes, while writes from other connections
+are detected through the ``connection_generation`` counter and trigger a full
+reload.
+"""
+
+import threading
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+from loguru import logger
+
+
+class ConnectionAdjacencyIndex:
+    """
+    Undirected connection graph in CSR form.
+
+    Parallel connections between the same two memories collapse into one edge
+    with the strongest strength. Patched nodes keep their neighbours in a small
+    overlay until the overlay grows large enough to rebuild the CSR arrays.
+    """
+
+    # Rebuild the CSR arrays once this fraction of nodes is patched
+    COMPACT_FRACTION = 0.25
+    MIN_COMPACT_NODES = 64
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded index."""
+        # Storage generation the index contents reflect (None = not loaded)
+        self.generation: int | None = None
+
+        # Guards all reads and writes of the arrays and id mappings
+        self.lock = threading.RLock()
+
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._strengths = np.zeros(0, dtype=np.float64)
+
+        # Neighbours of nodes changed since the CSR arrays were built
+        self._patched: dict[int, dict[int, float]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index holds a synchronized snapshot of the graph."""
+        return self.generation is not None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._rows
+
+    def load(
+        self, connections: Iterable[tuple[str, str, float]], generation: int
+    ) -> None:
+        """
+        Replace the index contents with a fresh snapshot.
+
+        Args:
+            connections: Iterable of (source_id, target_id, strength)
+            generation: Storage generation the snapshot was read at
+        """
+        with self.lock:
+            self._ids = []
+            self._rows = {}
+            adjacency: dict[int, dict[int, float]] = {}
+
+            edge_count = 0
+            for source_id, target_id, strength in connections:
+                if source_id == target_id:
+                    continue
+                source = self._row_for(source_id)
+                target = self._row_for(target_id)
+                for node, neighbour in ((source, target), (target, source)):
+                    neighbours = adjacency.setdefault(node, {})
+                    if strength > neighbours.get(neighbour, -1.0):
+                        neighbours[neighbour] = strength
+                edge_count += 1
+
+            self._build(adjacency)
+            self.generation = generation
+
+            logger.debug(
+                "Connection adjacency index loaded",
+                nodes=len(self._ids),
+                connections=edge_count,
+                generation=generation,
+            )
+
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next lookup triggers a reload."""
+        with self.lock:
+            self.generation = None
+
+    def set_connection(
+        self, source_id: str, target_id: str, strength: float | None
+    ) -> None:
+        """
+        Patch the edge between two memories.
+
+        Args:
+            source_id: One endpoint
+            target_id: Other endpoint
+            strength: Strongest remaining connection strength between the two
+                memories, or None if they are no longer connected
+        """
+        if source_id == target_id:
+            return
+
+        with self.lock:
+            if strength is None and (
+                source_id not in self._rows or target_id not in self._rows
+            ):
+                return
+
+            source = self._row_for(source_id)
+            target = self._row_for(target_id)
+            for node, neighbour in ((source, target), (target, source)):
+                neighbours = self._patched.get(node)
+                if neighbours is None:
+                    neighbours = self._csr_neighbours(node)
+                    self._patched[node] = neighbours
+                if strength is None:
+                    neighbours.pop(neighbour, None)
+                else:
+                    neighbours[neighbour] = strength
+
+            if len(self._patched) > max(
+                self.MIN_COMPACT_NODES, self.COMPACT_FRACTION * len(self._ids)
+            ):
+                self._compact()
+
+    def expand(
+        self, memory_ids: Sequence[str], min_strength: float = 0.0
+    ) -> list[tuple[str, list[tuple[str, float]]]]:
+        """
+        Get the neighbours of a whole BFS frontier.
+
+        Args:
+            memory_ids: Frontier memory IDs, in traversal order
+            min_strength: Minimum connection strength to follow
+
+        Returns:
+            (memory_id, neighbours) per frontier memory in input order, where
+            neighbours are (neighbour_id, strength) sorted strongest first
+        """
+        results: list[tuple[str, list[tuple[str, float]]]] = []
+        with self.lock:
+            for memory_id in memory_ids:
+                row = self._rows.get(memory_id)
+                if row is None:
+                    results.append((memory_id, []))
+                    continue
+
+                patched = self._patched.get(row)
+                if patched is not None:
+                    neighbours = sorted(
+                        (
+                            (self._ids[neighbour], strength)
+                            for neighbour, strength in patched.items()
+                            if strength >= min_strength
+                        ),
+                        key=lambda item: -item[1],
+                    )
+                else:
+                    neighbours = self._csr_slice(row, min_strength)
+                results.append((memory_id, neighbours))
+
+        return results
+
+    def get_stats(self) -> dict[str, int | bool | None]:
+        """Get index size and synchronization state."""
+        with self.lock:
+            return {
+                "nodes": len(self._ids),
+                "edges": int(self._indices.shape[0]) // 2,
+                "patched_nodes": len(self._patched),
+                "loaded": self.is_loaded,
+                "generation": self.generation,
+            }
+
+    def _row_for(self, memory_id: str) -> int:
+        """Get the row of a memory, adding it if unknown; caller holds the lock."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            row = len(self._ids)
+            self._ids.append(memory_id)
+            self._rows[memory_id] = row
+        return row
+
+    def _csr_slice(self, row: int, min_strength: float) -> list[tuple[str, float]]:
+        """Neighbours of an unpatched row meeting min_strength, strongest first."""
+        if row + 1 >= self._indptr.shape[0]:
+            return []
+
+        start, end = int(self._indptr[row]), int(self._indptr[row + 1])
+        strengths = self._strengths[start:end]
+        # Strengths are sorted descending, so the matches are a prefix
+        count = int(np.count_nonzero(strengths >= min_strength))
+        return [
+            (self._ids[neighbour], float(strength))
+            for neighbour, strength in zip(
+                self._indices[start : start + count].tolist(),
+                strengths[:count].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _csr_neighbours(self, row: int) -> dict[int, float]:
+        """All neighbours of a row from the CSR arrays."""
+        if row + 1 >= self._indptr.shape[0]:
+            return {}
+        start, end = int(self._indptr[row]), int(self._indptr[row + 1])
+        return dict(
+            zip(
+                self._indices[start:end].tolist(),
+                self._strengths[start:end].tolist(),
+                strict=True,
+            )
+        )
+
+    def _compact(self) -> None:
+        """Fold patched rows back into freshly built CSR arrays."""
+        adjacency = {
+            row: self._patched.get(row) or self._csr_neighbours(row)
+            for row in range(len(self._ids))
+        }
+        self._build(adjacency)
+
+    def _build(self, adjacency: dict[int, dict[int, float]]) -> None:
+        """Build CSR arrays from per-row neighbour maps and clear patches."""
+        size = len(self._ids)
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        indices: list[int] = []
+        strengths: list[float] = []
+
+        for row in range(size):
+            neighbours = sorted(
+                adjacency.get(row, {}).items(), key=lambda item: -item[1]
+            )
+            indices.extend(neighbour for neighbour, _ in neighbours)
+            strengths.extend(strength for _, strength in neighbours)
+            indptr[row + 1] = len(indices)
+
+        self._indptr = indptr
+        self._indices = np.asarray(indices, dtype=np.int32)
+        self._strengths = np.asarray(strengths, dtype=np.float64)
+        self._patched = {}
@@ -583,6 +583,9 @@ class MemoryConsolidation:
         """Identify episodic memories ready for consolidation."""
         candidates = []
 
+        # Candidates are selected by access count, so apply buffered accesses
+        self.db_manager.stats_buffer.flush()
+
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
@@ -854,17 +857,10 @@ class DualMemorySystem:
                 row = cursor.fetchone()
 
                 if row:
-                    # Update access count
-                    cursor.execute(
-                        """
-                        UPDATE memories
-                        SET access_count = access_count + 1,
-                            last_accessed = julianday('now')
-                        WHERE id = ?
-                    """,
-                        (memory_id,),
+                    # Access count is written behind; include buffered accesses
+                    pending_accesses = self.db_manager.stats_buffer.record_access(
+                        memory_id
                     )
-                    conn.commit()
 
                     # Convert to CognitiveMemory
                     dimensions = (
@@ -882,7 +878,7 @@ class DualMemorySystem:
                         if row["timestamp"]
                         else datetime.now(),
                         strength=row["strength"],
-                        access_count=row["access_count"] + 1,
+                        access_count=row["access_count"] + pending_accesses,
                         tags=tags,
                     )
 
@@ -973,6 +969,8 @@ class DualMemorySystem:
 
     def close(self) -> None:
         """Clean up resources."""
+        self.db_manager.stats_buffer.flush()
+
         if self.activity_tracker:
             try:
                 self.activity_tracker.close()
@@ -0,0 +1,1173 @@
+"""
+Embedded NumPy vector storage for single-user deployments.
+
+Implements the VectorStorage surface of HierarchicalMemoryStorage without a
+Qdrant server. Each hierarchy level keeps its vectors in a memory-mapped
+float32 matrix file, and an SQLite index next to the matrices maps memory IDs
+to rows and holds the payloads. Rows are append-only: updates and deletes
+leave tombstones that are compacted away once they make up a configurable
+share of a level. Searches are exact matrix products, or an inverted file
+(IVF) probe over spherical k-means lists once a level is large enough.
+
+Several processes (the MCP server and the file monitor) may open the same
+store. Writers serialize on the SQLite write lock, and every operation first
+picks up rows written by other processes from a per-level version counter.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from ..core.interfaces import VectorStorage
+from ..core.memory import CognitiveMemory, SearchResult
+
+LEVEL_NAMES = {0: "concepts", 1: "contexts", 2: "episodes"}
+SEARCH_MODES = ("auto", "exact", "ivf")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS levels (
+    level INTEGER PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,  -- Bumped when the matrix is compacted
+    version INTEGER NOT NULL DEFAULT 0,  -- Bumped by every write
+    used_rows INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS vectors (
+    id TEXT PRIMARY KEY,
+    level INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    source_path TEXT,
+    payload TEXT NOT NULL,
+    version INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vectors_level_row ON vectors (level, row);
+CREATE INDEX IF NOT EXISTS idx_vectors_level_version ON vectors (level, version);
+CREATE INDEX IF NOT EXISTS idx_vectors_source_path ON vectors (source_path);
+CREATE TABLE IF NOT EXISTS tombstones (
+    level INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (level, row)
+);
+"""
+
+
+class _IVFIndex:
+    """Inverted file index over one level's rows."""
+
+    TRAINING_ITERATIONS = 10
+    TRAINING_SAMPLES_PER_LIST = 64
+    ASSIGN_CHUNK_ROWS = 65536
+
+    def __init__(
+        self, centroids: np.ndarray, assignments: np.ndarray, trained_rows: int
+    ):
+        self.centroids = centroids
+        # List of every row below len(assignments)
+        self.assignments = assignments
+        # Live rows the centroids were trained on, to decide on retraining
+        self.trained_rows = trained_rows
+        self.dirty = True
+        self._order: np.ndarray | None = None
+        self._bounds: np.ndarray | None = None
+
+    @property
+    def lists(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def train(
+        cls, matrix: np.ndarray, rows: np.ndarray, lists: int, seed: int = 0
+    ) -> "_IVFIndex":
+        """Run spherical k-means on a sample of rows and assign every row."""
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(rows), lists * cls.TRAINING_SAMPLES_PER_LIST)
+        sample = np.asarray(
+            matrix[np.sort(rng.choice(rows, sample_size, replace=False))]
+        )
+        centroids = sample[rng.choice(sample_size, lists, replace=False)].copy()
+
+        for _ in range(cls.TRAINING_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=lists)
+            empty = counts == 0
+            if empty.any():
+                # Restart empty lists from random samples
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = (sums / np.maximum(norms, 1e-12)).astype(np.float32)
+
+        index = cls(centroids, np.zeros(0, dtype=np.int32), len(rows))
+        index.extend(matrix, int(rows.max()) + 1)
+        return index
+
+    def extend(self, matrix: np.ndarray, used_rows: int) -> None:
+        """Assign rows appended since the last call to their nearest list."""
+        start = len(self.assignments)
+        if used_rows <= start:
+            return
+        parts = [self.assignments]
+        for chunk_start in range(start, used_rows, self.ASSIGN_CHUNK_ROWS):
+            chunk = np.asarray(
+                matrix[
+                    chunk_start : min(used_rows, chunk_start + self.ASSIGN_CHUNK_ROWS)
+                ]
+            )
+            parts.append(np.argmax(chunk @ self.centroids.T, axis=1).astype(np.int32))
+        self.assignments = np.concatenate(parts)
+        self.dirty = True
+        self._order = None
+
+    def candidates(self, query: np.ndarray, probes: int) -> np.ndarray:
+        """Rows in the lists whose centroids are closest to the query."""
+        if self._order is None:
+            self._order = np.argsort(self.assignments, kind="stable")
+            self._bounds = np.searchsorted(
+                self.assignments[self._order], np.arange(self.lists + 1)
+            )
+        assert self._bounds is not None
+
+        probes = min(probes, self.lists)
+        nearest = np.argpartition(-(self.centroids @ query), probes - 1)[:probes]
+        return np.concatenate(
+            [self._order[self._bounds[lst] : self._bounds[lst + 1]] for lst in nearest]
+        )
+
+    def save(self, path: Path) -> None:
+        """Persist centroids and assignments atomically."""
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as handle:
+            np.savez(
+                handle,
+                centroids=self.centroids,
+                assignments=self.assignments,
+                trained_rows=self.trained_rows,
+            )
+        os.replace(temp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "_IVFIndex":
+        """Load an index saved with save()."""
+        with np.load(path) as data:
+            index = cls(
+                data["centroids"], data["assignments"], int(data["trained_rows"])
+            )
+        index.dirty = False
+        return index
+
+
+class _Level:
+    """In-process view of one hierarchy level."""
+
+    def __init__(self, level: int):
+        self.level = level
+        self.lock = threading.RLock()
+        self.generation = -1
+        self.version = -1
+        self.used = 0
+        self.matrix: np.memmap | None = None
+        # Row -> memory ID, None for tombstoned rows
+        self.ids: list[str | None] = []
+        self.live = np.zeros(0, dtype=bool)
+        self.ivf: _IVFIndex | None = None
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self.matrix is None else self.matrix.shape[0]
+
+    @property
+    def live_count(self) -> int:
+        return int(self.live[: self.used].sum())
+
+    def resize(self, used: int) -> None:
+        """Grow the row bookkeeping to used rows."""
+        if used > len(self.ids):
+            self.ids.extend([None] * (used - len(self.ids)))
+        if used > len(self.live):
+            live = np.zeros(max(used, 2 * len(self.live)), dtype=bool)
+            live[: len(self.live)] = self.live
+            self.live = live
+        self.used = used
+
+
+class EmbeddedVectorStorage(VectorStorage):
+    """
+    Single-node vector storage on memory-mapped NumPy matrices.
+
+    Vectors are normalized on write, so scores are cosine similarities as in
+    the Qdrant collections. Search results carry the same memory fields and
+    collection names as HierarchicalMemoryStorage.
+    """
+
+    MIN_CAPACITY_ROWS = 1024
+    # Compaction only pays off once a level has this many tombstones
+    MIN_COMPACTION_ROWS = 1000
+    MAX_IVF_LISTS = 4096
+
+    def __init__(
+        self,
+        vector_size: int,
+        project_id: str,
+        path: str | Path,
+        search_mode: str = "auto",
+        ivf_min_vectors: int = 100_000,
+        ivf_probes: int = 0,
+        compaction_ratio: float = 0.25,
+    ):
+        """
+        Open or create an embedded vector store.
+
+        Args:
+            vector_size: Dimension of embedding vectors (from configuration)
+            project_id: Project identifier; the store lives in path/project_id
+            path: Directory holding the stores of all projects
+            search_mode: "exact", "ivf", or "auto" to use IVF on levels with at
+                least ivf_min_vectors live vectors
+            ivf_min_vectors: Live vectors a level needs before auto mode
+                switches it to IVF search
+            ivf_probes: Lists probed per IVF search, 0 to probe a sixteenth of
+                the lists
+            compaction_ratio: Share of tombstoned rows that triggers compaction
+        """
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Invalid vector search mode: {search_mode}")
+
+        self.vector_size = vector_size
+        self.project_id = project_id
+        self.search_mode = search_mode
+        self.ivf_min_vectors = ivf_min_vectors
+        self.ivf_probes = ivf_probes
+        self.compaction_ratio = compaction_ratio
+        self.directory = Path(path) / project_id
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Always acquired after any level locks
+        self._db_lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.directory / "index.db",
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_dimension()
+
+        self._levels = {level: _Level(level) for level in LEVEL_NAMES}
+        # Holding the write lock keeps other processes from compacting while
+        # files of other generations are removed
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for state in self._levels.values():
+                self._refresh(state)
+                self._remove_stale_files(state)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        # One worker per hierarchy level, as in VectorSearchEngine
+        self._executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="embedded-search"
+        )
+        self._closed = False
+
+        logger.info(
+            "Embedded vector storage opened",
+            path=str(self.directory),
+            vectors={level: state.live_count for level, state in self._levels.items()},
+            search_mode=search_mode,
+        )
+
+    def get_collection_name(self, level: int) -> str:
+        """Collection name of a level, matching the Qdrant collections."""
+        if level not in LEVEL_NAMES:
+            raise ValueError(f"Invalid memory level: {level}")
+        return f"{self.project_id}_{LEVEL_NAMES[level]}"
+
+    def store_vector(
+        self, id: str, vector: np.ndarray, metadata: dict[str, Any]
+    ) -> None:
+        """
+        Store a vector with associated metadata in appropriate hierarchy level.
+
+        Args:
+            id: Unique identifier for the vector
+            vector: Cognitive embedding vector (dimension must match configured vector_size)
+            metadata: Associated metadata including hierarchy_level
+        """
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[-1] != self.vector_size:
+            raise ValueError(
+                f"Expected {self.vector_size}-dimensional vector, got {vector.shape[-1]}"
+            )
+
+        hierarchy_level = metadata.get("hierarchy_level", 2)
+        if hierarchy_level not in LEVEL_NAMES:
+            raise ValueError(f"Invalid hierarchy level: {hierarchy_level}")
+
+        self._write([(id, hierarchy_level, vector, metadata)])
+        logger.debug("Vector stored successfully", id=id, level=hierarchy_level)
+
+    def store_vectors_batch(
+        self, items: list[tuple[str, np.ndarray, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Store several vectors in one transaction.
+
+        Invalid items are skipped and reported as failed.
+
+        Args:
+            items: List of (id, vector, metadata) tuples
+
+        Returns:
+            List of successfully stored vector IDs
+        """
+        valid = []
+        for id, vector, metadata in items:
+            vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+            hierarchy_level = metadata.get("hierarchy_level", 2)
+            if (
+                vector.shape[-1] != self.vector_size
+                or hierarchy_level not in LEVEL_NAMES
+            ):
+                logger.error(
+                    "Skipping invalid vector in batch",
+                    id=id,
+                    level=hierarchy_level,
+                    dimension=vector.shape[-1],
+                )
+                continue
+            valid.append((id, hierarchy_level, vector, metadata))
+
+        if not valid:
+            return []
+
+        try:
+            self._write(valid)
+        except Exception as e:
+            logger.error("Failed to store vector batch", count=len(valid), error=str(e))
+            return []
+        return [item[0] for item in valid]
+
+    def search_similar(
+        self, query_vector: np.ndarray, k: int, filters: dict | None = None
+    ) -> list[SearchResult]:
+        """
+        Search for similar vectors across all hierarchy levels.
+
+        Args:
+            query_vector: Query vector for similarity search
+            k: Number of results to return
+            filters: Optional metadata filters
+
+        Returns:
+            List of SearchResult objects sorted by score
+        """
+        return self.search_cross_level(query_vector, k, filters=filters)
+
+    def search_cross_level(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        k_per_level: dict[int, int] | None = None,
+        score_thresholds: dict[int, float] | None = None,
+        filters: dict | None = None,
+    ) -> list[SearchResult]:
+        """
+        Search all hierarchy levels concurrently and merge into a global top-k.
+
+        Args:
+            query_vector: Query vector for similarity search
+            k: Number of merged results to return
+            k_per_level: Optional per-level result limits (defaults to
+                max(1, k // 3) each, distributing k across the levels; pass
+                k for every level to make the merged top-k exact)
+            score_thresholds: Optional per-level minimum similarity scores
+            filters: Optional metadata filters
+
+        Returns:
+            List of SearchResult objects sorted by score
+        """
+        futures = []
+        for level in LEVEL_NAMES:
+            level_k = (
+                k_per_level.get(level, 0)
+                if k_per_level is not None
+                else max(1, k // 3)  # Distribute k across levels
+            )
+            if level_k <= 0:
+                continue
+            futures.append(
+                self._executor.submit(
+                    self.search_by_level,
+                    query_vector,
+                    level,
+                    level_k,
+                    filters,
+                    (score_thresholds or {}).get(level),
+                )
+            )
+
+        all_results = [result for future in futures for result in future.result()]
+        all_results.sort(key=lambda x: x.similarity_score, reverse=True)
+        return all_results[:k]
+
+    def search_by_level(
+        self,
+        query_vector: np.ndarray,
+        level: int,
+        k: int,
+        filters: dict | None = None,
+        score_threshold: float | None = None,
+    ) -> list[SearchResult]:
+        """Search within a specific hierarchy level."""
+        try:
+            return self._search_level(
+                self._levels[level], query_vector, k, filters, score_threshold
+            )
+        except Exception as e:
+            logger.error("Vector search failed", level=level, error=str(e))
+            return []
+
+    def delete_vector(self, id: str) -> bool:
+        """
+        Delete a vector by ID.
+
+        Args:
+            id: Vector ID to delete
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        return bool(self.delete_vectors_by_ids([id]))
+
+    def delete_vectors_by_ids(
+        self, memory_ids: list[str], hierarchy_levels: dict[str, int] | None = None
+    ) -> list[str]:
+        """
+        Delete vectors by their IDs in one transaction.
+
+        IDs that are not stored count as deleted, as with Qdrant deletes.
+
+        Args:
+            memory_ids: List of vector IDs to delete
+            hierarchy_levels: Unused; rows are located through the index
+
+        Returns:
+            List of successfully deleted memory IDs
+        """
+        if not memory_ids:
+            return []
+
+        try:
+            self._delete("id", list(dict.fromkeys(memory_ids)))
+        except Exception as e:
+            logger.warning(
+                "Bulk vector deletion failed", count=len(memory_ids), error=str(e)
+            )
+            return []
+        return list(memory_ids)
+
+    def delete_vectors_by_source_path(self, source_path: str) -> bool:
+        """
+        Delete every vector whose payload source_path matches.
+
+        Args:
+            source_path: Source file path stored in the vector payload
+
+        Returns:
+            True if the delete completed, False otherwise
+        """
+        try:
+            self._delete("source_path", [source_path])
+            return True
+        except Exception as e:
+            logger.warning(
+                "Vector deletion by source path failed",
+                source_path=source_path,
+                error=str(e),
+            )
+            return False
+
+    def update_vector(
+        self, id: str, vector: np.ndarray, metadata: dict[str, Any]
+    ) -> bool:
+        """
+        Update an existing vector and its metadata.
+
+        Args:
+            id: Vector ID to update
+            vector: New vector data
+            metadata: New metadata
+
+        Returns:
+            True if updated, False otherwise
+        """
+        try:
+            self.store_vector(id, vector, metadata)
+            return True
+        except Exception as e:
+            logger.error("Failed to update vector", id=id, error=str(e))
+            return False
+
+    def get_storage_stats(self) -> dict[str, Any]:
+        """Get storage statistics for all levels."""
+        stats = {}
+        for level, state in self._levels.items():
+            with state.lock:
+                try:
+                    self._refresh(state)
+                    live = state.live_count
+                    stats[f"level_{level}"] = {
+                        "collection_name": self.get_collection_name(level),
+                        "vectors_count": live,
+                        "points_count": live,
+                        "indexed_vectors_count": live if state.ivf else 0,
+                        "tombstoned_rows": state.used - live,
+                        "capacity_rows": state.capacity,
+                        "index": "ivf" if self._use_ivf(state) else "exact",
+                        "status": "green",
+                    }
+                except Exception as e:
+                    logger.error(f"Failed to get stats for level {level}", error=str(e))
+                    stats[f"level_{level}"] = {"error": str(e)}
+        return stats
+
+    def optimize_collections(self) -> bool:
+        """Compact tombstoned rows and train IVF lists where configured."""
+        try:
+            for state in self._levels.values():
+                with state.lock:
+                    self._refresh(state)
+                    if state.used > state.live_count:
+                        self._compact(state)
+                    if self._use_ivf(state):
+                        self._ensure_ivf(state, retrain=True)
+            return True
+        except Exception as e:
+            logger.error("Failed to optimize embedded vector storage", error=str(e))
+            return False
+
+    def close(self) -> None:
+        """Persist IVF indexes, flush matrices and close the index database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        try:
+            for state in self._levels.values():
+                with state.lock:
+                    if state.ivf is not None and state.ivf.dirty:
+                        state.ivf.save(self._ivf_path(state.level, state.generation))
+                    if state.matrix is not None:
+                        state.matrix.flush()
+                        state.matrix = None
+            with self._db_lock:
+                self._conn.close()
+            logger.info("Embedded vector storage closed", path=str(self.directory))
+        except Exception as e:
+            logger.error("Error closing embedded vector storage", error=str(e))
+
+    def __enter__(self) -> "EmbeddedVectorStorage":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    # Writes
+
+    def _write(self, items: list[tuple[str, int, np.ndarray, dict[str, Any]]]) -> None:
+        """Append vectors, tombstoning previous rows of the same IDs."""
+        vectors = np.stack([item[2] for item in items])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.maximum(norms, 1e-12)
+
+        states = list(self._levels.values())
+        for state in states:
+            state.lock.acquire()
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for state in states:
+                        self._refresh(state)
+
+                    previous = self._locate("id", [item[0] for item in items])
+                    versions = {
+                        level: self._levels[level].version + 1 for level in LEVEL_NAMES
+                    }
+                    used = {level: self._levels[level].used for level in LEVEL_NAMES}
+                    tombstones: list[tuple[int, int]] = []
+                    appended: list[tuple[int, int, str]] = []
+                    rows: list[tuple[Any, ...]] = []
+
+                    for (id, level, _, metadata), vector in zip(
+                        items, vectors, strict=True
+                    ):
+                        if id in previous:
+                            tombstones.append(previous.pop(id))
+                        state = self._levels[level]
+                        row = used[level]
+                        used[level] += 1
+                        self._ensure_capacity(state, row + 1)
+                        assert state.matrix is not None
+                        state.matrix[row] = vector
+                        appended.append((level, row, id))
+                        rows.append(
+                            (
+                                id,
+                                level,
+                                row,
+                                metadata.get("source_path"),
+                                json.dumps(metadata, default=str),
+                                versions[level],
+                            )
+                        )
+                        # A repeated ID in the batch replaces its earlier row
+                        previous[id] = (level, row)
+
+                    for state in states:
+                        if state.matrix is not None:
+                            state.matrix.flush()
+
+                    self._conn.executemany(
+                        """
+                        INSERT INTO vectors (id, level, row, source_path, payload, version)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (id) DO UPDATE SET
+                            level = excluded.level,
+                            row = excluded.row,
+                            source_path = excluded.source_path,
+                            payload = excluded.payload,
+                            version = excluded.version
+                        """,
+                        rows,
+                    )
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO tombstones (level, row, version) VALUES (?, ?, ?)",
+                        [(level, row, versions[level]) for level, row in tombstones],
+                    )
+                    touched = {level for level, _, _ in appended} | {
+                        level for level, _ in tombstones
+                    }
+                    self._conn.executemany(
+                        "UPDATE levels SET version = ?, used_rows = ? WHERE level = ?",
+                        [(versions[level], used[level], level) for level in touched],
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+            for level in touched:
+                state = self._levels[level]
+                state.resize(used[level])
+                state.version = versions[level]
+            for level, row, id in appended:
+                state = self._levels[level]
+                state.ids[row] = id
+                state.live[row] = True
+            for level, row in tombstones:
+                state = self._levels[level]
+                state.ids[row] = None
+                state.live[row] = False
+
+            for level in touched:
+                self._after_write(self._levels[level])
+        finally:
+            for state in reversed(states):
+                state.lock.release()
+
+    def _delete(self, column: str, values: list[str]) -> None:
+        """Tombstone every row whose column matches one of the values."""
+        states = list(self._levels.values())
+        for state in states:
+            state.lock.acquire()
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for state in states:
+                        self._refresh(state)
+                    located = self._locate(column, values)
+                    if not located:
+                        self._conn.execute("ROLLBACK")
+                        return
+
+                    versions = {
+                        level: self._levels[level].version + 1
+                        for level, _ in located.values()
+                    }
+                    self._executemany_in(
+                        "DELETE FROM vectors WHERE id IN ({})", list(located)
+                    )
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO tombstones (level, row, version) VALUES (?, ?, ?)",
+                        [
+                            (level, row, versions[level])
+                            for level, row in located.values()
+                        ],
+                    )
+                    self._conn.executemany(
+                        "UPDATE levels SET version = ? WHERE level = ?",
+                        [(version, level) for level, version in versions.items()],
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+            for level, row in located.values():
+                state = self._levels[level]
+                state.ids[row] = None
+                state.live[row] = False
+            for level, version in versions.items():
+                self._levels[level].version = version
+                self._after_write(self._levels[level])
+        finally:
+            for state in reversed(states):
+                state.lock.release()
+
+    def _after_write(self, state: _Level) -> None:
+        """Compact a level or extend its IVF lists after a write; lock held."""
+        dead = state.used - state.live_count
+        if (
+            dead >= self.MIN_COMPACTION_ROWS
+            and dead >= self.compaction_ratio * state.used
+        ):
+            self._compact(state)
+        elif state.ivf is not None:
+            assert state.matrix is not None
+            state.ivf.extend(state.matrix, state.used)
+
+    def _compact(self, state: _Level) -> None:
+        """Rewrite a level's matrix without tombstoned rows; lock held."""
+        started = time.perf_counter()
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._refresh(state)
+                assert state.matrix is not None
+                live_rows = np.flatnonzero(state.live[: state.used])
+                generation = state.generation + 1
+                path = self._matrix_path(state.level, generation)
+                capacity = max(self.MIN_CAPACITY_ROWS, len(live_rows))
+                matrix = self._open_matrix(path, capacity, create=True)
+                for start in range(0, len(live_rows), _IVFIndex.ASSIGN_CHUNK_ROWS):
+                    chunk = live_rows[start : start + _IVFIndex.ASSIGN_CHUNK_ROWS]
+                    matrix[start : start + len(chunk)] = state.matrix[chunk]
+                matrix.flush()
+
+                version = state.version + 1
+                # New rows never exceed old ones, so ascending renumbering keeps
+                # (level, row) unique at every step
+                self._conn.executemany(
+                    "UPDATE vectors SET row = ?, version = ? WHERE level = ? AND row = ?",
+                    [
+                        (new_row, version, state.level, int(old_row))
+                        for new_row, old_row in enumerate(live_rows)
+                    ],
+                )
+                self._conn.execute(
+                    "DELETE FROM tombstones WHERE level = ?", (state.level,)
+                )
+                self._conn.execute(
+                    """
+                    UPDATE levels SET generation = ?, version = ?, used_rows = ?
+                    WHERE level = ?
+                    """,
+                    (generation, version, len(live_rows), state.level),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        old_generation, old_ivf = state.generation, state.ivf
+        state.matrix = matrix
+        state.generation = generation
+        state.version = version
+        state.ids = [state.ids[row] for row in live_rows]
+        state.live = np.ones(len(live_rows), dtype=bool)
+        state.used = len(live_rows)
+        state.ivf = None
+        if old_ivf is not None:
+            # Live rows keep their order, so covered rows stay a prefix
+            covered = live_rows[live_rows < len(old_ivf.assignments)]
+            state.ivf = _IVFIndex(
+                old_ivf.centroids, old_ivf.assignments[covered], old_ivf.trained_rows
+            )
+            state.ivf.extend(matrix, state.used)
+            state.ivf.save(self._ivf_path(state.level, generation))
+        self._remove_files(state.level, old_generation)
+
+        logger.info(
+            "Compacted embedded vector level",
+            level=state.level,
+            live_rows=state.used,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+    # Reads
+
+    def _search_level(
+        self,
+        state: _Level,
+        query_vector: np.ndarray,
+        k: int,
+        filters: dict | None,
+        score_threshold: float | None,
+    ) -> list[SearchResult]:
+        """Score one level and return its top-k results."""
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(query))
+        if norm > 0.0:
+            query = query / norm
+
+        with state.lock:
+            self._refresh(state)
+            if state.used == 0 or state.matrix is None:
+                return []
+
+            if self._use_ivf(state):
+                self._ensure_ivf(state)
+                assert state.ivf is not None
+                rows = np.sort(state.ivf.candidates(query, self._probes(state.ivf)))
+                rows = rows[state.live[rows]]
+                scores = np.asarray(state.matrix[rows]) @ query
+            else:
+                scores = np.asarray(state.matrix[: state.used]) @ query
+                rows = np.flatnonzero(state.live[: state.used])
+                scores = scores[rows]
+
+            if score_threshold is not None:
+                keep = scores >= score_threshold
+                rows, scores = rows[keep], scores[keep]
+
+            # Filters are checked on payloads, so rank every candidate for them
+            if filters or len(rows) <= k:
+                order = np.argsort(-scores, kind="stable")
+            else:
+                top = np.argpartition(-scores, k - 1)[:k]
+                order = top[np.argsort(-scores[top], kind="stable")]
+            ranked = [
+                (state.ids[int(rows[index])], float(scores[index])) for index in order
+            ]
+
+        results: list[SearchResult] = []
+        collection_name = self.get_collection_name(state.level)
+        batch = max(k, 64) if filters else k
+        for start in range(0, len(ranked), batch):
+            window = ranked[start : start + batch]
+            payloads = self._payloads([id for id, _ in window if id is not None])
+            for id, score in window:
+                if id is None:
+                    continue
+                payload = payloads.get(id)
+                if payload is None or not _matches(payload, filters):
+                    continue
+                results.append(
+                    _to_result(id, score, payload, state.level, collection_name)
+                )
+                if len(results) == k:
+                    return results
+        return results
+
+    def _use_ivf(self, state: _Level) -> bool:
+        """Whether a level is searched through IVF lists."""
+        if self.search_mode == "exact":
+            return False
+        live = state.live_count
+        if self.search_mode == "ivf":
+            return live >= 2
+        return live >= self.ivf_min_vectors
+
+    def _probes(self, ivf: _IVFIndex) -> int:
+        """Lists probed per IVF search."""
+        return self.ivf_probes if self.ivf_probes > 0 else max(1, ivf.lists // 16)
+
+    def _ensure_ivf(self, state: _Level, retrain: bool = False) -> None:
+        """Train IVF lists for a level, or retrain once it has doubled; lock held."""
+        assert state.matrix is not None
+        live_rows = np.flatnonzero(state.live[: state.used])
+        if (
+            state.ivf is not None
+            and not retrain
+            and state.ivf.trained_rows * 2 >= len(live_rows)
+        ):
+            state.ivf.extend(state.matrix, state.used)
+            return
+
+        started = time.perf_counter()
+        lists = int(min(self.MAX_IVF_LISTS, max(1, math.isqrt(len(live_rows)))))
+        state.ivf = _IVFIndex.train(state.matrix, live_rows, lists)
+        state.ivf.extend(state.matrix, state.used)
+        state.ivf.save(self._ivf_path(state.level, state.generation))
+        logger.info(
+            "Trained IVF lists for embedded vector level",
+            level=state.level,
+            lists=lists,
+            vectors=len(live_rows),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+    def _payloads(self, ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Load payloads of the given IDs."""
+        payloads = {}
+        with self._db_lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for id, payload in self._conn.execute(
+                    f"SELECT id, payload FROM vectors WHERE id IN ({placeholders})",
+                    chunk,
+                ):
+                    payloads[id] = json.loads(payload)
+        return payloads
+
+    # Shared state
+
+    def _refresh(self, state: _Level) -> None:
+        """Apply writes committed since the level was last read; lock held."""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT generation, version, used_rows FROM levels WHERE level = ?",
+                (state.level,),
+            ).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO levels (level) VALUES (?)", (state.level,)
+                )
+                row = (0, 0, 0)
+            generation, version, used = row
+
+            if generation != state.generation:
+                self._load(state, generation, version, used)
+                return
+            if version == state.version:
+                return
+
+            self._ensure_capacity(state, used)
+            state.resize(used)
+            for row_number, id in self._conn.execute(
+                "SELECT row, id FROM vectors WHERE level = ? AND version > ?",
+                (state.level, state.version),
+            ):
+                state.ids[row_number] = id
+                state.live[row_number] = True
+            for (row_number,) in self._conn.execute(
+                "SELECT row FROM tombstones WHERE level = ? AND version > ?",
+                (state.level, state.version),
+            ):
+                state.ids[row_number] = None
+                state.live[row_number] = False
+            state.version = version
+
+    def _load(self, state: _Level, generation: int, version: int, used: int) -> None:
+        """Load a level from disk; lock held."""
+        path = self._matrix_path(state.level, generation)
+        if path.exists():
+            capacity = path.stat().st_size // (4 * self.vector_size)
+            state.matrix = self._open_matrix(
+                path, max(self.MIN_CAPACITY_ROWS, capacity, used)
+            )
+        else:
+            if used:
+                logger.warning(
+                    "Embedded vector matrix missing, vectors will read as zeros",
+                    path=str(path),
+                    rows=used,
+                )
+            state.matrix = self._open_matrix(
+                path, max(self.MIN_CAPACITY_ROWS, used), create=True
+            )
+
+        state.ids = [None] * used
+        state.live = np.zeros(used, dtype=bool)
+        state.used = used
+        for row_number, id in self._conn.execute(
+            "SELECT row, id FROM vectors WHERE level = ?", (state.level,)
+        ):
+            state.ids[row_number] = id
+            state.live[row_number] = True
+
+        state.ivf = None
+        ivf_path = self._ivf_path(state.level, generation)
+        if ivf_path.exists():
+            try:
+                state.ivf = _IVFIndex.load(ivf_path)
+                state.ivf.extend(state.matrix, used)
+            except Exception as e:
+                logger.warning(
+                    "Ignoring unreadable IVF index", path=str(ivf_path), error=str(e)
+                )
+                state.ivf = None
+
+        state.generation = generation
+        state.version = version
+
+    def _ensure_capacity(self, state: _Level, rows: int) -> None:
+        """Grow a level's matrix file to hold at least rows rows; lock held."""
+        if rows <= state.capacity and state.matrix is not None:
+            return
+        capacity = max(self.MIN_CAPACITY_ROWS, state.capacity)
+        while capacity < rows:
+            capacity *= 2
+        path = self._matrix_path(state.level, max(state.generation, 0))
+        if state.matrix is not None:
+            state.matrix.flush()
+        state.matrix = self._open_matrix(path, capacity, create=not path.exists())
+
+    def _open_matrix(self, path: Path, rows: int, create: bool = False) -> np.memmap:
+        """Map a matrix file with room for rows rows, growing the file if needed."""
+        size = rows * 4 * self.vector_size
+        with open(path, "w+b" if create else "r+b") as handle:
+            if os.fstat(handle.fileno()).st_size < size:
+                handle.truncate(size)
+        return np.memmap(
+            path, dtype=np.float32, mode="r+", shape=(rows, self.vector_size)
+        )
+
+    def _locate(self, column: str, values: list[str]) -> dict[str, tuple[int, int]]:
+        """Find (level, row) of stored vectors by ID or source path."""
+        located = {}
+        for start in range(0, len(values), 500):
+            chunk = values[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for id, level, row in self._conn.execute(
+                f"SELECT id, level, row FROM vectors WHERE {column} IN ({placeholders})",
+                chunk,
+            ):
+                located[id] = (level, row)
+        return located
+
+    def _executemany_in(self, sql: str, values: list[str]) -> None:
+        """Run a statement with an IN list over values in chunks."""
+        for start in range(0, len(values), 500):
+            chunk = values[start : start + 500]
+            self._conn.execute(sql.format(", ".join("?" * len(chunk))), chunk)
+
+    def _check_dimension(self) -> None:
+        """Record the vector dimension of a new store, or verify an existing one."""
+        row = self._conn.execute(
+            "SELECT value FROM settings WHERE key = 'vector_size'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT INTO settings (key, value) VALUES ('vector_size', ?)",
+                (str(self.vector_size),),
+            )
+        elif int(row[0]) != self.vector_size:
+            raise ValueError(
+                f"Embedded vector store at {self.directory} holds "
+                f"{row[0]}-dimensional vectors, expected {self.vector_size}"
+            )
+
+    def _matrix_path(self, level: int, generation: int) -> Path:
+        return self.directory / f"level_{level}.{generation}.f32"
+
+    def _ivf_path(self, level: int, generation: int) -> Path:
+        return self.directory / f"level_{level}.{generation}.ivf.npz"
+
+    def _remove_files(self, level: int, generation: int) -> None:
+        """Remove the matrix and IVF files of a superseded generation."""
+        for path in (
+            self._matrix_path(level, generation),
+            self._ivf_path(level, generation),
+        ):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                # Still mapped elsewhere on some platforms; removed on next open
+                logger.debug(
+                    "Could not remove old vector file", path=str(path), error=str(e)
+                )
+
+    def _remove_stale_files(self, state: _Level) -> None:
+        """Remove files left behind by interrupted compactions; write lock held."""
+        for path in self.directory.glob(f"level_{state.level}.*"):
+            generation = path.name.split(".")[1]
+            if generation.isdigit() and int(generation) != state.generation:
+                self._remove_files(state.level, int(generation))
+
+
+def _matches(payload: dict[str, Any], filters: dict | None) -> bool:
+    """Whether a payload has every filtered key set to its value."""
+    return not filters or all(
+        payload.get(key) == value for key, value in filters.items()
+    )
+
+
+def _to_result(
+    id: str, score: float, payload: dict[str, Any], level: int, collection_name: str
+) -> SearchResult:
+    """Build a SearchResult the way VectorSearchEngine does for Qdrant points."""
+    memory = CognitiveMemory(
+        id=payload.get("memory_id", id),
+        content=payload.get("content", ""),
+        memory_type=payload.get("memory_type", "unknown"),
+        hierarchy_level=payload.get("hierarchy_level", level),
+        dimensions=payload.get("dimensions", {}),
+        timestamp=payload.get("timestamp", 0.0),
+        strength=payload.get("strength", 1.0),
+        access_count=payload.get("access_count", 0),
+    )
+    return SearchResult(
+        memory=memory,
+        similarity_score=score,
+        metadata={"collection": collection_name},
+    )
+
+
+def create_embedded_storage(
+    vector_size: int,
+    project_id: str,
+    path: str | Path,
+    search_mode: str = "auto",
+    ivf_min_vectors: int = 100_000,
+    ivf_probes: int = 0,
+    compaction_ratio: float = 0.25,
+) -> EmbeddedVectorStorage:
+    """
+    Factory function to create embedded vector storage.
+
+    Args:
+        vector_size: Dimension of embedding vectors (from configuration)
+        project_id: Project identifier for the store directory
+        path: Directory holding the stores of all projects
+        search_mode: "auto", "exact" or "ivf"
+        ivf_min_vectors: Live vectors before auto mode uses IVF on a level
+        ivf_probes: Lists probed per IVF search, 0 for a sixteenth of them
+        compaction_ratio: Share of tombstoned rows that triggers compaction
+
+    Returns:
+        EmbeddedVectorStorage: Configured storage instance
+    """
+    return EmbeddedVectorStorage(
+        vector_size=vector_size,
+        project_id=project_id,
+        path=path,
+        search_mode=search_mode,
+        ivf_min_vectors=ivf_min_vectors,
+        ivf_probes=ivf_probes,
+        compaction_ratio=compaction_ratio,
+    )
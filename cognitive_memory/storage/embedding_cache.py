@@ -0,0 +1,275 @@
+"""
+Persistent content-addressed embedding cache.
+
+Re-ingesting unchanged content is common: atomic reloads of files where only
+some sections changed, repeated project initialization, git re-loads and
+consolidation all encode text that was encoded before. This cache stores
+model embeddings in SQLite keyed by (model identity, sha256 of the exact
+encoded text) so those passes skip inference. Least recently used entries are
+evicted once the cache exceeds its byte budget.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from .embedding_codec import deserialize_embedding, serialize_embedding
+from .sqlite_persistence import DatabaseManager
+
+# Unix epoch as a Julian day number
+_UNIX_EPOCH_JULIAN_DAY = 2440587.5
+
+
+def _julian_now() -> float:
+    """Current time as a Julian day, like SQLite's julianday('now') but finer."""
+    return time.time() / 86400.0 + _UNIX_EPOCH_JULIAN_DAY
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache shared by every process using the database.
+
+    Cache failures are logged and treated as misses so they never interrupt
+    ingestion.
+    """
+
+    # Keys per lookup query, well below SQLite's bound-parameter limit
+    LOOKUP_CHUNK_SIZE = 500
+
+    # Eviction frees space down to this fraction of max_bytes
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, db_manager: DatabaseManager, max_bytes: int = 256 * 1024**2):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            db_manager: Database holding the embedding_cache table
+            max_bytes: Maximum total size of cached embeddings
+        """
+        self.db_manager = db_manager
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Estimated total size; recomputed exactly whenever eviction runs
+        self._total_bytes: int | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Hash the exact text that is passed to the embedding model."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, model_id: str, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """
+        Look up cached embeddings and record the hits.
+
+        Hits update last use and hit counts through the database's statistics
+        write-behind buffer, so lookups stay read-only.
+
+        Args:
+            model_id: Identity of the embedding model
+            texts: Texts to look up
+
+        Returns:
+            Cached embedding for each text, or None where it is not cached
+        """
+        hashes = [self.content_hash(text) for text in texts]
+        found: dict[str, np.ndarray] = {}
+
+        try:
+            unique_hashes = list(dict.fromkeys(hashes))
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(unique_hashes), self.LOOKUP_CHUNK_SIZE):
+                    chunk = unique_hashes[start : start + self.LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"""
+                        SELECT content_hash, embedding FROM embedding_cache
+                        WHERE model_id = ? AND content_hash IN ({placeholders})
+                        """,
+                        (model_id, *chunk),
+                    )
+                    for row in cursor.fetchall():
+                        embedding = deserialize_embedding(
+                            row["embedding"], row["content_hash"]
+                        )
+                        if embedding is not None:
+                            found[row["content_hash"]] = embedding
+
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed", error=str(e))
+            found = {}
+
+        if found:
+            self.db_manager.stats_buffer.record_embedding_hits(model_id, found)
+
+        results = [found.get(content_hash) for content_hash in hashes]
+        hit_count = sum(result is not None for result in results)
+        with self._lock:
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+
+        return [None if result is None else result.copy() for result in results]
+
+    def put_many(
+        self,
+        model_id: str,
+        texts: Sequence[str],
+        embeddings: Sequence[np.ndarray] | np.ndarray,
+    ) -> None:
+        """
+        Cache embeddings for texts, evicting old entries if over budget.
+
+        Zero or non-finite vectors are not cached: providers return them as a
+        fallback when encoding fails.
+
+        Args:
+            model_id: Identity of the embedding model
+            texts: Encoded texts
+            embeddings: Embedding for each text, or a matrix with one row per text
+        """
+        now = _julian_now()
+        rows = []
+        for text, embedding in zip(texts, embeddings, strict=True):
+            vector = np.asarray(embedding)
+            if not np.isfinite(vector).all() or not vector.any():
+                continue
+            blob = serialize_embedding(vector)
+            rows.append((model_id, self.content_hash(text), blob, len(blob), now))
+
+        if not rows:
+            return
+
+        # Eviction orders entries by last use, so apply buffered hits first
+        with self._lock:
+            may_evict = (
+                self._total_bytes is None
+                or self._total_bytes + sum(row[3] for row in rows) > self.max_bytes
+            )
+        if may_evict:
+            self.db_manager.stats_buffer.flush()
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO embedding_cache (
+                        model_id, content_hash, embedding, byte_size, last_used_at
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
+                with self._lock:
+                    if self._total_bytes is None:
+                        self._total_bytes = self._read_total_bytes(cursor)
+                    else:
+                        self._total_bytes += sum(row[3] for row in rows)
+                    self.stores += len(rows)
+                    over_budget = self._total_bytes > self.max_bytes
+
+                if over_budget:
+                    self._evict(cursor)
+                conn.commit()
+
+        except Exception as e:
+            logger.warning("Embedding cache store failed", error=str(e))
+
+    def _evict(self, cursor: Any) -> None:
+        """Delete least recently used entries until under the target size."""
+        total = self._read_total_bytes(cursor)
+        if total > self.max_bytes:
+            excess = total - int(self.max_bytes * self.EVICTION_TARGET)
+            cursor.execute(
+                """
+                SELECT model_id, content_hash, byte_size FROM embedding_cache
+                ORDER BY last_used_at
+                """
+            )
+
+            evicted = []
+            freed = 0
+            for row in cursor:
+                if freed >= excess:
+                    break
+                evicted.append((row["model_id"], row["content_hash"]))
+                freed += row["byte_size"]
+
+            cursor.executemany(
+                "DELETE FROM embedding_cache WHERE model_id = ? AND content_hash = ?",
+                evicted,
+            )
+            total -= freed
+
+            with self._lock:
+                self.evictions += len(evicted)
+            logger.debug(
+                "Evicted embedding cache entries", count=len(evicted), freed=freed
+            )
+
+        with self._lock:
+            self._total_bytes = total
+
+    @staticmethod
+    def _read_total_bytes(cursor: Any) -> int:
+        """Read the exact total size of cached embeddings."""
+        cursor.execute("SELECT COALESCE(SUM(byte_size), 0) FROM embedding_cache")
+        return int(cursor.fetchone()[0])
+
+    def clear(self) -> None:
+        """Delete every cached embedding."""
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("DELETE FROM embedding_cache")
+                conn.commit()
+            with self._lock:
+                self._total_bytes = 0
+        except Exception as e:
+            logger.warning("Failed to clear embedding cache", error=str(e))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache size and hit-rate statistics.
+
+        Returns:
+            Dictionary with entry count and total bytes in the database, the
+            byte budget, and hit, miss, store and eviction counts for this
+            process
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats: dict[str, Any] = {
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                row = conn.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(byte_size), 0)
+                    FROM embedding_cache
+                    """
+                ).fetchone()
+            stats["entries"] = int(row[0])
+            stats["bytes"] = int(row[1])
+        except Exception as e:
+            stats["error"] = str(e)
+
+        return stats
@@ -0,0 +1,71 @@
+"""
+Binary codec for stored embeddings.
+
+Embeddings are stored as a fixed 12-byte header followed by little-endian
+float32 values. The same format is used for memories.cognitive_embedding and
+for the embedding_cache table.
+"""
+
+import json
+import struct
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+# Binary embedding format: fixed header followed by little-endian float32 values.
+# Header layout: magic (4s), format version (B), dtype code (B), reserved (H),
+# dimension (I) - 12 bytes in total, all little-endian.
+_EMBEDDING_MAGIC = b"HEMB"
+_EMBEDDING_FORMAT_VERSION = 1
+_EMBEDDING_DTYPE_FLOAT32 = 1
+_EMBEDDING_HEADER = struct.Struct("<4sBBHI")
+_EMBEDDING_DTYPE = np.dtype("<f4")
+
+
+def serialize_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize a cognitive embedding to the binary float32 BLOB format."""
+    vector = np.ascontiguousarray(embedding, dtype=_EMBEDDING_DTYPE).reshape(-1)
+    header = _EMBEDDING_HEADER.pack(
+        _EMBEDDING_MAGIC,
+        _EMBEDDING_FORMAT_VERSION,
+        _EMBEDDING_DTYPE_FLOAT32,
+        0,
+        vector.shape[0],
+    )
+    return header + vector.tobytes()
+
+
+def deserialize_embedding(value: Any, memory_id: str) -> np.ndarray | None:
+    """
+    Deserialize a stored cognitive embedding, returning None if unreadable.
+
+    Accepts both the binary BLOB format and legacy JSON text written before
+    migration 008, so rows can be read while the converter is still running.
+    """
+    try:
+        if isinstance(value, bytes | memoryview):
+            magic, version, dtype_code, _, dimension = _EMBEDDING_HEADER.unpack_from(
+                value
+            )
+            if (
+                magic != _EMBEDDING_MAGIC
+                or version != _EMBEDDING_FORMAT_VERSION
+                or dtype_code != _EMBEDDING_DTYPE_FLOAT32
+            ):
+                raise ValueError("unsupported embedding blob header")
+
+            # Copy so callers get a writable array independent of the row buffer
+            return np.frombuffer(
+                value,
+                dtype=_EMBEDDING_DTYPE,
+                count=dimension,
+                offset=_EMBEDDING_HEADER.size,
+            ).astype(np.float32)
+
+        return np.array(json.loads(value), dtype=np.float32)
+    except (json.JSONDecodeError, struct.error, TypeError, ValueError) as e:
+        logger.warning(
+            f"Failed to deserialize cognitive embedding for memory {memory_id}: {e}"
+        )
+        return None
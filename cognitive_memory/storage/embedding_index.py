@@ -0,0 +1,284 @@
+"""
+Resident embedding index for a single memory hierarchy level.
+
+This module keeps the embeddings of one hierarchy level in a contiguous,
+pre-normalized float32 matrix. Similarity against a query then becomes a single
+matrix-vector product followed by a top-k selection, instead of re-reading and
+deserializing every memory row on each retrieval.
+
+The index is owned and maintained by the metadata store: writes made through
+the store patch it in place, while writes from other connections are detected
+through the ``memory_generation`` counter and trigger a full reload.
+"""
+
+import threading
+from collections.abc import Iterable
+
+import numpy as np
+from loguru import logger
+
+
+class LevelEmbeddingIndex:
+    """
+    In-memory matrix of normalized embeddings for one hierarchy level.
+
+    Rows are addressed by memory ID. Removal swaps the last row into the freed
+    slot so the matrix stays contiguous, and capacity grows geometrically so
+    incremental inserts are amortized O(1).
+    """
+
+    def __init__(self, level: int, initial_capacity: int = 256):
+        """
+        Initialize an empty, unloaded index.
+
+        Args:
+            level: Hierarchy level whose embeddings this index holds
+            initial_capacity: Number of rows to preallocate on first insert
+        """
+        self.level = level
+        self.initial_capacity = max(1, initial_capacity)
+
+        # Storage generation the index contents reflect (None = not loaded)
+        self.generation: int | None = None
+
+        # Guards all reads and writes of the matrix and id mappings
+        self.lock = threading.RLock()
+
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._dimension: int | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index holds a synchronized snapshot of its level."""
+        return self.generation is not None
+
+    @property
+    def dimension(self) -> int | None:
+        """Embedding dimension of the indexed vectors, if known."""
+        return self._dimension
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._rows
+
+    def load(self, entries: Iterable[tuple[str, np.ndarray]], generation: int) -> None:
+        """
+        Replace the index contents with a fresh snapshot.
+
+        Args:
+            entries: Iterable of (memory_id, embedding) pairs
+            generation: Storage generation the snapshot was read at
+        """
+        with self.lock:
+            self._ids = []
+            self._rows = {}
+            self._matrix = None
+            self._dimension = None
+
+            for memory_id, embedding in entries:
+                self._upsert_locked(memory_id, embedding)
+
+            self.generation = generation
+
+            logger.debug(
+                "Level embedding index loaded",
+                level=self.level,
+                size=len(self._ids),
+                generation=generation,
+            )
+
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next lookup triggers a reload."""
+        with self.lock:
+            self.generation = None
+
+    def upsert(self, memory_id: str, embedding: np.ndarray) -> bool:
+        """
+        Insert or replace the embedding for a memory.
+
+        Args:
+            memory_id: Memory identifier
+            embedding: Embedding vector (any float dtype)
+
+        Returns:
+            True if the embedding was indexed, False if it was rejected
+        """
+        with self.lock:
+            return self._upsert_locked(memory_id, embedding)
+
+    def remove(self, memory_ids: Iterable[str]) -> int:
+        """
+        Remove memories from the index.
+
+        Args:
+            memory_ids: Memory identifiers to remove
+
+        Returns:
+            Number of rows actually removed
+        """
+        removed = 0
+        with self.lock:
+            for memory_id in memory_ids:
+                row = self._rows.pop(memory_id, None)
+                if row is None:
+                    continue
+
+                last_row = len(self._ids) - 1
+                if row != last_row and self._matrix is not None:
+                    # Move the last row into the freed slot
+                    last_id = self._ids[last_row]
+                    self._matrix[row] = self._matrix[last_row]
+                    self._ids[row] = last_id
+                    self._rows[last_id] = row
+
+                self._ids.pop()
+                removed += 1
+
+        return removed
+
+    def search(
+        self, query: np.ndarray, threshold: float = 0.0, k: int | None = None
+    ) -> list[tuple[str, float]]:
+        """
+        Find indexed memories whose cosine similarity meets the threshold.
+
+        Similarities are clamped to [0, 1] to match the activation engine's
+        cosine similarity semantics.
+
+        Args:
+            query: Query embedding
+            threshold: Minimum similarity for a match
+            k: Maximum number of matches to return (None = all matches)
+
+        Returns:
+            List of (memory_id, similarity) sorted by similarity, highest first
+        """
+        with self.lock:
+            size = len(self._ids)
+            if size == 0 or self._matrix is None:
+                return []
+
+            query_vector = np.asarray(query, dtype=np.float32).reshape(-1)
+            if query_vector.shape[0] != self._dimension:
+                logger.warning(
+                    "Query dimension does not match level index",
+                    level=self.level,
+                    query_dimension=query_vector.shape[0],
+                    index_dimension=self._dimension,
+                )
+                return []
+
+            norm = float(np.linalg.norm(query_vector))
+            if norm == 0.0:
+                similarities = np.zeros(size, dtype=np.float32)
+            else:
+                similarities = self._matrix[:size] @ (query_vector / norm)
+            np.clip(similarities, 0.0, 1.0, out=similarities)
+
+            candidates = np.flatnonzero(similarities >= threshold)
+            if candidates.size == 0:
+                return []
+
+            if k is not None and 0 < k < candidates.size:
+                top = np.argpartition(similarities[candidates], -k)[-k:]
+                candidates = candidates[top]
+
+            order = candidates[np.argsort(-similarities[candidates], kind="stable")]
+            return [(self._ids[row], float(similarities[row])) for row in order]
+
+    def similarities(self, queries: np.ndarray) -> tuple[list[str], np.ndarray] | None:
+        """
+        Compute clamped cosine similarities of every indexed row to each query.
+
+        Args:
+            queries: Query embeddings, shape (m, dimension) or (dimension,)
+
+        Returns:
+            Tuple of (memory_ids, similarities) where similarities has shape
+            (len(memory_ids), m), or None if the query dimension does not match
+        """
+        with self.lock:
+            query_matrix = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+            size = len(self._ids)
+            if size == 0 or self._matrix is None:
+                return [], np.zeros((0, query_matrix.shape[0]), dtype=np.float32)
+
+            if query_matrix.shape[1] != self._dimension:
+                logger.warning(
+                    "Query dimension does not match level index",
+                    level=self.level,
+                    query_dimension=query_matrix.shape[1],
+                    index_dimension=self._dimension,
+                )
+                return None
+
+            norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            similarities = self._matrix[:size] @ (query_matrix / norms).T
+            np.clip(similarities, 0.0, 1.0, out=similarities)
+
+            return list(self._ids), similarities
+
+    def get_stats(self) -> dict[str, int | bool | None]:
+        """Get index size and synchronization state."""
+        with self.lock:
+            return {
+                "level": self.level,
+                "size": len(self._ids),
+                "capacity": 0 if self._matrix is None else self._matrix.shape[0],
+                "dimension": self._dimension,
+                "loaded": self.is_loaded,
+                "generation": self.generation,
+            }
+
+    def _upsert_locked(self, memory_id: str, embedding: np.ndarray) -> bool:
+        """Insert or replace a row; caller must hold the lock."""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+
+        if self._dimension is None:
+            self._dimension = vector.shape[0]
+        elif vector.shape[0] != self._dimension:
+            logger.debug(
+                "Skipping embedding with mismatched dimension",
+                memory_id=memory_id,
+                level=self.level,
+                expected=self._dimension,
+                actual=vector.shape[0],
+            )
+            self.remove([memory_id])
+            return False
+
+        norm = float(np.linalg.norm(vector))
+        if norm > 0.0:
+            vector = vector / norm
+
+        row = self._rows.get(memory_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(memory_id)
+            self._rows[memory_id] = row
+
+        assert self._matrix is not None
+        self._matrix[row] = vector
+        return True
+
+    def _ensure_capacity(self, required_rows: int) -> None:
+        """Grow the backing matrix geometrically to hold required_rows."""
+        assert self._dimension is not None
+        current = 0 if self._matrix is None else self._matrix.shape[0]
+        if required_rows <= current:
+            return
+
+        capacity = max(self.initial_capacity, current)
+        while capacity < required_rows:
+            capacity *= 2
+
+        matrix = np.zeros((capacity, self._dimension), dtype=np.float32)
+        if self._matrix is not None and self._ids:
+            matrix[: len(self._ids)] = self._matrix[: len(self._ids)]
+        self._matrix = matrix
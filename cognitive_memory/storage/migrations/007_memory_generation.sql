@@ -0,0 +1,31 @@
+-- 007_memory_generation.sql
+-- Track a write generation for the memories table
+
+-- Single-row counter bumped by triggers whenever a memory is inserted, deleted,
+-- or has its hierarchy level or embedding changed. In-process caches (such as
+-- the resident level embedding index) compare against it to detect writes made
+-- by other connections or processes without re-reading the memories table.
+CREATE TABLE IF NOT EXISTS memory_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO memory_generation (id, generation) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_memories_generation_insert
+AFTER INSERT ON memories
+BEGIN
+    UPDATE memory_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_memories_generation_delete
+AFTER DELETE ON memories
+BEGIN
+    UPDATE memory_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_memories_generation_update
+AFTER UPDATE OF hierarchy_level, cognitive_embedding ON memories
+BEGIN
+    UPDATE memory_generation SET generation = generation + 1 WHERE id = 1;
+END;
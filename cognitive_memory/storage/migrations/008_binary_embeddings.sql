@@ -0,0 +1,14 @@
+-- 008_binary_embeddings.sql
+-- Store cognitive embeddings as binary float32 BLOBs instead of JSON text
+
+-- New and rewritten rows store cognitive_embedding as a 12-byte header
+-- (magic, format version, dtype code, dimension) followed by little-endian
+-- float32 values. The column keeps its declared TEXT affinity: SQLite never
+-- coerces BLOB values, so no table rebuild is needed.
+--
+-- Existing JSON rows are rewritten in batches by the online converter in
+-- DatabaseManager.convert_json_embeddings(). This partial index lets the
+-- converter find the remaining JSON rows without scanning the whole table,
+-- and it shrinks to nothing once conversion is complete.
+CREATE INDEX IF NOT EXISTS idx_memories_json_embedding
+ON memories(id) WHERE typeof(cognitive_embedding) = 'text';
@@ -0,0 +1,22 @@
+-- 009_embedding_cache.sql
+-- Persistent content-addressed cache of model embeddings
+
+-- Rows are keyed by the embedding model identity and the sha256 of the exact
+-- text that was encoded, so re-ingesting unchanged content skips inference.
+-- Embeddings use the same binary float32 format as memories.cognitive_embedding.
+-- last_used_at is a Julian day like created_at, and drives LRU eviction once
+-- the cache exceeds its byte budget.
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    byte_size INTEGER NOT NULL,
+    created_at REAL NOT NULL DEFAULT (julianday('now')),
+    last_used_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (model_id, content_hash)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used
+ON embedding_cache (last_used_at);
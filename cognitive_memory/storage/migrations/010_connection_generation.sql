@@ -0,0 +1,31 @@
+-- 010_connection_generation.sql
+-- Track a write generation for the memory_connections table
+
+-- Single-row counter bumped by triggers whenever a connection is inserted,
+-- deleted (including cascades from deleted memories), or has its endpoints or
+-- strength changed. The in-process adjacency index used for spreading
+-- activation compares against it to detect writes made by other connections.
+CREATE TABLE IF NOT EXISTS connection_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO connection_generation (id, generation) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_connections_generation_insert
+AFTER INSERT ON memory_connections
+BEGIN
+    UPDATE connection_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_connections_generation_delete
+AFTER DELETE ON memory_connections
+BEGIN
+    UPDATE connection_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_connections_generation_update
+AFTER UPDATE OF source_id, target_id, strength ON memory_connections
+BEGIN
+    UPDATE connection_generation SET generation = generation + 1 WHERE id = 1;
+END;
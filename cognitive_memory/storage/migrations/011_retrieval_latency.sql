@@ -0,0 +1,17 @@
+-- 011_retrieval_latency.sql
+-- Create retrieval latency table with one row per sampled retrieval
+
+-- retrieval_stats rows reference a returned memory, so a retrieval that
+-- returned nothing left no trace there. Per-phase latencies are recorded here
+-- instead, once per sampled retrieval whatever its result count; rows in
+-- retrieval_stats link back through retrieval_metadata.retrieval_id.
+CREATE TABLE IF NOT EXISTS retrieval_latency (
+    retrieval_id TEXT PRIMARY KEY,
+    query_hash TEXT NOT NULL,
+    session_id TEXT,
+    total_results INTEGER NOT NULL,
+    phases_ms TEXT NOT NULL,  -- JSON object of phase name to milliseconds
+    timestamp REAL NOT NULL DEFAULT (julianday('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_retrieval_latency_timestamp ON retrieval_latency (timestamp);
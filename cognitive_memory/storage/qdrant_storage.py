@@ -5,6 +5,7 @@ This module implements hierarchical memory storage using Qdrant vector database
 with 3-tier collections: L0 (concepts), L1 (contexts), L2 (episodes).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -65,6 +66,7 @@ class QdrantCollectionManager:
             for level, config in self.collections.items():
                 if not self._collection_exists(config.name):
                     self._create_collection(config)
+                    self._create_payload_indexes(config)
                     logger.info(
                         f"Created collection for level {level}", collection=config.name
                     )
@@ -104,6 +106,22 @@ class QdrantCollectionManager:
             shard_number=config.segments_number,
         )
 
+    def _create_payload_indexes(self, config: CollectionConfig) -> None:
+        """Index payload fields used for filtered deletes."""
+        try:
+            self.client.create_payload_index(
+                collection_name=config.name,
+                field_name="source_path",
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+        except Exception as e:
+            # Filtering still works without the index, only slower
+            logger.warning(
+                "Failed to create source_path payload index",
+                collection=config.name,
+                error=str(e),
+            )
+
     def get_collection_name(self, level: int) -> str:
         """Get collection name for memory level."""
         if level not in self.collections:
@@ -267,6 +285,11 @@ class VectorSearchEngine:
         self.client = client
         self.collection_manager = collection_manager
 
+        # One worker per hierarchy level so cross-level searches run concurrently
+        self._executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="qdrant-search"
+        )
+
     def search_level(
         self,
         level: int,
@@ -285,49 +308,18 @@ class VectorSearchEngine:
             else query_vector
         )
 
-        # Build filter conditions
-        filter_conditions = None
-        if filters:
-            filter_conditions = models.Filter(
-                must=[
-                    models.FieldCondition(key=key, match=models.MatchValue(value=value))
-                    for key, value in filters.items()
-                ]
-            )
-
         try:
             search_result = self.client.search(
                 collection_name=collection_name,
                 query_vector=query_list,
                 limit=k,
-                query_filter=filter_conditions,
+                query_filter=self._build_filter(filters),
                 score_threshold=score_threshold,
                 with_payload=True,
                 with_vectors=False,
             )
 
-            results = []
-            for point in search_result:
-                # Extract CognitiveMemory from payload
-                payload = point.payload
-                memory = CognitiveMemory(
-                    id=payload.get("memory_id", str(point.id)),
-                    content=payload.get("content", ""),
-                    memory_type=payload.get("memory_type", "unknown"),
-                    hierarchy_level=payload.get("hierarchy_level", level),
-                    dimensions=payload.get("dimensions", {}),
-                    timestamp=payload.get("timestamp", 0.0),
-                    strength=payload.get("strength", 1.0),
-                    access_count=payload.get("access_count", 0),
-                )
-
-                results.append(
-                    SearchResult(
-                        memory=memory,
-                        similarity_score=point.score,
-                        metadata={"collection": collection_name},
-                    )
-                )
+            results = self._points_to_results(search_result, level, collection_name)
 
             logger.debug(
                 "Vector search completed",
@@ -351,20 +343,103 @@ class VectorSearchEngine:
     def search_cross_level(
         self,
         query_vector: np.ndarray,
-        k_per_level: int,
+        k_per_level: int | dict[int, int],
         levels: list[int] | None = None,
         filters: dict[str, Any] | None = None,
+        score_threshold: float | dict[int, float] | None = None,
     ) -> dict[int, list[SearchResult]]:
-        """Search across multiple memory levels."""
+        """
+        Search across multiple memory levels concurrently.
+
+        Each level lives in its own collection, so the per-level queries are
+        issued in parallel and the call costs one round-trip of wall time
+        rather than one per level.
+
+        Args:
+            query_vector: Query vector for similarity search
+            k_per_level: Result limit for every level, or a per-level mapping
+            levels: Levels to search (defaults to all levels)
+            filters: Optional metadata filters
+            score_threshold: Minimum score for every level, or a per-level mapping
+
+        Returns:
+            Dictionary mapping level to its search results
+        """
         if levels is None:
             levels = [0, 1, 2]  # All levels
 
-        results = {}
+        futures = {}
         for level in levels:
-            level_results = self.search_level(
-                level=level, query_vector=query_vector, k=k_per_level, filters=filters
+            k = (
+                k_per_level.get(level, 0)
+                if isinstance(k_per_level, dict)
+                else k_per_level
+            )
+            if k <= 0:
+                continue
+
+            threshold = (
+                score_threshold.get(level)
+                if isinstance(score_threshold, dict)
+                else score_threshold
+            )
+            futures[level] = self._executor.submit(
+                self.search_level,
+                level=level,
+                query_vector=query_vector,
+                k=k,
+                filters=filters,
+                score_threshold=threshold,
+            )
+
+        # search_level handles its own errors and returns [] on failure
+        return {
+            level: futures[level].result() if level in futures else []
+            for level in levels
+        }
+
+    def close(self) -> None:
+        """Stop the search worker threads."""
+        self._executor.shutdown(wait=False)
+
+    def _build_filter(self, filters: dict[str, Any] | None) -> models.Filter | None:
+        """Build a Qdrant filter requiring every key to match its value."""
+        if not filters:
+            return None
+
+        return models.Filter(
+            must=[
+                models.FieldCondition(key=key, match=models.MatchValue(value=value))
+                for key, value in filters.items()
+            ]
+        )
+
+    def _points_to_results(
+        self, points: list[Any], level: int, collection_name: str
+    ) -> list[SearchResult]:
+        """Convert scored Qdrant points into SearchResult objects."""
+        results = []
+        for point in points:
+            # Extract CognitiveMemory from payload
+            payload = point.payload
+            memory = CognitiveMemory(
+                id=payload.get("memory_id", str(point.id)),
+                content=payload.get("content", ""),
+                memory_type=payload.get("memory_type", "unknown"),
+                hierarchy_level=payload.get("hierarchy_level", level),
+                dimensions=payload.get("dimensions", {}),
+                timestamp=payload.get("timestamp", 0.0),
+                strength=payload.get("strength", 1.0),
+                access_count=payload.get("access_count", 0),
+            )
+
+            results.append(
+                SearchResult(
+                    memory=memory,
+                    similarity_score=point.score,
+                    metadata={"collection": collection_name},
+                )
             )
-            results[level] = level_results
 
         return results
 
@@ -386,6 +461,7 @@ class HierarchicalMemoryStorage(VectorStorage):
         grpc_port: int | None = None,
         prefer_grpc: bool = True,
         timeout: int | None = None,
+        client: QdrantClient | None = None,
     ):
         """
         Initialize hierarchical memory storage.
@@ -398,6 +474,8 @@ class HierarchicalMemoryStorage(VectorStorage):
             grpc_port: Qdrant gRPC port (defaults to config port + 1)
             prefer_grpc: Whether to prefer gRPC connection
             timeout: Connection timeout in seconds (defaults to config)
+            client: Pre-built Qdrant client, e.g. QdrantClient(":memory:"), used
+                instead of connecting to a server
         """
         # Use defaults from config if not provided
         default_config = QdrantConfig()
@@ -409,24 +487,28 @@ class HierarchicalMemoryStorage(VectorStorage):
         self.project_id = project_id
 
         # Initialize Qdrant client
-        try:
-            self.client = QdrantClient(
-                host=host,
-                port=port,
-                grpc_port=grpc_port,
-                prefer_grpc=prefer_grpc,
-                timeout=timeout,
-            )
-            logger.info(
-                "Connected to Qdrant server",
-                host=host,
-                port=port,
-                grpc_port=grpc_port,
-                prefer_grpc=prefer_grpc,
-            )
-        except Exception as e:
-            logger.error("Failed to connect to Qdrant server", error=str(e))
-            raise
+        if client is not None:
+            self.client = client
+            logger.info("Using provided Qdrant client", project_id=project_id)
+        else:
+            try:
+                self.client = QdrantClient(
+                    host=host,
+                    port=port,
+                    grpc_port=grpc_port,
+                    prefer_grpc=prefer_grpc,
+                    timeout=timeout,
+                )
+                logger.info(
+                    "Connected to Qdrant server",
+                    host=host,
+                    port=port,
+                    grpc_port=grpc_port,
+                    prefer_grpc=prefer_grpc,
+                )
+            except Exception as e:
+                logger.error("Failed to connect to Qdrant server", error=str(e))
+                raise
 
         # Initialize collection manager and search engine
         self.collection_manager = QdrantCollectionManager(
@@ -494,6 +576,79 @@ class HierarchicalMemoryStorage(VectorStorage):
             )
             raise
 
+    def store_vectors_batch(
+        self, items: list[tuple[str, np.ndarray, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Store several vectors with one upsert call per hierarchy level.
+
+        Invalid items are skipped and reported as failed. If a level's upsert
+        fails as a whole, its points are retried individually so a single bad
+        point does not fail the rest of the batch.
+
+        Args:
+            items: List of (id, vector, metadata) tuples
+
+        Returns:
+            List of successfully stored vector IDs
+        """
+        points_by_level: dict[int, list[PointStruct]] = {}
+
+        for id, vector, metadata in items:
+            hierarchy_level = metadata.get("hierarchy_level", 2)
+            if vector.shape[-1] != self.vector_size or hierarchy_level not in [0, 1, 2]:
+                logger.error(
+                    "Skipping invalid vector in batch",
+                    id=id,
+                    level=hierarchy_level,
+                    dimension=vector.shape[-1],
+                )
+                continue
+
+            points_by_level.setdefault(hierarchy_level, []).append(
+                PointStruct(id=id, vector=vector.flatten().tolist(), payload=metadata)
+            )
+
+        stored_ids: list[str] = []
+        for hierarchy_level, points in points_by_level.items():
+            collection_name = self.collection_manager.get_collection_name(
+                hierarchy_level
+            )
+            try:
+                self.client.upsert(collection_name=collection_name, points=points)
+                stored_ids.extend(str(point.id) for point in points)
+
+                logger.debug(
+                    "Vector batch stored successfully",
+                    count=len(points),
+                    level=hierarchy_level,
+                    collection=collection_name,
+                )
+
+            except Exception as e:
+                logger.warning(
+                    "Batch vector upsert failed, retrying individually",
+                    count=len(points),
+                    collection=collection_name,
+                    error=str(e),
+                )
+                for point in points:
+                    try:
+                        self.client.upsert(
+                            collection_name=collection_name, points=[point]
+                        )
+                        stored_ids.append(str(point.id))
+                    except Exception as point_error:
+                        logger.error(
+                            "Failed to store vector",
+                            id=point.id,
+                            level=hierarchy_level,
+                            collection=collection_name,
+                            error=str(point_error),
+                        )
+
+        return stored_ids
+
     def search_similar(
         self, query_vector: np.ndarray, k: int, filters: dict | None = None
     ) -> list[SearchResult]:
@@ -508,10 +663,38 @@ class HierarchicalMemoryStorage(VectorStorage):
         Returns:
             List of SearchResult objects sorted by score
         """
-        # Search across all levels
-        k_per_level = max(1, k // 3)  # Distribute k across levels
+        return self.search_cross_level(query_vector, k, filters=filters)
+
+    def search_cross_level(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        k_per_level: dict[int, int] | None = None,
+        score_thresholds: dict[int, float] | None = None,
+        filters: dict | None = None,
+    ) -> list[SearchResult]:
+        """
+        Search all hierarchy levels concurrently and merge into a global top-k.
+
+        Args:
+            query_vector: Query vector for similarity search
+            k: Number of merged results to return
+            k_per_level: Optional per-level result limits (defaults to
+                max(1, k // 3) each, distributing k across the levels; pass
+                k for every level to make the merged top-k exact)
+            score_thresholds: Optional per-level minimum similarity scores
+            filters: Optional metadata filters
+
+        Returns:
+            List of SearchResult objects sorted by score
+        """
         cross_level_results = self.search_engine.search_cross_level(
-            query_vector=query_vector, k_per_level=k_per_level, filters=filters
+            query_vector=query_vector,
+            k_per_level=(
+                k_per_level if k_per_level is not None else max(1, k // 3)
+            ),  # Distribute k across levels
+            filters=filters,
+            score_threshold=score_thresholds,
         )
 
         # Combine and sort results
@@ -520,7 +703,7 @@ class HierarchicalMemoryStorage(VectorStorage):
             all_results.extend(results)
 
         # Sort by score (descending) and limit to k
-        all_results.sort(key=lambda x: x.score, reverse=True)
+        all_results.sort(key=lambda x: x.similarity_score, reverse=True)
         return all_results[:k]
 
     def search_by_level(
@@ -567,12 +750,18 @@ class HierarchicalMemoryStorage(VectorStorage):
 
         return success
 
-    def delete_vectors_by_ids(self, memory_ids: list[str]) -> list[str]:
+    def delete_vectors_by_ids(
+        self, memory_ids: list[str], hierarchy_levels: dict[str, int] | None = None
+    ) -> list[str]:
         """
-        Delete vectors by their IDs across all collections.
+        Delete vectors by their IDs with one request per collection.
+
+        IDs whose hierarchy level is known are deleted only from that level's
+        collection; the rest are deleted from every collection.
 
         Args:
             memory_ids: List of vector IDs to delete
+            hierarchy_levels: Optional mapping of memory ID to hierarchy level
 
         Returns:
             List of successfully deleted memory IDs
@@ -580,12 +769,38 @@ class HierarchicalMemoryStorage(VectorStorage):
         if not memory_ids:
             return []
 
-        successfully_deleted = []
-
+        ids_by_level: dict[int, list[str]] = {0: [], 1: [], 2: []}
         for memory_id in memory_ids:
-            success = self.delete_vector(memory_id)
-            if success:
-                successfully_deleted.append(memory_id)
+            level = (hierarchy_levels or {}).get(memory_id)
+            if level in ids_by_level:
+                ids_by_level[level].append(memory_id)
+            else:
+                for level_ids in ids_by_level.values():
+                    level_ids.append(memory_id)
+
+        deleted: set[str] = set()
+        for level, level_ids in ids_by_level.items():
+            if not level_ids:
+                continue
+
+            collection_name = self.collection_manager.get_collection_name(level)
+            point_ids: list[int | str] = list(level_ids)
+            try:
+                result = self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.PointIdsList(points=point_ids),
+                )
+                if result.status == models.UpdateStatus.COMPLETED:
+                    deleted.update(level_ids)
+            except Exception as e:
+                logger.warning(
+                    "Bulk vector deletion failed",
+                    collection=collection_name,
+                    count=len(level_ids),
+                    error=str(e),
+                )
+
+        successfully_deleted = [mid for mid in memory_ids if mid in deleted]
 
         logger.info(
             "Batch vector deletion completed",
@@ -598,6 +813,51 @@ class HierarchicalMemoryStorage(VectorStorage):
 
         return successfully_deleted
 
+    def delete_vectors_by_source_path(self, source_path: str) -> bool:
+        """
+        Delete every vector whose payload source_path matches, in each collection.
+
+        Args:
+            source_path: Source file path stored in the vector payload
+
+        Returns:
+            True if the delete completed in every collection, False otherwise
+        """
+        points_selector = models.FilterSelector(
+            filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="source_path", match=models.MatchValue(value=source_path)
+                    )
+                ]
+            )
+        )
+
+        success = True
+        for level in [0, 1, 2]:
+            collection_name = self.collection_manager.get_collection_name(level)
+            try:
+                result = self.client.delete(
+                    collection_name=collection_name, points_selector=points_selector
+                )
+                if result.status != models.UpdateStatus.COMPLETED:
+                    success = False
+            except Exception as e:
+                success = False
+                logger.warning(
+                    "Vector deletion by source path failed",
+                    source_path=source_path,
+                    collection=collection_name,
+                    error=str(e),
+                )
+
+        logger.debug(
+            "Vector deletion by source path completed",
+            source_path=source_path,
+            success=success,
+        )
+        return success
+
     def update_vector(
         self, id: str, vector: np.ndarray, metadata: dict[str, Any]
     ) -> bool:
@@ -664,6 +924,7 @@ class HierarchicalMemoryStorage(VectorStorage):
     def close(self) -> None:
         """Close connection to Qdrant server."""
         try:
+            self.search_engine.close()
             self.client.close()
             logger.info("Qdrant connection closed")
         except Exception as e:
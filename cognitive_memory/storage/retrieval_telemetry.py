@@ -0,0 +1,200 @@
+"""
+Sampled retrieval telemetry persisted to the retrieval_latency and
+retrieval_stats tables.
+
+A sampled fraction of retrievals records one retrieval_latency row with its
+per-phase latencies, plus one retrieval_stats row per returned memory carrying
+its rank and score. Rows are written behind through the database's statistics
+buffer so sampling adds no write transaction to the retrieval path. Latency
+percentiles are read back from retrieval_latency over a sliding time window,
+so status commands running in another process see what the server measured.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from ..core.memory import BridgeMemory, CognitiveMemory
+from .sqlite_persistence import DatabaseManager
+
+
+class RetrievalTelemetry:
+    """
+    Sample retrieval latencies and report per-phase percentiles.
+
+    Phases are named query_encode, activation (with its l0_load and
+    activation_bfs breakdown), vector_fallback, bridge_discovery,
+    response_formatting and total; a phase is only recorded for retrievals
+    that ran it. Retrievals that return no memories still count towards the
+    percentiles; they just have no retrieval_stats rows.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        sample_rate: float = 0.1,
+        window_minutes: float = 60.0,
+    ):
+        """
+        Initialize retrieval telemetry.
+
+        Args:
+            db_manager: Database holding the telemetry tables
+            sample_rate: Fraction of retrievals to record (0.0 to 1.0)
+            window_minutes: Sliding window for latency percentiles
+        """
+        self.db_manager = db_manager
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.window_minutes = window_minutes
+
+        # Identifies rows recorded by this process
+        self.session_id = uuid.uuid4().hex
+
+        self._lock = threading.Lock()
+        self.sampled = 0
+
+    def should_sample(self) -> bool:
+        """Decide whether the next retrieval is recorded."""
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
+
+    def record(
+        self,
+        query: str,
+        phase_times_ms: dict[str, float],
+        results: dict[str, list[CognitiveMemory | BridgeMemory]],
+        scores: dict[str, float] | None = None,
+        query_metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Queue a sampled retrieval for persistence.
+
+        Args:
+            query: Query text; only its hash is stored
+            phase_times_ms: Latency of each phase that ran, including total
+            results: Returned memories by type, in rank order
+            scores: Optional activation strengths by memory ID
+            query_metadata: Optional JSON-serializable query context
+        """
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        retrieval_id = uuid.uuid4().hex
+        phases_ms = {
+            phase: round(elapsed, 3) for phase, elapsed in phase_times_ms.items()
+        }
+        retrieval_metadata = json.dumps(
+            {"retrieval_id": retrieval_id, "phases_ms": phases_ms}
+        )
+        query_metadata_json = json.dumps(
+            {"query_length": len(query), **(query_metadata or {})}
+        )
+        total_ms = phase_times_ms.get("total")
+        total_results = sum(len(memories) for memories in results.values())
+        recorded_at = time.time()
+
+        rows = []
+        rank = 0
+        for query_type, memories in results.items():
+            for item in memories:
+                rank += 1
+                if isinstance(item, BridgeMemory):
+                    memory, score = item.memory, item.bridge_score
+                else:
+                    memory = item
+                    score = (scores or {}).get(
+                        memory.id, memory.metadata.get("similarity_score", 0.0)
+                    )
+                rows.append(
+                    (
+                        query_type,
+                        query_hash,
+                        memory.id,
+                        float(score),
+                        rank,
+                        self.session_id,
+                        query_metadata_json,
+                        retrieval_metadata,
+                        total_ms,
+                        total_results,
+                        recorded_at,
+                    )
+                )
+
+        latency_row = (
+            retrieval_id,
+            query_hash,
+            self.session_id,
+            total_results,
+            json.dumps(phases_ms),
+            recorded_at,
+        )
+
+        with self._lock:
+            self.sampled += 1
+        self.db_manager.stats_buffer.record_retrieval(rows, latency_row)
+
+    def get_latency_percentiles(
+        self, window_minutes: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Compute per-phase latency percentiles over the sliding window.
+
+        Args:
+            window_minutes: Window length; defaults to the configured window
+
+        Returns:
+            Dictionary with the window, sample rate, number of sampled
+            retrievals, and count, p50, p95 and p99 in milliseconds per phase
+        """
+        window = self.window_minutes if window_minutes is None else window_minutes
+        report: dict[str, Any] = {
+            "window_minutes": window,
+            "sample_rate": self.sample_rate,
+            "samples": 0,
+            "phases": {},
+        }
+
+        # Include samples of this process that are still buffered
+        self.db_manager.stats_buffer.flush()
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT phases_ms FROM retrieval_latency
+                    WHERE timestamp >= julianday('now') - ?
+                    """,
+                    (window / (24 * 60),),
+                ).fetchall()
+        except Exception as e:
+            logger.warning("Failed to read retrieval telemetry", error=str(e))
+            return report
+
+        phase_samples: dict[str, list[float]] = {}
+        for row in rows:
+            try:
+                phases = json.loads(row[0])
+            except (TypeError, ValueError):
+                continue
+            for phase, elapsed in phases.items():
+                phase_samples.setdefault(phase, []).append(float(elapsed))
+
+        report["samples"] = len(rows)
+        for phase, samples in phase_samples.items():
+            values = np.percentile(samples, self.PERCENTILES)
+            report["phases"][phase] = {
+                "count": len(samples),
+                **{
+                    f"p{percentile}": round(float(value), 3)
+                    for percentile, value in zip(self.PERCENTILES, values, strict=True)
+                },
+            }
+
+        return report
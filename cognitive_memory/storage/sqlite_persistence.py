@@ -7,40 +7,114 @@ retrieval statistics to support the cognitive memory system.
 """
 
 import json
+import os
 import sqlite3
+import threading
 import time
-from collections.abc import Iterator
+import weakref
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import numpy as np
 from loguru import logger
 
 from ..core.interfaces import ConnectionGraph, MemoryStorage
 from ..core.memory import CognitiveMemory
+from .connection_index import ConnectionAdjacencyIndex
+from .embedding_codec import deserialize_embedding, serialize_embedding
+from .embedding_index import LevelEmbeddingIndex
+from .stats_buffer import StatsWriteBuffer
+
+
+class _ThreadConnection:
+    """A thread's dedicated pooled connection and its checkout state."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.in_use = False
+
+
+def _return_thread_connection(
+    manager_ref: "weakref.ReferenceType[DatabaseManager]",
+    connection: sqlite3.Connection,
+) -> None:
+    """Hand a dead thread's connection back to its pool, or close it."""
+    manager = manager_ref()
+    if manager is None:
+        connection.close()
+        return
+
+    with manager._pool_lock:
+        manager._pool_stats["thread_connections"] -= 1
+    manager._return_to_pool(connection)
 
 
 class DatabaseManager:
     """SQLite database manager with schema management and migrations."""
 
-    def __init__(self, db_path: str = "data/cognitive_memory.db"):
+    # Prepared statements kept per pooled connection
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        db_path: str = "data/cognitive_memory.db",
+        pool_size: int = 8,
+        stats_flush_interval: float = 1.0,
+        stats_flush_max_pending: int = 1000,
+        retrieval_retention_days: float = 7.0,
+    ):
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled connections kept open
+            stats_flush_interval: Maximum seconds access and activation
+                statistics stay buffered before being written; 0 writes them
+                through immediately
+            stats_flush_max_pending: Buffered statistics updates that trigger
+                an early flush
+            retrieval_retention_days: Age in days after which sampled
+                retrieval telemetry rows are pruned
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Connection pool: each thread keeps a dedicated long-lived connection,
+        # nested and excess checkouts borrow from a bounded idle list, and
+        # anything beyond pool_size gets a temporary overflow connection.
+        self.pool_size = max(1, pool_size)
+        self._pool_lock = threading.RLock()
+        self._local = threading.local()
+        self._idle_connections: list[sqlite3.Connection] = []
+        self._pool_pid = os.getpid()
+        self._pool_closed = False
+        self._pool_stats = {
+            "open_connections": 0,
+            "in_use_connections": 0,
+            "thread_connections": 0,
+            "connections_created": 0,
+            "checkouts": 0,
+            "reused_checkouts": 0,
+            "overflow_checkouts": 0,
+        }
+
         # Path to migration files
         self.migrations_path = Path(__file__).parent / "migrations"
 
         # Initialize database schema
         self._initialize_database()
 
+        # Access and activation counters shared by every store on this database
+        self.stats_buffer = StatsWriteBuffer(
+            self,
+            flush_interval=stats_flush_interval,
+            max_pending=stats_flush_max_pending,
+            retrieval_retention_days=retrieval_retention_days,
+        )
+
     def _initialize_database(self) -> None:
         """Initialize database with complete schema using migration files."""
         try:
@@ -60,6 +134,9 @@ class DatabaseManager:
             logger.error("Failed to initialize database", error=str(e))
             raise
 
+        # Rewrite any embeddings still stored as JSON text (migration 008)
+        self.convert_json_embeddings()
+
     def _create_migration_table(self, cursor: sqlite3.Cursor) -> None:
         """Create table to track applied migrations."""
         cursor.execute("""
@@ -87,10 +164,7 @@ class DatabaseManager:
                 # Read and execute migration SQL
                 sql_content = migration_file.read_text()
                 # Split and execute individual statements to avoid auto-commit issues
-                statements = [
-                    stmt.strip() for stmt in sql_content.split(";") if stmt.strip()
-                ]
-                for statement in statements:
+                for statement in self._split_sql_statements(sql_content):
                     cursor.execute(statement)
 
                 # Record migration as applied
@@ -102,33 +176,294 @@ class DatabaseManager:
 
         logger.info(f"All migrations applied. Total: {len(migration_files)}")
 
-    @contextmanager
-    def get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection with proper context management."""
-        conn = None
-        try:
-            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
+    @staticmethod
+    def _split_sql_statements(sql_content: str) -> list[str]:
+        """
+        Split migration SQL into complete statements.
+
+        Fragments are accumulated until SQLite reports a complete statement so
+        that trigger bodies (BEGIN ... END) containing semicolons stay intact.
+        """
+
+        def has_sql(text: str) -> bool:
+            return any(
+                line.strip() and not line.strip().startswith("--")
+                for line in text.splitlines()
+            )
 
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+        statements = []
+        buffer = ""
+        for fragment in sql_content.split(";"):
+            buffer += fragment + ";"
+            if sqlite3.complete_statement(buffer):
+                statement = buffer.strip().rstrip(";").strip()
+                # Skip fragments that only contain comments or whitespace
+                if has_sql(statement):
+                    statements.append(statement)
+                buffer = ""
 
-            # Set performance optimizations
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.execute("PRAGMA cache_size = 10000")
-            conn.execute("PRAGMA temp_store = MEMORY")
+        # Trailing text ending inside a comment never completes; keep real SQL
+        leftover = buffer.strip().rstrip(";").strip()
+        if has_sql(leftover):
+            statements.append(leftover)
 
+        return statements
+
+    @contextmanager
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get a pooled database connection with proper context management.
+
+        The calling thread's dedicated connection is reused when it is free;
+        PRAGMAs are applied once per connection and its statement cache
+        persists across calls. Any open transaction that was not committed is
+        rolled back when the connection is released.
+        """
+        conn, release = self._acquire_connection()
+        try:
             yield conn
 
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error("Database operation failed", error=str(e))
             raise
         finally:
-            if conn:
-                conn.close()
+            release(conn)
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a new connection with row access and PRAGMAs configured."""
+        # Pooled connections may be handed to another thread after their
+        # owner exits; the pool guarantees they are never used concurrently.
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+
+        # Enable foreign key constraints
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        # Set performance optimizations
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = 10000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+
+        return conn
+
+    def _acquire_connection(
+        self,
+    ) -> tuple[sqlite3.Connection, Callable[[sqlite3.Connection], None]]:
+        """Check out a connection and the callback that releases it."""
+        if os.getpid() != self._pool_pid:
+            self._reset_pool_after_fork()
+
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and not holder.in_use:
+            holder.in_use = True
+            with self._pool_lock:
+                self._pool_stats["checkouts"] += 1
+                self._pool_stats["reused_checkouts"] += 1
+                self._pool_stats["in_use_connections"] += 1
+            return holder.connection, self._release_thread_connection
+
+        conn = None
+        with self._pool_lock:
+            self._pool_stats["checkouts"] += 1
+            self._pool_stats["in_use_connections"] += 1
+            if self._idle_connections:
+                conn = self._idle_connections.pop()
+                self._pool_stats["reused_checkouts"] += 1
+                pooled = True
+            elif self._pool_stats["open_connections"] < self.pool_size:
+                self._pool_stats["open_connections"] += 1
+                self._pool_stats["connections_created"] += 1
+                pooled = True
+            else:
+                self._pool_stats["overflow_checkouts"] += 1
+                pooled = False
+
+        if conn is None:
+            try:
+                conn = self._create_connection()
+            except Exception:
+                with self._pool_lock:
+                    self._pool_stats["in_use_connections"] -= 1
+                    if pooled:
+                        self._pool_stats["open_connections"] -= 1
+                raise
+
+        if not pooled:
+            return conn, self._release_overflow_connection
+
+        if holder is None:
+            # First checkout on this thread: keep the connection for reuse
+            holder = _ThreadConnection(conn)
+            holder.in_use = True
+            weakref.finalize(holder, _return_thread_connection, weakref.ref(self), conn)
+            self._local.holder = holder
+            with self._pool_lock:
+                self._pool_stats["thread_connections"] += 1
+            return conn, self._release_thread_connection
+
+        # Nested checkout while the thread's own connection is busy
+        return conn, self._release_pooled_connection
+
+    def _release_thread_connection(self, conn: sqlite3.Connection) -> None:
+        """Release the calling thread's dedicated connection."""
+        self._discard_open_transaction(conn)
+        self._local.holder.in_use = False
+        with self._pool_lock:
+            self._pool_stats["in_use_connections"] -= 1
+
+    def _release_pooled_connection(self, conn: sqlite3.Connection) -> None:
+        """Return a borrowed connection to the idle list."""
+        with self._pool_lock:
+            self._pool_stats["in_use_connections"] -= 1
+        self._return_to_pool(conn)
+
+    def _release_overflow_connection(self, conn: sqlite3.Connection) -> None:
+        """Close a temporary connection opened beyond the pool size."""
+        with self._pool_lock:
+            self._pool_stats["in_use_connections"] -= 1
+        conn.close()
+
+    def _return_to_pool(self, conn: sqlite3.Connection) -> None:
+        """Make an open pooled connection available to other threads."""
+        self._discard_open_transaction(conn)
+        with self._pool_lock:
+            if not self._pool_closed:
+                self._idle_connections.append(conn)
+                return
+            self._pool_stats["open_connections"] -= 1
+        conn.close()
+
+    def _discard_open_transaction(self, conn: sqlite3.Connection) -> None:
+        """Roll back work the caller left uncommitted, as closing used to."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning("Failed to reset pooled connection", error=str(e))
+
+    def _reset_pool_after_fork(self) -> None:
+        """Drop connections inherited from a parent process."""
+        self._pool_lock = threading.RLock()
+        self._local = threading.local()
+        self._idle_connections = []
+        self._pool_pid = os.getpid()
+        self._pool_stats.update(
+            open_connections=0, in_use_connections=0, thread_connections=0
+        )
+
+    def get_pool_stats(self) -> dict[str, int]:
+        """Get connection pool occupancy and reuse statistics."""
+        with self._pool_lock:
+            stats = dict(self._pool_stats)
+            stats["idle_connections"] = len(self._idle_connections)
+        stats["pool_size"] = self.pool_size
+        return stats
+
+    def close(self) -> None:
+        """
+        Flush buffered statistics and close pooled connections.
+
+        Idle connections and the calling thread's connection are closed now;
+        connections owned by other threads are closed when those threads exit.
+        """
+        self.stats_buffer.close()
+
+        with self._pool_lock:
+            self._pool_closed = True
+            idle = self._idle_connections
+            self._idle_connections = []
+            self._pool_stats["open_connections"] -= len(idle)
+
+        for conn in idle:
+            conn.close()
+
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and not holder.in_use:
+            del self._local.holder
+
+    def convert_json_embeddings(self, batch_size: int = 500) -> int:
+        """
+        Convert legacy JSON text embeddings to the binary float32 format.
+
+        Rows are rewritten in small batches, each in its own transaction, so
+        readers and writers on other connections are never blocked for long.
+        Each update is conditioned on the original JSON value, so rows changed
+        concurrently are left to their new writer. Safe to call repeatedly.
+
+        Args:
+            batch_size: Number of rows to rewrite per transaction
+
+        Returns:
+            Number of embeddings converted
+        """
+        converted = 0
+        skipped: set[str] = set()
+
+        try:
+            while True:
+                with self.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        """
+                        SELECT id, cognitive_embedding FROM memories
+                        WHERE typeof(cognitive_embedding) = 'text'
+                        LIMIT ?
+                    """,
+                        (batch_size + len(skipped),),
+                    )
+                    rows = [row for row in cursor if row["id"] not in skipped]
+                    if not rows:
+                        break
+
+                    updates = []
+                    for row in rows[:batch_size]:
+                        embedding = deserialize_embedding(
+                            row["cognitive_embedding"], row["id"]
+                        )
+                        if embedding is None:
+                            # Leave unreadable rows untouched rather than loop
+                            skipped.add(row["id"])
+                            continue
+                        updates.append(
+                            (
+                                serialize_embedding(embedding),
+                                row["id"],
+                                row["cognitive_embedding"],
+                            )
+                        )
+
+                    cursor.executemany(
+                        """
+                        UPDATE memories SET cognitive_embedding = ?
+                        WHERE id = ? AND cognitive_embedding = ?
+                    """,
+                        updates,
+                    )
+                    conn.commit()
+                    converted += len(updates)
+
+            if converted:
+                logger.info(
+                    "Converted JSON embeddings to binary format",
+                    converted=converted,
+                    skipped=len(skipped),
+                )
+            return converted
+
+        except Exception as e:
+            logger.error(
+                "Failed to convert JSON embeddings",
+                converted=converted,
+                error=str(e),
+            )
+            return converted
 
     def vacuum_database(self) -> bool:
         """Vacuum database to reclaim space and optimize performance."""
@@ -147,7 +482,7 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
-                stats = {}
+                stats: dict[str, Any] = {}
                 tables = [
                     "memories",
                     "memory_connections",
@@ -163,6 +498,10 @@ class DatabaseManager:
                 # Get database file size
                 stats["database_size_bytes"] = self.db_path.stat().st_size
 
+                # Connection pool occupancy
+                stats["connection_pool"] = self.get_pool_stats()
+                stats["stats_buffer"] = self.stats_buffer.get_stats()
+
                 return stats
 
         except Exception as e:
@@ -177,66 +516,37 @@ class MemoryMetadataStore(MemoryStorage):
         """Initialize memory metadata store."""
         self.db_manager = db_manager
 
+        # Resident per-level embedding indexes, created lazily on first use
+        self._level_indexes: dict[int, LevelEmbeddingIndex] = {}
+        self._level_indexes_lock = threading.Lock()
+
+    _STORE_MEMORY_SQL = """
+        INSERT OR REPLACE INTO memories (
+            id, content, memory_type, hierarchy_level,
+            dimensions, timestamp, strength, access_count,
+            last_accessed, created_at, updated_at,
+            decay_rate, importance_score, consolidation_status,
+            tags, context_metadata, cognitive_embedding
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def store_memory(self, memory: CognitiveMemory) -> bool:
         """Store a cognitive memory with full metadata."""
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Serialize dimensions and tags
-                dimensions_json = json.dumps(memory.dimensions)
-                tags_json = json.dumps(memory.tags) if memory.tags else None
-
-                # Current timestamp
-                now = time.time()
-
-                # Convert datetime to timestamp if needed
-                timestamp_val = (
-                    memory.timestamp.timestamp()
-                    if hasattr(memory.timestamp, "timestamp")
-                    else memory.timestamp
-                )
-
-                # Serialize cognitive embedding to JSON if present
-                embedding_json = None
-                if memory.cognitive_embedding is not None:
-                    embedding_json = json.dumps(memory.cognitive_embedding.tolist())
-
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO memories (
-                        id, content, memory_type, hierarchy_level,
-                        dimensions, timestamp, strength, access_count,
-                        last_accessed, created_at, updated_at,
-                        decay_rate, importance_score, consolidation_status,
-                        tags, context_metadata, cognitive_embedding
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        memory.id,
-                        memory.content,
-                        memory.memory_type,
-                        memory.hierarchy_level,
-                        dimensions_json,
-                        timestamp_val,
-                        memory.strength,
-                        memory.access_count,
-                        now,  # last_accessed
-                        now,  # created_at (will be ignored if record exists)
-                        now,  # updated_at
-                        memory.decay_rate,  # Use memory's decay rate
-                        memory.importance_score,  # Use memory's importance score
-                        "none",  # consolidation_status
-                        tags_json,
-                        json.dumps(memory.metadata)
-                        if memory.metadata
-                        else None,  # context_metadata
-                        embedding_json,  # cognitive_embedding
-                    ),
+                    self._STORE_MEMORY_SQL,
+                    self._memory_to_row_params(memory, time.time()),
                 )
 
+                changed_rows = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
 
+                self._update_level_indexes(generation, changed_rows, upserted=[memory])
+
                 logger.debug(
                     "Memory stored successfully",
                     memory_id=memory.id,
@@ -250,6 +560,90 @@ class MemoryMetadataStore(MemoryStorage):
             logger.error("Failed to store memory", memory_id=memory.id, error=str(e))
             return False
 
+    def store_memories_batch(self, memories: Sequence[CognitiveMemory]) -> list[bool]:
+        """
+        Store several memories in a single transaction.
+
+        Rows are written with one executemany call and one commit. If the batch
+        cannot be written as a whole, each memory is retried individually so
+        the returned flags still identify exactly which memories failed.
+
+        Args:
+            memories: Memories to store
+
+        Returns:
+            List of success flags, one per input memory
+        """
+        if not memories:
+            return []
+
+        try:
+            now = time.time()
+            params = [self._memory_to_row_params(memory, now) for memory in memories]
+
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(self._STORE_MEMORY_SQL, params)
+
+                changed_rows = cursor.rowcount
+                generation = self._read_generation(cursor)
+                conn.commit()
+
+                self._update_level_indexes(generation, changed_rows, upserted=memories)
+
+                logger.debug("Memory batch stored successfully", count=len(memories))
+                return [True] * len(memories)
+
+        except Exception as e:
+            logger.warning(
+                "Batch memory store failed, retrying individually",
+                count=len(memories),
+                error=str(e),
+            )
+            return [self.store_memory(memory) for memory in memories]
+
+    def _memory_to_row_params(
+        self, memory: CognitiveMemory, now: float
+    ) -> tuple[Any, ...]:
+        """Build the INSERT parameters for a memory row."""
+        # Serialize dimensions and tags
+        dimensions_json = json.dumps(memory.dimensions)
+        tags_json = json.dumps(memory.tags) if memory.tags else None
+
+        # Convert datetime to timestamp if needed
+        timestamp_val = (
+            memory.timestamp.timestamp()
+            if hasattr(memory.timestamp, "timestamp")
+            else memory.timestamp
+        )
+
+        # Serialize cognitive embedding to a float32 BLOB if present
+        embedding_blob = None
+        if memory.cognitive_embedding is not None:
+            embedding_blob = serialize_embedding(memory.cognitive_embedding)
+
+        return (
+            memory.id,
+            memory.content,
+            memory.memory_type,
+            memory.hierarchy_level,
+            dimensions_json,
+            timestamp_val,
+            memory.strength,
+            memory.access_count,
+            now,  # last_accessed
+            now,  # created_at (will be ignored if record exists)
+            now,  # updated_at
+            memory.decay_rate,  # Use memory's decay rate
+            memory.importance_score,  # Use memory's importance score
+            "none",  # consolidation_status
+            tags_json,
+            json.dumps(memory.metadata)
+            if memory.metadata
+            else None,  # context_metadata
+            embedding_blob,  # cognitive_embedding
+        )
+
     def retrieve_memory(self, memory_id: str) -> CognitiveMemory | None:
         """Retrieve a memory by ID."""
         try:
@@ -267,21 +661,11 @@ class MemoryMetadataStore(MemoryStorage):
                 if not row:
                     return None
 
-                # Update access count and last accessed
-                cursor.execute(
-                    """
-                    UPDATE memories
-                    SET access_count = access_count + 1,
-                        last_accessed = julianday('now')
-                    WHERE id = ?
-                """,
-                    (memory_id,),
-                )
+            # Access count and last accessed are written behind
+            self.db_manager.stats_buffer.record_access(memory_id)
 
-                conn.commit()
-
-                # Convert row to CognitiveMemory
-                return self._row_to_memory(row)
+            # Convert row to CognitiveMemory
+            return self._row_to_memory(row)
 
         except Exception as e:
             logger.error("Failed to retrieve memory", memory_id=memory_id, error=str(e))
@@ -328,7 +712,17 @@ class MemoryMetadataStore(MemoryStorage):
                     logger.warning("Memory not found for update", memory_id=memory.id)
                     return False
 
+                changed_rows = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
+
+                # update_memory does not rewrite the stored embedding
+                self._update_level_indexes(
+                    generation,
+                    changed_rows,
+                    upserted=[memory],
+                    embeddings_written=False,
+                )
                 return True
 
         except Exception as e:
@@ -347,8 +741,14 @@ class MemoryMetadataStore(MemoryStorage):
                     logger.warning("Memory not found for deletion", memory_id=memory_id)
                     return False
 
+                changed_rows = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
 
+                self._update_level_indexes(
+                    generation, changed_rows, deleted_ids=[memory_id]
+                )
+
                 logger.debug("Memory deleted successfully", memory_id=memory_id)
                 return True
 
@@ -487,8 +887,13 @@ class MemoryMetadataStore(MemoryStorage):
                 )
 
                 deleted_count = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
 
+                self._update_level_indexes(
+                    generation, deleted_count, deleted_ids=memory_ids
+                )
+
                 logger.info(
                     "Deleted memories by source path",
                     source_path=source_path,
@@ -597,8 +1002,13 @@ class MemoryMetadataStore(MemoryStorage):
                 )
 
                 deleted_count = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
 
+                self._update_level_indexes(
+                    generation, deleted_count, deleted_ids=memory_ids
+                )
+
                 logger.info(
                     "Deleted memories by tags",
                     tags=tags,
@@ -649,8 +1059,13 @@ class MemoryMetadataStore(MemoryStorage):
                 )
 
                 deleted_count = cursor.rowcount
+                generation = self._read_generation(cursor)
                 conn.commit()
 
+                self._update_level_indexes(
+                    generation, deleted_count, deleted_ids=memory_ids
+                )
+
                 logger.info(
                     "Deleted memories by IDs",
                     memory_ids=memory_ids[:5]
@@ -669,6 +1084,156 @@ class MemoryMetadataStore(MemoryStorage):
             )
             return 0
 
+    def get_memories_by_ids(self, memory_ids: Sequence[str]) -> list[CognitiveMemory]:
+        """
+        Get memories by their IDs without updating access statistics.
+
+        Args:
+            memory_ids: Memory IDs to fetch
+
+        Returns:
+            Found memories in the order of the requested IDs
+        """
+        if not memory_ids:
+            return []
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+
+                placeholders = ", ".join("?" * len(memory_ids))
+                cursor.execute(
+                    f"SELECT * FROM memories WHERE id IN ({placeholders})",
+                    list(memory_ids),
+                )
+
+                by_id = {row["id"]: self._row_to_memory(row) for row in cursor}
+                return [by_id[mid] for mid in memory_ids if mid in by_id]
+
+        except Exception as e:
+            logger.error(
+                "Failed to get memories by IDs",
+                memory_count=len(memory_ids),
+                error=str(e),
+            )
+            return []
+
+    def close(self) -> None:
+        """Flush buffered access and activation statistics to the database."""
+        self.db_manager.stats_buffer.flush()
+
+    def get_level_index(self, level: int) -> LevelEmbeddingIndex | None:
+        """
+        Get the resident embedding index for a hierarchy level.
+
+        The index is loaded on first use and reloaded whenever the storage
+        generation shows writes that were not applied through this store
+        (for example from another process sharing the database).
+
+        Args:
+            level: Hierarchy level (0, 1, or 2)
+
+        Returns:
+            Synchronized LevelEmbeddingIndex, or None if it could not be loaded
+        """
+        with self._level_indexes_lock:
+            index = self._level_indexes.get(level)
+            if index is None:
+                index = LevelEmbeddingIndex(level)
+                self._level_indexes[level] = index
+
+        try:
+            with index.lock:
+                with self.db_manager.get_connection() as conn:
+                    cursor = conn.cursor()
+
+                    # Read the generation before the rows so a concurrent write
+                    # can only make the snapshot look older, never newer
+                    generation = self._read_generation(cursor)
+                    if index.generation == generation:
+                        return index
+
+                    cursor.execute(
+                        """
+                        SELECT id, cognitive_embedding FROM memories
+                        WHERE hierarchy_level = ? AND cognitive_embedding IS NOT NULL
+                    """,
+                        (level,),
+                    )
+
+                    entries = []
+                    for row in cursor:
+                        embedding = deserialize_embedding(
+                            row["cognitive_embedding"], row["id"]
+                        )
+                        if embedding is not None:
+                            entries.append((row["id"], embedding))
+
+                    index.load(entries, generation)
+                    return index
+
+        except Exception as e:
+            logger.error(
+                "Failed to load level embedding index", level=level, error=str(e)
+            )
+            index.invalidate()
+            return None
+
+    def _read_generation(self, cursor: sqlite3.Cursor) -> int:
+        """Read the memories write generation maintained by triggers."""
+        cursor.execute("SELECT generation FROM memory_generation WHERE id = 1")
+        row = cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    def _update_level_indexes(
+        self,
+        generation: int,
+        changed_rows: int,
+        upserted: Sequence[CognitiveMemory] = (),
+        deleted_ids: Sequence[str] = (),
+        embeddings_written: bool = True,
+    ) -> None:
+        """
+        Apply a committed write to the loaded level indexes.
+
+        A write through this store advances the generation by exactly the
+        number of rows it changed. If the observed generation differs, another
+        writer got in between and the index is invalidated instead of patched.
+
+        Args:
+            generation: Generation read inside the write transaction
+            changed_rows: Rows inserted, updated, or deleted by the write
+            upserted: Memories written by the operation
+            deleted_ids: IDs of memories deleted by the operation
+            embeddings_written: Whether the write stored the memories' embeddings
+        """
+        for index in list(self._level_indexes.values()):
+            with index.lock:
+                if index.generation is None:
+                    continue
+
+                if generation != index.generation + changed_rows:
+                    index.invalidate()
+                    continue
+
+                index.remove(deleted_ids)
+
+                for memory in upserted:
+                    if memory.hierarchy_level != index.level:
+                        index.remove([memory.id])
+                    elif not embeddings_written:
+                        if memory.id not in index:
+                            # Stored embedding unknown here; reload lazily
+                            index.invalidate()
+                            break
+                    elif memory.cognitive_embedding is not None:
+                        index.upsert(memory.id, memory.cognitive_embedding)
+                    else:
+                        index.remove([memory.id])
+
+                if index.is_loaded:
+                    index.generation = generation
+
     def _row_to_memory(self, row: sqlite3.Row) -> CognitiveMemory:
         """Convert database row to CognitiveMemory object."""
         dimensions = json.loads(row["dimensions"]) if row["dimensions"] else {}
@@ -681,16 +1246,12 @@ class MemoryMetadataStore(MemoryStorage):
             else datetime.now()
         )
 
-        # Deserialize cognitive embedding from JSON if present
+        # Deserialize cognitive embedding if present
         cognitive_embedding = None
         if "cognitive_embedding" in row.keys() and row["cognitive_embedding"]:
-            try:
-                embedding_list = json.loads(row["cognitive_embedding"])
-                cognitive_embedding = np.array(embedding_list)
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(
-                    f"Failed to deserialize cognitive embedding for memory {row['id']}: {e}"
-                )
+            cognitive_embedding = deserialize_embedding(
+                row["cognitive_embedding"], row["id"]
+            )
 
         # Deserialize context metadata from JSON if present
         metadata = {}
@@ -734,6 +1295,9 @@ class ConnectionGraphStore(ConnectionGraph):
         """Initialize connection graph store."""
         self.db_manager = db_manager
 
+        # Resident adjacency index for spreading activation, loaded lazily
+        self._adjacency = ConnectionAdjacencyIndex()
+
     def add_connection(
         self,
         source_id: str,
@@ -745,6 +1309,7 @@ class ConnectionGraphStore(ConnectionGraph):
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                generation_before = self._read_generation(cursor)
 
                 cursor.execute(
                     """
@@ -756,8 +1321,11 @@ class ConnectionGraphStore(ConnectionGraph):
                     (source_id, target_id, strength, connection_type, strength),
                 )
 
+                patch = self._read_adjacency_patch(cursor, source_id, target_id)
                 conn.commit()
 
+                self._update_adjacency(generation_before, patch, source_id, target_id)
+
                 logger.debug(
                     "Connection added successfully",
                     source_id=source_id,
@@ -802,26 +1370,19 @@ class ConnectionGraphStore(ConnectionGraph):
 
                 rows = cursor.fetchall()
 
-                # Update activation count for accessed connections
-                if rows:
-                    cursor.execute(
-                        """
-                        UPDATE memory_connections
-                        SET activation_count = activation_count + 1,
-                            last_activated = julianday('now')
-                        WHERE (source_id = ? OR target_id = ?) AND strength >= ?
-                    """,
-                        (memory_id, memory_id, min_strength),
-                    )
-                    conn.commit()
+            # Activation counts of the traversed connections are written behind
+            if rows:
+                self.db_manager.stats_buffer.record_activation(
+                    (memory_id,), min_strength
+                )
 
-                # Convert to CognitiveMemory objects
-                memories = []
-                for row in rows:
-                    memory = self._row_to_memory(row)
-                    memories.append(memory)
+            # Convert to CognitiveMemory objects
+            memories = []
+            for row in rows:
+                memory = self._row_to_memory(row)
+                memories.append(memory)
 
-                return memories
+            return memories
 
         except Exception as e:
             logger.error(
@@ -839,6 +1400,7 @@ class ConnectionGraphStore(ConnectionGraph):
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                generation_before = self._read_generation(cursor)
 
                 cursor.execute(
                     """
@@ -867,7 +1429,10 @@ class ConnectionGraphStore(ConnectionGraph):
                     )
                     return False
 
+                patch = self._read_adjacency_patch(cursor, source_id, target_id)
                 conn.commit()
+
+                self._update_adjacency(generation_before, patch, source_id, target_id)
                 return True
 
         except Exception as e:
@@ -884,6 +1449,7 @@ class ConnectionGraphStore(ConnectionGraph):
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
+                generation_before = self._read_generation(cursor)
 
                 cursor.execute(
                     """
@@ -902,8 +1468,11 @@ class ConnectionGraphStore(ConnectionGraph):
                     )
                     return False
 
+                patch = self._read_adjacency_patch(cursor, source_id, target_id)
                 conn.commit()
 
+                self._update_adjacency(generation_before, patch, source_id, target_id)
+
                 logger.debug(
                     "Connection removed successfully",
                     source_id=source_id,
@@ -921,6 +1490,133 @@ class ConnectionGraphStore(ConnectionGraph):
             )
             return False
 
+    def close(self) -> None:
+        """Flush buffered access and activation statistics to the database."""
+        self.db_manager.stats_buffer.flush()
+
+    def get_adjacency_index(self) -> ConnectionAdjacencyIndex | None:
+        """
+        Get the resident adjacency index of the connection graph.
+
+        The index is loaded on first use and reloaded whenever the connection
+        generation shows writes that were not applied through this store.
+
+        Returns:
+            Synchronized ConnectionAdjacencyIndex, or None if it could not be
+            loaded
+        """
+        index = self._adjacency
+        try:
+            with index.lock:
+                with self.db_manager.get_connection() as conn:
+                    cursor = conn.cursor()
+
+                    # Read the generation before the rows so a concurrent write
+                    # can only make the snapshot look older, never newer
+                    generation = self._read_generation(cursor)
+                    if index.generation == generation:
+                        return index
+
+                    cursor.execute(
+                        "SELECT source_id, target_id, strength FROM memory_connections"
+                    )
+                    index.load(
+                        (
+                            (row["source_id"], row["target_id"], row["strength"])
+                            for row in cursor
+                        ),
+                        generation,
+                    )
+                    return index
+
+        except Exception as e:
+            logger.error("Failed to load connection adjacency index", error=str(e))
+            index.invalidate()
+            return None
+
+    def record_activations(
+        self, memory_ids: Sequence[str], min_strength: float = 0.0
+    ) -> None:
+        """
+        Record that connections of memories were traversed during activation.
+
+        Buffers the same activation statistics as get_connections, for a whole
+        BFS frontier as one traversal.
+
+        Args:
+            memory_ids: Memories whose connections were expanded
+            min_strength: Minimum strength of the traversed connections
+        """
+        self.db_manager.stats_buffer.record_activation(tuple(memory_ids), min_strength)
+
+    def _read_generation(self, cursor: sqlite3.Cursor) -> int:
+        """Read the memory_connections write generation maintained by triggers."""
+        cursor.execute("SELECT generation FROM connection_generation WHERE id = 1")
+        row = cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    def _read_adjacency_patch(
+        self, cursor: sqlite3.Cursor, source_id: str, target_id: str
+    ) -> tuple[float | None, int] | None:
+        """
+        Read what a connection write changed, inside the write transaction.
+
+        Args:
+            cursor: Cursor of the write transaction
+            source_id: One endpoint of the written connection
+            target_id: Other endpoint of the written connection
+
+        Returns:
+            Tuple of (strongest remaining strength between the two memories or
+            None, generation after the write), or None if the index is unloaded
+        """
+        if not self._adjacency.is_loaded:
+            return None
+
+        cursor.execute(
+            """
+            SELECT MAX(strength) FROM memory_connections
+            WHERE (source_id = ? AND target_id = ?)
+               OR (source_id = ? AND target_id = ?)
+        """,
+            (source_id, target_id, target_id, source_id),
+        )
+        strength = cursor.fetchone()[0]
+        return strength, self._read_generation(cursor)
+
+    def _update_adjacency(
+        self,
+        generation_before: int,
+        patch: tuple[float | None, int] | None,
+        source_id: str,
+        target_id: str,
+    ) -> None:
+        """
+        Apply a committed connection write to the loaded adjacency index.
+
+        If the generation read before the write differs from the index's,
+        another writer got in between and the index is invalidated instead of
+        patched.
+
+        Args:
+            generation_before: Generation read inside the write transaction
+                before the write
+            patch: Result of _read_adjacency_patch for the write
+            source_id: One endpoint of the written connection
+            target_id: Other endpoint of the written connection
+        """
+        index = self._adjacency
+        with index.lock:
+            if index.generation is None:
+                return
+            if patch is None or index.generation != generation_before:
+                index.invalidate()
+                return
+
+            strength, generation = patch
+            index.set_connection(source_id, target_id, strength)
+            index.generation = generation
+
     def get_connection_strength(self, source_id: str, target_id: str) -> float | None:
         """Get the strength of a connection between two memories."""
         try:
@@ -961,16 +1657,12 @@ class ConnectionGraphStore(ConnectionGraph):
             else datetime.now()
         )
 
-        # Deserialize cognitive embedding from JSON if present
+        # Deserialize cognitive embedding if present
         cognitive_embedding = None
         if "cognitive_embedding" in row.keys() and row["cognitive_embedding"]:
-            try:
-                embedding_list = json.loads(row["cognitive_embedding"])
-                cognitive_embedding = np.array(embedding_list)
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(
-                    f"Failed to deserialize cognitive embedding for memory {row['id']}: {e}"
-                )
+            cognitive_embedding = deserialize_embedding(
+                row["cognitive_embedding"], row["id"]
+            )
 
         # Deserialize context metadata from JSON if present
         metadata = {}
@@ -1009,17 +1701,34 @@ class ConnectionGraphStore(ConnectionGraph):
 
 def create_sqlite_persistence(
     db_path: str = "data/cognitive_memory.db",
+    pool_size: int = 8,
+    stats_flush_interval: float = 1.0,
+    stats_flush_max_pending: int = 1000,
+    retrieval_retention_days: float = 7.0,
 ) -> tuple[MemoryMetadataStore, ConnectionGraphStore]:
     """
     Factory function to create SQLite persistence components.
 
     Args:
         db_path: Path to SQLite database file
+        pool_size: Maximum number of pooled database connections
+        stats_flush_interval: Maximum seconds access and activation statistics
+            stay buffered
+        stats_flush_max_pending: Buffered statistics updates that trigger an
+            early flush
+        retrieval_retention_days: Age in days after which sampled retrieval
+            telemetry rows are pruned
 
     Returns:
         Tuple of (MemoryMetadataStore, ConnectionGraphStore)
     """
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(
+        db_path,
+        pool_size=pool_size,
+        stats_flush_interval=stats_flush_interval,
+        stats_flush_max_pending=stats_flush_max_pending,
+        retrieval_retention_days=retrieval_retention_days,
+    )
     memory_store = MemoryMetadataStore(db_manager)
     connection_store = ConnectionGraphStore(db_manager)
 
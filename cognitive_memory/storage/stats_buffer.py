@@ -0,0 +1,584 @@
+"""
+Write-behind buffer for access, activation, cache hit and retrieval statistics.
+
+Retrieval reads used to write: every memory lookup bumped its access count and
+every traversal step bumped the activation counts of the connections it
+followed, each in its own transaction. Under concurrent recall load that means
+many small write transactions competing for the SQLite write lock and growing
+the WAL. This buffer accumulates those counters in process and applies them in
+a single batched transaction once the flush interval elapses, once enough
+distinct updates are pending, or at shutdown.
+"""
+
+import atexit
+import threading
+import time
+import weakref
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .sqlite_persistence import DatabaseManager
+
+K = TypeVar("K", bound=Hashable)
+
+
+class StatsWriteBuffer:
+    """
+    Accumulate access and activation counters and flush them in batches.
+
+    Memory accesses are merged per memory ID. Connection activations are merged
+    per traversal, i.e. per (memory IDs, min_strength) predicate, so flushed
+    counts match what the immediate per-call UPDATEs would have produced.
+    Bridge cache hits are merged per query hash and embedding cache hits per
+    (model, content hash). Sampled retrieval_stats and retrieval_latency rows
+    are appended as-is, and rows older than retrieval_retention_days are
+    pruned whenever new ones are written. Failed flushes are merged back and
+    retried on the next flush; retrieval rows beyond MAX_RETRIEVAL_BACKLOG are
+    dropped oldest first. Timed flushes run on one long-lived daemon thread, so
+    they reuse that thread's pooled connection.
+    """
+
+    # Most retrieval rows kept buffered while flushes keep failing
+    MAX_RETRIEVAL_BACKLOG = 10_000
+
+    def __init__(
+        self,
+        db_manager: "DatabaseManager",
+        flush_interval: float = 1.0,
+        max_pending: int = 1000,
+        retrieval_retention_days: float = 7.0,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            db_manager: Database the counters are written to
+            flush_interval: Maximum seconds an update stays buffered; 0 or
+                less writes every update through immediately
+            max_pending: Flush once this many distinct updates are pending
+            retrieval_retention_days: Age in days after which retrieval_stats
+                and retrieval_latency rows are pruned
+        """
+        self.db_manager = db_manager
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.retrieval_retention_days = retrieval_retention_days
+
+        self._lock = threading.Lock()
+        # Serializes flushes so merged-back failures keep their order
+        self._flush_lock = threading.Lock()
+        # Set while updates wait for a timed flush by the flusher thread
+        self._pending_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+        weakref.finalize(self, _stop_flusher, self._pending_event, self._stop_event)
+
+        # memory_id -> [access count, last access unix time]
+        self._accesses: dict[str, list[float]] = {}
+        # (memory IDs, min_strength) -> [traversal count, last traversal time]
+        self._activations: dict[tuple[tuple[str, ...], float], list[float]] = {}
+        # bridge_cache query_hash -> [hit count, last hit time]
+        self._bridge_hits: dict[str, list[float]] = {}
+        # embedding_cache (model_id, content_hash) -> [hit count, last hit time]
+        self._embedding_hits: dict[tuple[str, str], list[float]] = {}
+        # retrieval_stats rows in insert column order
+        self._retrieval_rows: list[tuple[Any, ...]] = []
+        # retrieval_latency rows in insert column order
+        self._latency_rows: list[tuple[Any, ...]] = []
+
+        self.flushes = 0
+        self.flushed_updates = 0
+        self.failed_flushes = 0
+        self.dropped_retrieval_rows = 0
+
+        _BUFFERS.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct updates waiting to be flushed."""
+        with self._lock:
+            return self._pending_count()
+
+    def record_access(self, memory_id: str) -> int:
+        """
+        Record one access of a memory.
+
+        Args:
+            memory_id: Accessed memory
+
+        Returns:
+            Accesses of the memory not yet written to the database, including
+            this one, so callers can report an up-to-date access count
+        """
+        with self._lock:
+            entry = self._accesses.get(memory_id)
+            if entry is None:
+                entry = self._accesses[memory_id] = [0, 0.0]
+            entry[0] += 1
+            entry[1] = time.time()
+            pending_accesses = int(entry[0])
+
+        self._after_record()
+        return pending_accesses
+
+    def pending_accesses(self, memory_id: str) -> int:
+        """Get the buffered access count of a memory."""
+        with self._lock:
+            entry = self._accesses.get(memory_id)
+            return int(entry[0]) if entry else 0
+
+    def record_activation(
+        self, memory_ids: tuple[str, ...], min_strength: float = 0.0
+    ) -> None:
+        """
+        Record one traversal of the connections of some memories.
+
+        Every connection touching any of the memories with at least
+        min_strength gets its activation count bumped once.
+
+        Args:
+            memory_ids: Memories whose connections were traversed
+            min_strength: Minimum strength of the traversed connections
+        """
+        if not memory_ids:
+            return
+
+        key = (memory_ids, min_strength)
+        with self._lock:
+            entry = self._activations.get(key)
+            if entry is None:
+                entry = self._activations[key] = [0, 0.0]
+            entry[0] += 1
+            entry[1] = time.time()
+
+        self._after_record()
+
+    def record_bridge_hit(self, query_hash: str) -> None:
+        """
+        Record one served bridge_cache entry.
+
+        Args:
+            query_hash: Cache key whose rows were served
+        """
+        with self._lock:
+            entry = self._bridge_hits.get(query_hash)
+            if entry is None:
+                entry = self._bridge_hits[query_hash] = [0, 0.0]
+            entry[0] += 1
+            entry[1] = time.time()
+
+        self._after_record()
+
+    def record_embedding_hits(
+        self, model_id: str, content_hashes: Iterable[str]
+    ) -> None:
+        """
+        Record one served embedding_cache entry per content hash.
+
+        Args:
+            model_id: Identity of the embedding model
+            content_hashes: Cache keys of the served embeddings
+        """
+        now = time.time()
+        with self._lock:
+            for content_hash in content_hashes:
+                key = (model_id, content_hash)
+                entry = self._embedding_hits.get(key)
+                if entry is None:
+                    entry = self._embedding_hits[key] = [0, 0.0]
+                entry[0] += 1
+                entry[1] = now
+
+        self._after_record()
+
+    def record_retrieval(
+        self,
+        rows: list[tuple[Any, ...]],
+        latency_row: tuple[Any, ...] | None = None,
+    ) -> None:
+        """
+        Queue retrieval_stats rows and a retrieval_latency row for insertion.
+
+        Rows whose memory no longer exists when the buffer flushes are skipped;
+        the latency row is written regardless.
+
+        Args:
+            rows: (query_type, query_hash, memory_id, retrieval_score,
+                retrieval_rank, session_id, query_metadata, retrieval_metadata,
+                search_latency_ms, total_candidates, unix timestamp) tuples
+            latency_row: Optional (retrieval_id, query_hash, session_id,
+                total_results, phases_ms, unix timestamp) tuple
+        """
+        if not rows and latency_row is None:
+            return
+
+        with self._lock:
+            self._retrieval_rows.extend(rows)
+            if latency_row is not None:
+                self._latency_rows.append(latency_row)
+
+        self._after_record()
+
+    def flush(self) -> int:
+        """
+        Write all pending updates in one transaction.
+
+        Returns:
+            Number of distinct updates written
+        """
+        with self._flush_lock:
+            with self._lock:
+                accesses, self._accesses = self._accesses, {}
+                activations, self._activations = self._activations, {}
+                bridge_hits, self._bridge_hits = self._bridge_hits, {}
+                embedding_hits, self._embedding_hits = self._embedding_hits, {}
+                retrieval_rows, self._retrieval_rows = self._retrieval_rows, []
+                latency_rows, self._latency_rows = self._latency_rows, []
+                self._pending_event.clear()
+
+            if not (
+                accesses
+                or activations
+                or bridge_hits
+                or embedding_hits
+                or retrieval_rows
+                or latency_rows
+            ):
+                return 0
+
+            # Connecting to a removed database file would recreate it empty
+            if not self.db_manager.db_path.exists():
+                return 0
+
+            try:
+                self._write(
+                    accesses,
+                    activations,
+                    bridge_hits,
+                    embedding_hits,
+                    retrieval_rows,
+                    latency_rows,
+                )
+            except Exception as e:
+                self._merge_back(
+                    accesses,
+                    activations,
+                    bridge_hits,
+                    embedding_hits,
+                    retrieval_rows,
+                    latency_rows,
+                )
+                self.failed_flushes += 1
+                logger.warning(
+                    "Failed to flush buffered statistics",
+                    pending_accesses=len(accesses),
+                    pending_activations=len(activations),
+                    pending_bridge_hits=len(bridge_hits),
+                    pending_embedding_hits=len(embedding_hits),
+                    pending_retrieval_rows=len(retrieval_rows),
+                    pending_latency_rows=len(latency_rows),
+                    error=str(e),
+                )
+                return 0
+
+            written = (
+                len(accesses)
+                + len(activations)
+                + len(bridge_hits)
+                + len(embedding_hits)
+                + len(retrieval_rows)
+                + len(latency_rows)
+            )
+            self.flushes += 1
+            self.flushed_updates += written
+            return written
+
+    def close(self) -> None:
+        """Stop the flusher thread and flush pending updates."""
+        with self._lock:
+            self._closed = True
+            flusher = self._flusher
+        _stop_flusher(self._pending_event, self._stop_event)
+        # Joining lets the thread exit and hand back its pooled connection
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+        _BUFFERS.discard(self)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pending buffer size and flush counters."""
+        with self._lock:
+            pending_accesses = len(self._accesses)
+            pending_activations = len(self._activations)
+            pending_bridge_hits = len(self._bridge_hits)
+            pending_embedding_hits = len(self._embedding_hits)
+            pending_retrieval_rows = len(self._retrieval_rows)
+            pending_latency_rows = len(self._latency_rows)
+        return {
+            "pending": pending_accesses
+            + pending_activations
+            + pending_bridge_hits
+            + pending_embedding_hits
+            + pending_retrieval_rows
+            + pending_latency_rows,
+            "pending_accesses": pending_accesses,
+            "pending_activations": pending_activations,
+            "pending_bridge_hits": pending_bridge_hits,
+            "pending_embedding_hits": pending_embedding_hits,
+            "pending_retrieval_rows": pending_retrieval_rows,
+            "pending_latency_rows": pending_latency_rows,
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending,
+            "retrieval_retention_days": self.retrieval_retention_days,
+            "flushes": self.flushes,
+            "flushed_updates": self.flushed_updates,
+            "failed_flushes": self.failed_flushes,
+            "dropped_retrieval_rows": self.dropped_retrieval_rows,
+        }
+
+    def _after_record(self) -> None:
+        """Flush or schedule a timed flush after an update was recorded."""
+        with self._lock:
+            pending = self._pending_count()
+            flush_now = (
+                self._closed or self.flush_interval <= 0 or pending >= self.max_pending
+            )
+            if not flush_now:
+                self._pending_event.set()
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(
+                        target=_run_flusher,
+                        args=(weakref.ref(self), self._pending_event, self._stop_event),
+                        name="stats-buffer-flusher",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+
+        if flush_now:
+            self.flush()
+
+    def _pending_count(self) -> int:
+        """Number of distinct pending updates; caller holds the lock."""
+        return (
+            len(self._accesses)
+            + len(self._activations)
+            + len(self._bridge_hits)
+            + len(self._embedding_hits)
+            + len(self._retrieval_rows)
+            + len(self._latency_rows)
+        )
+
+    def _write(
+        self,
+        accesses: dict[str, list[float]],
+        activations: dict[tuple[tuple[str, ...], float], list[float]],
+        bridge_hits: dict[str, list[float]],
+        embedding_hits: dict[tuple[str, str], list[float]],
+        retrieval_rows: list[tuple[Any, ...]],
+        latency_rows: list[tuple[Any, ...]],
+    ) -> None:
+        """Apply a batch of updates in a single transaction."""
+        with self.db_manager.get_connection() as conn:
+            try:
+                if accesses:
+                    conn.executemany(
+                        """
+                        UPDATE memories
+                        SET access_count = access_count + ?,
+                            last_accessed = julianday(?, 'unixepoch')
+                        WHERE id = ?
+                    """,
+                        [
+                            (int(count), accessed_at, memory_id)
+                            for memory_id, (count, accessed_at) in accesses.items()
+                        ],
+                    )
+
+                for (memory_ids, min_strength), (
+                    count,
+                    activated_at,
+                ) in activations.items():
+                    placeholders = ", ".join("?" * len(memory_ids))
+                    conn.execute(
+                        f"""
+                        UPDATE memory_connections
+                        SET activation_count = activation_count + ?,
+                            last_activated = julianday(?, 'unixepoch')
+                        WHERE (source_id IN ({placeholders})
+                               OR target_id IN ({placeholders}))
+                          AND strength >= ?
+                    """,
+                        (
+                            int(count),
+                            activated_at,
+                            *memory_ids,
+                            *memory_ids,
+                            min_strength,
+                        ),
+                    )
+
+                if bridge_hits:
+                    conn.executemany(
+                        """
+                        UPDATE bridge_cache
+                        SET access_count = access_count + ?,
+                            last_accessed = julianday(?, 'unixepoch')
+                        WHERE query_hash = ?
+                    """,
+                        [
+                            (int(count), hit_at, query_hash)
+                            for query_hash, (count, hit_at) in bridge_hits.items()
+                        ],
+                    )
+
+                if embedding_hits:
+                    conn.executemany(
+                        """
+                        UPDATE embedding_cache
+                        SET hit_count = hit_count + ?,
+                            last_used_at = julianday(?, 'unixepoch')
+                        WHERE model_id = ? AND content_hash = ?
+                    """,
+                        [
+                            (int(count), hit_at, model_id, content_hash)
+                            for (model_id, content_hash), (
+                                count,
+                                hit_at,
+                            ) in embedding_hits.items()
+                        ],
+                    )
+
+                if retrieval_rows:
+                    conn.executemany(
+                        """
+                        INSERT INTO retrieval_stats (
+                            query_type, query_hash, memory_id, retrieval_score,
+                            retrieval_rank, session_id, query_metadata,
+                            retrieval_metadata, search_latency_ms,
+                            total_candidates, timestamp
+                        )
+                        SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, julianday(?, 'unixepoch')
+                        WHERE EXISTS (SELECT 1 FROM memories WHERE id = ?)
+                    """,
+                        [(*row, row[2]) for row in retrieval_rows],
+                    )
+
+                if latency_rows:
+                    conn.executemany(
+                        """
+                        INSERT INTO retrieval_latency (
+                            retrieval_id, query_hash, session_id, total_results,
+                            phases_ms, timestamp
+                        )
+                        VALUES (?, ?, ?, ?, ?, julianday(?, 'unixepoch'))
+                    """,
+                        latency_rows,
+                    )
+
+                if retrieval_rows or latency_rows:
+                    for table in ("retrieval_stats", "retrieval_latency"):
+                        conn.execute(
+                            f"""
+                            DELETE FROM {table}
+                            WHERE timestamp < julianday('now') - ?
+                        """,
+                            (self.retrieval_retention_days,),
+                        )
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _merge_back(
+        self,
+        accesses: dict[str, list[float]],
+        activations: dict[tuple[tuple[str, ...], float], list[float]],
+        bridge_hits: dict[str, list[float]],
+        embedding_hits: dict[tuple[str, str], list[float]],
+        retrieval_rows: list[tuple[Any, ...]],
+        latency_rows: list[tuple[Any, ...]],
+    ) -> None:
+        """Return the updates of a failed flush to the pending buffer."""
+        with self._lock:
+            dropped = 0
+            for pending, failed in (
+                (self._retrieval_rows, retrieval_rows),
+                (self._latency_rows, latency_rows),
+            ):
+                pending[:0] = failed
+                excess = len(pending) - self.MAX_RETRIEVAL_BACKLOG
+                if excess > 0:
+                    del pending[:excess]
+                    dropped += excess
+            self.dropped_retrieval_rows += dropped
+            _merge(self._accesses, accesses)
+            _merge(self._activations, activations)
+            _merge(self._bridge_hits, bridge_hits)
+            _merge(self._embedding_hits, embedding_hits)
+
+        if dropped > 0:
+            logger.warning(
+                "Dropped oldest buffered retrieval rows",
+                dropped=dropped,
+                max_backlog=self.MAX_RETRIEVAL_BACKLOG,
+            )
+
+
+def _merge(pending: dict[K, list[float]], failed: dict[K, list[float]]) -> None:
+    """Add failed [count, last_time] counters into the pending ones."""
+    for key, (count, last_time) in failed.items():
+        entry = pending.get(key)
+        if entry is None:
+            pending[key] = [count, last_time]
+        else:
+            entry[0] += count
+            entry[1] = max(entry[1], last_time)
+
+
+def _run_flusher(
+    buffer_ref: "weakref.ReferenceType[StatsWriteBuffer]",
+    pending: threading.Event,
+    stopped: threading.Event,
+) -> None:
+    """Flush a buffer flush_interval after updates become pending, until stopped."""
+    while True:
+        pending.wait()
+        buffer = buffer_ref()
+        if buffer is None or stopped.is_set():
+            return
+        interval = buffer.flush_interval
+        # Only hold the buffer while flushing so it can still be collected
+        del buffer
+
+        if stopped.wait(interval):
+            return
+        buffer = buffer_ref()
+        if buffer is None:
+            return
+        try:
+            buffer.flush()
+        except Exception as e:
+            logger.warning("Timed statistics flush failed", error=str(e))
+        del buffer
+
+
+def _stop_flusher(pending: threading.Event, stopped: threading.Event) -> None:
+    """Wake the flusher thread and make it exit."""
+    stopped.set()
+    pending.set()
+
+
+# Live buffers, flushed at interpreter exit if they were never closed
+_BUFFERS: "weakref.WeakSet[StatsWriteBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    """Flush buffers that are still open when the interpreter exits."""
+    for buffer in list(_BUFFERS):
+        buffer.close()
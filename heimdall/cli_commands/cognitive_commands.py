@@ -356,6 +356,32 @@ def system_status(
 
                 console.print(memory_table)
 
+            # Retrieval latency percentiles per phase
+            latency = result.get("retrieval_latency")
+            if latency and latency.get("phases"):
+                latency_table = Table(
+                    title=(
+                        f"Retrieval Latency (ms, last {latency['window_minutes']:g} "
+                        f"min, {latency['samples']} sampled)"
+                    )
+                )
+                latency_table.add_column("Phase", style="cyan")
+                latency_table.add_column("Samples", style="white")
+                latency_table.add_column("p50", style="green")
+                latency_table.add_column("p95", style="yellow")
+                latency_table.add_column("p99", style="red")
+
+                for phase, stats in latency["phases"].items():
+                    latency_table.add_row(
+                        phase.replace("_", " ").title(),
+                        str(stats["count"]),
+                        f"{stats['p50']:.1f}",
+                        f"{stats['p95']:.1f}",
+                        f"{stats['p99']:.1f}",
+                    )
+
+                console.print(latency_table)
+
             # Detailed information
             if detailed:
                 if result.get("system_config"):
@@ -1,14 +1,22 @@
 """Project memory management commands."""
 
 import json
+import shutil
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+    from cognitive_memory.core.config import SystemConfig
+
 console = Console()
 
 
@@ -63,6 +71,116 @@ def _ensure_heimdall_in_gitignore(project_path: Path) -> None:
         )
 
 
+def _embedded_vector_path(config: "SystemConfig", project_path: Path) -> Path:
+    """Get the directory holding the embedded vector stores of a project."""
+    return Path(config.vector_storage.path or project_path / ".heimdall" / "vectors")
+
+
+def _embedded_collections(
+    store_dir: Path, project_id: str, vector_size: int
+) -> list[dict[str, Any]]:
+    """
+    Describe the level collections of an existing embedded vector store.
+
+    Args:
+        store_dir: Store directory, i.e. the vector path joined with project_id
+        project_id: Project identifier of the store
+        vector_size: Configured embedding dimension
+
+    Returns:
+        Collection details in the format project_list uses for Qdrant
+    """
+    from cognitive_memory.storage.embedded_vector_storage import (
+        EmbeddedVectorStorage,
+    )
+
+    with EmbeddedVectorStorage(vector_size, project_id, store_dir.parent) as storage:
+        stats = storage.get_storage_stats()
+
+    return [
+        {
+            "name": level_stats["collection_name"],
+            "level": level_stats["collection_name"].rsplit("_", 1)[1],
+            "vectors_count": level_stats["vectors_count"],
+            "points_count": level_stats["points_count"],
+            "indexed_vectors_count": level_stats["indexed_vectors_count"],
+        }
+        for level_stats in stats.values()
+        if "collection_name" in level_stats
+    ]
+
+
+def _connect_qdrant() -> tuple["QdrantClient", str]:
+    """
+    Connect to the running Qdrant service.
+
+    Returns:
+        Tuple of (client, Qdrant URL)
+
+    Raises:
+        typer.Exit: If Qdrant is not running
+    """
+    from urllib.parse import urlparse
+
+    from qdrant_client import QdrantClient
+
+    from cognitive_memory.core.config import QdrantConfig
+    from heimdall.cognitive_system.service_manager import QdrantManager
+
+    # Check Qdrant status
+    manager = QdrantManager()
+    status = manager.get_status()
+
+    if status.status.value != "running":
+        console.print(
+            "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
+            style="bold red",
+        )
+        raise typer.Exit(1)
+
+    # Create Qdrant client
+    qdrant_config = QdrantConfig.from_env()
+    parsed_url = urlparse(qdrant_config.url)
+    host = parsed_url.hostname or "localhost"
+    port = parsed_url.port or 6333
+
+    client = QdrantClient(host=host, port=port, prefer_grpc=qdrant_config.prefer_grpc)
+    return client, qdrant_config.url
+
+
+def _delete_qdrant_collections(
+    client: "QdrantClient", collection_names: list[str]
+) -> tuple[list[str], list[dict[str, str]]]:
+    """Delete Qdrant collections, returning the deleted and failed ones."""
+    deleted_collections = []
+    failed_collections = []
+
+    for name in collection_names:
+        try:
+            client.delete_collection(name)
+            deleted_collections.append(name)
+            console.print(f"✅ Deleted: {name}")
+        except Exception as e:
+            failed_collections.append({"name": name, "error": str(e)})
+            console.print(f"❌ Failed to delete {name}: {e}")
+
+    return deleted_collections, failed_collections
+
+
+def _delete_embedded_store(
+    store_dir: Path, collection_names: list[str]
+) -> tuple[list[str], list[dict[str, str]]]:
+    """Delete an embedded vector store directory with all its collections."""
+    try:
+        shutil.rmtree(store_dir)
+    except Exception as e:
+        console.print(f"❌ Failed to delete {store_dir}: {e}")
+        return [], [{"name": name, "error": str(e)} for name in collection_names]
+
+    console.print(f"✅ Deleted embedded vector store: {store_dir}")
+    return collection_names, []
+
+
 def project_init(
     project_root: str | None = typer.Option(
         None, help="Project root directory (defaults to current directory)"
@@ -70,6 +188,11 @@ def project_init(
     auto_start_qdrant: bool = typer.Option(
         True, help="Automatically start Qdrant if not running"
     ),
+    vector_backend: str | None = typer.Option(
+        None,
+        "--vector-backend",
+        help="Vector storage backend: qdrant or embedded (defaults to configuration)",
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
     # Interactive control flags
     non_interactive: bool = typer.Option(
@@ -140,6 +263,9 @@ def project_init(
             SystemConfig,
             get_project_id,
         )
+        from cognitive_memory.storage.embedded_vector_storage import (
+            create_embedded_storage,
+        )
         from cognitive_memory.storage.qdrant_storage import create_hierarchical_storage
         from heimdall.cognitive_system.service_manager import QdrantManager
 
@@ -154,68 +280,107 @@ def project_init(
         console.print(f"🚀 Initializing project: {project_id}", style="bold blue")
         console.print(f"📁 Project root: {project_path}")
 
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
+        # Load system configuration to get embedding dimension and backend
+        config = SystemConfig.from_env()
+        qdrant_config = QdrantConfig.from_env()
+        backend = (vector_backend or config.vector_storage.backend).lower()
+        if backend not in ("qdrant", "embedded"):
+            console.print(
+                f"❌ Unknown vector backend: {backend} (use qdrant or embedded)",
+                style="bold red",
+            )
+            raise typer.Exit(1)
 
-        if status.status.value != "running":
-            if auto_start_qdrant:
-                console.print(
-                    "🔄 Qdrant not running, starting automatically...",
-                    style="bold yellow",
+        if backend == "embedded":
+            # Vectors live in the project directory, no Qdrant service needed
+            vector_path = _embedded_vector_path(config, project_path)
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task(
+                    "Initializing embedded vector store...", total=None
                 )
 
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    task = progress.add_task("Starting Qdrant service...", total=None)
+                storage = create_embedded_storage(
+                    vector_size=config.embedding.embedding_dimension,
+                    project_id=project_id,
+                    path=vector_path,
+                    search_mode=config.vector_storage.search_mode,
+                )
+                storage.close()
 
-                    success = manager.start(wait_timeout=30)
-                    if not success:
-                        progress.update(task, description="❌ Failed to start Qdrant")
-                        console.print(
-                            "❌ Failed to start Qdrant automatically", style="bold red"
+                progress.update(
+                    task, description="✅ Embedded vector store initialized"
+                )
+        else:
+            # Check Qdrant status
+            manager = QdrantManager()
+            status = manager.get_status()
+
+            if status.status.value != "running":
+                if auto_start_qdrant:
+                    console.print(
+                        "🔄 Qdrant not running, starting automatically...",
+                        style="bold yellow",
+                    )
+
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        console=console,
+                    ) as progress:
+                        task = progress.add_task(
+                            "Starting Qdrant service...", total=None
                         )
-                        raise typer.Exit(1)
 
-                    progress.update(task, description="✅ Qdrant started successfully")
-            else:
-                console.print(
-                    "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
-                    style="bold red",
-                )
-                raise typer.Exit(1)
+                        success = manager.start(wait_timeout=30)
+                        if not success:
+                            progress.update(
+                                task, description="❌ Failed to start Qdrant"
+                            )
+                            console.print(
+                                "❌ Failed to start Qdrant automatically",
+                                style="bold red",
+                            )
+                            raise typer.Exit(1)
 
-        # Load system configuration to get embedding dimension
-        config = SystemConfig.from_env()
+                        progress.update(
+                            task, description="✅ Qdrant started successfully"
+                        )
+                else:
+                    console.print(
+                        "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
+                        style="bold red",
+                    )
+                    raise typer.Exit(1)
 
-        # Create Qdrant client configuration
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
+            from urllib.parse import urlparse
 
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
+            parsed_url = urlparse(qdrant_config.url)
+            host = parsed_url.hostname or "localhost"
+            port = parsed_url.port or 6333
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Initializing project collections...", total=None)
-
-            # Create hierarchical storage to initialize collections
-            _ = create_hierarchical_storage(
-                vector_size=config.embedding.embedding_dimension,
-                project_id=project_id,
-                host=host,
-                port=port,
-                prefer_grpc=qdrant_config.prefer_grpc,
-            )
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task(
+                    "Initializing project collections...", total=None
+                )
+
+                # Create hierarchical storage to initialize collections
+                _ = create_hierarchical_storage(
+                    vector_size=config.embedding.embedding_dimension,
+                    project_id=project_id,
+                    host=host,
+                    port=port,
+                    prefer_grpc=qdrant_config.prefer_grpc,
+                )
 
-            progress.update(task, description="✅ Project collections initialized")
+                progress.update(task, description="✅ Project collections initialized")
 
         # Initialize shared environment and download models if needed
         with Progress(
@@ -325,6 +490,11 @@ def project_init(
                 template = template_path.read_text()
                 yaml_content = template.replace("${project_id}", project_id)
                 yaml_content = yaml_content.replace("${qdrant_url}", qdrant_config.url)
+                if backend == "embedded":
+                    yaml_content += yaml.dump(
+                        {"vector_storage": {"backend": backend}},
+                        default_flow_style=False,
+                    )
                 config_file.write_text(yaml_content)
             else:
                 # Fallback to direct YAML generation
@@ -346,6 +516,7 @@ def project_init(
                         ],
                     },
                     "database": {"path": "./.heimdall/cognitive_memory.db"},
+                    "vector_storage": {"backend": backend},
                 }
                 config_file.write_text(
                     yaml.dump(project_config, default_flow_style=False)
@@ -484,122 +655,127 @@ def project_list(
         False, "--collections", help="Show collection details"
     ),
 ) -> None:
-    """List all projects in shared Qdrant instance."""
+    """List all projects in shared Qdrant instance or embedded vector storage."""
     try:
-        from qdrant_client import QdrantClient
+        from cognitive_memory.core.config import SystemConfig
 
-        from cognitive_memory.core.config import QdrantConfig
-        from heimdall.cognitive_system.service_manager import QdrantManager
-
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
-
-        if status.status.value != "running":
-            console.print(
-                "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
-                style="bold red",
-            )
-            raise typer.Exit(1)
-
-        # Create Qdrant client
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
-
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
-
-        client = QdrantClient(
-            host=host, port=port, prefer_grpc=qdrant_config.prefer_grpc
-        )
-
-        # Get all collections and extract project IDs
-        try:
-            all_collections = client.get_collections().collections
-            projects: dict[str, list[dict[str, Any]]] = {}
-
-            for collection in all_collections:
-                # Extract project ID from collection name (format: {project_id}_{level})
-                if "_" in collection.name:
-                    parts = collection.name.rsplit("_", 1)
-                    if len(parts) == 2 and parts[1] in [
-                        "concepts",
-                        "contexts",
-                        "episodes",
-                    ]:
-                        project_id = parts[0]
-                        if project_id not in projects:
-                            projects[project_id] = []
-
-                        # Get detailed collection info for stats
-                        try:
-                            collection_info = client.get_collection(collection.name)
-                            points_count = collection_info.points_count
-                            indexed_vectors_count = (
-                                collection_info.indexed_vectors_count
-                            )
-                        except Exception:
-                            points_count = 0
-                            indexed_vectors_count = 0
-
-                        projects[project_id].append(
-                            {
-                                "name": collection.name,
-                                "level": parts[1],
-                                "vectors_count": points_count,  # Use points_count as vectors_count
-                                "points_count": points_count,
-                                "indexed_vectors_count": indexed_vectors_count,
-                            }
-                        )
-
-            if json_output:
-                result = {
-                    "total_projects": len(projects),
-                    "projects": projects,
-                    "qdrant_url": qdrant_config.url,
-                }
-                console.print(json.dumps(result, indent=2))
-            else:
-                if not projects:
-                    console.print(
-                        "📭 No projects found in shared Qdrant instance",
-                        style="bold yellow",
+        config = SystemConfig.from_env()
+        projects: dict[str, list[dict[str, Any]]] = {}
+
+        if config.vector_storage.backend == "embedded":
+            # Each project store is a directory named after the project ID
+            vector_path = _embedded_vector_path(config, Path.cwd())
+            location = {"vector_path": str(vector_path)}
+            source = "embedded vector storage"
+            title = "Projects in Embedded Vector Storage"
+
+            store_dirs = sorted(vector_path.iterdir()) if vector_path.is_dir() else []
+            for store_dir in store_dirs:
+                if not (store_dir / "index.db").exists():
+                    continue
+                try:
+                    projects[store_dir.name] = _embedded_collections(
+                        store_dir,
+                        store_dir.name,
+                        config.embedding.embedding_dimension,
                     )
-                else:
+                except Exception as e:
                     console.print(
-                        f"📊 Found {len(projects)} project(s) in shared Qdrant:",
-                        style="bold blue",
+                        f"❌ Error reading embedded vector store {store_dir}: {e}",
+                        style="bold red",
                     )
+                    raise typer.Exit(1) from e
+        else:
+            client, qdrant_url = _connect_qdrant()
+            location = {"qdrant_url": qdrant_url}
+            source = "shared Qdrant"
+            title = "Projects in Shared Qdrant"
 
-                    projects_table = Table(title="Projects in Shared Qdrant")
-                    projects_table.add_column("Project ID", style="cyan")
-                    projects_table.add_column("Collections", style="green")
-                    if show_collections:
-                        projects_table.add_column("Total Vectors", style="white")
-                        projects_table.add_column("Total Points", style="white")
-
-                    for project_id, collections in projects.items():
-                        collection_names = ", ".join([c["name"] for c in collections])
-                        if show_collections:
-                            total_vectors = sum(c["vectors_count"] for c in collections)
-                            total_points = sum(c["points_count"] for c in collections)
-                            projects_table.add_row(
-                                project_id,
-                                collection_names,
-                                str(total_vectors),
-                                str(total_points),
+            # Get all collections and extract project IDs
+            try:
+                all_collections = client.get_collections().collections
+
+                for collection in all_collections:
+                    # Extract project ID from collection name (format: {project_id}_{level})
+                    if "_" in collection.name:
+                        parts = collection.name.rsplit("_", 1)
+                        if len(parts) == 2 and parts[1] in [
+                            "concepts",
+                            "contexts",
+                            "episodes",
+                        ]:
+                            project_id = parts[0]
+                            if project_id not in projects:
+                                projects[project_id] = []
+
+                            # Get detailed collection info for stats
+                            try:
+                                collection_info = client.get_collection(collection.name)
+                                points_count = collection_info.points_count
+                                indexed_vectors_count = (
+                                    collection_info.indexed_vectors_count
+                                )
+                            except Exception:
+                                points_count = 0
+                                indexed_vectors_count = 0
+
+                            projects[project_id].append(
+                                {
+                                    "name": collection.name,
+                                    "level": parts[1],
+                                    "vectors_count": points_count,  # Use points_count as vectors_count
+                                    "points_count": points_count,
+                                    "indexed_vectors_count": indexed_vectors_count,
+                                }
                             )
-                        else:
-                            projects_table.add_row(project_id, collection_names)
 
-                    console.print(projects_table)
+            except Exception as e:
+                console.print(
+                    f"❌ Error querying Qdrant collections: {e}", style="bold red"
+                )
+                raise typer.Exit(1) from e
 
-        except Exception as e:
-            console.print(
-                f"❌ Error querying Qdrant collections: {e}", style="bold red"
-            )
-            raise typer.Exit(1) from e
+        if json_output:
+            result = {
+                "total_projects": len(projects),
+                "projects": projects,
+                **location,
+            }
+            console.print(json.dumps(result, indent=2))
+        else:
+            if not projects:
+                console.print(
+                    f"📭 No projects found in {source}",
+                    style="bold yellow",
+                )
+            else:
+                console.print(
+                    f"📊 Found {len(projects)} project(s) in {source}:",
+                    style="bold blue",
+                )
+
+                projects_table = Table(title=title)
+                projects_table.add_column("Project ID", style="cyan")
+                projects_table.add_column("Collections", style="green")
+                if show_collections:
+                    projects_table.add_column("Total Vectors", style="white")
+                    projects_table.add_column("Total Points", style="white")
+
+                for project_id, collections in projects.items():
+                    collection_names = ", ".join([c["name"] for c in collections])
+                    if show_collections:
+                        total_vectors = sum(c["vectors_count"] for c in collections)
+                        total_points = sum(c["points_count"] for c in collections)
+                        projects_table.add_row(
+                            project_id,
+                            collection_names,
+                            str(total_vectors),
+                            str(total_points),
+                        )
+                    else:
+                        projects_table.add_row(project_id, collection_names)
+
+                console.print(projects_table)
 
     except Exception as e:
         console.print(f"❌ Error listing projects: {e}", style="bold red")
@@ -618,10 +794,7 @@ def project_clean(
 ) -> None:
     """Remove project collections and setup from current directory."""
     try:
-        from qdrant_client import QdrantClient
-
-        from cognitive_memory.core.config import QdrantConfig, get_project_id
-        from heimdall.cognitive_system.service_manager import QdrantManager
+        from cognitive_memory.core.config import SystemConfig, get_project_id
 
         # Determine project root and generate project ID
         if project_root:
@@ -634,40 +807,58 @@ def project_clean(
         console.print(f"🗑️ Cleaning project: {project_id}")
         console.print(f"📁 Project root: {project_path}")
 
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
-
-        if status.status.value != "running":
-            console.print(
-                "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
-                style="bold red",
-            )
-            raise typer.Exit(1)
-
-        # Create Qdrant client
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
-
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
-
-        client = QdrantClient(
-            host=host, port=port, prefer_grpc=qdrant_config.prefer_grpc
-        )
+        config = SystemConfig.from_env()
+        embedded = config.vector_storage.backend == "embedded"
+        if not embedded:
+            client, _ = _connect_qdrant()
+        delete_collections: Callable[
+            [list[str]], tuple[list[str], list[dict[str, str]]]
+        ]
 
         # Find collections for this project
         try:
-            all_collections = client.get_collections().collections
-            project_collections = [
-                c
-                for c in all_collections
-                if c.name.startswith(f"{project_id}_")
-                and c.name.endswith(("_concepts", "_contexts", "_episodes"))
-            ]
+            if embedded:
+                # The embedded store keeps all levels in one project directory
+                store_dir = _embedded_vector_path(config, project_path) / project_id
+                collection_names = []
+                total_vectors = 0
+                if store_dir.is_dir():
+                    collection_names = [
+                        f"{project_id}_{level_name}"
+                        for level_name in ("concepts", "contexts", "episodes")
+                    ]
+                    try:
+                        total_vectors = sum(
+                            c["points_count"]
+                            for c in _embedded_collections(
+                                store_dir,
+                                project_id,
+                                config.embedding.embedding_dimension,
+                            )
+                        )
+                    except Exception:
+                        pass  # Still delete stores that can't be opened
+                delete_collections = partial(_delete_embedded_store, store_dir)
+            else:
+                all_collections = client.get_collections().collections
+                collection_names = [
+                    c.name
+                    for c in all_collections
+                    if c.name.startswith(f"{project_id}_")
+                    and c.name.endswith(("_concepts", "_contexts", "_episodes"))
+                ]
+
+                # Get detailed collection info to calculate total vectors
+                total_vectors = 0
+                for name in collection_names:
+                    try:
+                        collection_info = client.get_collection(name)
+                        total_vectors += collection_info.points_count or 0
+                    except Exception:
+                        pass  # Skip collections that can't be queried
+                delete_collections = partial(_delete_qdrant_collections, client)
 
-            if not project_collections:
+            if not collection_names:
                 console.print(
                     f"⚠️ No collections found for project: {project_id}",
                     style="bold yellow",
@@ -675,17 +866,6 @@ def project_clean(
                 console.print("Use 'heimdall project list' to see available projects")
                 raise typer.Exit(1)
 
-            collection_names = [c.name for c in project_collections]
-
-            # Get detailed collection info to calculate total vectors
-            total_vectors = 0
-            for collection in project_collections:
-                try:
-                    collection_info = client.get_collection(collection.name)
-                    total_vectors += collection_info.points_count
-                except Exception:
-                    pass  # Skip collections that can't be queried
-
             if dry_run:
                 console.print(
                     f"🔍 DRY RUN: Would delete {len(collection_names)} collection(s) for project '{project_id}':",
@@ -715,19 +895,9 @@ def project_clean(
                     raise typer.Exit(0)
 
             # Delete collections
-            deleted_collections = []
-            failed_collections = []
-
-            for collection in project_collections:
-                try:
-                    client.delete_collection(collection.name)
-                    deleted_collections.append(collection.name)
-                    console.print(f"✅ Deleted: {collection.name}")
-                except Exception as e:
-                    failed_collections.append(
-                        {"name": collection.name, "error": str(e)}
-                    )
-                    console.print(f"❌ Failed to delete {collection.name}: {e}")
+            deleted_collections, failed_collections = delete_collections(
+                collection_names
+            )
 
             # Check for .heimdall directory and git hooks after successful collection deletion
             heimdall_dir_removed = False
@@ -423,6 +423,25 @@ class HealthChecker:
     ) -> HealthCheck:
         """Check Qdrant service status and health."""
         try:
+            from cognitive_memory.core.config import SystemConfig
+
+            config = SystemConfig.from_env()
+            if config.vector_storage.backend == "embedded":
+                # Vectors are stored in process, there is no service to start
+                return HealthCheck(
+                    name="Qdrant Service",
+                    status=HealthResult.HEALTHY,
+                    message="Qdrant not required (embedded vector storage)",
+                    details={
+                        "vector_backend": config.vector_storage.backend,
+                        "vector_path": config.vector_storage.resolve_path(
+                            config.database.path
+                        ),
+                    }
+                    if verbose
+                    else None,
+                )
+
             status = self.qdrant_manager.get_status()
 
             if status.status == ServiceStatus.RUNNING:
@@ -936,31 +955,61 @@ class HealthChecker:
             from cognitive_memory.encoding.onnx_provider import ONNXEmbeddingProvider
 
             provider = ONNXEmbeddingProvider()
-            test_texts = ["test sentence"] * 10
+            # Mixed lengths, like real queries and chunks, so padding shows up
+            test_texts = [
+                "test sentence",
+                "how does spreading activation pick starting memories",
+                " ".join(["markdown chunk text about memory consolidation"] * 12),
+            ] * 4
+            token_count = sum(len(ids) for ids in provider._tokenize(test_texts))
+
+            # Untimed warm-up so session setup is not billed to either run
+            provider.encode_batch(test_texts)
+
+            # Before: every input padded to the model's max_length
+            fixed_start = time.time()
+            provider._embed_token_ids(
+                provider._tokenize(test_texts), pad_to_max_length=True
+            )
+            fixed_time = time.time() - fixed_start
 
+            # After: dynamic padding with length-bucketed batches
             encoding_start = time.time()
             embeddings = provider.encode_batch(test_texts)
             encoding_time = time.time() - encoding_start
 
             total_time = time.time() - start_time
+            tokens_per_second = token_count / max(encoding_time, 1e-9)
+            fixed_tokens_per_second = token_count / max(fixed_time, 1e-9)
+            throughput = (
+                f"{tokens_per_second:.0f} tokens/s, "
+                f"{fixed_tokens_per_second:.0f} with fixed-length padding"
+            )
 
             # Performance thresholds (ONNX should be faster)
             if encoding_time > 3.0:
                 status = HealthResult.WARNING
-                message = f"Slow ONNX encoding performance: {encoding_time:.2f}s for 10 sentences"
+                message = f"Slow ONNX encoding performance: {encoding_time:.2f}s for {len(test_texts)} texts ({throughput})"
             elif encoding_time > 8.0:
                 status = HealthResult.CRITICAL
-                message = f"Very slow ONNX encoding performance: {encoding_time:.2f}s for 10 sentences"
+                message = f"Very slow ONNX encoding performance: {encoding_time:.2f}s for {len(test_texts)} texts ({throughput})"
             else:
                 status = HealthResult.HEALTHY
-                message = f"Good ONNX encoding performance: {encoding_time:.2f}s for 10 sentences"
+                message = f"Good ONNX encoding performance: {encoding_time:.2f}s for {len(test_texts)} texts ({throughput})"
 
             details = None
             if verbose:
                 details = {
                     "encoding_time_seconds": round(encoding_time, 3),
                     "total_time_seconds": round(total_time, 3),
-                    "sentences_per_second": round(10 / encoding_time, 1),
+                    "sentences_per_second": round(len(test_texts) / encoding_time, 1),
+                    "tokens": token_count,
+                    "tokens_per_second": round(tokens_per_second, 1),
+                    "fixed_padding_time_seconds": round(fixed_time, 3),
+                    "fixed_padding_tokens_per_second": round(
+                        fixed_tokens_per_second, 1
+                    ),
+                    "padding_speedup": round(fixed_time / max(encoding_time, 1e-9), 2),
                     "embedding_shape": list(embeddings.shape),
                     "provider": "ONNX",
                 }
@@ -34,6 +34,7 @@ from cognitive_memory.core.interfaces import CognitiveSystem
 from cognitive_memory.core.version import get_version_info
 from cognitive_memory.main import initialize_system, initialize_with_config
 from heimdall.display_utils import format_memory_results_json
+from heimdall.operation_executor import OperationExecutor
 from heimdall.operations import CognitiveOperations
 
 # Configure logging
@@ -61,6 +62,8 @@ class HeimdallMCPServer:
         """
         self.cognitive_system = cognitive_system
         self.operations = CognitiveOperations(cognitive_system)
+        # Blocking operations run in worker threads so the event loop stays free
+        self.executor = OperationExecutor()
         self.server: Server = Server("heimdall-cognitive-memory")
         self._register_handlers()
 
@@ -279,7 +282,13 @@ class HeimdallMCPServer:
                 context["source_type"] = "store_memory"
 
             # Store the experience using operations layer
-            result = self.operations.store_experience(text=text, context=context)
+            result = await self.executor.run(
+                "store_memory",
+                self.operations.store_experience,
+                text=text,
+                context=context,
+                write=True,
+            )
 
             if result["success"]:
                 # Get hierarchy level, memory type, and memory ID from result
@@ -317,8 +326,12 @@ class HeimdallMCPServer:
 
         try:
             # Retrieve memories using operations layer
-            result = self.operations.retrieve_memories(
-                query=query, types=types_filter, limit=max_results
+            result = await self.executor.run(
+                "recall_memories",
+                self.operations.retrieve_memories,
+                query=query,
+                types=types_filter,
+                limit=max_results,
             )
 
             if not result["success"]:
@@ -391,8 +404,12 @@ class HeimdallMCPServer:
             }
 
             # Store the lesson using operations layer
-            result = self.operations.store_experience(
-                text=lesson_content, context=context
+            result = await self.executor.run(
+                "session_lessons",
+                self.operations.store_experience,
+                text=lesson_content,
+                context=context,
+                write=True,
             )
 
             if result["success"]:
@@ -424,7 +441,9 @@ class HeimdallMCPServer:
 
         try:
             # Get status using operations layer
-            result = self.operations.get_system_status(detailed=detailed)
+            result = await self.executor.run(
+                "memory_status", self.operations.get_system_status, detailed=detailed
+            )
 
             if not result["success"]:
                 return [
@@ -443,6 +462,9 @@ class HeimdallMCPServer:
                 "timestamp": datetime.now().isoformat(),
             }
 
+            if "retrieval_latency" in result:
+                formatted_status["retrieval_latency"] = result["retrieval_latency"]
+
             if detailed:
                 # Add detailed configuration
                 formatted_status.update(
@@ -450,6 +472,7 @@ class HeimdallMCPServer:
                         "system_config": result.get("system_config", {}),
                         "storage_stats": result.get("storage_stats", {}),
                         "embedding_info": result.get("embedding_info", {}),
+                        "executor_stats": self.executor.get_stats(),
                         "detailed_config": {
                             "embedding_model": "all-MiniLM-L6-v2",
                             "embedding_dimensions": 384,
@@ -485,8 +508,12 @@ class HeimdallMCPServer:
 
         try:
             # Delete memory using operations layer
-            result = self.operations.delete_memory_by_id(
-                memory_id=memory_id.strip(), dry_run=dry_run
+            result = await self.executor.run(
+                "delete_memory",
+                self.operations.delete_memory_by_id,
+                memory_id=memory_id.strip(),
+                dry_run=dry_run,
+                write=not dry_run,
             )
 
             if not result["success"]:
@@ -542,7 +569,13 @@ class HeimdallMCPServer:
 
         try:
             # Delete memories using operations layer
-            result = self.operations.delete_memories_by_tags(tags=tags, dry_run=dry_run)
+            result = await self.executor.run(
+                "delete_memories_by_tags",
+                self.operations.delete_memories_by_tags,
+                tags=tags,
+                dry_run=dry_run,
+                write=not dry_run,
+            )
 
             if not result["success"]:
                 return [
@@ -597,10 +630,15 @@ class HeimdallMCPServer:
     async def run_stdio(self) -> None:
         """Run MCP server with stdio transport."""
         logger.info("Starting Heimdall MCP Server (stdio mode)")
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream, write_stream, self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self.executor.shutdown(wait=False)
 
     async def run_http(self, host: str = "127.0.0.1", port: int = 8080) -> None:
         """Run MCP server with HTTP transport."""
@@ -611,7 +649,9 @@ class HeimdallMCPServer:
             """Health check endpoint for container monitoring."""
             try:
                 # Basic health check - verify cognitive system is responsive
-                status_result = self.operations.get_system_status()
+                status_result = await self.executor.run(
+                    "health", self.operations.get_system_status
+                )
                 if status_result["success"]:
                     return JSONResponse(
                         {
@@ -661,7 +701,10 @@ class HeimdallMCPServer:
             app=app, host=host, port=port, log_level="info", access_log=True
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            self.executor.shutdown(wait=False)
 
 
 async def main() -> None:
@@ -13,6 +13,7 @@ from .file_types import (
     FileChangeEvent,
     FileMonitor,
     FileState,
+    InotifyWatcher,
 )
 from .loader_registry import (
     LoaderRegistry,
@@ -24,6 +25,7 @@ __all__ = [
     "FileChangeEvent",
     "FileState",
     "FileMonitor",
+    "InotifyWatcher",
     "EventQueue",
     "LightweightMonitor",
     "LightweightMonitorError",
@@ -158,7 +158,7 @@ class FileSyncHandler:
 
     def _handle_file_modified(self, event: FileChangeEvent) -> bool:
         """
-        Handle file modification with atomic delete+reload operation.
+        Handle file modification by incrementally reloading changed chunks.
 
         Args:
             event: FileChangeEvent for file modification
@@ -173,25 +173,29 @@ class FileSyncHandler:
                 logger.debug(f"No loader available for modified file: {event.path}")
                 return True  # Not an error - just unsupported file type
 
-            # Use centralized atomic reload operation
+            # Re-encode only the chunks that changed
             source_path = str(event.path)
-            logger.debug(f"Performing atomic reload for modified file: {event.path}")
+            logger.debug(
+                f"Performing incremental reload for modified file: {event.path}"
+            )
 
-            result = self.cognitive_system.atomic_reload_memories_from_source(
+            result = self.cognitive_system.incremental_reload_memories_from_source(
                 loader, source_path
             )
 
             if result.get("success", False):
                 deleted_count = result.get("deleted_count", 0)
                 loaded_count = result.get("memories_loaded", 0)
+                unchanged_count = result.get("memories_unchanged", 0)
                 logger.info(
                     f"File sync reload completed: deleted {deleted_count}, "
-                    f"loaded {loaded_count} memories from {event.path}"
+                    f"loaded {loaded_count}, kept {unchanged_count} memories "
+                    f"from {event.path}"
                 )
                 return True
             else:
                 error_msg = result.get("error", "Unknown error")
-                logger.error(f"Atomic reload failed for {event.path}: {error_msg}")
+                logger.error(f"Incremental reload failed for {event.path}: {error_msg}")
                 return False
 
         except Exception as e:
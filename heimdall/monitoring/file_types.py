@@ -6,12 +6,20 @@ This module contains minimal file monitoring definitions that can be imported
 without heavy dependencies like ML models, ONNX runtime, etc.
 """
 
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
 import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 
@@ -50,13 +58,10 @@ class FileState:
     def from_path(cls, path: Path) -> "FileState":
         """Create FileState by examining the current file."""
         try:
-            if path.exists():
-                stat = path.stat()
-                return cls(
-                    path=path, exists=True, mtime=stat.st_mtime, size=stat.st_size
-                )
-            else:
-                return cls(path=path, exists=False)
+            stat = path.stat()
+            return cls(path=path, exists=True, mtime=stat.st_mtime, size=stat.st_size)
+        except FileNotFoundError:
+            return cls(path=path, exists=False)
         except (OSError, PermissionError) as e:
             logger.warning(f"Cannot stat file {path}: {e}")
             return cls(path=path, exists=False)
@@ -84,22 +89,264 @@ class FileState:
         return None
 
 
+@dataclass
+class DirectoryListing:
+    """Cached listing of one directory for the polling scanner."""
+
+    mtime_ns: int
+    files: list[Path]
+    subdirectories: list[Path]
+    racy: bool = False
+
+
+class InotifyWatcher:
+    """
+    Recursive Linux inotify watch set over directory trees.
+
+    Uses libc through ctypes so no extra dependency is loaded. Each directory
+    in a tree gets its own watch; events are returned as (path, mask) pairs.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+        | IN_ONLYDIR
+    )
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    _libc: ctypes.CDLL | None = None
+
+    def __init__(self) -> None:
+        """
+        Create an inotify instance.
+
+        Raises:
+            OSError: If inotify is unavailable or the instance limit is reached
+        """
+        libc = self._load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 failed: {os.strerror(error)}")
+
+        self.libc = libc
+        self.fd = fd
+        self.watches: dict[int, Path] = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def _load_libc(cls) -> ctypes.CDLL | None:
+        """Load libc and check it exposes the inotify API."""
+        if not sys.platform.startswith("linux"):
+            return None
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            except OSError:
+                return None
+            if not hasattr(libc, "inotify_init1"):
+                return None
+            libc.inotify_add_watch.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            cls._libc = libc
+        return cls._libc
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """Check whether inotify can be used on this system."""
+        return cls._load_libc() is not None
+
+    @property
+    def watch_count(self) -> int:
+        """Number of directories currently watched."""
+        return len(self.watches)
+
+    def add_tree(self, root: Path, should_ignore: Callable[[Path], bool]) -> list[Path]:
+        """
+        Watch a directory and all of its non-ignored subdirectories.
+
+        Args:
+            root: Directory tree to watch
+            should_ignore: Predicate for directories to prune
+
+        Returns:
+            Directories newly watched
+
+        Raises:
+            OSError: If a watch cannot be added (e.g. the watch limit is hit)
+        """
+        added = []
+        for directory, subdirectories, _files in os.walk(root):
+            directory_path = Path(directory)
+            subdirectories[:] = [
+                name
+                for name in subdirectories
+                if not should_ignore(directory_path / name)
+            ]
+            if self.add_watch(directory_path):
+                added.append(directory_path)
+        return added
+
+    def add_watch(self, directory: Path) -> bool:
+        """
+        Watch a single directory.
+
+        Returns:
+            True if the directory was not watched before, False if it was
+            already watched or has disappeared
+        """
+        wd = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(directory), self.WATCH_MASK
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return False
+            raise OSError(error, f"Cannot watch {directory}: {os.strerror(error)}")
+
+        with self.lock:
+            is_new = wd not in self.watches
+            self.watches[wd] = directory
+        return is_new
+
+    def remove_tree(self, root: Path) -> None:
+        """Stop watching a directory and everything below it."""
+        with self.lock:
+            doomed = [
+                wd
+                for wd, directory in self.watches.items()
+                if directory == root or root in directory.parents
+            ]
+            for wd in doomed:
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def read_events(self, timeout: float) -> list[tuple[Path | None, int]]:
+        """
+        Wait for and decode pending events.
+
+        Args:
+            timeout: Seconds to wait for the first event
+
+        Returns:
+            List of (path, mask) pairs; the path is None for queue overflow
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events: list[tuple[Path | None, int]] = []
+        offset = 0
+        with self.lock:
+            while offset + self.EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(
+                    buffer, offset
+                )
+                offset += self.EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    events.append((None, mask))
+                    continue
+
+                directory = self.watches.get(wd)
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+
+                path = directory / os.fsdecode(name) if name else directory
+                events.append((path, mask))
+
+        return events
+
+    def close(self) -> None:
+        """Release the inotify instance and all of its watches."""
+        with self.lock:
+            self.watches.clear()
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
 class FileMonitor:
     """
     Minimal file monitor with no heavy dependencies.
 
-    Monitors markdown files for changes using polling-based detection.
+    Monitors markdown files for changes using Linux inotify events when
+    available, falling back to polling-based detection otherwise.
     This implementation has minimal memory footprint and no ML dependencies.
     """
 
     # Supported markdown file extensions
     MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdown", ".mkd"}
 
+    # Watch backends: "auto" prefers inotify and falls back to polling
+    BACKENDS = {"auto", "inotify", "polling"}
+
+    # Directories modified this recently are re-listed on the next scan, since
+    # an entry added within the same mtime tick would not change the mtime
+    RACY_MTIME_NS = 2_000_000_000
+
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        backend: str = "auto",
     ):
-        """Initialize file monitor."""
+        """
+        Initialize file monitor.
+
+        Args:
+            polling_interval: Seconds between scans when polling
+            ignore_patterns: Path substrings to ignore
+            backend: "auto", "inotify" or "polling"
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown file monitor backend: {backend}")
+
         self.polling_interval = polling_interval
+        self.backend = backend
+        self.active_backend: str | None = None
+        self.inotify: InotifyWatcher | None = None
+        self.inotify_overflows = 0
         self.ignore_patterns = ignore_patterns or {
             ".git",
             "__pycache__",
@@ -115,6 +362,16 @@ class FileMonitor:
         self.monitor_thread: threading.Thread | None = None
         self.monitored_paths: set[Path] = set()
 
+        # Polling scanner cache: directory -> listing at its last seen mtime
+        self.directory_cache: dict[Path, DirectoryListing] = {}
+        self.scan_lock = threading.Lock()
+        self.last_scan_stats = {
+            "directories": 0,
+            "directories_listed": 0,
+            "files": 0,
+            "duration_seconds": 0.0,
+        }
+
     def register_callback(
         self, change_type: ChangeType, callback: Callable[[FileChangeEvent], None]
     ) -> None:
@@ -127,6 +384,8 @@ class FileMonitor:
         if path.is_dir():
             self.monitored_paths.add(path)
             logger.debug(f"Added directory to monitoring: {path}")
+            if self.inotify is not None:
+                self._watch_tree(path)
         else:
             logger.warning(f"Path is not a directory: {path}")
 
@@ -135,23 +394,113 @@ class FileMonitor:
         if path in self.monitored_paths:
             self.monitored_paths.remove(path)
             logger.debug(f"Removed directory from monitoring: {path}")
+            if self.inotify is not None:
+                self.inotify.remove_tree(path)
         else:
             logger.warning(f"Path not currently monitored: {path}")
 
     def get_monitored_files(self) -> set[Path]:
         """Get all markdown files in monitored paths."""
-        files = set()
-        for path in self.monitored_paths:
-            if path.exists() and path.is_dir():
-                for file_path in path.rglob("*"):
-                    if (
-                        file_path.is_file()
-                        and file_path.suffix.lower() in self.MARKDOWN_EXTENSIONS
-                        and not self._should_ignore_path(file_path)
-                    ):
-                        files.add(file_path)
+        start_time = time.perf_counter()
+        files: set[Path] = set()
+        visited: set[Path] = set()
+
+        with self.scan_lock:
+            self.last_scan_stats["directories_listed"] = 0
+            for path in list(self.monitored_paths):
+                files.update(self._scan_directory_files(path, visited))
+
+            # Forget directories that disappeared or are no longer monitored
+            for directory in set(self.directory_cache) - visited:
+                del self.directory_cache[directory]
+            self.last_scan_stats.update(
+                directories=len(visited),
+                files=len(files),
+                duration_seconds=time.perf_counter() - start_time,
+            )
+
+        return files
+
+    def _scan_directory_files(
+        self, root: Path, visited: set[Path] | None = None
+    ) -> list[Path]:
+        """
+        List markdown files below a directory using the directory cache.
+
+        Only directories whose mtime changed since the last scan are listed
+        again; ignored subdirectories are pruned before descending.
+
+        Args:
+            root: Directory tree to scan
+            visited: Collects every directory reached by the scan
+
+        Returns:
+            Markdown files in the tree
+        """
+        if visited is None:
+            visited = set()
+
+        files: list[Path] = []
+        if self._should_ignore_path(root):
+            return files
+
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            listing = self._list_directory(directory)
+            if listing is None:
+                continue
+
+            visited.add(directory)
+            files.extend(listing.files)
+            pending.extend(listing.subdirectories)
+
         return files
 
+    def _list_directory(self, directory: Path) -> DirectoryListing | None:
+        """Get a directory listing, re-reading it only if its mtime changed."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.directory_cache.pop(directory, None)
+            return None
+
+        cached = self.directory_cache.get(directory)
+        if cached is not None and cached.mtime_ns == mtime_ns and not cached.racy:
+            return cached
+
+        files: list[Path] = []
+        subdirectories: list[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = Path(entry.path)
+                    # DirEntry type checks come from the directory read itself
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._should_ignore_path(path):
+                            subdirectories.append(path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower()
+                        in self.MARKDOWN_EXTENSIONS
+                        and entry.is_file()
+                        and not self._should_ignore_path(path)
+                    ):
+                        files.append(path)
+        except OSError as e:
+            logger.warning(f"Cannot list directory {directory}: {e}")
+            self.directory_cache.pop(directory, None)
+            return None
+
+        listing = DirectoryListing(
+            mtime_ns=mtime_ns,
+            files=files,
+            subdirectories=subdirectories,
+            racy=time.time_ns() - mtime_ns < self.RACY_MTIME_NS,
+        )
+        self.directory_cache[directory] = listing
+        self.last_scan_stats["directories_listed"] += 1
+        return listing
+
     def _should_ignore_path(self, path: Path) -> bool:
         """Check if path should be ignored."""
         path_str = str(path)
@@ -168,7 +517,7 @@ class FileMonitor:
         self.monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
-        logger.info(f"Started file monitoring with {self.polling_interval}s interval")
+        logger.info(f"Started file monitoring with {self.backend} backend")
 
     def stop_monitoring(self) -> None:
         """Stop file monitoring."""
@@ -188,10 +537,165 @@ class FileMonitor:
 
         self.monitor_thread = None
 
+    def get_backend_status(self) -> dict[str, Any]:
+        """Get the requested and active watch backends."""
+        return {
+            "requested": self.backend,
+            "active": self.active_backend,
+            "watched_directories": self.inotify.watch_count if self.inotify else 0,
+            "inotify_overflows": self.inotify_overflows,
+            "polling_interval": self.polling_interval,
+            "last_scan": dict(self.last_scan_stats),
+        }
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         logger.debug("File monitoring loop started")
 
+        if self.backend != "polling" and self._start_inotify():
+            self._inotify_loop()
+
+        if self.monitoring:
+            self._polling_loop()
+
+        logger.debug("File monitoring loop ended")
+
+    def _start_inotify(self) -> bool:
+        """
+        Set up inotify watches for all monitored paths.
+
+        Returns:
+            True if the inotify backend is active, False to fall back to polling
+        """
+        if not InotifyWatcher.is_supported():
+            logger.info("inotify is not available, using polling file monitor")
+            return False
+
+        try:
+            self.inotify = InotifyWatcher()
+            for path in list(self.monitored_paths):
+                self._watch_tree(path)
+        except OSError as e:
+            logger.warning(f"Cannot use inotify ({e}), using polling file monitor")
+            self._stop_inotify()
+            return False
+
+        self.active_backend = "inotify"
+        logger.info(
+            f"Using inotify file monitor with {self.inotify.watch_count} watches"
+        )
+        return True
+
+    def _stop_inotify(self) -> None:
+        """Close the inotify instance, if any."""
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def _watch_tree(self, root: Path) -> list[Path]:
+        """Add inotify watches for a directory tree."""
+        if self.inotify is None or not root.is_dir():
+            return []
+        return self.inotify.add_tree(root, self._should_ignore_path)
+
+    def _inotify_loop(self) -> None:
+        """Event-driven monitoring loop backed by inotify."""
+        try:
+            # Establish the baseline exactly as the first polling scan would
+            self._scan_files()
+
+            while self.monitoring and self.inotify is not None:
+                events = self.inotify.read_events(timeout=1.0)
+                if events:
+                    self._handle_inotify_events(events)
+        except Exception as e:
+            logger.error(f"inotify monitoring failed ({e}), falling back to polling")
+        finally:
+            self._stop_inotify()
+
+    def _handle_inotify_events(self, events: list[tuple[Path | None, int]]) -> None:
+        """Translate a batch of inotify events into file change events."""
+        changed: dict[Path, None] = {}
+
+        for path, mask in events:
+            if path is None:
+                # Kernel queue overflowed: events were lost, so rescan everything
+                self.inotify_overflows += 1
+                logger.warning("inotify event queue overflowed, rescanning")
+                for root in list(self.monitored_paths):
+                    self._watch_tree(root)
+                self._scan_files()
+                changed.clear()
+                continue
+
+            if not mask & InotifyWatcher.IN_ISDIR:
+                changed[path] = None
+                continue
+
+            if mask & (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_MOVED_TO):
+                if self._should_ignore_path(path):
+                    continue
+                # Files may land in a new directory before its watch exists
+                for directory in self._watch_tree(path):
+                    try:
+                        with os.scandir(directory) as entries:
+                            for entry in entries:
+                                if entry.is_file():
+                                    changed[Path(entry.path)] = None
+                    except OSError:
+                        continue
+            elif mask & (InotifyWatcher.IN_DELETE | InotifyWatcher.IN_MOVED_FROM):
+                if self.inotify is not None:
+                    self.inotify.remove_tree(path)
+                for tracked in list(self.file_states):
+                    if path in tracked.parents:
+                        changed[tracked] = None
+
+        for path in changed:
+            self._refresh_path(path)
+
+    def _refresh_path(self, path: Path) -> None:
+        """Re-examine one file and emit an event if its state changed."""
+        if (
+            path.suffix.lower() not in self.MARKDOWN_EXTENSIONS
+            or self._should_ignore_path(path)
+            or path.is_dir()
+        ):
+            return
+
+        current_state = FileState.from_path(path)
+        previous_state = self.file_states.get(path)
+
+        if previous_state is None:
+            if current_state.exists:
+                self._emit_event(
+                    FileChangeEvent(
+                        path=path, change_type=ChangeType.ADDED, timestamp=time.time()
+                    )
+                )
+                self.file_states[path] = current_state
+            return
+
+        change_type = current_state.detect_change_type(previous_state)
+        if change_type:
+            self._emit_event(
+                FileChangeEvent(
+                    path=path, change_type=change_type, timestamp=time.time()
+                )
+            )
+
+        if current_state.exists:
+            self.file_states[path] = current_state
+        else:
+            del self.file_states[path]
+
+    def _polling_loop(self) -> None:
+        """Polling monitoring loop."""
+        self.active_backend = "polling"
+        logger.info(
+            f"Using polling file monitor with {self.polling_interval}s interval"
+        )
+
         while self.monitoring:
             try:
                 self._scan_files()
@@ -200,8 +704,6 @@ class FileMonitor:
                 logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(self.polling_interval)
 
-        logger.debug("File monitoring loop ended")
-
     def _scan_files(self) -> None:
         """Scan files for changes and emit events."""
         current_files = self.get_monitored_files()
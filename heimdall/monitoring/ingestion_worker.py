@@ -0,0 +1,197 @@
+"""
+Long-lived ingestion worker for the lightweight monitor.
+
+The lightweight monitor avoids importing the ML stack, so it delegates memory
+operations to a child process. Spawning the ``heimdall`` CLI per file change
+pays the full start-up cost (interpreter, embedding model, spaCy, Qdrant
+connection) on every event. This worker initializes the cognitive system once
+and then serves requests over its stdin/stdout pipe.
+
+Protocol: newline-delimited JSON. The worker first writes a ready message::
+
+    {"ready": true, "pid": 1234}
+
+and then answers each request line::
+
+    {"id": 1, "op": "load", "path": "/docs/a.md"}
+
+with a response line::
+
+    {"id": 1, "success": true, "permanent": false, "error": null, "result": {...}}
+
+Supported operations are ``load``, ``remove``, ``ping`` and ``shutdown``, plus
+``batch``, which carries several load/remove ``items`` and answers with one
+response per item under ``results``.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, TextIO
+
+from loguru import logger
+
+from heimdall.operations import CognitiveOperations
+
+# Result keys forwarded to the monitor for logging and statistics
+RESULT_KEYS = (
+    "memories_loaded",
+    "memories_deleted",
+    "deleted_count",
+    "connections_created",
+    "memories_failed",
+    "processing_time",
+)
+
+
+class IngestionWorker:
+    """
+    Serves memory operations for a warm, already initialized cognitive system.
+    """
+
+    def __init__(self, operations: CognitiveOperations):
+        """
+        Initialize the worker.
+
+        Args:
+            operations: CognitiveOperations bound to an initialized system
+        """
+        self.operations = operations
+        self.requests_served = 0
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute a single request.
+
+        Args:
+            request: Decoded request with ``id``, ``op`` and ``path`` keys
+
+        Returns:
+            Response dictionary; ``permanent`` marks failures not worth retrying
+        """
+        request_id = request.get("id")
+        op = request.get("op")
+        path = request.get("path")
+        start_time = time.time()
+
+        try:
+            if op == "ping":
+                result: dict[str, Any] = {"success": True, "error": None}
+            elif op == "batch":
+                responses = [self.handle(item) for item in request.get("items", [])]
+                response = self._response(
+                    request_id, all(r["success"] for r in responses)
+                )
+                response["results"] = responses
+                return response
+            elif op == "load":
+                if not path or not Path(path).exists():
+                    return self._response(
+                        request_id, False, f"Source path not found: {path}", True
+                    )
+                result = self.operations.load_memories(source_path=path)
+            elif op == "remove":
+                if not path:
+                    return self._response(request_id, False, "Missing path", True)
+                result = self.operations.delete_memories_by_source_path(path)
+            else:
+                return self._response(
+                    request_id, False, f"Unknown operation: {op}", True
+                )
+        except Exception as e:
+            logger.error(f"Ingestion worker failed on {op} {path}: {e}")
+            return self._response(request_id, False, str(e), False)
+
+        self.requests_served += 1
+        success = bool(result.get("success", False))
+        logger.info(
+            f"Ingestion worker {op} {'succeeded' if success else 'failed'} "
+            f"in {time.time() - start_time:.2f}s: {path}"
+        )
+
+        response = self._response(request_id, success, result.get("error"), False)
+        response["result"] = {key: result[key] for key in RESULT_KEYS if key in result}
+        return response
+
+    def serve(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        """
+        Answer requests until the input closes or a shutdown request arrives.
+
+        Args:
+            input_stream: Stream of JSON request lines
+            output_stream: Stream receiving JSON response lines
+        """
+        self._write(output_stream, {"ready": True, "pid": os.getpid()})
+
+        for line in input_stream:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                self._write(
+                    output_stream,
+                    self._response(None, False, f"Invalid request: {e}", True),
+                )
+                continue
+
+            if request.get("op") == "shutdown":
+                self._write(output_stream, self._response(request.get("id"), True))
+                break
+
+            self._write(output_stream, self.handle(request))
+
+    @staticmethod
+    def _response(
+        request_id: Any,
+        success: bool,
+        error: str | None = None,
+        permanent: bool = False,
+    ) -> dict[str, Any]:
+        """Build a response message."""
+        return {
+            "id": request_id,
+            "success": success,
+            "permanent": permanent,
+            "error": error,
+            "result": {},
+        }
+
+    @staticmethod
+    def _write(output_stream: TextIO, message: dict[str, Any]) -> None:
+        """Write one protocol message and flush it."""
+        output_stream.write(json.dumps(message, default=str) + "\n")
+        output_stream.flush()
+
+
+def main() -> int:
+    """Run the ingestion worker on the process stdin/stdout pipe."""
+    # Keep stdout for protocol messages only; anything else printed goes to stderr
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    from cognitive_memory.main import graceful_shutdown, initialize_system
+
+    try:
+        cognitive_system = initialize_system("default")
+    except Exception as e:
+        logger.error(f"Ingestion worker failed to initialize: {e}")
+        IngestionWorker._write(protocol_out, {"ready": False, "error": str(e)})
+        return 1
+
+    try:
+        IngestionWorker(CognitiveOperations(cognitive_system)).serve(
+            sys.stdin, protocol_out
+        )
+    finally:
+        graceful_shutdown(cognitive_system)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
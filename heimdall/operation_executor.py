@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Bounded executor for running cognitive operations off the asyncio event loop.
+
+CognitiveOperations methods are synchronous and spend their time in ONNX
+inference, SQLite and Qdrant I/O. Async interfaces (the MCP server) hand them
+to this executor so the event loop stays free to serve other clients while an
+operation runs.
+
+Reads run concurrently on a shared thread pool; writes take an exclusive lock
+so they are serialized with each other and with in-flight reads. Each tool has
+its own concurrency limit, and queue and run times are tracked per tool.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ReadWriteLock:
+    """
+    Writer-preferring reader/writer lock.
+
+    Any number of readers may hold the lock at once; a writer holds it alone.
+    Once a writer is waiting, new readers wait behind it so a steady stream of
+    reads cannot starve writes.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for shared reading."""
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release a shared read hold."""
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire the lock for exclusive writing."""
+        with self._condition:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Release the exclusive write hold."""
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+
+class OperationExecutor:
+    """
+    Run blocking cognitive operations in worker threads for async callers.
+
+    Callers await `run()`, which waits for the tool's concurrency slot,
+    submits the call to a bounded thread pool and resolves with its result.
+    The event loop is never blocked by the operation itself.
+    """
+
+    # Default in-flight limit per tool; writes are serialized by the lock anyway
+    DEFAULT_TOOL_LIMITS = {
+        "recall_memories": 4,
+        "memory_status": 2,
+        "health": 2,
+    }
+    DEFAULT_TOOL_LIMIT = 1
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        tool_limits: dict[str, int] | None = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Worker threads shared by all tools
+            tool_limits: Per-tool in-flight limits overriding the defaults
+        """
+        self.max_workers = max_workers
+        self.tool_limits = {**self.DEFAULT_TOOL_LIMITS, **(tool_limits or {})}
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cognitive-op"
+        )
+        self._lock = ReadWriteLock()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+
+    async def run(
+        self,
+        tool: str,
+        func: Callable[..., T],
+        *args: Any,
+        write: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking operation in a worker thread and await its result.
+
+        Args:
+            tool: Tool name used for concurrency limits and metrics
+            func: Synchronous callable to run
+            *args: Positional arguments for func
+            write: Whether the operation modifies memory state
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+
+        Raises:
+            Any exception raised by func
+        """
+        submitted = time.perf_counter()
+        self._record(tool, queued=1)
+
+        semaphore = self._semaphore(tool)
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            self._record(tool, queued=-1)
+            raise
+
+        def finished(future: asyncio.Future[T]) -> None:
+            # Keep the slot until the worker is done, even if the caller left
+            semaphore.release()
+            if not future.cancelled():
+                future.exception()
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor, self._invoke, tool, submitted, write, func, args, kwargs
+        )
+        future.add_done_callback(finished)
+
+        # A cancelled caller must not abandon an operation that already started
+        return await asyncio.shield(future)
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        """Get the in-flight limiter for a tool."""
+        semaphore = self._semaphores.get(tool)
+        if semaphore is None:
+            limit = self.tool_limits.get(tool, self.DEFAULT_TOOL_LIMIT)
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[tool] = semaphore
+        return semaphore
+
+    def _invoke(
+        self,
+        tool: str,
+        submitted: float,
+        write: bool,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        """Run func in a worker thread under the read or write lock."""
+        if write:
+            self._lock.acquire_write()
+        else:
+            self._lock.acquire_read()
+
+        started = time.perf_counter()
+        self._record(tool, queued=-1, in_flight=1, queue_seconds=started - submitted)
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if write:
+                self._lock.release_write()
+            else:
+                self._lock.release_read()
+            self._record(
+                tool,
+                in_flight=-1,
+                run_seconds=time.perf_counter() - started,
+                failed=failed,
+            )
+
+    def _record(
+        self,
+        tool: str,
+        queued: int = 0,
+        in_flight: int = 0,
+        queue_seconds: float | None = None,
+        run_seconds: float | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Update per-tool counters and timings."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                tool,
+                {
+                    "started": 0,
+                    "calls": 0,
+                    "errors": 0,
+                    "queued": 0,
+                    "in_flight": 0,
+                    "total_queue_seconds": 0.0,
+                    "max_queue_seconds": 0.0,
+                    "total_run_seconds": 0.0,
+                    "max_run_seconds": 0.0,
+                },
+            )
+            stats["queued"] += queued
+            stats["in_flight"] += in_flight
+            if queue_seconds is not None:
+                stats["started"] += 1
+                stats["total_queue_seconds"] += queue_seconds
+                stats["max_queue_seconds"] = max(
+                    stats["max_queue_seconds"], queue_seconds
+                )
+            if run_seconds is not None:
+                stats["calls"] += 1
+                stats["total_run_seconds"] += run_seconds
+                stats["max_run_seconds"] = max(stats["max_run_seconds"], run_seconds)
+            if failed:
+                stats["errors"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get executor configuration and per-tool metrics.
+
+        Returns:
+            Dictionary with worker count and, per tool, call and error counts,
+            current queue depth, in-flight operations, and average and maximum
+            queue and run times in seconds
+        """
+        with self._stats_lock:
+            tools = {}
+            for tool, stats in self._stats.items():
+                started = stats["started"]
+                calls = stats["calls"]
+                tools[tool] = {
+                    **stats,
+                    "limit": self.tool_limits.get(tool, self.DEFAULT_TOOL_LIMIT),
+                    "avg_queue_seconds": (
+                        stats["total_queue_seconds"] / started if started else 0.0
+                    ),
+                    "avg_run_seconds": (
+                        stats["total_run_seconds"] / calls if calls else 0.0
+                    ),
+                }
+
+        return {"max_workers": self.max_workers, "tools": tools}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting operations and release the worker threads."""
+        self._executor.shutdown(wait=wait)
@@ -194,6 +194,8 @@ class CognitiveOperations:
             - system_config: dict - System configuration (if detailed=True)
             - storage_stats: dict - Storage statistics (if detailed=True)
             - embedding_info: dict - Embedding model info (if detailed=True)
+            - retrieval_latency: dict - Per-phase retrieval latency percentiles
+              (if retrieval telemetry is enabled)
             - success: bool - True if status retrieved successfully
             - error: str | None - Error message if failed
         """
@@ -206,6 +208,9 @@ class CognitiveOperations:
                 "error": None,
             }
 
+            if "retrieval_latency" in stats:
+                result["retrieval_latency"] = stats["retrieval_latency"]
+
             if detailed:
                 result.update(
                     {
@@ -473,9 +478,11 @@ class CognitiveOperations:
                     total_success = False
             else:
                 try:
-                    # Perform atomic reload (delete existing + load new)
-                    results = self.cognitive_system.atomic_reload_memories_from_source(
-                        loader, file_path_str, **kwargs
+                    # Reload incrementally (keep unchanged chunks, replace the rest)
+                    results = (
+                        self.cognitive_system.incremental_reload_memories_from_source(
+                            loader, file_path_str, **kwargs
+                        )
                     )
 
                     if results["success"]:
@@ -573,8 +580,8 @@ class CognitiveOperations:
                 }
         else:
             try:
-                # Perform atomic reload (delete existing + load new)
-                results = self.cognitive_system.atomic_reload_memories_from_source(
+                # Reload incrementally (keep unchanged chunks, replace the rest)
+                results = self.cognitive_system.incremental_reload_memories_from_source(
                     loader, source_path, **kwargs
                 )
 
@@ -2,13 +2,20 @@
 """
 Lightweight file monitoring process with subprocess delegation.
 
-Provides file change detection and delegates cognitive operations to CLI subprocesses.
+Provides file change detection and delegates cognitive operations to a persistent
+ingestion worker process, or to one CLI subprocess per event.
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
+import json
 import os
 import queue
+import select
 import signal
+import struct
 import subprocess
 import sys
 import threading
@@ -35,7 +42,7 @@ import time
 # - Achieves architecture goal of lightweight monitoring with subprocess delegation
 #
 # COPIED FROM: heimdall/monitoring/file_types.py
-# LAST SYNC: 2025-06-25
+# LAST SYNC: 2026-10-16
 # ================================================================================
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -81,13 +88,10 @@ class FileState:
     def from_path(cls, path: Path) -> "FileState":
         """Create FileState by examining the current file."""
         try:
-            if path.exists():
-                stat = path.stat()
-                return cls(
-                    path=path, exists=True, mtime=stat.st_mtime, size=stat.st_size
-                )
-            else:
-                return cls(path=path, exists=False)
+            stat = path.stat()
+            return cls(path=path, exists=True, mtime=stat.st_mtime, size=stat.st_size)
+        except FileNotFoundError:
+            return cls(path=path, exists=False)
         except (OSError, PermissionError) as e:
             logger.warning(f"Cannot stat file {path}: {e}")
             return cls(path=path, exists=False)
@@ -115,22 +119,264 @@ class FileState:
         return None
 
 
+@dataclass
+class DirectoryListing:
+    """Cached listing of one directory for the polling scanner."""
+
+    mtime_ns: int
+    files: list[Path]
+    subdirectories: list[Path]
+    racy: bool = False
+
+
+class InotifyWatcher:
+    """
+    Recursive Linux inotify watch set over directory trees.
+
+    Uses libc through ctypes so no extra dependency is loaded. Each directory
+    in a tree gets its own watch; events are returned as (path, mask) pairs.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+        | IN_ONLYDIR
+    )
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    _libc: ctypes.CDLL | None = None
+
+    def __init__(self) -> None:
+        """
+        Create an inotify instance.
+
+        Raises:
+            OSError: If inotify is unavailable or the instance limit is reached
+        """
+        libc = self._load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 failed: {os.strerror(error)}")
+
+        self.libc = libc
+        self.fd = fd
+        self.watches: dict[int, Path] = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def _load_libc(cls) -> ctypes.CDLL | None:
+        """Load libc and check it exposes the inotify API."""
+        if not sys.platform.startswith("linux"):
+            return None
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            except OSError:
+                return None
+            if not hasattr(libc, "inotify_init1"):
+                return None
+            libc.inotify_add_watch.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            cls._libc = libc
+        return cls._libc
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """Check whether inotify can be used on this system."""
+        return cls._load_libc() is not None
+
+    @property
+    def watch_count(self) -> int:
+        """Number of directories currently watched."""
+        return len(self.watches)
+
+    def add_tree(self, root: Path, should_ignore: Callable[[Path], bool]) -> list[Path]:
+        """
+        Watch a directory and all of its non-ignored subdirectories.
+
+        Args:
+            root: Directory tree to watch
+            should_ignore: Predicate for directories to prune
+
+        Returns:
+            Directories newly watched
+
+        Raises:
+            OSError: If a watch cannot be added (e.g. the watch limit is hit)
+        """
+        added = []
+        for directory, subdirectories, _files in os.walk(root):
+            directory_path = Path(directory)
+            subdirectories[:] = [
+                name
+                for name in subdirectories
+                if not should_ignore(directory_path / name)
+            ]
+            if self.add_watch(directory_path):
+                added.append(directory_path)
+        return added
+
+    def add_watch(self, directory: Path) -> bool:
+        """
+        Watch a single directory.
+
+        Returns:
+            True if the directory was not watched before, False if it was
+            already watched or has disappeared
+        """
+        wd = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(directory), self.WATCH_MASK
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return False
+            raise OSError(error, f"Cannot watch {directory}: {os.strerror(error)}")
+
+        with self.lock:
+            is_new = wd not in self.watches
+            self.watches[wd] = directory
+        return is_new
+
+    def remove_tree(self, root: Path) -> None:
+        """Stop watching a directory and everything below it."""
+        with self.lock:
+            doomed = [
+                wd
+                for wd, directory in self.watches.items()
+                if directory == root or root in directory.parents
+            ]
+            for wd in doomed:
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def read_events(self, timeout: float) -> list[tuple[Path | None, int]]:
+        """
+        Wait for and decode pending events.
+
+        Args:
+            timeout: Seconds to wait for the first event
+
+        Returns:
+            List of (path, mask) pairs; the path is None for queue overflow
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events: list[tuple[Path | None, int]] = []
+        offset = 0
+        with self.lock:
+            while offset + self.EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(
+                    buffer, offset
+                )
+                offset += self.EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    events.append((None, mask))
+                    continue
+
+                directory = self.watches.get(wd)
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+
+                path = directory / os.fsdecode(name) if name else directory
+                events.append((path, mask))
+
+        return events
+
+    def close(self) -> None:
+        """Release the inotify instance and all of its watches."""
+        with self.lock:
+            self.watches.clear()
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
 class FileMonitor:
     """
     Minimal file monitor with no heavy dependencies.
 
-    Monitors markdown files for changes using polling-based detection.
+    Monitors markdown files for changes using Linux inotify events when
+    available, falling back to polling-based detection otherwise.
     This implementation has minimal memory footprint and no ML dependencies.
     """
 
     # Supported markdown file extensions
     MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdown", ".mkd"}
 
+    # Watch backends: "auto" prefers inotify and falls back to polling
+    BACKENDS = {"auto", "inotify", "polling"}
+
+    # Directories modified this recently are re-listed on the next scan, since
+    # an entry added within the same mtime tick would not change the mtime
+    RACY_MTIME_NS = 2_000_000_000
+
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        backend: str = "auto",
     ):
-        """Initialize file monitor."""
+        """
+        Initialize file monitor.
+
+        Args:
+            polling_interval: Seconds between scans when polling
+            ignore_patterns: Path substrings to ignore
+            backend: "auto", "inotify" or "polling"
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown file monitor backend: {backend}")
+
         self.polling_interval = polling_interval
+        self.backend = backend
+        self.active_backend: str | None = None
+        self.inotify: InotifyWatcher | None = None
+        self.inotify_overflows = 0
         self.ignore_patterns = ignore_patterns or {
             ".git",
             "__pycache__",
@@ -146,6 +392,16 @@ class FileMonitor:
         self.monitor_thread: threading.Thread | None = None
         self.monitored_paths: set[Path] = set()
 
+        # Polling scanner cache: directory -> listing at its last seen mtime
+        self.directory_cache: dict[Path, DirectoryListing] = {}
+        self.scan_lock = threading.Lock()
+        self.last_scan_stats = {
+            "directories": 0,
+            "directories_listed": 0,
+            "files": 0,
+            "duration_seconds": 0.0,
+        }
+
     def register_callback(
         self, change_type: ChangeType, callback: Callable[[FileChangeEvent], None]
     ) -> None:
@@ -158,6 +414,8 @@ class FileMonitor:
         if path.is_dir():
             self.monitored_paths.add(path)
             logger.debug(f"Added directory to monitoring: {path}")
+            if self.inotify is not None:
+                self._watch_tree(path)
         else:
             logger.warning(f"Path is not a directory: {path}")
 
@@ -166,23 +424,113 @@ class FileMonitor:
         if path in self.monitored_paths:
             self.monitored_paths.remove(path)
             logger.debug(f"Removed directory from monitoring: {path}")
+            if self.inotify is not None:
+                self.inotify.remove_tree(path)
         else:
             logger.warning(f"Path not currently monitored: {path}")
 
     def get_monitored_files(self) -> set[Path]:
         """Get all markdown files in monitored paths."""
-        files = set()
-        for path in self.monitored_paths:
-            if path.exists() and path.is_dir():
-                for file_path in path.rglob("*"):
-                    if (
-                        file_path.is_file()
-                        and file_path.suffix.lower() in self.MARKDOWN_EXTENSIONS
-                        and not self._should_ignore_path(file_path)
-                    ):
-                        files.add(file_path)
+        start_time = time.perf_counter()
+        files: set[Path] = set()
+        visited: set[Path] = set()
+
+        with self.scan_lock:
+            self.last_scan_stats["directories_listed"] = 0
+            for path in list(self.monitored_paths):
+                files.update(self._scan_directory_files(path, visited))
+
+            # Forget directories that disappeared or are no longer monitored
+            for directory in set(self.directory_cache) - visited:
+                del self.directory_cache[directory]
+            self.last_scan_stats.update(
+                directories=len(visited),
+                files=len(files),
+                duration_seconds=time.perf_counter() - start_time,
+            )
+
+        return files
+
+    def _scan_directory_files(
+        self, root: Path, visited: set[Path] | None = None
+    ) -> list[Path]:
+        """
+        List markdown files below a directory using the directory cache.
+
+        Only directories whose mtime changed since the last scan are listed
+        again; ignored subdirectories are pruned before descending.
+
+        Args:
+            root: Directory tree to scan
+            visited: Collects every directory reached by the scan
+
+        Returns:
+            Markdown files in the tree
+        """
+        if visited is None:
+            visited = set()
+
+        files: list[Path] = []
+        if self._should_ignore_path(root):
+            return files
+
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            listing = self._list_directory(directory)
+            if listing is None:
+                continue
+
+            visited.add(directory)
+            files.extend(listing.files)
+            pending.extend(listing.subdirectories)
+
         return files
 
+    def _list_directory(self, directory: Path) -> DirectoryListing | None:
+        """Get a directory listing, re-reading it only if its mtime changed."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.directory_cache.pop(directory, None)
+            return None
+
+        cached = self.directory_cache.get(directory)
+        if cached is not None and cached.mtime_ns == mtime_ns and not cached.racy:
+            return cached
+
+        files: list[Path] = []
+        subdirectories: list[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = Path(entry.path)
+                    # DirEntry type checks come from the directory read itself
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._should_ignore_path(path):
+                            subdirectories.append(path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower()
+                        in self.MARKDOWN_EXTENSIONS
+                        and entry.is_file()
+                        and not self._should_ignore_path(path)
+                    ):
+                        files.append(path)
+        except OSError as e:
+            logger.warning(f"Cannot list directory {directory}: {e}")
+            self.directory_cache.pop(directory, None)
+            return None
+
+        listing = DirectoryListing(
+            mtime_ns=mtime_ns,
+            files=files,
+            subdirectories=subdirectories,
+            racy=time.time_ns() - mtime_ns < self.RACY_MTIME_NS,
+        )
+        self.directory_cache[directory] = listing
+        self.last_scan_stats["directories_listed"] += 1
+        return listing
+
     def _should_ignore_path(self, path: Path) -> bool:
         """Check if path should be ignored."""
         path_str = str(path)
@@ -199,7 +547,7 @@ class FileMonitor:
         self.monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
-        logger.info(f"Started file monitoring with {self.polling_interval}s interval")
+        logger.info(f"Started file monitoring with {self.backend} backend")
 
     def stop_monitoring(self) -> None:
         """Stop file monitoring."""
@@ -219,10 +567,165 @@ class FileMonitor:
 
         self.monitor_thread = None
 
+    def get_backend_status(self) -> dict[str, Any]:
+        """Get the requested and active watch backends."""
+        return {
+            "requested": self.backend,
+            "active": self.active_backend,
+            "watched_directories": self.inotify.watch_count if self.inotify else 0,
+            "inotify_overflows": self.inotify_overflows,
+            "polling_interval": self.polling_interval,
+            "last_scan": dict(self.last_scan_stats),
+        }
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         logger.debug("File monitoring loop started")
 
+        if self.backend != "polling" and self._start_inotify():
+            self._inotify_loop()
+
+        if self.monitoring:
+            self._polling_loop()
+
+        logger.debug("File monitoring loop ended")
+
+    def _start_inotify(self) -> bool:
+        """
+        Set up inotify watches for all monitored paths.
+
+        Returns:
+            True if the inotify backend is active, False to fall back to polling
+        """
+        if not InotifyWatcher.is_supported():
+            logger.info("inotify is not available, using polling file monitor")
+            return False
+
+        try:
+            self.inotify = InotifyWatcher()
+            for path in list(self.monitored_paths):
+                self._watch_tree(path)
+        except OSError as e:
+            logger.warning(f"Cannot use inotify ({e}), using polling file monitor")
+            self._stop_inotify()
+            return False
+
+        self.active_backend = "inotify"
+        logger.info(
+            f"Using inotify file monitor with {self.inotify.watch_count} watches"
+        )
+        return True
+
+    def _stop_inotify(self) -> None:
+        """Close the inotify instance, if any."""
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def _watch_tree(self, root: Path) -> list[Path]:
+        """Add inotify watches for a directory tree."""
+        if self.inotify is None or not root.is_dir():
+            return []
+        return self.inotify.add_tree(root, self._should_ignore_path)
+
+    def _inotify_loop(self) -> None:
+        """Event-driven monitoring loop backed by inotify."""
+        try:
+            # Establish the baseline exactly as the first polling scan would
+            self._scan_files()
+
+            while self.monitoring and self.inotify is not None:
+                events = self.inotify.read_events(timeout=1.0)
+                if events:
+                    self._handle_inotify_events(events)
+        except Exception as e:
+            logger.error(f"inotify monitoring failed ({e}), falling back to polling")
+        finally:
+            self._stop_inotify()
+
+    def _handle_inotify_events(self, events: list[tuple[Path | None, int]]) -> None:
+        """Translate a batch of inotify events into file change events."""
+        changed: dict[Path, None] = {}
+
+        for path, mask in events:
+            if path is None:
+                # Kernel queue overflowed: events were lost, so rescan everything
+                self.inotify_overflows += 1
+                logger.warning("inotify event queue overflowed, rescanning")
+                for root in list(self.monitored_paths):
+                    self._watch_tree(root)
+                self._scan_files()
+                changed.clear()
+                continue
+
+            if not mask & InotifyWatcher.IN_ISDIR:
+                changed[path] = None
+                continue
+
+            if mask & (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_MOVED_TO):
+                if self._should_ignore_path(path):
+                    continue
+                # Files may land in a new directory before its watch exists
+                for directory in self._watch_tree(path):
+                    try:
+                        with os.scandir(directory) as entries:
+                            for entry in entries:
+                                if entry.is_file():
+                                    changed[Path(entry.path)] = None
+                    except OSError:
+                        continue
+            elif mask & (InotifyWatcher.IN_DELETE | InotifyWatcher.IN_MOVED_FROM):
+                if self.inotify is not None:
+                    self.inotify.remove_tree(path)
+                for tracked in list(self.file_states):
+                    if path in tracked.parents:
+                        changed[tracked] = None
+
+        for path in changed:
+            self._refresh_path(path)
+
+    def _refresh_path(self, path: Path) -> None:
+        """Re-examine one file and emit an event if its state changed."""
+        if (
+            path.suffix.lower() not in self.MARKDOWN_EXTENSIONS
+            or self._should_ignore_path(path)
+            or path.is_dir()
+        ):
+            return
+
+        current_state = FileState.from_path(path)
+        previous_state = self.file_states.get(path)
+
+        if previous_state is None:
+            if current_state.exists:
+                self._emit_event(
+                    FileChangeEvent(
+                        path=path, change_type=ChangeType.ADDED, timestamp=time.time()
+                    )
+                )
+                self.file_states[path] = current_state
+            return
+
+        change_type = current_state.detect_change_type(previous_state)
+        if change_type:
+            self._emit_event(
+                FileChangeEvent(
+                    path=path, change_type=change_type, timestamp=time.time()
+                )
+            )
+
+        if current_state.exists:
+            self.file_states[path] = current_state
+        else:
+            del self.file_states[path]
+
+    def _polling_loop(self) -> None:
+        """Polling monitoring loop."""
+        self.active_backend = "polling"
+        logger.info(
+            f"Using polling file monitor with {self.polling_interval}s interval"
+        )
+
         while self.monitoring:
             try:
                 self._scan_files()
@@ -231,8 +734,6 @@ class FileMonitor:
                 logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(self.polling_interval)
 
-        logger.debug("File monitoring loop ended")
-
     def _scan_files(self) -> None:
         """Scan files for changes and emit events."""
         current_files = self.get_monitored_files()
@@ -368,67 +869,128 @@ class SingletonLock:
             self.lock_file = None
 
 
+@dataclass
+class PendingChange:
+    """A coalesced, not yet dispatched change for one path."""
+
+    event: FileChangeEvent
+    first_seen: float
+    last_seen: float
+    merged_events: int = 1
+
+
+def coalesce_change_types(
+    previous: ChangeType, current: ChangeType
+) -> ChangeType | None:
+    """
+    Collapse two consecutive changes to the same path into their net effect.
+
+    Args:
+        previous: Pending (not yet processed) change type
+        current: Newly observed change type
+
+    Returns:
+        Net change type, or None if the changes cancel out
+    """
+    if previous == ChangeType.ADDED:
+        # A file that appears and disappears before processing never existed
+        return None if current == ChangeType.DELETED else ChangeType.ADDED
+    if current == ChangeType.DELETED:
+        return ChangeType.DELETED
+    # DELETED then ADDED is a replacement; anything else is a modification
+    return ChangeType.MODIFIED
+
+
 class EventQueue:
     """
-    Thread-safe queue for file change events with deduplication.
+    Thread-safe, debouncing queue for file change events.
 
-    Provides event deduplication based on file path and change type within time windows.
+    Changes are held per path until no new change for that path has arrived
+    within the debounce window. Bursts of changes to one path are collapsed
+    into their net effect (ADDED+DELETED cancel out, repeated MODIFIED become
+    one), and ready changes can be taken in batches.
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, debounce_seconds: float = 2.0):
         """
         Initialize event queue.
 
         Args:
-            max_size: Maximum queue size before blocking
+            max_size: Maximum number of pending paths before dropping events
+            debounce_seconds: Quiet period required before a path is dispatched
         """
-        self._queue: queue.Queue[FileChangeEvent] = queue.Queue(maxsize=max_size)
-        self._recent_events: dict[Path, FileChangeEvent] = {}
-        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.debounce_seconds = debounce_seconds
+        self._pending: dict[Path, PendingChange] = {}
+        self._condition = threading.Condition()
+
+        # Coalescing statistics
+        self._stats: dict[str, int] = {
+            "events_received": 0,
+            "events_coalesced": 0,
+            "events_cancelled": 0,
+            "events_dispatched": 0,
+            "batches_dispatched": 0,
+            "max_queue_depth": 0,
+            "in_flight": 0,
+        }
 
     def put(self, event: FileChangeEvent, deduplicate: bool = True) -> bool:
         """
-        Add event to queue with optional deduplication.
+        Add event to queue, coalescing it with any pending change for its path.
 
         Args:
             event: FileChangeEvent to add
-            deduplicate: Whether to deduplicate recent events for same file
+            deduplicate: Whether to debounce the event; when False the
+                coalesced change is ready for dispatch immediately
 
         Returns:
-            True if event was added, False if deduplicated
+            True if a new pending change was created, False if the event was
+            merged into an existing one or dropped
         """
-        try:
-            with self._lock:
-                # Check for recent duplicate events
-                if deduplicate and event.path in self._recent_events:
-                    recent_event = self._recent_events[event.path]
-                    # Skip if same event type within 1 second
-                    if (
-                        event.change_type == recent_event.change_type
-                        and event.timestamp - recent_event.timestamp < 1.0
-                    ):
-                        logger.debug(f"Deduplicated event: {event}")
-                        return False
-
-                # Add to queue
-                self._queue.put_nowait(event)
-                self._recent_events[event.path] = event
-
-                # Clean old recent events (keep last 100)
-                if len(self._recent_events) > 100:
-                    oldest_paths = list(self._recent_events.keys())[:50]
-                    for path in oldest_paths:
-                        del self._recent_events[path]
+        with self._condition:
+            self._stats["events_received"] += 1
+            now = time.time()
+            # Non-debounced events are backdated so they are ready right away
+            seen_at = now if deduplicate else now - self.debounce_seconds
+
+            pending = self._pending.get(event.path)
+            if pending is not None:
+                self._stats["events_coalesced"] += 1
+                change_type = coalesce_change_types(
+                    pending.event.change_type, event.change_type
+                )
+                if change_type is None:
+                    del self._pending[event.path]
+                    self._stats["events_cancelled"] += pending.merged_events + 1
+                    logger.debug(f"Cancelled out pending change: {event}")
+                    return False
+
+                pending.event = FileChangeEvent(
+                    path=event.path, change_type=change_type, timestamp=event.timestamp
+                )
+                pending.last_seen = seen_at
+                pending.merged_events += 1
+                logger.debug(f"Coalesced event: {event} -> {change_type.value}")
+                self._condition.notify_all()
+                return False
 
-                return True
+            if len(self._pending) >= self.max_size:
+                logger.error("Event queue is full, dropping event")
+                return False
 
-        except queue.Full:
-            logger.error("Event queue is full, dropping event")
-            return False
+            self._pending[event.path] = PendingChange(
+                event=event, first_seen=now, last_seen=seen_at
+            )
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], len(self._pending)
+            )
+            self._condition.notify_all()
+            return True
 
     def get(self, timeout: float | None = None) -> FileChangeEvent | None:
         """
-        Get next event from queue.
+        Get next event whose debounce window has elapsed.
 
         Args:
             timeout: Maximum time to wait for event
@@ -436,18 +998,92 @@ class EventQueue:
         Returns:
             Next FileChangeEvent or None if timeout
         """
-        try:
-            return self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        events = self.get_batch(1, timeout=timeout)
+        return events[0] if events else None
+
+    def get_batch(
+        self, max_items: int, timeout: float | None = None
+    ) -> list[FileChangeEvent]:
+        """
+        Get up to max_items ready events, oldest first.
+
+        Waits until at least one event is ready or the timeout expires. Call
+        task_done() once per returned event after processing it.
+
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Maximum time to wait for the first ready event
+
+        Returns:
+            List of ready events (empty on timeout)
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._condition:
+            while True:
+                now = time.time()
+                ready_at = now - self.debounce_seconds
+                ready = [
+                    path
+                    for path, pending in self._pending.items()
+                    if pending.last_seen <= ready_at
+                ][: max(1, max_items)]
+
+                if ready:
+                    events = [self._pending.pop(path).event for path in ready]
+                    self._stats["events_dispatched"] += len(events)
+                    self._stats["batches_dispatched"] += 1
+                    self._stats["in_flight"] += len(events)
+                    return events
+
+                # Sleep until the earliest pending path becomes ready
+                wait_time = None
+                if self._pending:
+                    earliest = min(p.last_seen for p in self._pending.values())
+                    wait_time = max(0.0, earliest + self.debounce_seconds - now)
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return []
+                    wait_time = (
+                        remaining if wait_time is None else min(wait_time, remaining)
+                    )
+
+                self._condition.wait(timeout=wait_time)
 
     def task_done(self) -> None:
-        """Mark a previously enqueued task as done."""
-        self._queue.task_done()
+        """Mark a previously dispatched event as processed."""
+        with self._condition:
+            self._stats["in_flight"] = max(0, self._stats["in_flight"] - 1)
 
     def qsize(self) -> int:
-        """Get approximate queue size."""
-        return self._queue.qsize()
+        """Get number of pending (not yet dispatched) paths."""
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get queue depth and coalescing statistics.
+
+        Returns:
+            Dictionary of counters plus the current depth and coalescing
+            ratio (share of received events that did not cause their own
+            dispatch)
+        """
+        with self._condition:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["queue_depth"] = len(self._pending)
+            received = stats["events_received"]
+            stats["coalescing_ratio"] = (
+                1.0 - stats["events_dispatched"] / received if received else 0.0
+            )
+            if stats["batches_dispatched"]:
+                stats["average_batch_size"] = (
+                    stats["events_dispatched"] / stats["batches_dispatched"]
+                )
+            else:
+                stats["average_batch_size"] = None
+            return stats
 
 
 class SignalHandler:
@@ -501,7 +1137,11 @@ class MarkdownFileWatcher:
     """
 
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        debounce_seconds: float = 2.0,
+        backend: str = "auto",
     ):
         """
         Initialize file watcher.
@@ -509,6 +1149,8 @@ class MarkdownFileWatcher:
         Args:
             polling_interval: Seconds between polling checks
             ignore_patterns: Set of patterns to ignore
+            debounce_seconds: Quiet period before a changed path is dispatched
+            backend: File monitor backend ("auto", "inotify" or "polling")
         """
         self.polling_interval = polling_interval
         self.ignore_patterns = ignore_patterns or {
@@ -519,11 +1161,13 @@ class MarkdownFileWatcher:
 
         # Create underlying monitor
         self.monitor = FileMonitor(
-            polling_interval=polling_interval, ignore_patterns=self.ignore_patterns
+            polling_interval=polling_interval,
+            ignore_patterns=self.ignore_patterns,
+            backend=backend,
         )
 
         # Event queue for processing
-        self.event_queue = EventQueue()
+        self.event_queue = EventQueue(debounce_seconds=debounce_seconds)
 
         # Register callbacks to forward events to queue
         for change_type in [ChangeType.ADDED, ChangeType.MODIFIED, ChangeType.DELETED]:
@@ -566,14 +1210,268 @@ class MarkdownFileWatcher:
             logger.debug(f"Queued file change event: {event}")
 
 
+class IngestionWorkerError(LightweightMonitorError):
+    """Raised when the ingestion worker cannot be started or has crashed."""
+
+    pass
+
+
+class IngestionWorkerClient:
+    """
+    Client for the persistent ingestion worker process.
+
+    The worker (heimdall.monitoring.ingestion_worker) loads the cognitive system
+    once and answers newline-delimited JSON requests over its stdin/stdout pipe.
+    The client restarts the worker after a crash or timeout, so a failing
+    ingestion never takes the monitor down with it.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        command: list[str] | None = None,
+        startup_timeout: float = 180.0,
+        log_file: Path | None = None,
+    ):
+        """
+        Initialize the client without starting the worker.
+
+        Args:
+            project_root: Working directory for the worker process
+            command: Worker command line (defaults to the heimdall worker module)
+            startup_timeout: Seconds to wait for the worker to become ready
+            log_file: File receiving the worker's stderr (None = inherit)
+        """
+        self.project_root = project_root
+        self.command = command or [
+            sys.executable,
+            "-m",
+            "heimdall.monitoring.ingestion_worker",
+        ]
+        self.startup_timeout = startup_timeout
+        self.log_file = log_file
+
+        self.process: subprocess.Popen | None = None
+        self.restart_count = 0
+        self._responses: queue.Queue[str | None] = queue.Queue()
+        self._next_request_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> int | None:
+        """PID of the running worker, if any."""
+        return self.process.pid if self.is_alive() and self.process else None
+
+    def is_alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """
+        Start the worker and wait until it reports ready.
+
+        Raises:
+            IngestionWorkerError: If the worker fails to start or initialize
+        """
+        if self.is_alive():
+            return
+
+        if self.process is not None:
+            self.restart_count += 1
+            logger.warning(
+                f"Restarting ingestion worker (restart #{self.restart_count})"
+            )
+
+        stderr_target: Any = None
+        if self.log_file is not None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            stderr_target = open(self.log_file, "a")
+
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr_target,
+                text=True,
+                bufsize=1,
+                cwd=self.project_root,
+            )
+        except Exception as e:
+            raise IngestionWorkerError(f"Failed to spawn ingestion worker: {e}") from e
+        finally:
+            if stderr_target is not None:
+                stderr_target.close()
+
+        # Drain stdout on a thread so reads can time out
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=self._read_responses,
+            args=(self.process.stdout, self._responses),
+            name="IngestionWorkerReader",
+            daemon=True,
+        ).start()
+
+        try:
+            ready = self._read_message(self.startup_timeout)
+        except TimeoutError as e:
+            self._terminate()
+            raise IngestionWorkerError(str(e)) from e
+
+        if not ready.get("ready"):
+            self._terminate()
+            raise IngestionWorkerError(
+                f"Ingestion worker failed to initialize: {ready.get('error')}"
+            )
+
+        logger.info(f"Ingestion worker ready (PID: {self.process.pid})")
+
+    def request(self, op: str, path: str, timeout: float) -> dict[str, Any]:
+        """
+        Send a request to the worker, starting it if needed.
+
+        Args:
+            op: Operation name ("load" or "remove")
+            path: File path the operation applies to
+            timeout: Seconds to wait for the response
+
+        Returns:
+            Response dictionary from the worker
+
+        Raises:
+            IngestionWorkerError: If the worker crashed or could not be started
+            TimeoutError: If no response arrived in time (the worker is killed)
+        """
+        return self._send({"op": op, "path": path}, timeout)
+
+    def request_batch(
+        self, items: list[dict[str, str]], timeout: float
+    ) -> dict[str, Any]:
+        """
+        Send several operations to the worker in a single request.
+
+        Args:
+            items: Operations as {"op": ..., "path": ...} dictionaries
+            timeout: Seconds to wait for the whole batch
+
+        Returns:
+            Response dictionary whose "results" holds one response per item
+
+        Raises:
+            IngestionWorkerError: If the worker crashed or could not be started
+            TimeoutError: If no response arrived in time (the worker is killed)
+        """
+        return self._send({"op": "batch", "items": items}, timeout)
+
+    def _send(self, message: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Send one request message and wait for its response."""
+        with self._lock:
+            self.start()
+            assert self.process is not None and self.process.stdin is not None
+
+            self._next_request_id += 1
+            request_id = self._next_request_id
+            try:
+                self.process.stdin.write(
+                    json.dumps({"id": request_id, **message}) + "\n"
+                )
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._terminate()
+                raise IngestionWorkerError(f"Ingestion worker pipe closed: {e}") from e
+
+            deadline = time.time() + timeout
+            while True:
+                try:
+                    response = self._read_message(max(0.0, deadline - time.time()))
+                except TimeoutError:
+                    # A hung worker cannot be trusted with the next request
+                    self._terminate()
+                    raise
+                if response.get("id") == request_id:
+                    return response
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Ask the worker to shut down, killing it if it does not exit in time.
+
+        Args:
+            timeout: Seconds to wait for a clean exit
+        """
+        with self._lock:
+            if not self.is_alive():
+                return
+            assert self.process is not None
+            try:
+                if self.process.stdin is not None:
+                    self.process.stdin.write(json.dumps({"op": "shutdown"}) + "\n")
+                    self.process.stdin.close()
+                self.process.wait(timeout=timeout)
+            except Exception:
+                self._terminate()
+
+    def _read_message(self, timeout: float) -> dict[str, Any]:
+        """Read the next protocol message from the worker."""
+        try:
+            line = self._responses.get(timeout=timeout)
+        except queue.Empty as e:
+            raise TimeoutError(
+                f"Ingestion worker did not respond within {timeout:.1f}s"
+            ) from e
+
+        if line is None:
+            self._terminate()
+            raise IngestionWorkerError("Ingestion worker exited unexpectedly")
+
+        try:
+            message: dict[str, Any] = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise IngestionWorkerError(f"Invalid worker message: {line!r}") from e
+        return message
+
+    def _terminate(self) -> None:
+        """Kill the worker process if it is still running."""
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait(timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Failed to terminate ingestion worker: {e}")
+
+    @staticmethod
+    def _read_responses(stream: Any, responses: queue.Queue) -> None:
+        """Forward worker stdout lines to the response queue until EOF."""
+        try:
+            for line in stream:
+                if line.strip():
+                    responses.put(line)
+        except Exception:
+            pass
+        finally:
+            responses.put(None)
+
+
 class LightweightMonitor:
     """
     File monitoring process with subprocess delegation.
 
-    Monitors file changes and delegates cognitive operations to CLI subprocesses.
+    Monitors file changes and delegates cognitive operations either to a
+    persistent ingestion worker process (the default) or to one CLI
+    subprocess per event.
     """
 
-    def __init__(self, project_root: Path, target_path: Path, lock_file: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        target_path: Path,
+        lock_file: Path,
+        ingestion_mode: str = "worker",
+        batch_size: int = 10,
+        debounce_seconds: float = 2.0,
+        watch_backend: str = "auto",
+    ):
         """
         Initialize lightweight monitor.
 
@@ -581,16 +1479,32 @@ class LightweightMonitor:
             project_root: Root directory of the project
             target_path: Path to monitor for file changes
             lock_file: Path to singleton lock file
+            ingestion_mode: "worker" for a persistent ingestion worker, or
+                "subprocess" for one CLI subprocess per event
+            batch_size: Maximum number of changed paths per ingestion call
+            debounce_seconds: Quiet period before a changed path is processed
+            watch_backend: File monitor backend: "auto" uses inotify when
+                available, "polling" forces periodic scans
         """
         self.project_root = project_root
         self.target_path = target_path
         self.lock_file_path = lock_file
+        self.ingestion_mode = ingestion_mode
+        self.batch_size = max(1, batch_size)
+        self.debounce_seconds = debounce_seconds
+        self.watch_backend = watch_backend
 
         # Components
         self.singleton_lock: SingletonLock | None = None
         self.signal_handler = SignalHandler()
         self.file_watcher: MarkdownFileWatcher | None = None
         self.processing_thread: threading.Thread | None = None
+        self.ingestion_worker: IngestionWorkerClient | None = None
+        if ingestion_mode == "worker":
+            self.ingestion_worker = IngestionWorkerClient(
+                project_root,
+                log_file=project_root / ".heimdall" / "ingestion_worker.log",
+            )
 
         # State
         self.running = False
@@ -605,6 +1519,7 @@ class LightweightMonitor:
             "last_activity": None,
             "subprocess_execution_times": [],  # Track execution times for averages
             "last_subprocess_error": None,
+            "worker_fallbacks": 0,
         }
 
         # Current processing state
@@ -642,7 +1557,11 @@ class LightweightMonitor:
             self.signal_handler.register_handlers()
 
             # Initialize file watcher
-            self.file_watcher = MarkdownFileWatcher(polling_interval=5.0)
+            self.file_watcher = MarkdownFileWatcher(
+                polling_interval=5.0,
+                debounce_seconds=self.debounce_seconds,
+                backend=self.watch_backend,
+            )
             self.file_watcher.add_path(self.target_path)
 
             # Start file monitoring
@@ -701,6 +1620,10 @@ class LightweightMonitor:
                 if self.processing_thread.is_alive():
                     logger.warning("Processing thread did not stop cleanly")
 
+            # Shut down the ingestion worker
+            if self.ingestion_worker:
+                self.ingestion_worker.stop()
+
             # Release singleton lock
             if self.singleton_lock:
                 self.singleton_lock.__exit__(None, None, None)
@@ -739,7 +1662,7 @@ class LightweightMonitor:
             self.stop()
 
     def _event_processing_loop(self) -> None:
-        """Process file change events using subprocess delegation."""
+        """Process debounced batches of file change events."""
         logger.debug("Event processing loop started")
 
         while self.running and not self.signal_handler.is_shutdown_requested():
@@ -748,25 +1671,32 @@ class LightweightMonitor:
                 if not self.file_watcher:
                     break
 
-                event = self.file_watcher.event_queue.get(timeout=1.0)
-                if event is None:
+                events = self.file_watcher.event_queue.get_batch(
+                    self.batch_size, timeout=1.0
+                )
+                if not events:
                     continue
 
-                # Process event via subprocess delegation
-                success = self._handle_file_change_subprocess(event)
-
-                # Update statistics
-                self.stats["files_processed"] = (self.stats["files_processed"] or 0) + 1
-                activity_time = time.time()
-                self.stats["last_activity"] = activity_time
+                # Process the batch in one worker call, or event by event
+                if self.ingestion_worker is not None and len(events) > 1:
+                    results = self._handle_file_changes_worker(events)
+                else:
+                    results = [self._handle_file_change(event) for event in events]
 
-                if not success:
-                    self.stats["subprocess_errors"] = (
-                        self.stats["subprocess_errors"] or 0
+                for success in results:
+                    # Update statistics
+                    self.stats["files_processed"] = (
+                        self.stats["files_processed"] or 0
                     ) + 1
+                    self.stats["last_activity"] = time.time()
+
+                    if not success:
+                        self.stats["subprocess_errors"] = (
+                            self.stats["subprocess_errors"] or 0
+                        ) + 1
 
-                # Mark task as done
-                self.file_watcher.event_queue.task_done()
+                    # Mark task as done
+                    self.file_watcher.event_queue.task_done()
 
             except Exception as e:
                 logger.error(f"Error in event processing loop: {e}")
@@ -879,6 +1809,240 @@ class LightweightMonitor:
             }
             return False
 
+    def _handle_file_change(self, event: FileChangeEvent) -> bool:
+        """Process one event via the ingestion worker or a CLI subprocess."""
+        if self.ingestion_worker is not None:
+            return self._handle_file_change_worker(event)
+        return self._handle_file_change_subprocess(event)
+
+    def _handle_file_changes_worker(self, events: list[FileChangeEvent]) -> list[bool]:
+        """
+        Process a batch of events with a single ingestion worker request.
+
+        Events that fail with a retryable error, or all events if the batch
+        request itself fails, are retried one by one.
+
+        Args:
+            events: Coalesced file change events to process
+
+        Returns:
+            Success flag per event, in input order
+        """
+        assert self.ingestion_worker is not None
+        logger.info(f"Processing {len(events)} file changes via ingestion worker")
+
+        items = [
+            {
+                "op": "remove" if event.change_type == ChangeType.DELETED else "load",
+                "path": str(event.path),
+            }
+            for event in events
+        ]
+
+        self.current_processing = {
+            "file_path": str(events[0].path),
+            "started_at": time.time(),
+            "change_type": events[0].change_type.value,
+            "batch_size": len(events),
+        }
+
+        try:
+            self.ingestion_worker.start()
+        except IngestionWorkerError as e:
+            self._fall_back_to_subprocess(e)
+            return [self._handle_file_change(event) for event in events]
+
+        start_time = time.time()
+        try:
+            response = self.ingestion_worker.request_batch(
+                items, timeout=self.subprocess_timeout * len(events)
+            )
+        except (IngestionWorkerError, TimeoutError) as e:
+            if isinstance(e, TimeoutError):
+                self.stats["subprocess_timeouts"] = (
+                    self.stats["subprocess_timeouts"] or 0
+                ) + 1
+            self.stats["last_subprocess_error"] = str(e)
+            logger.warning(f"Batch ingestion failed, retrying individually: {e}")
+            return [self._handle_file_change(event) for event in events]
+        finally:
+            self.current_processing = {
+                "file_path": None,
+                "started_at": None,
+                "change_type": None,
+            }
+
+        execution_time = time.time() - start_time
+        self.stats["subprocess_calls"] = (self.stats["subprocess_calls"] or 0) + 1
+        self.stats["subprocess_execution_times"].append(execution_time)
+        if len(self.stats["subprocess_execution_times"]) > 100:
+            self.stats["subprocess_execution_times"] = self.stats[
+                "subprocess_execution_times"
+            ][-100:]
+
+        item_responses = response.get("results") or []
+        results = []
+        for index, event in enumerate(events):
+            item = item_responses[index] if index < len(item_responses) else {}
+            if item.get("success"):
+                results.append(True)
+            elif item.get("permanent"):
+                self.stats["last_subprocess_error"] = item.get("error")
+                logger.error(
+                    f"Permanent failure for {event}, not retrying: {item.get('error')}"
+                )
+                results.append(False)
+            else:
+                results.append(self._handle_file_change(event))
+
+        logger.info(
+            f"Ingestion worker processed batch of {len(events)} in "
+            f"{execution_time:.2f}s ({sum(results)} succeeded)"
+        )
+        return results
+
+    def _fall_back_to_subprocess(self, error: Exception) -> None:
+        """Stop using the ingestion worker after it failed to start."""
+        logger.warning(
+            f"Ingestion worker unavailable, switching to subprocess mode: {error}"
+        )
+        self.stats["worker_fallbacks"] = (self.stats["worker_fallbacks"] or 0) + 1
+        self.ingestion_worker = None
+        self.ingestion_mode = "subprocess"
+
+    def _handle_file_change_worker(self, event: FileChangeEvent) -> bool:
+        """
+        Handle file change by delegating to the persistent ingestion worker.
+
+        Switches to CLI subprocess delegation if the worker cannot be started.
+
+        Args:
+            event: File change event to process
+
+        Returns:
+            True if the operation completed successfully, False otherwise
+        """
+        logger.info(f"Processing file change via ingestion worker: {event}")
+
+        self.current_processing = {
+            "file_path": str(event.path),
+            "started_at": time.time(),
+            "change_type": event.change_type.value,
+        }
+
+        try:
+            return self._execute_worker_with_retry(event)
+
+        except IngestionWorkerError as e:
+            self._fall_back_to_subprocess(e)
+            return self._handle_file_change_subprocess(event)
+
+        except Exception as e:
+            logger.error(f"Error handling file change in worker for event {event}: {e}")
+            return False
+
+        finally:
+            self.current_processing = {
+                "file_path": None,
+                "started_at": None,
+                "change_type": None,
+            }
+
+    def _execute_worker_with_retry(self, event: FileChangeEvent) -> bool:
+        """
+        Send a file change to the ingestion worker with retry logic.
+
+        A crashed or hung worker is restarted on the next attempt, mirroring
+        the retry, timeout and statistics behavior of subprocess delegation.
+
+        Args:
+            event: File change event being processed
+
+        Returns:
+            True if the worker completed the operation, False otherwise
+
+        Raises:
+            IngestionWorkerError: If the worker could not be started
+        """
+        assert self.ingestion_worker is not None
+
+        if event.change_type in [ChangeType.ADDED, ChangeType.MODIFIED]:
+            op = "load"
+        elif event.change_type == ChangeType.DELETED:
+            op = "remove"
+        else:
+            logger.error(f"Unknown change type: {event.change_type}")
+            return False
+
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                logger.info(
+                    f"Retrying ingestion worker (attempt {attempt + 1}/{self.max_retries + 1}): {event}"
+                )
+                self.stats["subprocess_retries"] = (
+                    self.stats["subprocess_retries"] or 0
+                ) + 1
+                time.sleep(self.retry_delay * attempt)
+
+            # Startup failures propagate so the caller can fall back
+            self.ingestion_worker.start()
+
+            start_time = time.time()
+            try:
+                response = self.ingestion_worker.request(
+                    op, str(event.path), timeout=self.subprocess_timeout
+                )
+            except TimeoutError:
+                logger.error(
+                    f"Ingestion worker timeout ({self.subprocess_timeout}s) for event: {event}"
+                )
+                self.stats["subprocess_timeouts"] = (
+                    self.stats["subprocess_timeouts"] or 0
+                ) + 1
+                last_error = "Ingestion worker timeout"
+                self.stats["last_subprocess_error"] = last_error
+                continue
+            except IngestionWorkerError as e:
+                # The worker crashed mid-request; it is restarted on retry
+                last_error = str(e)
+                self.stats["last_subprocess_error"] = last_error
+                logger.warning(f"Ingestion worker failed (attempt {attempt + 1}): {e}")
+                continue
+
+            execution_time = time.time() - start_time
+            self.stats["subprocess_calls"] = (self.stats["subprocess_calls"] or 0) + 1
+
+            if response.get("success"):
+                logger.info(
+                    f"Ingestion worker completed {op} in {execution_time:.2f}s "
+                    f"(attempt {attempt + 1}): {event.path} {response.get('result', {})}"
+                )
+                self.stats["subprocess_execution_times"].append(execution_time)
+                if len(self.stats["subprocess_execution_times"]) > 100:
+                    self.stats["subprocess_execution_times"] = self.stats[
+                        "subprocess_execution_times"
+                    ][-100:]
+                return True
+
+            last_error = response.get("error") or "Unknown error"
+            self.stats["last_subprocess_error"] = last_error
+            logger.warning(
+                f"Ingestion worker {op} failed after {execution_time:.2f}s "
+                f"(attempt {attempt + 1}): {last_error}"
+            )
+
+            if response.get("permanent"):
+                logger.error(f"Permanent failure detected, not retrying: {last_error}")
+                break
+
+        logger.error(
+            f"Ingestion worker failed after {self.max_retries + 1} attempts. "
+            f"Last error: {last_error}. Event: {event}"
+        )
+        return False
+
     def _build_subprocess_command(self, event: FileChangeEvent) -> list[str] | None:
         """
         Build CLI command for file change event.
@@ -1085,8 +2249,29 @@ class LightweightMonitor:
             "event_queue_size": (
                 self.file_watcher.event_queue.qsize() if self.file_watcher else 0
             ),
+            "event_queue": (
+                self.file_watcher.event_queue.get_stats() if self.file_watcher else {}
+            ),
+            "ingestion": self._get_ingestion_status(),
+            "watch_backend": self._get_watch_backend_status(),
+        }
+
+    def _get_ingestion_status(self) -> dict[str, Any]:
+        """Get ingestion mode and worker process state."""
+        worker = self.ingestion_worker
+        return {
+            "mode": self.ingestion_mode,
+            "worker_pid": worker.pid if worker else None,
+            "worker_restarts": worker.restart_count if worker else 0,
+            "worker_fallbacks": self.stats["worker_fallbacks"],
         }
 
+    def _get_watch_backend_status(self) -> dict[str, Any]:
+        """Get the requested and active file monitor backends."""
+        if self.file_watcher is None:
+            return {"requested": self.watch_backend, "active": None}
+        return self.file_watcher.monitor.get_backend_status()
+
     def _get_memory_usage(self) -> float | None:
         """Get current memory usage in MB."""
         try:
@@ -1110,8 +2295,6 @@ class LightweightMonitor:
     def _write_status_file(self) -> None:
         """Write current status to shared JSON file for CLI communication."""
         try:
-            import json
-
             # Calculate average execution time
             avg_execution_time = None
             if self.stats["subprocess_execution_times"]:
@@ -1140,6 +2323,7 @@ class LightweightMonitor:
                     if self.file_watcher
                     else 0,
                     "target_paths": [str(self.target_path)],
+                    "watch_backend": self._get_watch_backend_status(),
                 },
                 # Processing queue info
                 "processing": {
@@ -1149,6 +2333,11 @@ class LightweightMonitor:
                     "files_processed": self.stats["files_processed"],
                     "last_activity": self.stats["last_activity"],
                     "current_processing": self.current_processing.copy(),
+                    "batch_size": self.batch_size,
+                    "debounce_seconds": self.debounce_seconds,
+                    "event_queue": self.file_watcher.event_queue.get_stats()
+                    if self.file_watcher
+                    else {},
                 },
                 # Subprocess performance
                 "subprocess": {
@@ -1160,6 +2349,8 @@ class LightweightMonitor:
                     "average_execution_time": avg_execution_time,
                     "last_error": self.stats["last_subprocess_error"],
                 },
+                # Ingestion worker state
+                "ingestion": self._get_ingestion_status(),
                 # System resources
                 "resources": {
                     "memory_usage_mb": self._get_memory_usage(),
@@ -1213,6 +2404,30 @@ def main() -> int:
     parser.add_argument(
         "--lock-file", required=True, help="Path to singleton lock file"
     )
+    parser.add_argument(
+        "--ingestion-mode",
+        default="worker",
+        choices=["worker", "subprocess"],
+        help="Process changes in a persistent worker or one CLI call per event",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=int(os.getenv("MONITORING_BATCH_SIZE", "10")),
+        help="Maximum number of changed files per ingestion call",
+    )
+    parser.add_argument(
+        "--debounce-seconds",
+        type=float,
+        default=float(os.getenv("MONITORING_DEBOUNCE_SECONDS", "2.0")),
+        help="Quiet period before a changed file is processed",
+    )
+    parser.add_argument(
+        "--watch-backend",
+        default=os.getenv("MONITORING_WATCH_BACKEND", "auto"),
+        choices=["auto", "inotify", "polling"],
+        help="Detect changes with inotify events or periodic polling",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -1253,6 +2468,10 @@ def main() -> int:
             project_root=Path(args.project_root),
             target_path=Path(args.target_path),
             lock_file=Path(args.lock_file),
+            ingestion_mode=args.ingestion_mode,
+            batch_size=args.batch_size,
+            debounce_seconds=args.debounce_seconds,
+            watch_backend=args.watch_backend,
         )
 
         # Start monitoring
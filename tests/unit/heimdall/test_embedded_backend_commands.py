@@ -0,0 +1,104 @@
+"""
+Unit tests for project commands and health checks on the embedded backend.
+
+Tests that project list and clean work on the embedded vector store
+directories instead of Qdrant, and that the health check neither requires
+nor starts Qdrant when vectors are stored in process.
+"""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from rich.console import Console
+
+from cognitive_memory.core.config import SystemConfig, get_project_id
+from cognitive_memory.storage.embedded_vector_storage import EmbeddedVectorStorage
+from heimdall.cli_commands import project_commands
+from heimdall.cognitive_system.health_checker import HealthChecker, HealthResult
+
+
+def _json_output(output: io.StringIO) -> dict:
+    """Parse the JSON a command printed after its progress messages."""
+    text = output.getvalue()
+    return json.loads(text[text.index("{") :])
+
+
+@pytest.fixture
+def embedded_project(tmp_path, monkeypatch):
+    """Create a project with one vector in its embedded store."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("VECTOR_BACKEND", "embedded")
+    monkeypatch.delenv("VECTOR_STORAGE_PATH", raising=False)
+
+    project_id = get_project_id(tmp_path)
+    vector_size = SystemConfig.from_env().embedding.embedding_dimension
+    vector_path = tmp_path / ".heimdall" / "vectors"
+    with EmbeddedVectorStorage(vector_size, project_id, vector_path) as storage:
+        storage.store_vector(
+            "m1", np.ones(vector_size), {"memory_id": "m1", "hierarchy_level": 2}
+        )
+
+    output = io.StringIO()
+    monkeypatch.setattr(project_commands, "console", Console(file=output, width=10_000))
+    return tmp_path, project_id, vector_path / project_id, output
+
+
+class TestEmbeddedProjectCommands:
+    """Test project commands with the embedded vector backend."""
+
+    def test_list_reads_store_directories(self, embedded_project) -> None:
+        """Test projects are listed from the embedded store directory."""
+        _, project_id, _, output = embedded_project
+
+        with patch(
+            "heimdall.cognitive_system.service_manager.QdrantManager"
+        ) as manager:
+            project_commands.project_list(json_output=True, show_collections=False)
+
+        manager.assert_not_called()
+        result = _json_output(output)
+        assert list(result["projects"]) == [project_id]
+        collections = result["projects"][project_id]
+        assert {c["level"] for c in collections} == {"concepts", "contexts", "episodes"}
+        assert sum(c["vectors_count"] for c in collections) == 1
+
+    def test_clean_deletes_store_directory(self, embedded_project) -> None:
+        """Test cleaning a project deletes its embedded store directory."""
+        project_path, project_id, store_dir, output = embedded_project
+
+        with patch(
+            "heimdall.cognitive_system.service_manager.QdrantManager"
+        ) as manager:
+            project_commands.project_clean(
+                confirm=True,
+                json_output=True,
+                dry_run=False,
+                project_root=str(project_path),
+            )
+
+        manager.assert_not_called()
+        assert not store_dir.exists()
+        result = _json_output(output)
+        assert result["total_deleted"] == 3
+        assert result["deleted_collections"][0] == f"{project_id}_concepts"
+
+
+class TestEmbeddedHealthCheck:
+    """Test the Qdrant health check with the embedded vector backend."""
+
+    def test_qdrant_check_skipped(self, embedded_project) -> None:
+        """Test Qdrant is neither checked nor started for embedded storage."""
+        with patch(
+            "heimdall.cognitive_system.health_checker.QdrantManager"
+        ) as manager_class:
+            manager = Mock()
+            manager_class.return_value = manager
+            check = HealthChecker()._check_qdrant_service(fix_issues=True)
+
+        assert check.status == HealthResult.HEALTHY
+        assert not check.fix_attempted
+        manager.get_status.assert_not_called()
+        manager.start.assert_not_called()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OperationExecutor.
+
+Tests that blocking operations run off the event loop, reads overlap,
+writes are serialized, and per-tool limits and metrics are applied.
+"""
+
+import asyncio
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path to find heimdall module
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Direct import of the executor module
+executor_path = project_root / "heimdall" / "operation_executor.py"
+spec = importlib.util.spec_from_file_location(
+    "heimdall.operation_executor", executor_path
+)
+executor_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(executor_module)
+OperationExecutor = executor_module.OperationExecutor
+
+
+class ConcurrencyProbe:
+    """Blocking operation that records how many copies ran at once."""
+
+    def __init__(self, duration: float = 0.05):
+        self.duration = duration
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value: int = 0) -> int:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.duration)
+        with self.lock:
+            self.active -= 1
+        return value
+
+
+class TestOperationExecutor:
+    """Test suite for OperationExecutor."""
+
+    @pytest.fixture
+    def executor(self):
+        """Create an executor with enough workers for overlap tests."""
+        executor = OperationExecutor(
+            max_workers=4, tool_limits={"read": 4, "write": 4, "limited": 2}
+        )
+        yield executor
+        executor.shutdown()
+
+    async def _gather(self, executor, tool, probe, count, write=False):
+        return await asyncio.gather(
+            *(executor.run(tool, probe, i, write=write) for i in range(count))
+        )
+
+    def test_returns_result_and_propagates_errors(self, executor):
+        """Test results and exceptions pass through to the awaiting caller."""
+
+        def fail():
+            raise ValueError("boom")
+
+        assert asyncio.run(executor.run("read", lambda x: x * 2, 21)) == 42
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(executor.run("read", fail))
+
+        stats = executor.get_stats()["tools"]["read"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 1
+        assert stats["queued"] == 0
+        assert stats["in_flight"] == 0
+
+    def test_reads_run_concurrently(self, executor):
+        """Test read operations overlap in the worker pool."""
+        probe = ConcurrencyProbe()
+
+        results = asyncio.run(self._gather(executor, "read", probe, 4))
+
+        assert results == [0, 1, 2, 3]
+        assert probe.peak > 1
+
+    def test_writes_are_serialized(self, executor):
+        """Test write operations never overlap each other or reads."""
+        probe = ConcurrencyProbe(duration=0.02)
+
+        async def mixed():
+            await asyncio.gather(
+                self._gather(executor, "write", probe, 3, write=True),
+                self._gather(executor, "read", probe, 3),
+            )
+
+        asyncio.run(mixed())
+
+        stats = executor.get_stats()["tools"]
+        assert stats["write"]["calls"] == 3
+        assert stats["read"]["calls"] == 3
+        # Writes hold the lock alone, so readers overlap only with readers
+        assert probe.peak <= 3
+
+        write_probe = ConcurrencyProbe(duration=0.02)
+        asyncio.run(self._gather(executor, "write", write_probe, 3, write=True))
+        assert write_probe.peak == 1
+
+    def test_per_tool_limit(self, executor):
+        """Test a tool never exceeds its in-flight limit."""
+        probe = ConcurrencyProbe()
+
+        asyncio.run(self._gather(executor, "limited", probe, 6))
+
+        assert probe.peak <= 2
+        stats = executor.get_stats()["tools"]["limited"]
+        assert stats["limit"] == 2
+        assert stats["calls"] == 6
+        # Calls beyond the limit waited for a slot
+        assert stats["max_queue_seconds"] > 0.0
+        assert stats["avg_queue_seconds"] > 0.0
+
+    def test_event_loop_not_blocked(self, executor):
+        """Test the loop keeps running while an operation blocks a worker."""
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            await executor.run("read", time.sleep, 0.1)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(scenario()) > 5
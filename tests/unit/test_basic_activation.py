@@ -17,6 +17,7 @@ from cognitive_memory.core.memory import (
     MemoryConnection,
 )
 from cognitive_memory.retrieval.basic_activation import BasicActivationEngine
+from cognitive_memory.storage.sqlite_persistence import create_sqlite_persistence
 
 
 class TestBasicActivationEngine:
@@ -135,6 +136,9 @@ class TestBasicActivationEngine:
         assert isinstance(result, ActivationResult)
         assert result.total_activated >= 0
         assert result.activation_time_ms > 0
+        assert set(result.phase_times_ms) <= {"l0_load", "activation_bfs"}
+        assert "l0_load" in result.phase_times_ms
+        assert sum(result.phase_times_ms.values()) <= result.activation_time_ms
         mock_memory_storage.get_memories_by_level.assert_called_once_with(0)
 
     def test_find_starting_memories(
@@ -284,6 +288,85 @@ class TestBasicActivationEngine:
         assert isinstance(result, ActivationResult)
         assert result.total_activated <= 3  # Starting + max_activations
 
+    @pytest.mark.parametrize("max_activations", [3, 12, 50])
+    def test_bfs_adjacency_index_matches_per_node_traversal(
+        self, tmp_path, max_activations: int
+    ) -> None:
+        """Test frontier expansion activates the same memories in the same order."""
+        memory_store, connection_store = create_sqlite_persistence(
+            str(tmp_path / "activation.db")
+        )
+        rng = np.random.default_rng(3)
+        context = rng.normal(size=16)
+
+        memories = []
+        for i in range(40):
+            memory = CognitiveMemory(
+                id=f"m{i:02d}",
+                content=f"Memory {i}",
+                hierarchy_level=i % 3,
+                importance_score=float(rng.uniform(0.0, 1.0)),
+            )
+            memory.cognitive_embedding = context + rng.normal(scale=1.5, size=16)
+            memory_store.store_memory(memory)
+            memories.append(memory)
+
+        for _ in range(120):
+            source, target = rng.choice(40, size=2, replace=False)
+            connection_store.add_connection(
+                memories[source].id,
+                memories[target].id,
+                float(rng.uniform(0.2, 1.0)),
+                connection_type=str(rng.choice(["associative", "causal"])),
+            )
+
+        engine = BasicActivationEngine(memory_store, connection_store)
+        assert engine._get_adjacency_index() is not None
+
+        def activate():
+            result = engine._bfs_activation(
+                context, memories[:2], threshold=0.3, max_activations=max_activations
+            )
+            return (
+                [m.id for m in result.core_memories],
+                [m.id for m in result.peripheral_memories],
+                set(result.activation_strengths),
+            )
+
+        indexed = activate()
+        engine._get_adjacency_index = lambda: None
+        per_node = activate()
+
+        assert indexed == per_node
+        assert len(indexed[2]) > 2
+
+    def test_indexed_starting_memories_match_level_scan(self, tmp_path) -> None:
+        """Test the L0 index finds the same untruncated starting memories."""
+        memory_store, connection_store = create_sqlite_persistence(
+            str(tmp_path / "activation.db")
+        )
+        rng = np.random.default_rng(5)
+        context = rng.normal(size=16)
+        for i in range(30):
+            memory = CognitiveMemory(
+                id=f"m{i:02d}", content=f"Memory {i}", hierarchy_level=0
+            )
+            memory.cognitive_embedding = context + rng.normal(scale=0.5, size=16)
+            memory_store.store_memory(memory)
+
+        engine = BasicActivationEngine(memory_store, connection_store)
+        level_index = engine._get_level_index(0)
+        assert level_index is not None
+
+        indexed = engine._find_starting_memories_indexed(context, level_index, 0.5)
+        scanned = engine._find_starting_memories(
+            context, memory_store.get_memories_by_level(0), 0.5
+        )
+
+        assert [m.id for m in indexed] == [m.id for m in scanned]
+        result = engine.activate_memories(context, threshold=0.5, max_activations=5)
+        assert result.total_activated == len(scanned) > 5
+
     def test_compute_cosine_similarity(
         self, activation_engine: BasicActivationEngine
     ) -> None:
@@ -0,0 +1,164 @@
+"""
+Unit tests for the bridge discovery result cache.
+
+Tests that cached bridges are served without re-scanning candidates, that
+memory writes and TTL expiry invalidate entries, that keys are stable under
+tiny query perturbations, and that hit counters reach the bridge_cache table.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.retrieval.bridge_discovery import SimpleBridgeDiscovery
+from cognitive_memory.storage.bridge_cache import BridgeCache
+from cognitive_memory.storage.sqlite_persistence import (
+    DatabaseManager,
+    MemoryMetadataStore,
+)
+
+QUERY = np.array([0.0, 0.0, 1.0])
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a memory store with one activated memory and bridge candidates."""
+    db_manager = DatabaseManager(str(tmp_path / "bridges.db"))
+    memory_store = MemoryMetadataStore(db_manager)
+    embeddings = {
+        "activated": [0.0, 1.0, 0.0],
+        "bridge": [0.0, 1.0, 0.2],  # Far from query, near activated
+        "near_query": [0.0, 0.0, 1.0],  # Too similar to the query
+        "other": [1.0, 0.0, 0.0],
+    }
+    for memory_id, embedding in embeddings.items():
+        memory = CognitiveMemory(id=memory_id, content=memory_id, hierarchy_level=1)
+        memory.cognitive_embedding = np.array(embedding)
+        memory_store.store_memory(memory)
+
+    yield memory_store
+
+    db_manager.close()
+
+
+def make_discovery(memory_store: MemoryMetadataStore) -> SimpleBridgeDiscovery:
+    """Create bridge discovery with a cache on the store's database."""
+    return SimpleBridgeDiscovery(
+        memory_store,
+        min_novelty=0.3,
+        cache=BridgeCache(memory_store.db_manager, ttl_hours=24),
+    )
+
+
+def activated_memory(memory_store: MemoryMetadataStore) -> CognitiveMemory:
+    """Load the activated memory from the store."""
+    return memory_store.get_memories_by_ids(["activated"])[0]
+
+
+class TestBridgeCache:
+    """Test BridgeCache functionality."""
+
+    def test_cached_result_skips_candidate_scan(self, store):
+        """Test a repeated query is served from the cache."""
+        discovery = make_discovery(store)
+        activated = [activated_memory(store)]
+
+        first = discovery.discover_bridges(QUERY, activated, k=2)
+        assert [bridge.memory.id for bridge in first] == ["bridge", "other"]
+
+        discovery._get_indexed_candidates = Mock(  # type: ignore[method-assign]
+            side_effect=AssertionError("candidates scanned")
+        )
+        second = discovery.discover_bridges(QUERY, activated, k=2)
+
+        assert [bridge.memory.id for bridge in second] == ["bridge", "other"]
+        for cached, fresh in zip(second, first, strict=True):
+            assert cached.bridge_score == pytest.approx(fresh.bridge_score)
+            assert cached.novelty_score == pytest.approx(fresh.novelty_score)
+            assert cached.connection_potential == pytest.approx(
+                fresh.connection_potential
+            )
+            assert cached.explanation == fresh.explanation
+
+        stats = discovery.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 2
+        assert stats["queries"] == 1
+
+    def test_source_is_closest_activated_memory(self, store):
+        """Test cache rows link each bridge to its closest activated memory."""
+        discovery = make_discovery(store)
+        discovery.discover_bridges(QUERY, [activated_memory(store)], k=1)
+
+        with store.db_manager.get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT bridge_memory_id, source_memory_id, target_memory_id
+                FROM bridge_cache
+                """
+            ).fetchone()
+        assert tuple(row) == ("bridge", "activated", "bridge")
+
+    def test_memory_writes_invalidate_entries(self, store):
+        """Test adding a memory makes cached results stale."""
+        discovery = make_discovery(store)
+        activated = [activated_memory(store)]
+        discovery.discover_bridges(QUERY, activated, k=1)
+
+        newcomer = CognitiveMemory(id="newcomer", content="new", hierarchy_level=0)
+        newcomer.cognitive_embedding = np.array([0.0, 1.0, 0.0])
+        store.store_memory(newcomer)
+
+        bridges = discovery.discover_bridges(QUERY, activated, k=1)
+
+        assert [bridge.memory.id for bridge in bridges] == ["newcomer"]
+        assert discovery.cache.invalidations == 1
+        assert discovery.cache.hits == 0
+
+    def test_expired_entries_are_misses(self, store):
+        """Test entries past their TTL are not served."""
+        cache = BridgeCache(store.db_manager, ttl_hours=24)
+        discovery = SimpleBridgeDiscovery(store, cache=cache)
+        activated = [activated_memory(store)]
+        discovery.discover_bridges(QUERY, activated, k=1)
+
+        with store.db_manager.get_connection() as conn:
+            conn.execute("UPDATE bridge_cache SET created_at = created_at - 2")
+            conn.commit()
+
+        discovery.discover_bridges(QUERY, activated, k=1)
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_query_hash_quantizes_embedding(self):
+        """Test keys ignore tiny perturbations but not the activated set."""
+        parameters = {"min_novelty": 0.3}
+        key = BridgeCache.query_hash(QUERY, {"a", "b"}, 5, parameters)
+
+        assert key == BridgeCache.query_hash(
+            QUERY * 2.0 + 1e-6, ["b", "a"], 5, parameters
+        )
+        assert key != BridgeCache.query_hash(QUERY, {"a"}, 5, parameters)
+        assert key != BridgeCache.query_hash(QUERY, {"a", "b"}, 3, parameters)
+        assert key != BridgeCache.query_hash(
+            np.array([0.0, 0.6, 0.8]), {"a", "b"}, 5, parameters
+        )
+
+    def test_hit_counters_are_written_behind(self, store):
+        """Test served entries bump access_count once the buffer flushes."""
+        discovery = make_discovery(store)
+        activated = [activated_memory(store)]
+        for _ in range(3):
+            discovery.discover_bridges(QUERY, activated, k=1)
+
+        store.db_manager.stats_buffer.flush()
+
+        with store.db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT access_count, last_accessed FROM bridge_cache"
+            ).fetchone()
+        assert row["access_count"] == 2
+        assert row["last_accessed"] is not None
@@ -246,29 +246,31 @@ class TestSimpleBridgeDiscovery:
         # Should return empty list since no memories have embeddings
         assert candidates == []
 
-    def test_compute_bridge_scores(
+    def test_score_bridges(
         self,
         bridge_discovery: SimpleBridgeDiscovery,
         sample_memories_with_embeddings: list[CognitiveMemory],
         mock_numpy_embedding: np.ndarray,
     ) -> None:
-        """Test _compute_bridge_scores method."""
+        """Test _score_bridges method."""
         candidates = sample_memories_with_embeddings[:3]
         activated = sample_memories_with_embeddings[3:]
 
-        bridge_scores = bridge_discovery._compute_bridge_scores(
+        scored = bridge_discovery._score_bridges(
             context=mock_numpy_embedding, candidates=candidates, activated=activated
         )
 
-        assert isinstance(bridge_scores, list)
-        assert len(bridge_scores) <= len(candidates)
+        assert isinstance(scored, list)
+        assert len(scored) <= len(candidates)
 
-        for candidate, score in bridge_scores:
+        for candidate, score, novelty, connection_potential in scored:
             assert isinstance(candidate, CognitiveMemory)
             assert isinstance(score, float)
             assert 0.0 <= score <= 1.0
+            assert 0.0 <= novelty <= 1.0
+            assert 0.0 <= connection_potential <= 1.0
 
-    def test_compute_bridge_scores_low_novelty_filter(
+    def test_score_bridges_low_novelty_filter(
         self,
         bridge_discovery: SimpleBridgeDiscovery,
         sample_memories_with_embeddings: list[CognitiveMemory],
@@ -283,134 +285,82 @@ class TestSimpleBridgeDiscovery:
         for candidate in candidates:
             candidate.cognitive_embedding = context.copy()
 
-        bridge_scores = bridge_discovery._compute_bridge_scores(
+        scored = bridge_discovery._score_bridges(
             context=context, candidates=candidates, activated=activated
         )
 
         # Should filter out low novelty candidates
-        assert len(bridge_scores) == 0
+        assert len(scored) == 0
 
-    def test_calculate_novelty_score(
-        self,
-        bridge_discovery: SimpleBridgeDiscovery,
-        sample_memories_with_embeddings: list[CognitiveMemory],
-        mock_numpy_embedding: np.ndarray,
-    ) -> None:
-        """Test _calculate_novelty_score method."""
-        memory = sample_memories_with_embeddings[0]
-
-        novelty = bridge_discovery._calculate_novelty_score(
-            mock_numpy_embedding, memory
-        )
-
-        assert isinstance(novelty, float)
-        assert 0.0 <= novelty <= 1.0
-
-    def test_calculate_novelty_score_identical_vectors(
+    def test_score_bridges_identical_vectors(
         self,
         bridge_discovery: SimpleBridgeDiscovery,
         sample_memories_with_embeddings: list[CognitiveMemory],
     ) -> None:
-        """Test novelty score with identical vectors."""
+        """Test novelty and connection potential with identical vectors."""
+        bridge_discovery.min_novelty = 0.0
         memory = sample_memories_with_embeddings[0]
         context = memory.cognitive_embedding.copy()
 
-        novelty = bridge_discovery._calculate_novelty_score(context, memory)
+        [(_, _, novelty, connection_potential)] = bridge_discovery._score_bridges(
+            context, [memory], [memory]
+        )
 
         # Should be 0 for identical vectors (1.0 - 1.0 = 0.0)
         assert novelty == pytest.approx(0.0, abs=1e-6)
+        assert connection_potential == pytest.approx(1.0, abs=1e-6)
 
-    def test_calculate_novelty_score_no_embedding(
+    def test_score_bridges_skips_missing_embeddings(
         self,
         bridge_discovery: SimpleBridgeDiscovery,
+        sample_memories_with_embeddings: list[CognitiveMemory],
         sample_memory: CognitiveMemory,
         mock_numpy_embedding: np.ndarray,
     ) -> None:
-        """Test novelty score with memory without embedding."""
+        """Test candidates without embeddings are not scored."""
         sample_memory.cognitive_embedding = None
+        activated = sample_memories_with_embeddings[:2]
 
-        novelty = bridge_discovery._calculate_novelty_score(
-            mock_numpy_embedding, sample_memory
-        )
-
-        assert novelty == 0.0
-
-    def test_calculate_connection_potential(
-        self,
-        bridge_discovery: SimpleBridgeDiscovery,
-        sample_memories_with_embeddings: list[CognitiveMemory],
-    ) -> None:
-        """Test _calculate_connection_potential method."""
-        candidate = sample_memories_with_embeddings[0]
-        activated = sample_memories_with_embeddings[1:3]
-
-        connection_potential = bridge_discovery._calculate_connection_potential(
-            candidate, activated
+        scored = bridge_discovery._score_bridges(
+            mock_numpy_embedding, [sample_memory], activated
         )
 
-        assert isinstance(connection_potential, float)
-        assert 0.0 <= connection_potential <= 1.0
+        assert scored == []
 
-    def test_calculate_connection_potential_no_activated(
+    def test_score_bridges_no_activated(
         self,
         bridge_discovery: SimpleBridgeDiscovery,
         sample_memories_with_embeddings: list[CognitiveMemory],
+        mock_numpy_embedding: np.ndarray,
     ) -> None:
         """Test connection potential with no activated memories."""
-        candidate = sample_memories_with_embeddings[0]
-
-        connection_potential = bridge_discovery._calculate_connection_potential(
-            candidate, []
-        )
-
-        assert connection_potential == 0.0
-
-    def test_calculate_connection_potential_no_embedding(
-        self,
-        bridge_discovery: SimpleBridgeDiscovery,
-        sample_memories_with_embeddings: list[CognitiveMemory],
-        sample_memory: CognitiveMemory,
-    ) -> None:
-        """Test connection potential with candidate without embedding."""
-        sample_memory.cognitive_embedding = None
-        activated = sample_memories_with_embeddings[:2]
-
-        connection_potential = bridge_discovery._calculate_connection_potential(
-            sample_memory, activated
-        )
-
-        assert connection_potential == 0.0
-
-    def test_compute_cosine_similarity(
-        self, bridge_discovery: SimpleBridgeDiscovery
-    ) -> None:
-        """Test cosine similarity computation."""
-        vec1 = np.array([1.0, 2.0, 3.0])
-        vec2 = np.array([2.0, 4.0, 6.0])  # Same direction
-
-        similarity = bridge_discovery._compute_cosine_similarity(vec1, vec2)
-        assert isinstance(similarity, float)
-        assert 0.99 < similarity <= 1.0
+        bridge_discovery.min_novelty = 0.0
+        candidates = sample_memories_with_embeddings[:3]
 
-    def test_compute_cosine_similarity_orthogonal(
-        self, bridge_discovery: SimpleBridgeDiscovery
-    ) -> None:
-        """Test cosine similarity with orthogonal vectors."""
-        vec1 = np.array([1.0, 0.0])
-        vec2 = np.array([0.0, 1.0])
+        scored = bridge_discovery._score_bridges(mock_numpy_embedding, candidates, [])
 
-        similarity = bridge_discovery._compute_cosine_similarity(vec1, vec2)
-        assert similarity == pytest.approx(0.0, abs=1e-6)
+        assert len(scored) == len(candidates)
+        assert all(connection_potential == 0.0 for *_, connection_potential in scored)
 
-    def test_compute_cosine_similarity_zero_vector(
+    def test_embedding_matrix_normalizes_rows(
         self, bridge_discovery: SimpleBridgeDiscovery
     ) -> None:
-        """Test cosine similarity with zero vector."""
-        vec1 = np.array([1.0, 2.0])
-        vec2 = np.array([0.0, 0.0])
-
-        similarity = bridge_discovery._compute_cosine_similarity(vec1, vec2)
-        assert similarity == 0.0
+        """Test embedding rows are unit length and zero vectors stay zero."""
+        memories = []
+        for i, vector in enumerate(([1.0, 2.0], [2.0, 4.0], [0.0, 1.0], [0.0, 0.0])):
+            memory = CognitiveMemory(id=f"m{i}", content=f"Memory {i}")
+            memory.cognitive_embedding = np.array(vector)
+            memories.append(memory)
+
+        matrix = bridge_discovery._embedding_matrix(memories, 2)
+        similarities = matrix @ matrix.T
+
+        # Same direction, orthogonal, and zero vector
+        assert similarities[0, 1] == pytest.approx(1.0, abs=1e-6)
+        assert similarities[1, 2] == pytest.approx(0.894427, abs=1e-5)
+        assert similarities[2, 0] == pytest.approx(0.894427, abs=1e-5)
+        assert not matrix[3].any()
+        assert bridge_discovery._embedding_matrix(memories, 3) is None
 
     def test_generate_bridge_explanation(
         self,
@@ -601,3 +551,78 @@ class TestSimpleBridgeDiscovery:
             assert 0.0 <= bridge.connection_potential <= 1.0
             assert 0.0 <= bridge.bridge_score <= 1.0
             assert isinstance(bridge.explanation, str)
+
+    def test_vectorized_scores_match_pairwise(
+        self,
+        bridge_discovery: SimpleBridgeDiscovery,
+        sample_memories_with_embeddings: list[CognitiveMemory],
+        mock_numpy_embedding: np.ndarray,
+    ) -> None:
+        """Test bulk scoring agrees with pairwise cosine similarities."""
+        bridge_discovery.min_novelty = 0.0
+        candidates = sample_memories_with_embeddings[:3]
+        activated = sample_memories_with_embeddings[3:]
+
+        def cosine(a: np.ndarray, b: np.ndarray) -> float:
+            return float(
+                np.clip(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)), 0, 1)
+            )
+
+        scored = bridge_discovery._score_bridges(
+            mock_numpy_embedding, candidates, activated
+        )
+
+        assert len(scored) == len(candidates)
+        for candidate, bridge_score, novelty, connection_potential in scored:
+            assert novelty == pytest.approx(
+                1.0 - cosine(mock_numpy_embedding, candidate.cognitive_embedding),
+                abs=1e-5,
+            )
+            assert connection_potential == pytest.approx(
+                max(
+                    cosine(candidate.cognitive_embedding, memory.cognitive_embedding)
+                    for memory in activated
+                ),
+                abs=1e-5,
+            )
+            assert bridge_score == pytest.approx(
+                0.6 * novelty + 0.4 * connection_potential
+            )
+
+    def test_discover_bridges_uses_level_index(self, tmp_path) -> None:
+        """Test candidates are scored on the resident level indexes."""
+        from cognitive_memory.storage.sqlite_persistence import (
+            DatabaseManager,
+            MemoryMetadataStore,
+        )
+
+        store = MemoryMetadataStore(DatabaseManager(str(tmp_path / "bridges.db")))
+        embeddings = {
+            "activated": [1.0, 0.0, 0.0],
+            "bridge": [0.0, 1.0, 0.2],  # Far from query, near activated
+            "near_query": [0.0, 0.0, 1.0],  # Too similar to the query
+            "unrelated": [0.0, -1.0, 0.0],
+        }
+        memories = {}
+        for memory_id, embedding in embeddings.items():
+            memory = CognitiveMemory(id=memory_id, content=memory_id, hierarchy_level=1)
+            memory.cognitive_embedding = np.array(embedding)
+            store.store_memory(memory)
+            memories[memory_id] = memory
+
+        # Activated memory leans toward the bridge direction
+        memories["activated"].cognitive_embedding = np.array([0.0, 1.0, 0.0])
+
+        discovery = SimpleBridgeDiscovery(store, max_candidates=1, min_novelty=0.3)
+        discovery._get_candidate_memories = Mock(  # type: ignore[method-assign]
+            side_effect=AssertionError("full scan used")
+        )
+
+        bridges = discovery.discover_bridges(
+            context=np.array([0.0, 0.0, 1.0]),
+            activated=[memories["activated"]],
+            k=3,
+        )
+
+        assert [bridge.memory.id for bridge in bridges] == ["bridge"]
+        assert bridges[0].connection_potential > 0.9
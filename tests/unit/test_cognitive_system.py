@@ -5,10 +5,12 @@ This module tests the CognitiveMemorySystem implementation to ensure
 proper coordination between subsystems through abstract interfaces.
 """
 
+import itertools
 from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
+from git import Actor, Repo
 
 from cognitive_memory.core.cognitive_system import CognitiveMemorySystem
 from cognitive_memory.core.config import SystemConfig
@@ -21,6 +23,11 @@ from cognitive_memory.core.interfaces import (
     VectorStorage,
 )
 from cognitive_memory.core.memory import ActivationResult, BridgeMemory, CognitiveMemory
+from cognitive_memory.loaders import GitHistoryLoader, MarkdownMemoryLoader
+from cognitive_memory.storage.sqlite_persistence import (
+    DatabaseManager,
+    MemoryMetadataStore,
+)
 from tests.factory_utils import (
     MockEmbeddingProvider,
     MockMemoryStorage,
@@ -325,6 +332,25 @@ class TestCognitiveMemorySystem:
         assert len(results["bridge"]) > 0
         assert len(results["peripheral"]) == 0  # Not requested
 
+    def test_retrieve_memories_skipped_phases_are_not_timed(self, cognitive_system):
+        """Test a skipped phase's time is not charged to the next phase."""
+        telemetry = Mock()
+        telemetry.should_sample.return_value = True
+        cognitive_system.retrieval_telemetry = telemetry
+
+        # Every clock read advances one second
+        with patch(
+            "cognitive_memory.core.cognitive_system.time.perf_counter",
+            side_effect=itertools.count(),
+        ):
+            cognitive_system.retrieve_memories("test query", types=["bridge"])
+
+        phase_times = telemetry.record.call_args.args[1]
+        assert "activation" not in phase_times
+        assert phase_times["query_encode"] == 1000.0
+        assert phase_times["bridge_discovery"] == 1000.0
+        assert phase_times["response_formatting"] == 1000.0
+
     def test_factory_system_isolation(self, factory_cognitive_system):
         """Test that factory-created systems provide proper test isolation."""
         # This test demonstrates that factory-created systems provide isolated testing
@@ -451,6 +477,21 @@ class TestCognitiveMemorySystem:
         assert "activation_threshold" in config
         assert "bridge_discovery_k" in config
 
+    def test_repeated_queries_use_query_cache(
+        self, cognitive_system, mock_embedding_provider
+    ):
+        """Test repeated queries and lesson text are encoded only once."""
+        cognitive_system.retrieve_memories("machine learning concepts")
+        cognitive_system.retrieve_memories("  machine learning   concepts")
+        cognitive_system.store_experience("machine learning concepts")
+
+        mock_embedding_provider.encode.assert_called_once_with(
+            "machine learning concepts"
+        )
+        query_cache = cognitive_system.get_memory_stats()["query_cache"]
+        assert query_cache["hits"] == 2
+        assert query_cache["misses"] == 1
+
     def test_error_handling_in_store(self, cognitive_system, mock_embedding_provider):
         """Test error handling during experience storage."""
         # Make embedding provider raise exception
@@ -482,3 +523,250 @@ class TestCognitiveMemorySystem:
         # Should default to level 2
         stored_memory = mock_memory_storage.store_memory.call_args[0][0]
         assert stored_memory.hierarchy_level == 2
+
+    def test_load_memories_from_source_batched(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Test loaded memories are encoded in batches and failures counted."""
+        memories = [
+            CognitiveMemory(id=f"loaded-{i}", content=f"Chunk {i}", hierarchy_level=1)
+            for i in range(5)
+        ]
+        loader = Mock()
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = memories
+        loader.extract_connections.return_value = []
+
+        cognitive_system.config.embedding.batch_size = 2
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 512)
+        )
+        mock_memory_storage.store_memory.side_effect = lambda memory: (
+            memory.id != "loaded-3"
+        )
+
+        results = cognitive_system.load_memories_from_source(loader, "source.md")
+
+        assert results["success"]
+        assert results["memories_loaded"] == 4
+        assert results["memories_failed"] == 1
+        assert mock_embedding_provider.encode_batch.call_count == 3
+        mock_embedding_provider.encode.assert_not_called()
+        assert mock_vector_storage.store_vector.call_count == 4
+
+    def test_load_memories_reuses_cached_embeddings(
+        self, cognitive_system, mock_embedding_provider, tmp_path
+    ):
+        """Test re-loading unchanged content is served from the embedding cache."""
+        from cognitive_memory.storage.embedding_cache import EmbeddingCache
+
+        db_manager = DatabaseManager(str(tmp_path / "cache.db"))
+        cognitive_system.embedding_cache = EmbeddingCache(db_manager)
+        mock_embedding_provider.get_model_info = Mock(
+            return_value={"model_name": "test-model", "embedding_dimension": 512}
+        )
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 512)
+        )
+
+        def load(contents: list[str]) -> None:
+            loader = Mock()
+            loader.validate_source.return_value = True
+            loader.load_from_source.return_value = [
+                CognitiveMemory(id=f"m-{i}", content=content, hierarchy_level=1)
+                for i, content in enumerate(contents)
+            ]
+            loader.extract_connections.return_value = []
+            assert cognitive_system.load_memories_from_source(loader, "doc.md")[
+                "success"
+            ]
+
+        load(["Chunk one", "Chunk two"])
+        load(["Chunk one", "Chunk two", "Chunk three"])
+
+        batches = [
+            call.args[0] for call in mock_embedding_provider.encode_batch.call_args_list
+        ]
+        assert batches == [["Chunk one", "Chunk two"], ["Chunk three"]]
+        cache_stats = cognitive_system.get_memory_stats()["embedding_cache"]
+        assert cache_stats["hits"] == 2
+        assert cache_stats["entries"] == 3
+        db_manager.close()
+
+    def test_incremental_reload_keeps_unchanged_chunks(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+        mock_connection_graph,
+    ):
+        """Test only changed chunks are re-encoded and vanished ones deleted."""
+
+        def chunk(memory_id: str, header: str, content: str) -> CognitiveMemory:
+            return CognitiveMemory(
+                id=memory_id,
+                content=content,
+                hierarchy_level=1,
+                metadata={"source_path": "doc.md", "hierarchical_path": [header]},
+            )
+
+        mock_memory_storage.get_memories_by_source_path.return_value = [
+            chunk("kept", "Intro", "Unchanged intro"),
+            chunk("stale", "Usage", "Old usage text"),
+            chunk("gone", "Removed", "Removed section"),
+        ]
+        mock_memory_storage.delete_memories_by_ids.return_value = 2
+        mock_vector_storage.delete_vectors_by_ids.side_effect = (
+            lambda memory_ids, hierarchy_levels=None: list(memory_ids)
+        )
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 512)
+        )
+
+        loader = Mock(spec=MarkdownMemoryLoader)
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = [
+            chunk("new-1", "Intro", "Unchanged intro"),
+            chunk("new-2", "Usage", "New usage text"),
+        ]
+        loader.extract_connections.return_value = [
+            ("kept", "new-2", 0.8, "sequential"),
+        ]
+
+        results = cognitive_system.incremental_reload_memories_from_source(
+            loader, "doc.md"
+        )
+
+        assert results["success"]
+        assert results["memories_unchanged"] == 1
+        assert results["memories_loaded"] == 1
+        assert results["deleted_count"] == 2
+        assert results["connections_created"] == 1
+
+        encoded_texts = mock_embedding_provider.encode_batch.call_args[0][0]
+        assert encoded_texts == ["New usage text"]
+        mock_memory_storage.delete_memories_by_ids.assert_called_once_with(
+            ["stale", "gone"]
+        )
+        extracted = loader.extract_connections.call_args[0][0]
+        assert [memory.id for memory in extracted] == ["kept", "new-2"]
+        mock_connection_graph.add_connection.assert_called_once_with(
+            "kept", "new-2", 0.8, "sequential"
+        )
+
+    def test_incremental_reload_keeps_source_on_empty_parse(
+        self, cognitive_system, mock_memory_storage, mock_vector_storage
+    ):
+        """Test a parse without chunks does not wipe a stored source."""
+        mock_vector_storage.delete_vectors_by_ids.side_effect = (
+            lambda memory_ids, hierarchy_levels=None: list(memory_ids)
+        )
+        mock_memory_storage.get_memories_by_source_path.return_value = [
+            CognitiveMemory(id="kept", content="Stored chunk", hierarchy_level=1)
+        ]
+        loader = Mock(spec=MarkdownMemoryLoader)
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = []
+
+        results = cognitive_system.incremental_reload_memories_from_source(
+            loader, "doc.md"
+        )
+
+        assert not results["success"]
+        assert results["deleted_count"] == 0
+        mock_memory_storage.delete_memories_by_ids.assert_not_called()
+
+    def test_incremental_reload_keeps_source_on_store_failure(
+        self,
+        cognitive_system,
+        mock_memory_storage,
+        mock_vector_storage,
+        mock_embedding_provider,
+    ):
+        """Test replaced chunks are kept when their replacements fail to store."""
+        mock_vector_storage.delete_vectors_by_ids.side_effect = (
+            lambda memory_ids, hierarchy_levels=None: list(memory_ids)
+        )
+        mock_memory_storage.get_memories_by_source_path.return_value = [
+            CognitiveMemory(id="old", content="Old text", hierarchy_level=1)
+        ]
+        mock_memory_storage.store_memory.return_value = False
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 512)
+        )
+        loader = Mock(spec=MarkdownMemoryLoader)
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = [
+            CognitiveMemory(id="new", content="New text", hierarchy_level=1)
+        ]
+
+        results = cognitive_system.incremental_reload_memories_from_source(
+            loader, "doc.md"
+        )
+
+        assert not results["success"]
+        mock_memory_storage.delete_memories_by_ids.assert_not_called()
+
+    def test_incremental_reload_reloads_git_history_atomically(
+        self,
+        mock_embedding_provider,
+        mock_vector_storage,
+        mock_connection_graph,
+        mock_activation_engine,
+        mock_bridge_discovery,
+        test_config,
+        tmp_path,
+    ):
+        """Test reloading a git repository keeps every commit memory."""
+        from datetime import datetime
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        repo = Repo.init(str(repo_path))
+        author = Actor("Test User", "test@example.com")
+        for index in range(3):
+            test_file = repo_path / f"file_{index}.txt"
+            test_file.write_text(f"Content {index}")
+            repo.index.add([str(test_file)])
+            repo.index.commit(f"Commit {index}", author=author, committer=author)
+
+        memory_storage = MemoryMetadataStore(
+            DatabaseManager(str(tmp_path / "memories.db"))
+        )
+        system = CognitiveMemorySystem(
+            embedding_provider=mock_embedding_provider,
+            vector_storage=mock_vector_storage,
+            memory_storage=memory_storage,
+            connection_graph=mock_connection_graph,
+            activation_engine=mock_activation_engine,
+            bridge_discovery=mock_bridge_discovery,
+            config=test_config,
+        )
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 512)
+        )
+        loader = GitHistoryLoader(test_config.cognitive, system)
+
+        def latest_processed(source_path: str) -> tuple[str, datetime] | None:
+            # Resume after the newest commit while any are stored
+            if memory_storage.get_memories_by_source_path(source_path):
+                return repo.head.commit.hexsha, datetime.now()
+            return None
+
+        with patch.object(
+            loader, "get_latest_processed_commit", side_effect=latest_processed
+        ):
+            for _ in range(2):
+                results = system.incremental_reload_memories_from_source(
+                    loader, str(repo_path)
+                )
+                assert results["success"]
+                stored = memory_storage.get_memories_by_source_path(str(repo_path))
+                assert len(stored) == 3
+
+        memory_storage.db_manager.close()
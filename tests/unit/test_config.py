@@ -242,6 +242,7 @@ class TestProjectConfigDetection:
                         "interval_seconds": 15.0,
                     },
                     "database": {"path": "./test.db"},
+                    "vector_storage": {"backend": "embedded", "ivf_probes": 8},
                 }
 
                 config_file = heimdall_dir / "config.yaml"
@@ -255,6 +256,8 @@ class TestProjectConfigDetection:
                 assert detected["MONITORING_TARGET_PATH"] == "./test-docs"
                 assert detected["MONITORING_INTERVAL_SECONDS"] == "15.0"
                 assert detected["SQLITE_PATH"] == "./test.db"
+                assert detected["VECTOR_BACKEND"] == "embedded"
+                assert detected["VECTOR_IVF_PROBES"] == "8"
 
             finally:
                 os.chdir(old_cwd)
@@ -0,0 +1,174 @@
+"""
+Unit tests for ConnectionExtractor's single-pass chunk analysis and
+associative candidate generation.
+
+Uses a blank spaCy pipeline with a few word vectors so the tests do not need
+a downloaded model.
+"""
+
+import numpy as np
+import pytest
+import spacy
+from spacy.language import Language
+
+from cognitive_memory.core.config import CognitiveConfig
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.loaders.markdown.candidate_generator import (
+    CandidatePairGenerator,
+)
+from cognitive_memory.loaders.markdown.connection_extractor import (
+    ConnectionExtractor,
+)
+
+
+@Language.component("test_lowercase_lemmas")
+def _lowercase_lemmas(doc):
+    """Use lower-cased text as lemma so lexical overlap is meaningful."""
+    for token in doc:
+        token.lemma_ = token.lower_
+    return doc
+
+
+class CountingNLP:
+    """Wrap a spaCy pipeline and count how many texts it parses."""
+
+    def __init__(self, nlp: Language):
+        self.nlp = nlp
+        self.parsed = 0
+
+    def __call__(self, text: str):
+        self.parsed += 1
+        return self.nlp(text)
+
+    def pipe(self, texts):
+        for doc in self.nlp.pipe(texts):
+            self.parsed += 1
+            yield doc
+
+
+@pytest.fixture
+def nlp() -> CountingNLP:
+    """Create a blank English pipeline with small word vectors."""
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("test_lowercase_lemmas")
+    rng = np.random.default_rng(0)
+    for word in ["install", "configure", "server", "database", "run", "tests"]:
+        pipeline.vocab.set_vector(word, rng.normal(size=8).astype(np.float32))
+    return CountingNLP(pipeline)
+
+
+@pytest.fixture
+def memories() -> list[CognitiveMemory]:
+    """Create chunks of one document with links and title mentions."""
+    chunks = [
+        ("Setup", 1, "Setup guide. Install the server and configure the database."),
+        ("Step 1 install", 2, "Install the server. See [Configure](#configure)."),
+        ("Step 2 configure", 2, "Configure the database for the server."),
+        ("Testing", 2, "Run tests against the database after Setup."),
+        ("Notes", 3, "Unrelated remarks without vectors."),
+    ]
+    return [
+        CognitiveMemory(
+            id=f"m{i}",
+            content=content,
+            hierarchy_level=1,
+            metadata={
+                "title": title,
+                "header_level": level,
+                "source_path": "/docs/setup.md",
+            },
+        )
+        for i, (title, level, content) in enumerate(chunks)
+    ]
+
+
+class TestChunkAnalysis:
+    """Test the cached analysis matches per-pair scoring."""
+
+    def test_relevance_matrix_matches_pairwise_scores(self, nlp, memories) -> None:
+        """Test cached relevance equals the uncached per-pair computation."""
+        extractor = ConnectionExtractor(CognitiveConfig(), nlp)
+
+        analysis = extractor.analyze_memories(memories)
+        assert nlp.parsed == len(memories)
+
+        for i, memory1 in enumerate(memories):
+            for j, memory2 in enumerate(memories):
+                if i == j:
+                    continue
+                expected = extractor.calculate_relevance_score(memory1, memory2)
+                assert analysis.relevance[i, j] == pytest.approx(expected, abs=1e-5)
+
+    def test_pair_scores_match_relevance_matrix(self, nlp, memories) -> None:
+        """Test per-pair scoring of large loads agrees with the full matrix."""
+        extractor = ConnectionExtractor(CognitiveConfig(), nlp)
+        analysis = extractor.analyze_memories(memories)
+
+        large = ConnectionExtractor(
+            CognitiveConfig(connection_exact_pair_limit=0), nlp
+        ).analyze_memories(memories)
+        assert large.relevance is None
+
+        rows, columns = np.nonzero(~np.eye(len(memories), dtype=bool))
+        scores = extractor.score_pairs(large, rows, columns)
+        np.testing.assert_allclose(scores, analysis.relevance[rows, columns], atol=1e-5)
+
+    def test_extract_connections_parses_each_chunk_once(self, nlp, memories) -> None:
+        """Test extraction parses linearly and scores from the cache."""
+        config = CognitiveConfig(strength_floor=0.05)
+        extractor = ConnectionExtractor(config, nlp)
+
+        connections = extractor.extract_connections(memories)
+
+        assert nlp.parsed == len(memories)
+        assert connections
+        assert {conn[3] for conn in connections} >= {"hierarchical", "associative"}
+        assert all(conn[2] >= config.strength_floor for conn in connections)
+
+    def test_large_load_scores_only_candidates(self, nlp, memories) -> None:
+        """Test loads above the exact limit keep the strong associative pairs."""
+        config = CognitiveConfig(strength_floor=0.05)
+        exact = ConnectionExtractor(config, nlp).extract_connections(memories)
+
+        candidates_config = CognitiveConfig(
+            strength_floor=0.05,
+            connection_exact_pair_limit=0,
+            connection_candidate_neighbors=2,
+        )
+        approximate = ConnectionExtractor(candidates_config, nlp).extract_connections(
+            memories
+        )
+
+        exact_pairs = {(c[0], c[1], c[3]) for c in exact}
+        approximate_pairs = {(c[0], c[1], c[3]) for c in approximate}
+        assert approximate_pairs <= exact_pairs
+        assert {c[3] for c in approximate} >= {"hierarchical", "associative"}
+
+
+class TestCandidatePairGenerator:
+    """Test nearest-neighbour and MinHash candidate generation."""
+
+    def test_finds_near_duplicates_with_bounded_candidates(self) -> None:
+        """Test similar chunks are paired while candidates grow with n * M."""
+        rng = np.random.default_rng(1)
+        n, neighbors = 400, 5
+        vectors = rng.normal(size=(n, 16)).astype(np.float32)
+        vectors[1] = vectors[0] + 0.01
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        vocabulary = [f"word{k}" for k in range(5000)]
+        lemmas = [
+            frozenset(rng.choice(vocabulary, size=30, replace=False)) for _ in range(n)
+        ]
+        # Chunks 10 and 20 share almost all of their lemmas
+        lemmas[20] = frozenset(list(lemmas[10])[:29] + ["extra"])
+
+        generator = CandidatePairGenerator(neighbors=neighbors, block_size=64)
+        rows, columns = generator.generate(vectors, lemmas)
+        pairs = set(zip(rows.tolist(), columns.tolist(), strict=True))
+
+        assert (0, 1) in pairs
+        assert (10, 20) in pairs
+        assert np.all(rows < columns)
+        assert len(pairs) <= n * neighbors + n
+        assert len(pairs) < n * (n - 1) // 2 // 10
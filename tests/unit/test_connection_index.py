@@ -0,0 +1,79 @@
+"""
+Unit tests for ConnectionAdjacencyIndex.
+
+Tests the resident CSR adjacency used to expand spreading-activation
+frontiers without querying memory_connections per node.
+"""
+
+from cognitive_memory.storage.connection_index import ConnectionAdjacencyIndex
+
+
+def neighbour_ids(index, memory_id, min_strength=0.0):
+    """Neighbour IDs of a single memory, strongest first."""
+    [(_, neighbours)] = index.expand([memory_id], min_strength)
+    return [neighbour_id for neighbour_id, _ in neighbours]
+
+
+class TestConnectionAdjacencyIndex:
+    """Test ConnectionAdjacencyIndex functionality."""
+
+    def test_load_and_expand(self) -> None:
+        """Test connections are undirected and sorted strongest first."""
+        index = ConnectionAdjacencyIndex()
+        assert not index.is_loaded
+
+        index.load(
+            [("a", "b", 0.6), ("c", "a", 0.9), ("a", "d", 0.3), ("b", "c", 0.5)],
+            generation=4,
+        )
+
+        assert index.is_loaded
+        assert index.generation == 4
+        assert len(index) == 4
+
+        assert neighbour_ids(index, "a") == ["c", "b", "d"]
+        assert neighbour_ids(index, "a", min_strength=0.5) == ["c", "b"]
+        assert neighbour_ids(index, "c") == ["a", "b"]
+
+        expansion = index.expand(["b", "missing"], min_strength=0.6)
+        assert expansion == [("b", [("a", 0.6)]), ("missing", [])]
+
+    def test_parallel_connections_collapse(self) -> None:
+        """Test connections of several types keep the strongest strength."""
+        index = ConnectionAdjacencyIndex()
+        index.load(
+            [("a", "b", 0.4), ("b", "a", 0.8), ("a", "b", 0.6), ("a", "a", 1.0)],
+            generation=1,
+        )
+
+        assert index.expand(["a"]) == [("a", [("b", 0.8)])]
+        assert index.get_stats()["edges"] == 1
+
+    def test_set_connection_patches_and_compacts(self) -> None:
+        """Test patches are visible immediately and survive compaction."""
+        index = ConnectionAdjacencyIndex()
+        index.load([("a", "b", 0.5), ("b", "c", 0.7)], generation=1)
+
+        index.set_connection("a", "new", 0.9)
+        index.set_connection("b", "c", 0.2)
+        index.set_connection("a", "b", None)
+        index.set_connection("x", "y", None)
+
+        assert neighbour_ids(index, "a") == ["new"]
+        assert neighbour_ids(index, "new") == ["a"]
+        assert neighbour_ids(index, "b", min_strength=0.5) == []
+        assert "x" not in index
+
+        index._compact()
+
+        assert index.get_stats()["patched_nodes"] == 0
+        assert neighbour_ids(index, "a") == ["new"]
+        assert index.expand(["c"]) == [("c", [("b", 0.2)])]
+
+    def test_invalidate(self) -> None:
+        """Test invalidation marks the index for reload."""
+        index = ConnectionAdjacencyIndex()
+        index.load([("a", "b", 0.5)], generation=2)
+        index.invalidate()
+
+        assert not index.is_loaded
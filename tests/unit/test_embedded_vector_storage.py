@@ -0,0 +1,204 @@
+"""
+Unit tests for the embedded NumPy vector storage backend.
+
+Tests that exact search matches a brute-force ranking across levels and
+splits k evenly between them by default, that re-stored and deleted vectors
+are tombstoned and compacted away, that a store survives reopening and sees
+writes of other instances, and that IVF search finds the same nearest
+neighbours as exact search.
+"""
+
+import numpy as np
+import pytest
+
+from cognitive_memory.core.interfaces import VectorStorage
+from cognitive_memory.storage.embedded_vector_storage import EmbeddedVectorStorage
+
+PROJECT_ID = "project_abc12345"
+DIMENSION = 16
+
+
+def _vectors(count: int, seed: int = 0) -> np.ndarray:
+    """Create random unit vectors."""
+    vectors = np.random.default_rng(seed).normal(size=(count, DIMENSION))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _payload(index: int, level: int) -> dict:
+    """Create a payload shaped like the cognitive system's."""
+    return {
+        "memory_id": f"m{index}",
+        "content": f"memory {index}",
+        "memory_type": "episodic",
+        "hierarchy_level": level,
+        "source_path": f"docs/file_{index % 4}.md",
+    }
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create an exact-search store with 300 vectors spread over the levels."""
+    store = EmbeddedVectorStorage(DIMENSION, PROJECT_ID, tmp_path, search_mode="exact")
+    vectors = _vectors(300)
+    stored = store.store_vectors_batch(
+        [(f"m{i}", vectors[i], _payload(i, i % 3)) for i in range(300)]
+    )
+    assert len(stored) == 300
+
+    yield store, vectors
+
+    store.close()
+
+
+class TestEmbeddedVectorStorage:
+    """Test EmbeddedVectorStorage functionality."""
+
+    def test_implements_interface(self, storage) -> None:
+        """Test the store can stand in for Qdrant storage."""
+        store, _ = storage
+        assert isinstance(store, VectorStorage)
+
+    def test_search_matches_brute_force(self, storage) -> None:
+        """Test cross-level search returns the exact cosine top-k."""
+        store, vectors = storage
+        query = _vectors(1, seed=7)[0]
+
+        results = store.search_cross_level(
+            query, k=10, k_per_level={0: 10, 1: 10, 2: 10}
+        )
+
+        expected = np.argsort(-(vectors @ query))[:10]
+        assert [r.memory.id for r in results] == [f"m{i}" for i in expected]
+        assert [r.similarity_score for r in results] == pytest.approx(
+            (vectors @ query)[expected], abs=1e-5
+        )
+        assert results[0].memory.hierarchy_level == expected[0] % 3
+        assert results[0].metadata["collection"].startswith(PROJECT_ID)
+
+    def test_search_similar_distributes_k(self, storage) -> None:
+        """Test search_similar asks each level for k // 3 results."""
+        store, vectors = storage
+        query = _vectors(1, seed=7)[0]
+
+        results = store.search_similar(query, k=9)
+
+        scores = vectors @ query
+        expected = [
+            index
+            for level in range(3)
+            for index in np.argsort(-scores[level::3])[:3] * 3 + level
+        ]
+        expected.sort(key=lambda index: -scores[index])
+        assert [r.memory.id for r in results] == [f"m{i}" for i in expected]
+        assert [r.memory.hierarchy_level for r in results].count(0) == 3
+
+    def test_filters_and_thresholds(self, storage) -> None:
+        """Test payload filters and per-level score thresholds."""
+        store, vectors = storage
+
+        filtered = store.search_by_level(
+            vectors[3], 0, k=5, filters={"source_path": "docs/file_3.md"}
+        )
+        assert filtered[0].memory.id == "m3"
+        assert all(int(r.memory.id[1:]) % 12 == 3 for r in filtered)
+
+        thresholded = store.search_cross_level(
+            vectors[4], k=10, score_thresholds={0: 2.0, 1: 0.999, 2: 2.0}
+        )
+        assert [r.memory.id for r in thresholded] == ["m4"]
+
+    def test_restore_moves_vector_between_levels(self, storage) -> None:
+        """Test storing an existing ID replaces its vector and level."""
+        store, vectors = storage
+
+        store.store_vector("m0", vectors[1], _payload(0, 2))
+
+        assert store.search_by_level(vectors[1], 2, k=1)[0].memory.id == "m0"
+        assert store.search_by_level(vectors[0], 0, k=1)[0].memory.id != "m0"
+        stats = store.get_storage_stats()
+        assert stats["level_0"]["tombstoned_rows"] == 1
+        assert stats["level_2"]["vectors_count"] == 101
+
+    def test_delete_and_compaction(self, storage) -> None:
+        """Test deleted vectors disappear and compaction keeps the rest."""
+        store, vectors = storage
+
+        assert store.delete_vectors_by_source_path("docs/file_1.md")
+        assert store.delete_vector("m0")
+        deleted = {i for i in range(300) if i % 4 == 1} | {0}
+        assert not deleted & {
+            int(r.memory.id[1:]) for r in store.search_similar(vectors[1], k=300)
+        }
+
+        assert store.optimize_collections()
+
+        stats = store.get_storage_stats()
+        assert sum(stats[f"level_{i}"]["vectors_count"] for i in range(3)) == 224
+        assert all(stats[f"level_{i}"]["tombstoned_rows"] == 0 for i in range(3))
+        for index in (2, 3, 299):
+            assert store.search_similar(vectors[index], k=1)[0].memory.id == (
+                f"m{index}"
+            )
+
+    def test_reopen_and_shared_writes(self, storage, tmp_path) -> None:
+        """Test a second instance sees stored, new and deleted vectors."""
+        store, vectors = storage
+        other = EmbeddedVectorStorage(
+            DIMENSION, PROJECT_ID, tmp_path, search_mode="exact"
+        )
+        try:
+            assert other.search_similar(vectors[42], k=1)[0].memory.id == "m42"
+
+            store.store_vector("m1000", vectors[42], _payload(1000, 1))
+            store.delete_vector("m42")
+            store.optimize_collections()
+
+            results = other.search_similar(vectors[42], k=2)
+            assert results[0].memory.id == "m1000"
+            assert results[1].memory.id != "m42"
+        finally:
+            other.close()
+
+    def test_rejects_dimension_mismatch(self, storage, tmp_path) -> None:
+        """Test vectors and stores of the wrong dimension are rejected."""
+        store, _ = storage
+
+        with pytest.raises(ValueError):
+            store.store_vector("bad", np.ones(DIMENSION + 1), {"hierarchy_level": 0})
+        with pytest.raises(ValueError):
+            EmbeddedVectorStorage(DIMENSION * 2, PROJECT_ID, tmp_path)
+
+
+class TestIVFSearch:
+    """Test inverted file search."""
+
+    def test_ivf_finds_exact_neighbours(self, tmp_path) -> None:
+        """Test IVF search returns each stored vector as its own neighbour."""
+        centers = _vectors(20, seed=1)
+        noise = np.random.default_rng(2).normal(scale=0.05, size=(4000, DIMENSION))
+        vectors = (centers[np.arange(4000) % 20] + noise).astype(np.float32)
+        store = EmbeddedVectorStorage(
+            DIMENSION, PROJECT_ID, tmp_path, search_mode="ivf"
+        )
+        try:
+            store.store_vectors_batch(
+                [(f"m{i}", vectors[i], {"hierarchy_level": 0}) for i in range(4000)]
+            )
+
+            hits = [
+                store.search_by_level(vectors[i], 0, k=1)[0].memory.id == f"m{i}"
+                for i in range(0, 4000, 40)
+            ]
+
+            assert all(hits)
+            assert store.get_storage_stats()["level_0"]["index"] == "ivf"
+        finally:
+            store.close()
+
+        reopened = EmbeddedVectorStorage(
+            DIMENSION, PROJECT_ID, tmp_path, search_mode="ivf"
+        )
+        try:
+            assert reopened.search_by_level(vectors[7], 0, k=1)[0].memory.id == "m7"
+        finally:
+            reopened.close()
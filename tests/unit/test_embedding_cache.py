@@ -0,0 +1,126 @@
+"""
+Unit tests for the persistent embedding cache.
+
+Tests content-addressed lookups, model isolation, write-behind hit recording,
+LRU eviction by byte size, persistence across cache instances, and hit-rate
+reporting.
+"""
+
+import numpy as np
+import pytest
+
+from cognitive_memory.storage.embedding_cache import EmbeddingCache
+from cognitive_memory.storage.sqlite_persistence import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a migrated database in a temporary directory."""
+    manager = DatabaseManager(str(tmp_path / "cache.db"))
+    yield manager
+    manager.close()
+
+
+def vector(value: float, dimension: int = 8) -> np.ndarray:
+    """Create a constant float32 vector."""
+    return np.full(dimension, value, dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache functionality."""
+
+    def test_round_trip_and_hit_rate(self, db_manager):
+        """Test stored embeddings are returned for the exact same text."""
+        cache = EmbeddingCache(db_manager)
+        cache.put_many("model-a", ["alpha", "beta"], [vector(1.0), vector(2.0)])
+
+        results = cache.get_many("model-a", ["alpha", "gamma", "beta", "alpha "])
+
+        np.testing.assert_array_equal(results[0], vector(1.0))
+        assert results[1] is None
+        np.testing.assert_array_equal(results[2], vector(2.0))
+        # Keys are the exact encoded text, whitespace included
+        assert results[3] is None
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 0.5
+
+    def test_models_are_isolated(self, db_manager):
+        """Test one model never serves another model's embeddings."""
+        cache = EmbeddingCache(db_manager)
+        cache.put_many("model-a", ["alpha"], [vector(1.0)])
+
+        assert cache.get_many("model-b", ["alpha"]) == [None]
+
+    def test_persists_across_instances(self, db_manager):
+        """Test a new cache instance sees previously stored embeddings."""
+        EmbeddingCache(db_manager).put_many("model-a", ["alpha"], [vector(3.0)])
+
+        result = EmbeddingCache(db_manager).get_many("model-a", ["alpha"])[0]
+
+        np.testing.assert_array_equal(result, vector(3.0))
+
+    def test_failed_encodings_are_not_cached(self, db_manager):
+        """Test zero and non-finite fallback vectors are skipped."""
+        cache = EmbeddingCache(db_manager)
+        cache.put_many("model-a", ["zero", "nan"], [vector(0.0), vector(float("nan"))])
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_timestamps_share_julian_day_unit(self, db_manager):
+        """Test last use is recorded in the same unit as creation time."""
+        cache = EmbeddingCache(db_manager)
+        cache.put_many("model-a", ["a"], np.stack([vector(1.0)]))
+        cache.get_many("model-a", ["a"])
+        db_manager.stats_buffer.flush()
+
+        with db_manager.get_connection() as conn:
+            created_at, last_used_at = conn.execute(
+                "SELECT created_at, last_used_at FROM embedding_cache"
+            ).fetchone()
+        assert last_used_at == pytest.approx(created_at, abs=1.0 / 24)
+
+    def test_hits_are_written_behind(self, tmp_path):
+        """Test lookups record hits through the statistics buffer."""
+        db_manager = DatabaseManager(
+            str(tmp_path / "buffered.db"), stats_flush_interval=60.0
+        )
+        cache = EmbeddingCache(db_manager)
+        cache.put_many("model-a", ["a"], [vector(1.0)])
+
+        def read_hit_count() -> int:
+            with db_manager.get_connection() as conn:
+                row = conn.execute("SELECT hit_count FROM embedding_cache").fetchone()
+            return int(row[0])
+
+        cache.get_many("model-a", ["a"])
+        cache.get_many("model-a", ["a", "a"])
+
+        assert read_hit_count() == 0
+        db_manager.stats_buffer.flush()
+        assert read_hit_count() == 2
+        db_manager.close()
+
+    def test_evicts_least_recently_used(self, db_manager):
+        """Test eviction removes the least recently used entries first."""
+        # Each 8-dimension entry is a 12-byte header plus 32 bytes of floats
+        cache = EmbeddingCache(db_manager, max_bytes=44 * 4 - 1)
+        for text in ["a", "b", "c"]:
+            cache.put_many("model-a", [text], [vector(1.0)])
+        cache.get_many("model-a", ["a"])  # refresh "a"
+
+        cache.put_many("model-a", ["d"], [vector(2.0)])
+
+        results = cache.get_many("model-a", ["a", "b", "c", "d"])
+        assert [result is not None for result in results] == [
+            True,
+            False,
+            True,
+            True,
+        ]
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= cache.max_bytes
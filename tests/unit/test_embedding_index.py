@@ -0,0 +1,95 @@
+"""
+Unit tests for LevelEmbeddingIndex.
+
+Tests the resident, pre-normalized embedding matrix used to select
+activation starting points without reloading every memory row.
+"""
+
+import numpy as np
+
+from cognitive_memory.storage.embedding_index import LevelEmbeddingIndex
+
+
+class TestLevelEmbeddingIndex:
+    """Test LevelEmbeddingIndex functionality."""
+
+    def test_load_and_search(self) -> None:
+        """Test loading a snapshot and searching by cosine similarity."""
+        index = LevelEmbeddingIndex(level=0)
+        assert not index.is_loaded
+
+        index.load(
+            [
+                ("a", np.array([1.0, 0.0])),
+                ("b", np.array([0.0, 3.0])),
+                ("c", np.array([1.0, 1.0])),
+            ],
+            generation=7,
+        )
+
+        assert index.is_loaded
+        assert index.generation == 7
+        assert len(index) == 3
+
+        matches = index.search(np.array([2.0, 0.0]), threshold=0.5)
+        assert [memory_id for memory_id, _ in matches] == ["a", "c"]
+        assert matches[0][1] == np.float32(1.0)
+
+    def test_search_top_k_and_clamping(self) -> None:
+        """Test top-k selection and clamping of negative similarities."""
+        index = LevelEmbeddingIndex(level=0, initial_capacity=1)
+        for i in range(10):
+            angle = i * np.pi / 9
+            index.upsert(f"m{i}", np.array([np.cos(angle), np.sin(angle)]))
+
+        matches = index.search(np.array([1.0, 0.0]), threshold=0.0, k=3)
+        assert [memory_id for memory_id, _ in matches] == ["m0", "m1", "m2"]
+
+        all_matches = index.search(np.array([1.0, 0.0]), threshold=0.0)
+        assert all(0.0 <= similarity <= 1.0 for _, similarity in all_matches)
+
+    def test_remove_keeps_rows_consistent(self) -> None:
+        """Test that swap-removal keeps ids and rows aligned."""
+        index = LevelEmbeddingIndex(level=0)
+        index.upsert("a", np.array([1.0, 0.0, 0.0]))
+        index.upsert("b", np.array([0.0, 1.0, 0.0]))
+        index.upsert("c", np.array([0.0, 0.0, 1.0]))
+
+        assert index.remove(["a", "missing"]) == 1
+        assert "a" not in index
+        assert len(index) == 2
+
+        matches = index.search(np.array([0.0, 0.0, 1.0]), threshold=0.9)
+        assert matches == [("c", 1.0)]
+
+    def test_dimension_mismatch(self) -> None:
+        """Test that mismatched vectors and queries are rejected."""
+        index = LevelEmbeddingIndex(level=0)
+        assert index.upsert("a", np.array([1.0, 0.0]))
+        assert not index.upsert("b", np.array([1.0, 0.0, 0.0]))
+        assert "b" not in index
+
+        assert index.search(np.array([1.0, 0.0, 0.0]), threshold=0.0) == []
+
+    def test_invalidate(self) -> None:
+        """Test invalidation marks the index for reload."""
+        index = LevelEmbeddingIndex(level=1)
+        index.load([("a", np.array([1.0]))], generation=1)
+        index.invalidate()
+
+        assert not index.is_loaded
+        assert index.get_stats()["size"] == 1
+
+    def test_similarities_matrix(self) -> None:
+        """Test bulk similarities against several queries."""
+        index = LevelEmbeddingIndex(level=2)
+        index.upsert("a", np.array([1.0, 0.0]))
+        index.upsert("b", np.array([0.0, 2.0]))
+
+        ids, similarities = index.similarities(
+            np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+        )
+
+        assert ids == ["a", "b"]
+        np.testing.assert_allclose(similarities, [[1, 0, 0], [0, 1, 0]])
+        assert index.similarities(np.array([1.0, 0.0, 0.0])) is None
@@ -285,3 +285,23 @@ class TestCognitiveDimensionExtractor:
             # At least some dimensions should be activated
             total_activation = sum(np.sum(tensor) for tensor in dims.values())
             assert total_activation > 0.1
+
+    def test_extract_batch_matches_single_extraction(self) -> None:
+        """Test batch extraction stacks the same dimensions as single calls."""
+        texts = [
+            "I'm debugging a critical API issue before tomorrow's deployment",
+            "",
+            "Can you please help our team finish the report within 2 days?",
+        ]
+
+        batch = self.extractor.extract_batch(texts)
+
+        for category, dimensions in batch.items():
+            assert dimensions.shape[0] == len(texts)
+            for row, text in zip(dimensions, texts, strict=True):
+                expected = self.extractor.extract_dimensions(text)[category]
+                np.testing.assert_array_equal(row, expected)
+
+        empty = self.extractor.extract_batch([])
+        assert empty["emotional"].shape == (0, self.config.emotional_dimensions)
+        assert empty["social"].shape == (0, self.config.social_dimensions)
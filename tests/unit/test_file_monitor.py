@@ -5,6 +5,8 @@ Tests the FileMonitor, FileChangeEvent, and related components
 for automatic file change detection.
 """
 
+import os
+import shutil
 import tempfile
 import time
 from pathlib import Path
@@ -17,6 +19,7 @@ from heimdall.monitoring.file_types import (
     FileChangeEvent,
     FileMonitor,
     FileState,
+    InotifyWatcher,
 )
 
 
@@ -434,3 +437,153 @@ def tmp_path():
     """Create temporary directory for testing."""
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
+
+
+class TestDirectoryScanCache:
+    """Test the polling scanner only re-lists changed directories."""
+
+    def _build_tree(self, root: Path) -> None:
+        """Create a small docs tree with an ignored subtree."""
+        for name in ["a", "b", "c"]:
+            directory = root / name
+            directory.mkdir()
+            (directory / f"{name}.md").write_text(name)
+            (directory / "notes.txt").write_text(name)
+        (root / "node_modules" / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "pkg" / "README.md").write_text("ignored")
+
+    def _age_cache(self, monitor: FileMonitor) -> None:
+        """Mark cached listings as settled so they are reused."""
+        for listing in monitor.directory_cache.values():
+            listing.racy = False
+
+    def test_unchanged_directories_are_not_relisted(self, tmp_path):
+        """Test a second scan only lists directories whose mtime changed."""
+        self._build_tree(tmp_path)
+        monitor = FileMonitor(ignore_patterns={"node_modules"})
+        monitor.add_path(tmp_path)
+
+        files = monitor.get_monitored_files()
+        assert {f.name for f in files} == {"a.md", "b.md", "c.md"}
+        assert monitor.last_scan_stats["directories_listed"] == 4
+        # Ignored subtrees are pruned before descending
+        assert tmp_path / "node_modules" not in monitor.directory_cache
+
+        self._age_cache(monitor)
+        with patch("heimdall.monitoring.file_types.os.scandir") as scandir:
+            assert monitor.get_monitored_files() == files
+        scandir.assert_not_called()
+
+        (tmp_path / "b" / "new.md").write_text("new")
+        os.utime(tmp_path / "b", ns=(0, 10**9))
+        files = monitor.get_monitored_files()
+
+        assert tmp_path / "b" / "new.md" in files
+        assert monitor.last_scan_stats["directories_listed"] == 1
+
+    def test_removed_directories_are_forgotten(self, tmp_path):
+        """Test deleted subtrees drop out of the cache and the file set."""
+        self._build_tree(tmp_path)
+        monitor = FileMonitor(ignore_patterns={"node_modules"})
+        monitor.add_path(tmp_path)
+        monitor.get_monitored_files()
+
+        shutil.rmtree(tmp_path / "c")
+        files = monitor.get_monitored_files()
+
+        assert {f.name for f in files} == {"a.md", "b.md"}
+        assert tmp_path / "c" not in monitor.directory_cache
+
+
+def _wait_for(condition, timeout: float = 3.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.mark.skipif(
+    not InotifyWatcher.is_supported(), reason="inotify is only available on Linux"
+)
+class TestInotifyBackend:
+    """Test the event-driven inotify backend and its polling fallback."""
+
+    def _start(self, tmp_path, **kwargs):
+        """Start a monitor on tmp_path that records every event."""
+        monitor = FileMonitor(polling_interval=60.0, **kwargs)
+        events = []
+        for change_type in ChangeType:
+            monitor.register_callback(change_type, events.append)
+        monitor.add_path(tmp_path)
+        monitor.start_monitoring()
+        return monitor, events
+
+    def test_events_without_polling(self, tmp_path):
+        """Test changes in new subdirectories are seen long before a poll."""
+        monitor, events = self._start(tmp_path)
+        try:
+            assert _wait_for(lambda: monitor.active_backend == "inotify")
+
+            nested = tmp_path / "guides" / "deep"
+            nested.mkdir(parents=True)
+            test_file = nested / "setup.md"
+            test_file.write_text("original")
+            assert _wait_for(lambda: len(events) == 1)
+
+            test_file.write_text("modified content")
+            assert _wait_for(lambda: len(events) == 2)
+
+            test_file.unlink()
+            assert _wait_for(lambda: len(events) == 3)
+
+            (tmp_path / "notes.txt").write_text("ignored")
+            ignored = tmp_path / ".git"
+            ignored.mkdir()
+            (ignored / "HEAD.md").write_text("ignored")
+        finally:
+            monitor.stop_monitoring()
+
+        assert [event.change_type for event in events] == [
+            ChangeType.ADDED,
+            ChangeType.MODIFIED,
+            ChangeType.DELETED,
+        ]
+        assert all(event.path == test_file for event in events)
+        assert monitor.get_backend_status()["requested"] == "auto"
+
+    def test_overflow_rescans(self, tmp_path):
+        """Test a queue overflow recovers missed changes with a rescan."""
+        monitor = FileMonitor()
+        monitor.add_path(tmp_path)
+        events = []
+        monitor.register_callback(ChangeType.ADDED, events.append)
+
+        (tmp_path / "missed.md").write_text("content")
+        monitor._handle_inotify_events([(None, InotifyWatcher.IN_Q_OVERFLOW)])
+
+        assert [event.path.name for event in events] == ["missed.md"]
+        assert monitor.inotify_overflows == 1
+
+    def test_falls_back_to_polling(self, tmp_path):
+        """Test inotify set-up errors fall back to the polling scanner."""
+        with patch(
+            "heimdall.monitoring.file_types.InotifyWatcher.__init__",
+            side_effect=OSError(28, "No space left on device"),
+        ):
+            monitor, _events = self._start(tmp_path)
+            try:
+                assert _wait_for(lambda: monitor.active_backend == "polling")
+            finally:
+                monitor.stop_monitoring()
+
+    def test_polling_backend_requested(self, tmp_path):
+        """Test the polling backend can be forced."""
+        monitor, _events = self._start(tmp_path, backend="polling")
+        try:
+            assert _wait_for(lambda: monitor.active_backend == "polling")
+            assert monitor.inotify is None
+        finally:
+            monitor.stop_monitoring()
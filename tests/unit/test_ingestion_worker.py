@@ -0,0 +1,191 @@
+"""
+Unit tests for the persistent ingestion worker.
+
+Tests the worker's JSON-lines protocol and the lightweight monitor's client,
+which restarts the worker after crashes and timeouts.
+"""
+
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from heimdall.monitoring.ingestion_worker import IngestionWorker
+from lightweight_monitor import (
+    ChangeType,
+    FileChangeEvent,
+    IngestionWorkerClient,
+    IngestionWorkerError,
+    LightweightMonitor,
+)
+
+# Minimal stand-in worker speaking the same protocol without the ML stack
+FAKE_WORKER = """
+import json, os, sys, time
+print(json.dumps({"ready": True, "pid": os.getpid()}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["op"] == "shutdown":
+        break
+    if request["op"] == "batch":
+        results = [
+            {"success": not item["path"].endswith("bad.md"), "permanent": True}
+            for item in request["items"]
+        ]
+        response = {"id": request["id"], "success": True, "results": results}
+        print(json.dumps(response), flush=True)
+        continue
+    if request["path"].endswith("crash.md"):
+        sys.exit(1)
+    if request["path"].endswith("hang.md"):
+        time.sleep(30)
+    print(json.dumps({"id": request["id"], "success": True, "result": {}}), flush=True)
+"""
+
+
+class TestIngestionWorker:
+    """Test request handling inside the worker process."""
+
+    @pytest.fixture
+    def operations(self):
+        """Create mocked cognitive operations."""
+        operations = Mock()
+        operations.load_memories.return_value = {
+            "success": True,
+            "memories_loaded": 3,
+            "files_processed": ["a.md"],
+            "error": None,
+        }
+        operations.delete_memories_by_source_path.return_value = {
+            "success": True,
+            "deleted_count": 2,
+            "error": None,
+        }
+        return operations
+
+    def test_serve_round_trip(self, operations, tmp_path):
+        """Test the worker answers each request on its own line."""
+        doc = tmp_path / "a.md"
+        doc.write_text("# A")
+        requests = [
+            {"id": 1, "op": "load", "path": str(doc)},
+            {"id": 2, "op": "remove", "path": str(doc)},
+            {"id": 3, "op": "shutdown"},
+            {"id": 4, "op": "load", "path": str(doc)},
+        ]
+        output = io.StringIO()
+
+        IngestionWorker(operations).serve(
+            io.StringIO("\n".join(json.dumps(r) for r in requests) + "\n"), output
+        )
+
+        messages = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert messages[0]["ready"] is True
+        assert messages[1]["id"] == 1 and messages[1]["success"]
+        assert messages[1]["result"] == {"memories_loaded": 3}
+        assert messages[2]["result"] == {"deleted_count": 2}
+        assert [m["id"] for m in messages[1:]] == [1, 2, 3]
+        operations.load_memories.assert_called_once_with(source_path=str(doc))
+
+    def test_missing_file_is_permanent_failure(self, operations, tmp_path):
+        """Test loading a vanished file is reported as not retryable."""
+        response = IngestionWorker(operations).handle(
+            {"id": 1, "op": "load", "path": str(tmp_path / "missing.md")}
+        )
+
+        assert not response["success"]
+        assert response["permanent"]
+        operations.load_memories.assert_not_called()
+
+
+class TestIngestionWorkerClient:
+    """Test the monitor-side client for the worker process."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create a client for the stand-in worker."""
+        client = IngestionWorkerClient(
+            tmp_path,
+            command=[sys.executable, "-c", FAKE_WORKER],
+            startup_timeout=10.0,
+        )
+        yield client
+        client.stop()
+
+    def test_request_reuses_warm_worker(self, client):
+        """Test consecutive requests are served by the same process."""
+        assert client.request("load", "a.md", timeout=5.0)["success"]
+        pid = client.pid
+        assert client.request("remove", "a.md", timeout=5.0)["success"]
+
+        assert client.pid == pid
+        assert client.restart_count == 0
+
+    def test_restart_after_crash(self, client):
+        """Test a crashed worker is reported and restarted on the next request."""
+        with pytest.raises(IngestionWorkerError):
+            client.request("load", "crash.md", timeout=5.0)
+
+        assert client.request("load", "a.md", timeout=5.0)["success"]
+        assert client.restart_count == 1
+
+    def test_timeout_kills_worker(self, client):
+        """Test a hung worker is killed when a request times out."""
+        start = time.time()
+        with pytest.raises(TimeoutError):
+            client.request("load", "hang.md", timeout=0.5)
+
+        assert time.time() - start < 5.0
+        assert not client.is_alive()
+
+    def test_monitor_falls_back_when_worker_cannot_start(self, tmp_path):
+        """Test the monitor switches to subprocess mode if the worker fails."""
+        monitor = LightweightMonitor(
+            project_root=tmp_path,
+            target_path=tmp_path,
+            lock_file=tmp_path / "monitor.lock",
+        )
+        monitor.ingestion_worker = IngestionWorkerClient(
+            tmp_path, command=[sys.executable, "-c", "raise SystemExit(1)"]
+        )
+        monitor._handle_file_change_subprocess = Mock(return_value=True)
+
+        event = FileChangeEvent(
+            path=Path(tmp_path / "a.md"),
+            change_type=ChangeType.MODIFIED,
+            timestamp=time.time(),
+        )
+
+        assert monitor._handle_file_change_worker(event)
+        monitor._handle_file_change_subprocess.assert_called_once_with(event)
+        assert monitor.ingestion_mode == "subprocess"
+        assert monitor.stats["worker_fallbacks"] == 1
+
+    def test_monitor_dispatches_batch_in_one_request(self, client, tmp_path):
+        """Test a batch of events is sent to the worker as one request."""
+        monitor = LightweightMonitor(
+            project_root=tmp_path,
+            target_path=tmp_path,
+            lock_file=tmp_path / "monitor.lock",
+        )
+        monitor.ingestion_worker = client
+        monitor._handle_file_change_subprocess = Mock(return_value=True)
+
+        events = [
+            FileChangeEvent(
+                path=tmp_path / name, change_type=change_type, timestamp=time.time()
+            )
+            for name, change_type in [
+                ("a.md", ChangeType.ADDED),
+                ("bad.md", ChangeType.MODIFIED),
+                ("c.md", ChangeType.DELETED),
+            ]
+        ]
+
+        assert monitor._handle_file_changes_worker(events) == [True, False, True]
+        assert monitor.stats["subprocess_calls"] == 1
+        monitor._handle_file_change_subprocess.assert_not_called()
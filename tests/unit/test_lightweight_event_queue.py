@@ -0,0 +1,136 @@
+"""
+Unit tests for the lightweight monitor's debouncing EventQueue.
+
+Tests per-path debouncing, collapse rules for bursts of changes, batch
+dispatch, and the queue-depth and coalescing statistics.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lightweight_monitor import (
+    ChangeType,
+    EventQueue,
+    FileChangeEvent,
+    coalesce_change_types,
+)
+
+
+def _event(name: str, change_type: ChangeType) -> FileChangeEvent:
+    """Create an event for a file under a fixed docs directory."""
+    return FileChangeEvent(
+        path=Path("/docs") / name, change_type=change_type, timestamp=time.time()
+    )
+
+
+class TestCoalesceChangeTypes:
+    """Test the collapse rules for consecutive changes to one path."""
+
+    @pytest.mark.parametrize(
+        "previous,current,expected",
+        [
+            (ChangeType.ADDED, ChangeType.MODIFIED, ChangeType.ADDED),
+            (ChangeType.ADDED, ChangeType.DELETED, None),
+            (ChangeType.MODIFIED, ChangeType.MODIFIED, ChangeType.MODIFIED),
+            (ChangeType.MODIFIED, ChangeType.DELETED, ChangeType.DELETED),
+            (ChangeType.DELETED, ChangeType.ADDED, ChangeType.MODIFIED),
+        ],
+    )
+    def test_rules(self, previous, current, expected) -> None:
+        """Test each burst collapses to its net effect."""
+        assert coalesce_change_types(previous, current) == expected
+
+
+class TestEventQueue:
+    """Test debouncing and batch dispatch."""
+
+    def test_burst_collapses_to_one_event(self) -> None:
+        """Test repeated changes to a path produce one dispatched event."""
+        events = EventQueue(debounce_seconds=0.0)
+        assert events.put(_event("a.md", ChangeType.ADDED))
+        assert not events.put(_event("a.md", ChangeType.MODIFIED))
+        assert not events.put(_event("a.md", ChangeType.MODIFIED))
+
+        batch = events.get_batch(10, timeout=0.1)
+
+        assert [e.change_type for e in batch] == [ChangeType.ADDED]
+        assert events.qsize() == 0
+
+    def test_added_then_deleted_is_noop(self) -> None:
+        """Test a file created and removed before processing is never sent."""
+        events = EventQueue(debounce_seconds=0.0)
+        events.put(_event("tmp.md", ChangeType.ADDED))
+        events.put(_event("tmp.md", ChangeType.DELETED))
+
+        assert events.get_batch(10, timeout=0.05) == []
+        assert events.get_stats()["events_cancelled"] == 2
+
+    def test_debounce_window(self) -> None:
+        """Test a path is held back until it has been quiet long enough."""
+        events = EventQueue(debounce_seconds=0.3)
+        events.put(_event("a.md", ChangeType.MODIFIED))
+
+        assert events.get(timeout=0.05) is None
+
+        start = time.time()
+        event = events.get(timeout=2.0)
+        assert event is not None
+        assert time.time() - start >= 0.2
+
+    def test_new_change_restarts_debounce(self) -> None:
+        """Test each new change to a path pushes its dispatch back."""
+        events = EventQueue(debounce_seconds=0.3)
+        events.put(_event("a.md", ChangeType.MODIFIED))
+
+        def touch_again() -> None:
+            time.sleep(0.2)
+            events.put(_event("a.md", ChangeType.MODIFIED))
+
+        writer = threading.Thread(target=touch_again)
+        start = time.time()
+        writer.start()
+        event = events.get(timeout=2.0)
+        writer.join()
+
+        assert event is not None
+        assert time.time() - start >= 0.45
+
+    def test_batches_respect_size_and_order(self) -> None:
+        """Test ready paths are dispatched oldest first in bounded batches."""
+        events = EventQueue(debounce_seconds=0.0)
+        for i in range(5):
+            events.put(_event(f"{i}.md", ChangeType.MODIFIED))
+
+        first = events.get_batch(3, timeout=0.1)
+        second = events.get_batch(3, timeout=0.1)
+
+        assert [e.path.name for e in first] == ["0.md", "1.md", "2.md"]
+        assert [e.path.name for e in second] == ["3.md", "4.md"]
+
+        stats = events.get_stats()
+        assert stats["batches_dispatched"] == 2
+        assert stats["in_flight"] == 5
+        assert stats["max_queue_depth"] == 5
+
+    def test_undebounced_put_is_ready_immediately(self) -> None:
+        """Test initial-scan events skip the debounce window."""
+        events = EventQueue(debounce_seconds=60.0)
+        events.put(_event("a.md", ChangeType.ADDED), deduplicate=False)
+
+        assert events.get(timeout=0.1) is not None
+
+    def test_coalescing_ratio(self) -> None:
+        """Test the ratio reports the share of events absorbed by coalescing."""
+        events = EventQueue(debounce_seconds=0.0)
+        for _ in range(4):
+            events.put(_event("a.md", ChangeType.MODIFIED))
+        events.get_batch(10, timeout=0.1)
+
+        stats = events.get_stats()
+        assert stats["events_received"] == 4
+        assert stats["events_dispatched"] == 1
+        assert stats["coalescing_ratio"] == pytest.approx(0.75)
+        assert stats["queue_depth"] == 0
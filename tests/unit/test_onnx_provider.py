@@ -0,0 +1,118 @@
+"""
+Unit tests for ONNXEmbeddingProvider tokenization and batching.
+
+Uses the bundled tokenizer with a stand-in inference session, so dynamic
+padding and length-bucketed batching can be checked without the ONNX model.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from tokenizers import Tokenizer
+
+from cognitive_memory.core.config import EmbeddingConfig
+from cognitive_memory.encoding.onnx_provider import ONNXEmbeddingProvider
+
+TOKENIZER_FILE = (
+    Path(__file__).parent.parent.parent
+    / "cognitive_memory"
+    / "data"
+    / "models"
+    / "tokenizer"
+    / "tokenizer.json"
+)
+
+
+class RecordingSession:
+    """Inference session stand-in that embeds each row as its token count."""
+
+    def __init__(self) -> None:
+        self.input_shapes: list[tuple[int, ...]] = []
+
+    def run(self, output_names, inputs):
+        self.input_shapes.append(inputs["input_ids"].shape)
+        lengths = inputs["attention_mask"].sum(axis=1).astype(np.float32)
+        return [np.repeat(lengths[:, None], 4, axis=1)]
+
+
+def make_provider(batch_size: int = 32) -> ONNXEmbeddingProvider:
+    """Build a provider around the bundled tokenizer and a fake session."""
+    provider = ONNXEmbeddingProvider.__new__(ONNXEmbeddingProvider)
+    provider.embedding_config = EmbeddingConfig(
+        model_cache_dir="unused", batch_size=batch_size
+    )
+    provider.model_name = "all-MiniLM-L6-v2"
+    provider.max_length = 512
+    provider.embedding_dimension = 4
+    provider.output_names = ["embeddings"]
+    provider.ort_session = RecordingSession()
+    provider.tokenizer = Tokenizer.from_file(str(TOKENIZER_FILE))
+    provider._configure_tokenizer()
+    return provider
+
+
+class TestONNXEmbeddingProviderBatching:
+    """Test dynamic padding and length-bucketed batching."""
+
+    def test_single_text_is_not_padded_to_max_length(self) -> None:
+        """Test a short query only carries its own tokens."""
+        provider = make_provider()
+
+        tokens = provider._tokenize_text("short query")
+
+        assert tokens["input_ids"].shape[1] < 10
+        assert tokens["attention_mask"].all()
+
+    def test_batch_pads_to_longest_item(self) -> None:
+        """Test batch rows are padded to the longest text with pad_id."""
+        provider = make_provider()
+
+        tokens = provider._tokenize_batch(["hi", "a noticeably longer sentence here"])
+
+        width = tokens["input_ids"].shape[1]
+        assert tokens["attention_mask"][1].sum() == width
+        assert tokens["attention_mask"][0].sum() < width
+        assert (tokens["input_ids"][0][tokens["attention_mask"][0] == 0] == 0).all()
+
+    def test_long_text_is_truncated(self) -> None:
+        """Test inputs longer than max_length are truncated natively."""
+        provider = make_provider()
+
+        tokens = provider._tokenize_text("word " * 2000)
+
+        assert tokens["input_ids"].shape == (1, 512)
+        # Truncation keeps the closing [SEP] token
+        assert tokens["input_ids"][0, -1] == 102
+
+    def test_fixed_padding_option(self) -> None:
+        """Test pad_to_max_length restores full-length inputs."""
+        provider = make_provider(batch_size=2)
+        token_ids = provider._tokenize(["hi", "there", "again"])
+
+        tokens = provider._pad_token_ids(token_ids, pad_to_max_length=True)
+        provider._embed_token_ids(token_ids, pad_to_max_length=True)
+
+        assert tokens["input_ids"].shape == (3, 512)
+        assert provider.ort_session.input_shapes == [(2, 512), (1, 512)]
+        assert provider._tokenize_batch(["hi", "there"])["input_ids"].shape[1] < 10
+
+    def test_encode_batch_buckets_by_length_and_keeps_order(self) -> None:
+        """Test large batches are length-sorted and returned in input order."""
+        provider = make_provider(batch_size=2)
+        texts = ["word " * 40, "hi", "word " * 20, "", "hey there", "word " * 5]
+
+        embeddings = provider.encode_batch(texts)
+
+        expected = [
+            len(ids) if text.strip() else 0
+            for text, ids in zip(
+                texts,
+                provider._tokenize([t.strip() or "x" for t in texts]),
+                strict=True,
+            )
+        ]
+        np.testing.assert_array_equal(embeddings[:, 0], expected)
+        # Five non-empty texts in batches of two, each padded to similar lengths
+        shapes = provider.ort_session.input_shapes
+        assert [shape[0] for shape in shapes] == [2, 2, 1]
+        assert shapes[0][1] < shapes[1][1] < shapes[2][1]
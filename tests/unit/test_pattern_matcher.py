@@ -0,0 +1,90 @@
+"""
+Unit tests for the multi-pattern matcher used by dimension extraction.
+"""
+
+import random
+import re
+
+import pytest
+
+from cognitive_memory.core.config import CognitiveConfig
+from cognitive_memory.encoding import pattern_matcher
+from cognitive_memory.encoding.dimensions import CognitiveDimensionExtractor
+from cognitive_memory.encoding.pattern_matcher import PatternMatcher, _first_words
+
+
+def findall_counts(categories: dict, text: str) -> dict:
+    """Reference counts from one findall per pattern."""
+    return {
+        category: sum(len(re.findall(p, text, re.IGNORECASE)) for p in patterns)
+        for category, patterns in categories.items()
+    }
+
+
+class TestPatternMatcher:
+    """Test single-scan pattern counting."""
+
+    def test_first_words(self) -> None:
+        """Test first words are enumerated through groups and optional suffixes."""
+        assert _first_words(r"\b(frustrated?|why (is|does))\b") == {
+            "frustrate",
+            "frustrated",
+            "why",
+        }
+        assert _first_words(r"\b((in|within) \d+ days?)\b") == {"in", "within"}
+        assert _first_words(r"\b(can\'t handle)\b") == {"can"}
+
+    @pytest.mark.parametrize("pattern", [r"foo\b", r"\bfoo", r"\b\d+ days\b"])
+    def test_unindexed_patterns_fall_back_to_findall(self, pattern: str) -> None:
+        """Test patterns without enumerable first words still count correctly."""
+        assert _first_words(pattern) is None
+
+        matcher = PatternMatcher({"only": [pattern]})
+        text = "barfoo foo foobar 12 days and 3 days"
+        assert matcher.count(text) == findall_counts({"only": [pattern]}, text)
+
+    def test_without_private_parser_everything_falls_back(self, monkeypatch) -> None:
+        """Test counting stays exact when the private regex parser is missing."""
+        monkeypatch.setattr(pattern_matcher, "sre_parse", None)
+        categories = {"why": [r"\b(why (is|does))\b"], "help": [r"\b(help)\b"]}
+
+        matcher = PatternMatcher(categories)
+        text = "why is help needed, why does it help"
+
+        assert matcher._index == {}
+        assert matcher.count(text) == findall_counts(categories, text)
+
+    def test_overlapping_patterns_counted_independently(self) -> None:
+        """Test categories sharing words each count their own matches."""
+        categories = {
+            "meeting": [r"\b(meeting|team meeting)\b"],
+            "team": [r"\b(team|team meeting)\b"],
+            "repeat": [r"\b(need (to|it) (now|today))\b"],
+        }
+        matcher = PatternMatcher(categories)
+        text = "team meeting, need to now need it today, Team Meeting"
+
+        assert matcher.count(text) == findall_counts(categories, text)
+
+    def test_extractor_patterns_match_findall(self) -> None:
+        """Test counts equal findall for every extractor pattern on varied text."""
+        extractor = CognitiveDimensionExtractor(CognitiveConfig())
+        categories = {
+            key: patterns
+            for category, dimension_extractor in extractor._extractors.items()
+            for key, patterns in (
+                ((category, name), patterns)
+                for name, patterns in dimension_extractor.get_patterns().items()
+            )
+        }
+        vocabulary = (
+            "why is why does won't can't handle too much work with team up group "
+            "work meeting help need help can you please in 3 days within 12 hours "
+            "due today deadline right now need it now my own by myself fails errors "
+            "this week next month back up how to what if . , ! ' teamwork helpful"
+        ).split()
+        rng = random.Random(0)
+
+        for _ in range(200):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 40)))
+            assert extractor.matcher.count(text) == findall_counts(categories, text)
@@ -0,0 +1,125 @@
+"""
+Unit tests for QueryEmbeddingCache.
+
+Tests normalized-text lookups, model isolation, LRU eviction by entry count
+and byte size, and hit/miss accounting.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+
+from cognitive_memory.core.interfaces import EmbeddingProvider
+from cognitive_memory.core.query_cache import (
+    QueryEmbeddingCache,
+    get_model_identity,
+    normalize_query_text,
+)
+
+
+def make_provider(model_name: str = "test-model") -> Mock:
+    """Create a provider whose embedding depends on the text length."""
+    provider = Mock(spec=EmbeddingProvider)
+    provider.encode.side_effect = lambda text: np.full(4, float(len(text)))
+    provider.get_model_info = Mock(
+        return_value={"model_name": model_name, "embedding_dimension": 4}
+    )
+    return provider
+
+
+class TestQueryEmbeddingCache:
+    """Test QueryEmbeddingCache functionality."""
+
+    def test_repeated_query_hits_cache(self) -> None:
+        """Test whitespace variants of a query share one encoding."""
+        provider = make_provider()
+        cache = QueryEmbeddingCache(max_entries=8)
+
+        first = cache.encode(provider, "how does  spreading activation work")
+        second = cache.encode(provider, "  how does spreading\nactivation work ")
+
+        np.testing.assert_array_equal(first, second)
+        provider.encode.assert_called_once_with("how does  spreading activation work")
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_returned_embeddings_do_not_alias_cache(self) -> None:
+        """Test modifying a returned embedding leaves the entry intact."""
+        provider = make_provider()
+        cache = QueryEmbeddingCache()
+
+        cache.encode(provider, "query")
+        cached = cache.encode(provider, "query")
+        cached[:] = -1.0
+
+        np.testing.assert_array_equal(cache.encode(provider, "query"), np.full(4, 5.0))
+
+    def test_models_do_not_share_entries(self) -> None:
+        """Test the same text is cached separately per model."""
+        provider_a = make_provider("model-a")
+        provider_b = make_provider("model-b")
+        cache = QueryEmbeddingCache()
+
+        cache.encode(provider_a, "query")
+        cache.encode(provider_b, "query")
+
+        provider_a.encode.assert_called_once()
+        provider_b.encode.assert_called_once()
+        assert get_model_identity(provider_a) != get_model_identity(provider_b)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the entry limit evicts the least recently used query."""
+        provider = make_provider()
+        cache = QueryEmbeddingCache(max_entries=2)
+
+        cache.encode(provider, "a")
+        cache.encode(provider, "bb")
+        cache.encode(provider, "a")  # refresh "a"
+        cache.encode(provider, "ccc")  # evicts "bb"
+        provider.encode.reset_mock()
+
+        cache.encode(provider, "a")
+        provider.encode.assert_not_called()
+        cache.encode(provider, "bb")
+        provider.encode.assert_called_once_with("bb")
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_byte_limit(self) -> None:
+        """Test the byte budget bounds the cache independently of entries."""
+        provider = make_provider()
+        # Each entry holds 32 bytes of float64 plus its key text
+        cache = QueryEmbeddingCache(max_entries=100, max_bytes=70)
+
+        for text in ["a", "b", "c"]:
+            cache.encode(provider, text)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= 70
+
+    def test_disabled_cache_always_encodes(self) -> None:
+        """Test a zero-size cache passes every query to the provider."""
+        provider = make_provider()
+        cache = QueryEmbeddingCache(max_entries=0)
+
+        cache.encode(provider, "query")
+        cache.encode(provider, "query")
+
+        assert provider.encode.call_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+    def test_encodes_original_text(self) -> None:
+        """Test normalization applies to the cache key, not the encoded text."""
+        provider = make_provider()
+
+        for cache in (QueryEmbeddingCache(), QueryEmbeddingCache(max_entries=0)):
+            provider.encode.reset_mock()
+            cache.encode(provider, "  Lesson:\tkeep\nindentation ")
+            provider.encode.assert_called_once_with("  Lesson:\tkeep\nindentation ")
+
+    def test_normalize_query_text(self) -> None:
+        """Test normalization collapses whitespace and applies NFC."""
+        assert normalize_query_text(" a\t b\n") == "a b"
+        assert normalize_query_text("café") == "café"
@@ -0,0 +1,201 @@
+"""
+Unit tests for sampled retrieval telemetry.
+
+Tests that sampled retrievals are persisted to retrieval_latency and
+retrieval_stats through the statistics buffer, that per-phase percentiles are
+computed over the sliding window, that old rows are pruned after the
+configured retention, and that sampling honours the configured rate.
+"""
+
+import json
+
+import pytest
+
+from cognitive_memory.core.memory import BridgeMemory, CognitiveMemory
+from cognitive_memory.storage.retrieval_telemetry import RetrievalTelemetry
+from cognitive_memory.storage.sqlite_persistence import (
+    DatabaseManager,
+    MemoryMetadataStore,
+)
+
+
+@pytest.fixture
+def memories(tmp_path):
+    """Create a database with three stored memories."""
+    db_manager = DatabaseManager(str(tmp_path / "telemetry.db"))
+    memory_store = MemoryMetadataStore(db_manager)
+    stored = []
+    for index in range(3):
+        memory = CognitiveMemory(content=f"memory {index}", hierarchy_level=2)
+        memory_store.store_memory(memory)
+        stored.append(memory)
+
+    yield memory_store, stored
+
+    db_manager.close()
+
+
+def read_rows(db_manager: DatabaseManager) -> list:
+    """Read retrieval_stats rows in insertion order."""
+    with db_manager.get_connection() as conn:
+        return conn.execute(
+            """
+            SELECT query_type, query_hash, memory_id, retrieval_score,
+                   retrieval_rank, retrieval_metadata, search_latency_ms,
+                   total_candidates
+            FROM retrieval_stats ORDER BY id
+            """
+        ).fetchall()
+
+
+class TestRetrievalTelemetry:
+    """Test RetrievalTelemetry functionality."""
+
+    def test_record_writes_one_row_per_result(self, memories):
+        """Test a sampled retrieval is persisted once the buffer flushes."""
+        memory_store, stored = memories
+        db_manager = memory_store.db_manager
+        telemetry = RetrievalTelemetry(db_manager, sample_rate=1.0)
+        bridge = BridgeMemory(
+            memory=stored[2],
+            novelty_score=0.8,
+            connection_potential=0.6,
+            bridge_score=0.7,
+            explanation="bridge",
+        )
+
+        telemetry.record(
+            "what is cached?",
+            {"query_encode": 2.0, "activation": 5.0, "total": 9.0},
+            {"core": [stored[0]], "peripheral": [stored[1]], "bridge": [bridge]},
+            scores={stored[0].id: 0.9, stored[1].id: 0.4},
+        )
+
+        assert read_rows(db_manager) == []
+        db_manager.stats_buffer.flush()
+
+        rows = read_rows(db_manager)
+        assert [row["query_type"] for row in rows] == ["core", "peripheral", "bridge"]
+        assert [row["memory_id"] for row in rows] == [m.id for m in stored]
+        assert [row["retrieval_rank"] for row in rows] == [1, 2, 3]
+        assert [row["retrieval_score"] for row in rows] == pytest.approx(
+            [0.9, 0.4, 0.7]
+        )
+        assert {row["search_latency_ms"] for row in rows} == {9.0}
+        assert {row["total_candidates"] for row in rows} == {3}
+        assert "what is cached?" not in rows[0]["query_hash"]
+
+        metadata = [json.loads(row["retrieval_metadata"]) for row in rows]
+        assert len({entry["retrieval_id"] for entry in metadata}) == 1
+        assert metadata[0]["phases_ms"]["activation"] == 5.0
+        assert telemetry.sampled == 1
+
+    def test_percentiles_count_each_retrieval_once(self, memories):
+        """Test percentiles are computed per retrieval, not per result row."""
+        memory_store, stored = memories
+        telemetry = RetrievalTelemetry(memory_store.db_manager, sample_rate=1.0)
+
+        for total in range(1, 101):
+            phases = {"total": float(total)}
+            if total % 2 == 0:
+                phases["bridge_discovery"] = 1.0
+            telemetry.record("query", phases, {"core": stored[:2]})
+
+        report = telemetry.get_latency_percentiles()
+
+        assert report["samples"] == 100
+        assert report["phases"]["total"]["count"] == 100
+        assert report["phases"]["total"]["p50"] == pytest.approx(50.5)
+        assert report["phases"]["total"]["p99"] == pytest.approx(99.01)
+        assert report["phases"]["bridge_discovery"]["count"] == 50
+
+    def test_window_excludes_old_samples(self, memories):
+        """Test samples older than the window are left out of percentiles."""
+        memory_store, stored = memories
+        db_manager = memory_store.db_manager
+        telemetry = RetrievalTelemetry(db_manager, sample_rate=1.0)
+        telemetry.record("old", {"total": 100.0}, {"core": [stored[0]]})
+        db_manager.stats_buffer.flush()
+
+        with db_manager.get_connection() as conn:
+            conn.execute("UPDATE retrieval_latency SET timestamp = timestamp - 1")
+            conn.commit()
+
+        telemetry.record("new", {"total": 10.0}, {"core": [stored[1]]})
+        report = telemetry.get_latency_percentiles(window_minutes=60)
+
+        assert report["samples"] == 1
+        assert report["phases"]["total"]["p95"] == pytest.approx(10.0)
+
+    def test_zero_result_retrievals_are_counted(self, memories):
+        """Test retrievals that return nothing still contribute latencies."""
+        memory_store, stored = memories
+        db_manager = memory_store.db_manager
+        telemetry = RetrievalTelemetry(db_manager, sample_rate=1.0)
+
+        telemetry.record(
+            "nothing matches",
+            {"query_encode": 1.0, "vector_fallback": 4.0, "total": 6.0},
+            {"core": [], "peripheral": [], "bridge": []},
+        )
+        telemetry.record("query", {"total": 2.0}, {"core": [stored[0]]})
+        report = telemetry.get_latency_percentiles()
+
+        assert report["samples"] == 2
+        assert report["phases"]["total"]["count"] == 2
+        assert report["phases"]["vector_fallback"]["count"] == 1
+        assert [row["memory_id"] for row in read_rows(db_manager)] == [stored[0].id]
+
+    def test_rows_past_retention_are_pruned(self, tmp_path):
+        """Test rows older than the configured retention are pruned on write."""
+        db_manager = DatabaseManager(
+            str(tmp_path / "retention.db"), retrieval_retention_days=1.0
+        )
+        memory = CognitiveMemory(content="retained", hierarchy_level=2)
+        MemoryMetadataStore(db_manager).store_memory(memory)
+        telemetry = RetrievalTelemetry(db_manager, sample_rate=1.0)
+
+        telemetry.record("old", {"total": 1.0}, {"core": [memory]})
+        telemetry.record("recent", {"total": 1.0}, {"core": [memory]})
+        db_manager.stats_buffer.flush()
+        with db_manager.get_connection() as conn:
+            for table in ("retrieval_latency", "retrieval_stats"):
+                conn.execute(
+                    f"UPDATE {table} SET timestamp = timestamp - 2 "
+                    f"WHERE rowid = (SELECT MIN(rowid) FROM {table})"
+                )
+            conn.commit()
+
+        telemetry.record("new", {"total": 1.0}, {"core": [memory]})
+        db_manager.stats_buffer.flush()
+
+        with db_manager.get_connection() as conn:
+            counts = [
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("retrieval_latency", "retrieval_stats")
+            ]
+        db_manager.close()
+
+        assert counts == [2, 2]
+
+    def test_rows_for_deleted_memories_are_skipped(self, memories):
+        """Test buffered rows of memories deleted before the flush are dropped."""
+        memory_store, stored = memories
+        db_manager = memory_store.db_manager
+        telemetry = RetrievalTelemetry(db_manager, sample_rate=1.0)
+
+        telemetry.record("query", {"total": 3.0}, {"core": stored[:2]})
+        memory_store.delete_memory(stored[0].id)
+
+        assert db_manager.stats_buffer.flush() == 3
+        assert [row["memory_id"] for row in read_rows(db_manager)] == [stored[1].id]
+        assert db_manager.stats_buffer.failed_flushes == 0
+
+    def test_sample_rate_bounds(self, memories):
+        """Test a zero rate never samples and a full rate always does."""
+        memory_store, _ = memories
+        never = RetrievalTelemetry(memory_store.db_manager, sample_rate=0.0)
+        always = RetrievalTelemetry(memory_store.db_manager, sample_rate=1.0)
+
+        assert not any(never.should_sample() for _ in range(100))
+        assert all(always.should_sample() for _ in range(100))
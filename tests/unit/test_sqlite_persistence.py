@@ -5,11 +5,14 @@ Tests the DatabaseManager, MemoryMetadataStore, and ConnectionGraphStore
 components with proper schema migration handling.
 """
 
+import gc
 import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from cognitive_memory.core.memory import CognitiveMemory
@@ -51,6 +54,7 @@ class TestDatabaseManager:
                     "memory_connections",
                     "bridge_cache",
                     "retrieval_stats",
+                    "retrieval_latency",
                 }
 
                 assert expected_tables.issubset(tables)
@@ -80,6 +84,11 @@ class TestDatabaseManager:
                     "004_retrieval_stats",
                     "005_add_embedding_column",
                     "006_source_path_index",
+                    "007_memory_generation",
+                    "008_binary_embeddings",
+                    "009_embedding_cache",
+                    "010_connection_generation",
+                    "011_retrieval_latency",
                 ]
 
                 assert expected_migrations == migrations
@@ -130,6 +139,79 @@ class TestDatabaseManager:
         finally:
             Path(db_path).unlink(missing_ok=True)
 
+    def test_connection_pool_reuse(self):
+        """Test connections are reused per thread and returned by workers."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = tmp.name
+
+        try:
+            db_manager = DatabaseManager(db_path, pool_size=2)
+
+            with db_manager.get_connection() as first:
+                pass
+            with db_manager.get_connection() as second:
+                # Nested checkout borrows a separate pooled connection
+                with db_manager.get_connection() as nested:
+                    assert nested is not second
+                    # Pool exhausted: a temporary overflow connection is used
+                    with db_manager.get_connection() as overflow:
+                        assert overflow is not nested
+
+            assert first is second
+
+            worker_connections = []
+
+            def worker():
+                with db_manager.get_connection() as conn:
+                    worker_connections.append(conn)
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            gc.collect()
+
+            # The worker reused the idle pooled connection and handed it back
+            assert worker_connections[0] is nested
+
+            assert "connection_pool" in db_manager.get_database_stats()
+
+            stats = db_manager.get_pool_stats()
+            assert stats["pool_size"] == 2
+            assert stats["open_connections"] == 2
+            assert stats["in_use_connections"] == 0
+            assert stats["idle_connections"] == 1
+            assert stats["overflow_checkouts"] == 1
+            assert stats["reused_checkouts"] >= 2
+
+            db_manager.close()
+            assert db_manager.get_pool_stats()["idle_connections"] == 0
+
+        finally:
+            Path(db_path).unlink(missing_ok=True)
+
+    def test_uncommitted_work_discarded_on_release(self):
+        """Test pooled connections do not leak uncommitted transactions."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = tmp.name
+
+        try:
+            db_manager = DatabaseManager(db_path)
+
+            with db_manager.get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO memories (id, content, memory_type, "
+                    "hierarchy_level, dimensions, timestamp) "
+                    "VALUES ('uncommitted', 'x', 'episodic', 2, '{}', 0)"
+                )
+
+            with db_manager.get_connection() as conn:
+                assert not conn.in_transaction
+                count = conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+                assert count == 0
+
+        finally:
+            Path(db_path).unlink(missing_ok=True)
+
 
 class TestMemoryMetadataStore:
     """Test MemoryMetadataStore functionality."""
@@ -288,6 +370,166 @@ class TestMemoryMetadataStore:
         assert episodic_memories[0].memory_type == "episodic"
         assert semantic_memories[0].memory_type == "semantic"
 
+    def test_level_index_tracks_store_and_delete(self, memory_store):
+        """Test that the resident level index is patched by store writes."""
+        concept = CognitiveMemory(
+            id="concept_001",
+            content="Concept memory",
+            hierarchy_level=0,
+            timestamp=time.time(),
+        )
+        concept.cognitive_embedding = np.array([1.0, 0.0, 0.0])
+        memory_store.store_memory(concept)
+
+        index = memory_store.get_level_index(0)
+        assert index is not None
+        assert len(index) == 1
+        generation = index.generation
+
+        second = CognitiveMemory(
+            id="concept_002",
+            content="Second concept",
+            hierarchy_level=0,
+            timestamp=time.time(),
+        )
+        second.cognitive_embedding = np.array([0.0, 1.0, 0.0])
+        memory_store.store_memory(second)
+
+        # Patched in place rather than reloaded
+        assert memory_store.get_level_index(0) is index
+        assert index.generation == generation + 1
+        assert [mid for mid, _ in index.search(np.array([0.0, 2.0, 0.0]), 0.5)] == [
+            "concept_002"
+        ]
+
+        memory_store.delete_memory("concept_001")
+        assert "concept_001" not in index
+        assert len(memory_store.get_level_index(0)) == 1
+
+    def test_level_index_detects_external_writes(self, memory_store):
+        """Test that writes from another store instance trigger a reload."""
+        index = memory_store.get_level_index(0)
+        assert index is not None and len(index) == 0
+
+        other_store = MemoryMetadataStore(memory_store.db_manager)
+        concept = CognitiveMemory(
+            id="external_concept",
+            content="Written by another process",
+            hierarchy_level=0,
+            timestamp=time.time(),
+        )
+        concept.cognitive_embedding = np.array([0.5, 0.5])
+        other_store.store_memory(concept)
+
+        reloaded = memory_store.get_level_index(0)
+        assert "external_concept" in reloaded
+
+    def test_get_memories_by_ids_preserves_order(self, memory_store):
+        """Test batch retrieval by IDs keeps the requested order."""
+        for i in range(3):
+            memory_store.store_memory(
+                CognitiveMemory(
+                    id=f"ordered_{i}",
+                    content=f"Memory {i}",
+                    hierarchy_level=1,
+                    timestamp=time.time(),
+                )
+            )
+
+        memories = memory_store.get_memories_by_ids(
+            ["ordered_2", "missing", "ordered_0"]
+        )
+        assert [m.id for m in memories] == ["ordered_2", "ordered_0"]
+        assert all(m.access_count == 0 for m in memories)
+
+    def test_store_memories_batch(self, memory_store):
+        """Test storing several memories in one transaction."""
+        memories = []
+        for i in range(3):
+            memory = CognitiveMemory(
+                id=f"batch_{i}",
+                content=f"Batch memory {i}",
+                hierarchy_level=0,
+                timestamp=time.time(),
+            )
+            memory.cognitive_embedding = np.array([float(i), 1.0])
+            memories.append(memory)
+
+        index = memory_store.get_level_index(0)
+        generation = index.generation
+
+        assert memory_store.store_memories_batch(memories) == [True, True, True]
+        assert memory_store.store_memories_batch([]) == []
+
+        # The resident index is patched rather than reloaded
+        assert index.generation == generation + 3
+        assert len(memory_store.get_level_index(0)) == 3
+
+        stored = memory_store.get_memories_by_ids(["batch_0", "batch_1", "batch_2"])
+        assert [m.content for m in stored] == [
+            "Batch memory 0",
+            "Batch memory 1",
+            "Batch memory 2",
+        ]
+
+    def test_embedding_stored_as_binary(self, memory_store):
+        """Test embeddings round-trip through the binary float32 format."""
+        memory = CognitiveMemory(
+            id="binary_001",
+            content="Binary embedding",
+            hierarchy_level=1,
+            timestamp=time.time(),
+        )
+        memory.cognitive_embedding = np.array([0.25, -1.5, 3.0])
+        memory_store.store_memory(memory)
+
+        with memory_store.db_manager.get_connection() as conn:
+            value = conn.execute(
+                "SELECT cognitive_embedding FROM memories WHERE id = ?",
+                (memory.id,),
+            ).fetchone()[0]
+
+        assert isinstance(value, bytes)
+        assert len(value) == 12 + 3 * 4
+
+        retrieved = memory_store.retrieve_memory(memory.id)
+        assert retrieved.cognitive_embedding.dtype == np.float32
+        np.testing.assert_array_equal(retrieved.cognitive_embedding, [0.25, -1.5, 3.0])
+
+    def test_convert_json_embeddings(self, memory_store):
+        """Test legacy JSON embeddings are converted in place."""
+        memory_store.store_memory(
+            CognitiveMemory(
+                id="legacy_001",
+                content="Legacy embedding",
+                hierarchy_level=0,
+                timestamp=time.time(),
+            )
+        )
+        with memory_store.db_manager.get_connection() as conn:
+            conn.execute(
+                "UPDATE memories SET cognitive_embedding = ? WHERE id = ?",
+                ("[0.5, 0.25]", "legacy_001"),
+            )
+            conn.commit()
+
+        # Legacy rows stay readable before conversion
+        legacy = memory_store.get_memories_by_ids(["legacy_001"])[0]
+        np.testing.assert_array_equal(legacy.cognitive_embedding, [0.5, 0.25])
+
+        assert memory_store.db_manager.convert_json_embeddings(batch_size=1) == 1
+        assert memory_store.db_manager.convert_json_embeddings() == 0
+
+        with memory_store.db_manager.get_connection() as conn:
+            value_type = conn.execute(
+                "SELECT typeof(cognitive_embedding) FROM memories WHERE id = ?",
+                ("legacy_001",),
+            ).fetchone()[0]
+        assert value_type == "blob"
+
+        converted = memory_store.get_memories_by_ids(["legacy_001"])[0]
+        np.testing.assert_array_equal(converted.cognitive_embedding, [0.5, 0.25])
+
 
 class TestConnectionGraphStore:
     """Test ConnectionGraphStore functionality."""
@@ -406,6 +648,67 @@ class TestConnectionGraphStore:
         assert connections_from_0[0].id == memory_ids[1]
         assert connections_from_1[0].id == memory_ids[0]
 
+    def test_adjacency_index_tracks_store_writes(self, connection_store):
+        """Test that the resident adjacency index is patched by store writes."""
+        store, memory_ids = connection_store
+        a, b, c = memory_ids
+        store.add_connection(a, b, 0.8, "associative")
+
+        index = store.get_adjacency_index()
+        assert index is not None
+        assert index.expand([a]) == [(a, [(b, 0.8)])]
+
+        store.add_connection(c, a, 0.6, "causal")
+        store.add_connection(a, b, 0.5, "temporal")
+        store.update_connection_strength(b, a, 0.7)
+
+        # Patched in place rather than reloaded
+        assert store.get_adjacency_index() is index
+        assert index.expand([a]) == [(a, [(b, 0.7), (c, 0.6)])]
+
+        store.remove_connection(a, b)
+        assert store.get_adjacency_index() is index
+        assert index.expand([b]) == [(b, [])]
+        assert index.expand([a]) == [(a, [(c, 0.6)])]
+
+    def test_adjacency_index_detects_external_writes(self, connection_store):
+        """Test that writes from another store instance trigger a reload."""
+        store, memory_ids = connection_store
+        index = store.get_adjacency_index()
+        generation = index.generation
+
+        other_store = ConnectionGraphStore(store.db_manager)
+        other_store.add_connection(memory_ids[0], memory_ids[2], 0.9)
+
+        reloaded = store.get_adjacency_index()
+        assert reloaded.generation != generation
+        assert reloaded.expand([memory_ids[2]]) == [
+            (memory_ids[2], [(memory_ids[0], 0.9)])
+        ]
+
+        # Deleting a memory cascades to its connections
+        MemoryMetadataStore(store.db_manager).delete_memory(memory_ids[0])
+        assert store.get_adjacency_index().expand([memory_ids[2]]) == [
+            (memory_ids[2], [])
+        ]
+
+    def test_record_activations(self, connection_store):
+        """Test traversal statistics are recorded for a whole frontier."""
+        store, memory_ids = connection_store
+        store.add_connection(memory_ids[0], memory_ids[1], 0.8)
+        store.add_connection(memory_ids[1], memory_ids[2], 0.3)
+
+        store.record_activations([memory_ids[0], memory_ids[1]], min_strength=0.5)
+        store.db_manager.stats_buffer.flush()
+
+        with store.db_manager.get_connection() as conn:
+            counts = dict(
+                conn.execute(
+                    "SELECT target_id, activation_count FROM memory_connections"
+                ).fetchall()
+            )
+        assert counts == {memory_ids[1]: 2, memory_ids[2]: 1}
+
 
 class TestSQLitePersistenceIntegration:
     """Integration tests for SQLite persistence components."""
@@ -0,0 +1,208 @@
+"""
+Unit tests for the write-behind statistics buffer.
+
+Tests that access and activation counters are held back until a flush,
+flushed by size threshold, timer and shutdown, and match the counts the
+immediate per-call UPDATEs produced, that timed flushes share one thread,
+and that retried retrieval rows are capped.
+"""
+
+import time
+
+import pytest
+
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.storage.sqlite_persistence import create_sqlite_persistence
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """Create stores with three memories and a long flush interval."""
+    memory_store, connection_store = create_sqlite_persistence(
+        str(tmp_path / "stats.db"), stats_flush_interval=60.0
+    )
+    memory_ids = []
+    for index in range(3):
+        memory = CognitiveMemory(content=f"memory {index}", hierarchy_level=2)
+        memory_store.store_memory(memory)
+        memory_ids.append(memory.id)
+
+    yield memory_store, connection_store, memory_ids
+
+    memory_store.db_manager.close()
+
+
+def read_access_counts(db_manager) -> dict[str, int]:
+    """Read access_count per memory straight from the database."""
+    with db_manager.get_connection() as conn:
+        return dict(conn.execute("SELECT id, access_count FROM memories").fetchall())
+
+
+def read_activation_counts(db_manager) -> dict[tuple[str, str], int]:
+    """Read activation_count per connection straight from the database."""
+    with db_manager.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT source_id, target_id, activation_count FROM memory_connections"
+        ).fetchall()
+    return {(row[0], row[1]): row[2] for row in rows}
+
+
+class TestStatsWriteBuffer:
+    """Test StatsWriteBuffer functionality."""
+
+    def test_accesses_are_written_behind(self, stores):
+        """Test retrievals do not write until the buffer is flushed."""
+        memory_store, _, memory_ids = stores
+        db_manager = memory_store.db_manager
+        buffer = db_manager.stats_buffer
+
+        for _ in range(3):
+            assert memory_store.retrieve_memory(memory_ids[0]) is not None
+        memory_store.retrieve_memory(memory_ids[1])
+
+        assert read_access_counts(db_manager)[memory_ids[0]] == 0
+        assert buffer.pending == 2
+        assert buffer.pending_accesses(memory_ids[0]) == 3
+
+        assert buffer.flush() == 2
+        counts = read_access_counts(db_manager)
+        assert counts[memory_ids[0]] == 3
+        assert counts[memory_ids[1]] == 1
+        assert counts[memory_ids[2]] == 0
+        assert buffer.get_stats()["pending"] == 0
+
+    def test_activations_match_immediate_updates(self, stores):
+        """Test flushed activation counts equal one bump per traversal."""
+        _, connection_store, memory_ids = stores
+        a, b, c = memory_ids
+        connection_store.add_connection(a, b, 0.8)
+        connection_store.add_connection(b, c, 0.3)
+        before = read_activation_counts(connection_store.db_manager)
+
+        connection_store.get_connections(a, min_strength=0.5)
+        connection_store.get_connections(a, min_strength=0.5)
+        connection_store.get_connections(b, min_strength=0.1)
+        connection_store.record_activations([a, b], min_strength=0.5)
+        connection_store.close()
+
+        after = read_activation_counts(connection_store.db_manager)
+        assert after[(a, b)] - before[(a, b)] == 4
+        assert after[(b, c)] - before[(b, c)] == 1
+
+    def test_size_threshold_triggers_flush(self, stores):
+        """Test reaching max_pending flushes without waiting for the timer."""
+        memory_store, _, memory_ids = stores
+        buffer = memory_store.db_manager.stats_buffer
+        buffer.max_pending = 2
+
+        memory_store.retrieve_memory(memory_ids[0])
+        assert buffer.pending == 1
+        memory_store.retrieve_memory(memory_ids[1])
+
+        assert buffer.pending == 0
+        assert buffer.flushes == 1
+        assert read_access_counts(memory_store.db_manager)[memory_ids[1]] == 1
+
+    def test_timer_flushes_pending_updates(self, stores):
+        """Test pending updates are flushed once the flush interval elapses."""
+        memory_store, _, memory_ids = stores
+        buffer = memory_store.db_manager.stats_buffer
+        buffer.flush_interval = 0.05
+
+        memory_store.retrieve_memory(memory_ids[2])
+
+        deadline = time.time() + 5.0
+        while not buffer.flushes and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert buffer.flushes == 1
+        assert buffer.pending == 0
+        assert read_access_counts(memory_store.db_manager)[memory_ids[2]] == 1
+
+    def test_timed_flushes_share_one_thread(self, stores):
+        """Test every timed flush runs on the same long-lived flusher thread."""
+        memory_store, _, memory_ids = stores
+        buffer = memory_store.db_manager.stats_buffer
+        buffer.flush_interval = 0.05
+
+        flushers = []
+        for expected_flushes, memory_id in enumerate(memory_ids[:2], start=1):
+            memory_store.retrieve_memory(memory_id)
+            flushers.append(buffer._flusher)
+
+            deadline = time.time() + 5.0
+            while buffer.flushes < expected_flushes and time.time() < deadline:
+                time.sleep(0.01)
+            assert buffer.flushes == expected_flushes
+
+        assert flushers[0] is flushers[1]
+        assert flushers[0].is_alive()
+
+        memory_store.db_manager.close()
+        assert not flushers[0].is_alive()
+
+    def test_failed_retrieval_rows_are_capped(self, stores, monkeypatch):
+        """Test retried retrieval rows are capped, dropping the oldest."""
+        memory_store, _, memory_ids = stores
+        buffer = memory_store.db_manager.stats_buffer
+        buffer.MAX_RETRIEVAL_BACKLOG = 3
+
+        def fail(*args):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(buffer, "_write", fail)
+        rows = [
+            (
+                "search",
+                f"q{index}",
+                memory_ids[0],
+                0.5,
+                1,
+                None,
+                None,
+                None,
+                1.0,
+                1,
+                0.0,
+            )
+            for index in range(5)
+        ]
+        latency_rows = [
+            (f"r{index}", f"q{index}", None, 0, "{}", 0.0) for index in range(5)
+        ]
+        buffer.record_retrieval(rows[:2])
+        buffer.flush()
+        buffer.record_retrieval(rows[2:], latency_rows[0])
+        for latency_row in latency_rows[1:]:
+            buffer.record_retrieval([], latency_row)
+        buffer.flush()
+
+        assert buffer._retrieval_rows == rows[2:]
+        assert buffer._latency_rows == latency_rows[2:]
+        assert buffer.get_stats()["dropped_retrieval_rows"] == 4
+        assert buffer.failed_flushes == 2
+
+    def test_zero_interval_writes_through(self, tmp_path):
+        """Test a zero flush interval writes every update immediately."""
+        memory_store, _ = create_sqlite_persistence(
+            str(tmp_path / "through.db"), stats_flush_interval=0
+        )
+        memory = CognitiveMemory(content="write through", hierarchy_level=2)
+        memory_store.store_memory(memory)
+
+        memory_store.retrieve_memory(memory.id)
+
+        assert memory_store.db_manager.stats_buffer.pending == 0
+        assert read_access_counts(memory_store.db_manager)[memory.id] == 1
+        memory_store.db_manager.close()
+
+    def test_close_flushes_pending_updates(self, stores):
+        """Test closing the database manager flushes buffered statistics."""
+        memory_store, _, memory_ids = stores
+        db_manager = memory_store.db_manager
+        memory_store.retrieve_memory(memory_ids[0])
+
+        db_manager.close()
+
+        assert db_manager.stats_buffer.pending == 0
+        assert read_access_counts(db_manager)[memory_ids[0]] == 1
@@ -0,0 +1,188 @@
+"""
+Unit tests for cross-level vector search and bulk deletion.
+
+Tests that VectorSearchEngine fans per-level queries out concurrently with
+per-level limits and thresholds, that HierarchicalMemoryStorage merges them
+into a global top-k, that deletions use one request per collection, and that
+storage runs on an injected in-process client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from cognitive_memory.storage.qdrant_storage import (
+    HierarchicalMemoryStorage,
+    QdrantCollectionManager,
+    VectorSearchEngine,
+)
+
+PROJECT_ID = "project_abc12345"
+
+
+def _make_point(memory_id: str, score: float, level: int) -> SimpleNamespace:
+    """Create a scored point shaped like a Qdrant search hit."""
+    return SimpleNamespace(
+        id=memory_id,
+        score=score,
+        payload={"memory_id": memory_id, "hierarchy_level": level},
+    )
+
+
+def _make_client() -> Mock:
+    """Create a Qdrant client mock returning fixed hits per collection."""
+    hits = {
+        f"{PROJECT_ID}_concepts": [
+            _make_point("c1", 0.9, 0),
+            _make_point("c2", 0.4, 0),
+        ],
+        f"{PROJECT_ID}_contexts": [_make_point("x1", 0.7, 1)],
+        f"{PROJECT_ID}_episodes": [
+            _make_point("e1", 0.95, 2),
+            _make_point("e2", 0.8, 2),
+        ],
+    }
+
+    client = Mock()
+    client.search.side_effect = lambda collection_name, limit, **kwargs: hits[
+        collection_name
+    ][:limit]
+    return client
+
+
+class TestVectorSearchEngine:
+    """Test concurrent cross-level search."""
+
+    def test_per_level_k_and_threshold(self) -> None:
+        """Test per-level limits and score thresholds are forwarded."""
+        client = _make_client()
+        engine = VectorSearchEngine(
+            client, QdrantCollectionManager(client, 3, PROJECT_ID)
+        )
+
+        results = engine.search_cross_level(
+            query_vector=np.ones(3),
+            k_per_level={0: 1, 2: 2},
+            score_threshold={0: 0.5},
+        )
+        engine.close()
+
+        assert [r.memory.id for r in results[0]] == ["c1"]
+        assert results[1] == []  # k of 0 skips the level entirely
+        assert [r.memory.id for r in results[2]] == ["e1", "e2"]
+
+        calls = {
+            call.kwargs["collection_name"]: call.kwargs
+            for call in client.search.call_args_list
+        }
+        assert set(calls) == {f"{PROJECT_ID}_concepts", f"{PROJECT_ID}_episodes"}
+        assert calls[f"{PROJECT_ID}_concepts"]["score_threshold"] == 0.5
+        assert calls[f"{PROJECT_ID}_episodes"]["score_threshold"] is None
+
+    def test_search_similar_global_top_k(self) -> None:
+        """Test results from all levels are merged by score."""
+        client = _make_client()
+        storage = HierarchicalMemoryStorage.__new__(HierarchicalMemoryStorage)
+        storage.client = client
+        storage.search_engine = VectorSearchEngine(
+            client, QdrantCollectionManager(client, 3, PROJECT_ID)
+        )
+
+        results = storage.search_similar(np.ones(3), k=3)
+        exact = storage.search_cross_level(
+            np.ones(3), k=3, k_per_level={0: 3, 1: 3, 2: 3}
+        )
+        storage.search_engine.close()
+
+        # k is distributed across levels: one hit per level for k=3
+        assert [r.memory.id for r in results] == ["e1", "c1", "x1"]
+        assert {call.kwargs["limit"] for call in client.search.call_args_list} == {
+            1,
+            3,
+        }
+        assert [r.memory.id for r in exact] == ["e1", "c1", "e2"]
+
+
+class TestBulkVectorDeletion:
+    """Test per-collection bulk deletion."""
+
+    @pytest.fixture
+    def storage(self) -> HierarchicalMemoryStorage:
+        """Create storage backed by a mock client that completes deletes."""
+        client = Mock()
+        client.delete.return_value = SimpleNamespace(
+            status=models.UpdateStatus.COMPLETED
+        )
+        storage = HierarchicalMemoryStorage.__new__(HierarchicalMemoryStorage)
+        storage.client = client
+        storage.collection_manager = QdrantCollectionManager(client, 3, PROJECT_ID)
+        return storage
+
+    def test_delete_grouped_by_known_level(self, storage) -> None:
+        """Test IDs with known levels only hit their own collection."""
+        deleted = storage.delete_vectors_by_ids(
+            ["a", "b", "c"], hierarchy_levels={"a": 0, "b": 0, "c": 2}
+        )
+
+        assert deleted == ["a", "b", "c"]
+        requests = {
+            call.kwargs["collection_name"]: call.kwargs["points_selector"].points
+            for call in storage.client.delete.call_args_list
+        }
+        assert requests == {
+            f"{PROJECT_ID}_concepts": ["a", "b"],
+            f"{PROJECT_ID}_episodes": ["c"],
+        }
+
+    def test_delete_unknown_levels_once_per_collection(self, storage) -> None:
+        """Test IDs without levels are deleted with one request per collection."""
+        deleted = storage.delete_vectors_by_ids(["a", "b"])
+
+        assert deleted == ["a", "b"]
+        assert storage.client.delete.call_count == 3
+
+    def test_delete_by_source_path_filter(self, storage) -> None:
+        """Test source path deletion uses a payload filter per collection."""
+        assert storage.delete_vectors_by_source_path("/docs/a.md")
+
+        assert storage.client.delete.call_count == 3
+        selector = storage.client.delete.call_args.kwargs["points_selector"]
+        condition = selector.filter.must[0]
+        assert condition.key == "source_path"
+        assert condition.match.value == "/docs/a.md"
+
+
+class TestInjectedClient:
+    """Test storage on a provided in-process Qdrant client."""
+
+    def test_store_search_delete_in_memory(self) -> None:
+        """Test the full vector lifecycle without a Qdrant server."""
+        storage = HierarchicalMemoryStorage(
+            vector_size=3, project_id=PROJECT_ID, client=QdrantClient(":memory:")
+        )
+        memory_ids = [
+            "00000000-0000-0000-0000-000000000001",
+            "00000000-0000-0000-0000-000000000002",
+        ]
+        storage.store_vector(
+            memory_ids[0],
+            np.array([1.0, 0.0, 0.0]),
+            {"memory_id": memory_ids[0], "hierarchy_level": 0},
+        )
+        storage.store_vector(
+            memory_ids[1],
+            np.array([0.0, 1.0, 0.0]),
+            {"memory_id": memory_ids[1], "hierarchy_level": 2},
+        )
+
+        results = storage.search_similar(np.array([0.9, 0.1, 0.0]), k=2)
+        assert [r.memory.id for r in results] == memory_ids
+
+        assert storage.delete_vectors_by_ids([memory_ids[0]]) == [memory_ids[0]]
+        results = storage.search_similar(np.array([0.9, 0.1, 0.0]), k=2)
+        assert [r.memory.id for r in results] == [memory_ids[1]]
+        storage.close()